@@ -1,6 +1,9 @@
-from fastapi import APIRouter, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
 
 from backend.core.runtime_access import RuntimeServices
+from backend.models.schemas import TaskMoveRequest
 from loguru import logger
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
@@ -14,21 +17,63 @@ async def list_tasks():
     return [tm.serialize_task(task) for task in tm.tasks.values()]
 
 
+@router.get("/page", response_model=dict)
+async def query_tasks(
+    status: Optional[list[str]] = Query(None),
+    type: Optional[list[str]] = Query(None),
+    created_after: Optional[float] = None,
+    created_before: Optional[float] = None,
+    q: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+):
+    """Get one filtered page of tasks (including history), newest first."""
+    tm = RuntimeServices.task_manager()
+    await tm.wait_until_tasks_loaded()
+    return await tm.query_tasks(
+        statuses=status,
+        task_types=type,
+        created_after=created_after,
+        created_before=created_before,
+        search=q,
+        limit=limit,
+        offset=offset,
+    )
+
+
 @router.get("/queue/summary", response_model=dict)
 async def get_queue_summary():
     """Get task queue runtime summary."""
     return RuntimeServices.task_manager().get_queue_summary()
 
 
+@router.get("/queue/pools", response_model=dict)
+async def get_queue_pools():
+    """Get per-resource-pool concurrency limits and load."""
+    return RuntimeServices.task_manager().get_pool_summary()
+
+
 @router.get("/{task_id}", response_model=dict)
 async def get_task(task_id: str):
     """Get task status."""
     tm = RuntimeServices.task_manager()
     await tm.wait_until_tasks_loaded()
-    task = tm.get_task(task_id)
+    task = await tm.fetch_task(task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
-    return tm.serialize_task(task)
+    payload = tm.serialize_task(task)
+    payload["result"] = await tm.get_task_result(task_id)
+    return payload
+
+
+@router.get("/{task_id}/result")
+async def get_task_result(task_id: str):
+    """Get a task's full result, including fields detached from the task list."""
+    tm = RuntimeServices.task_manager()
+    await tm.wait_until_tasks_loaded()
+    if not await tm.fetch_task(task_id):
+        raise HTTPException(status_code=404, detail="Task not found")
+    return {"task_id": task_id, "result": await tm.get_task_result(task_id)}
 
 
 @router.post("/pause-all")
@@ -62,6 +107,18 @@ async def cancel_task(task_id: str):
     return {"message": "Cancellation requested", "status": "cancelled"}
 
 
+@router.post("/{task_id}/move")
+async def move_task(task_id: str, req: TaskMoveRequest):
+    """Move a queued task to another position in the pending queue."""
+    tm = RuntimeServices.task_manager()
+    position = await tm.move_queued_task(task_id, req.position)
+    if position is None:
+        if not tm.get_task(task_id):
+            raise HTTPException(status_code=404, detail="Task not found")
+        raise HTTPException(status_code=409, detail="Task is not waiting in the queue")
+    return {"message": "Task moved", "task_id": task_id, "queue_position": position}
+
+
 @router.post("/{task_id}/resume")
 async def resume_task(task_id: str):
     """Resume a paused/cancelled/failed task."""
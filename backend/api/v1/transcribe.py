@@ -73,3 +73,9 @@ async def transcribe_segment(req: TranscribeSegmentRequest):
         except Exception as e:
              logger.error(f"Sync segment transcription failed: {e}")
              raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/models/stats")
+async def transcription_model_stats():
+    """Loaded Whisper models, their estimated memory, and cache hits, misses and load time."""
+    return RuntimeServices.asr().model_manager.stats()
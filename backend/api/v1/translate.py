@@ -68,3 +68,20 @@ async def translate_subtitles(req: TranslateRequest):
     except Exception as e:
         logger.error(f"Failed to submit translation task: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/stats")
+async def translation_stats():
+    """
+    Per-provider adaptive concurrency, in-flight batches and tokens/sec,
+    translation memory counters, and requests/tokens per segment of recent jobs.
+    """
+    from backend.services.translator.translation_memory import translation_memory
+    from backend.services.translator.translation_rate_limiter import concurrency_stats
+    from backend.services.translator.translation_usage import recent_job_usage
+
+    return {
+        "providers": concurrency_stats(),
+        "memory": translation_memory.stats(),
+        "jobs": recent_job_usage(),
+    }
@@ -163,7 +163,6 @@ class DesktopDownloadFlowService:
             segments=segments,
             target_language=request.target_language,
             mode=request.translation_mode,
-            batch_size=10,
             progress_callback=translate_progress,
         )
         translation_result = build_translation_task_result(
@@ -1,9 +1,14 @@
+import asyncio
 import os
 from loguru import logger
 
 from backend.core.runtime_access import RuntimeServices, TaskRuntimeContext
-from backend.models.schemas import OCRExtractRequest
+from backend.models.schemas import OCRExtractRequest, TextEvent
 from backend.services.ocr.engine_provider import get_ocr_engine
+from backend.utils.artifact_cache import artifact_cache
+
+# Bump when VideoOCRPipeline's event extraction changes.
+OCR_PIPELINE_VERSION = "1"
 
 
 def load_ocr_results(video_path: str) -> dict[str, list]:
@@ -24,55 +29,81 @@ def load_ocr_results(video_path: str) -> dict[str, list]:
         return {"events": []}
 
 
+def _ocr_cache_params(request: OCRExtractRequest) -> dict:
+    return {"engine": request.engine, "roi": request.roi, "sample_rate": request.sample_rate}
+
+
+def load_cached_ocr_events(request: OCRExtractRequest) -> list[TextEvent] | None:
+    cached = artifact_cache.get(request.video_path, "ocr", _ocr_cache_params(request), OCR_PIPELINE_VERSION)
+    if not isinstance(cached, list):
+        return None
+    logger.info(f"Reusing cached OCR events for {request.video_path}")
+    return [TextEvent(**event) for event in cached]
+
+
+def store_cached_ocr_events(request: OCRExtractRequest, events) -> None:
+    artifact_cache.put(
+        request.video_path,
+        "ocr",
+        _ocr_cache_params(request),
+        [event.model_dump(mode="json") for event in events],
+        OCR_PIPELINE_VERSION,
+    )
+
+
 async def run_ocr_task(task_id: str, request: OCRExtractRequest):
     runtime = TaskRuntimeContext.for_task(task_id)
     try:
         runtime.checkpoint()
-        engine = get_ocr_engine(request.engine)
+        events = load_cached_ocr_events(request)
+        cache_hit = events is not None
+        if not cache_hit:
+            engine = get_ocr_engine(request.engine)
+
+            if request.engine != "paddle" and not engine.ocr:
+                await runtime.update(
+                    status="running",
+                    cancelled=False,
+                    message="Initializing OCR Models...",
+                    progress=0,
+                )
+
+                def download_bridge(p, msg):
+                    runtime.submit_progress(round(p * 20, 1), msg)
+
+                await asyncio.to_thread(engine.initialize_models, download_bridge)
 
-        if request.engine != "paddle" and not engine.ocr:
             await runtime.update(
                 status="running",
                 cancelled=False,
-                message="Initializing OCR Models...",
+                message="Starting extraction...",
                 progress=0,
             )
 
-            def download_bridge(p, msg):
-                runtime.submit_progress(round(p * 20, 1), msg)
-
-            await asyncio.to_thread(engine.initialize_models, download_bridge)
-
-        await runtime.update(
-            status="running",
-            cancelled=False,
-            message="Starting extraction...",
-            progress=0,
-        )
-
-        from backend.services.ocr.pipeline import VideoOCRPipeline
+            from backend.services.ocr.pipeline import VideoOCRPipeline
 
-        pipeline = VideoOCRPipeline(engine)
-        roi_tuple = tuple(request.roi) if request.roi and len(request.roi) == 4 else None
+            pipeline = VideoOCRPipeline(engine)
+            roi_tuple = tuple(request.roi) if request.roi and len(request.roi) == 4 else None
 
-        import time
-        last_update = 0
+            import time
+            last_update = 0
 
-        def progress_bridge(p, msg):
-            nonlocal last_update
-            runtime.checkpoint()
-            now = time.time()
-            if now - last_update > 0.5 or p >= 1.0:
-                runtime.submit_progress(round(p * 100, 1), msg)
-                last_update = now
+            def progress_bridge(p, msg):
+                nonlocal last_update
+                runtime.checkpoint()
+                now = time.time()
+                if now - last_update > 0.5 or p >= 1.0:
+                    runtime.submit_progress(round(p * 100, 1), msg)
+                    last_update = now
 
-        events = await asyncio.to_thread(
-            pipeline.process_video,
-            video_path=request.video_path,
-            roi=roi_tuple,
-            sample_rate=request.sample_rate,
-            progress_callback=progress_bridge,
-        )
+            events = await asyncio.to_thread(
+                pipeline.process_video,
+                video_path=request.video_path,
+                roi=roi_tuple,
+                sample_rate=request.sample_rate,
+                progress_callback=progress_bridge,
+            )
+            store_cached_ocr_events(request, events)
 
         import json
 
@@ -110,6 +141,7 @@ async def run_ocr_task(task_id: str, request: OCRExtractRequest):
                     {"type": "json", "path": json_path},
                     {"type": "srt", "path": srt_path},
                 ],
+                **({"cache": "hit"} if cache_hit else {}),
             },
         )
     except Exception as e:
@@ -135,23 +167,27 @@ def execute_ocr(
     *,
     progress_callback,
 ):
-    from backend.services.ocr.pipeline import VideoOCRPipeline
-
-    engine = get_ocr_engine(request.engine)
-    if request.engine != "paddle" and getattr(engine, "ocr", None) is None:
-        def init_progress(progress: float, message: str) -> None:
-            progress_callback(round(progress * 20, 1), message)
-
-        engine.initialize_models(init_progress)
-
-    pipeline = VideoOCRPipeline(engine)
-    roi_tuple = tuple(request.roi) if request.roi and len(request.roi) == 4 else None
-    events = pipeline.process_video(
-        video_path=request.video_path,
-        roi=roi_tuple,
-        sample_rate=request.sample_rate,
-        progress_callback=progress_callback,
-    )
+    events = load_cached_ocr_events(request)
+    cache_hit = events is not None
+    if not cache_hit:
+        from backend.services.ocr.pipeline import VideoOCRPipeline
+
+        engine = get_ocr_engine(request.engine)
+        if request.engine != "paddle" and getattr(engine, "ocr", None) is None:
+            def init_progress(progress: float, message: str) -> None:
+                progress_callback(round(progress * 20, 1), message)
+
+            engine.initialize_models(init_progress)
+
+        pipeline = VideoOCRPipeline(engine)
+        roi_tuple = tuple(request.roi) if request.roi and len(request.roi) == 4 else None
+        events = pipeline.process_video(
+            video_path=request.video_path,
+            roi=roi_tuple,
+            sample_rate=request.sample_rate,
+            progress_callback=progress_callback,
+        )
+        store_cached_ocr_events(request, events)
 
     import json
 
@@ -183,4 +219,5 @@ def execute_ocr(
             {"type": "json", "path": json_path},
             {"type": "srt", "path": srt_path},
         ],
+        **({"cache": "hit"} if cache_hit else {}),
     }
@@ -28,7 +28,7 @@ class PipelineSubmissionService:
                 await orchestrator.reset_task_for_reuse(existing_task_id)
                 await orchestrator._task_manager.enqueue_task(
                     existing_task_id,
-                    lambda: orchestrator._pipeline_runner.run(req.steps, existing_task_id),
+                    lambda: orchestrator._pipeline_runner.run(req.steps, existing_task_id, streaming=req.streaming),
                     queued_message="Queued",
                 )
                 return {
@@ -53,7 +53,7 @@ class PipelineSubmissionService:
 
         await orchestrator._task_manager.enqueue_task(
             task_id,
-            lambda: orchestrator._pipeline_runner.run(req.steps, task_id),
+            lambda: orchestrator._pipeline_runner.run(req.steps, task_id, streaming=req.streaming),
             queued_message="Queued",
         )
 
@@ -99,7 +99,7 @@ class TaskOrchestrator:
         return {"task_id": task_id, "status": "pending", "message": queued_message}
 
     async def resume_task(self, task_id: str) -> dict:
-        task = self._task_manager.get_task(task_id)
+        task = self._task_manager.get_task(task_id) or await self._task_manager.load_task(task_id)
         if not task:
             raise ValueError("Task not found")
         if not task.request_params:
@@ -107,7 +107,6 @@ async def run_translation_task(task_id: str, req: TranslationRequest) -> None:
             "segments": req.segments,
             "target_language": req.target_language,
             "mode": req.mode,
-            "batch_size": 10,
             "cancel_check": runtime.checkpoint,
         },
         start_message="Starting translation...",
@@ -131,7 +130,6 @@ def execute_translation(
         segments=req.segments,
         target_language=req.target_language,
         mode=req.mode,
-        batch_size=10,
         progress_callback=progress_callback,
     )
     result = build_translation_task_result(
@@ -25,6 +25,12 @@ DEFAULT_DOWNLOADER_FORMATS = {
     "audio": "bestaudio[ext=m4a]/bestaudio/best",
 }
 
+DEFAULT_TASK_POOL_LIMITS = {
+    "network": 3,
+    "encoder": 1,
+    "llm": 2,
+}
+
 RUNTIME_DIR_ENV = "MEDIAFLOW_RUNTIME_DIR"
 
 
@@ -80,6 +86,20 @@ def _parse_json_dict(value: str | None, default: dict) -> dict:
     return default.copy()
 
 
+def _parse_int_dict(value: str | None, default: dict) -> dict:
+    """JSON object of integers; entries whose value is not an integer are dropped."""
+    parsed = _parse_json_dict(value, default)
+    result = {}
+    for key, item in parsed.items():
+        if isinstance(item, bool):
+            continue
+        try:
+            result[str(key)] = int(item)
+        except (TypeError, ValueError):
+            continue
+    return result
+
+
 class Settings:
     def __init__(self):
         self.APP_NAME = "MediaFlow Core"
@@ -90,6 +110,21 @@ class Settings:
         self.HOST = "127.0.0.1"
         self.PORT = 8800
         self.TASK_MAX_CONCURRENT = 2
+        # Per-resource-pool worker limits; pools not listed use TASK_MAX_CONCURRENT.
+        self.TASK_POOL_LIMITS = DEFAULT_TASK_POOL_LIMITS.copy()
+        self.TASK_PROGRESS_FLUSH_INTERVAL_MS = 1000
+        self.TASK_RESULT_INLINE_LIMIT_BYTES = 64 * 1024
+        self.TASK_KEEP_HISTORY_IN_MEMORY = True
+        # Persist each pipeline step's outputs so a resumed pipeline skips finished steps.
+        self.PIPELINE_CHECKPOINTS = True
+        # Translate transcript chunks while later ones are still being transcribed.
+        self.PIPELINE_STREAMING = False
+        self.WS_PROGRESS_EVENTS_PER_SEC = 4
+        self.WS_CLIENT_QUEUE_SIZE = 256
+        self.DB_POOLED_CONNECTIONS = True
+        self.DB_POOL_SIZE = 5
+        self.DB_SYNCHRONOUS = "NORMAL"
+        self.DB_BUSY_TIMEOUT_MS = 5000
 
         self.RESOURCE_DIR = self._resolve_resource_dir()
         self.RUNTIME_DIR = self._resolve_runtime_dir()
@@ -106,7 +141,67 @@ class Settings:
         self.ENABLE_FASTER_WHISPER_CLI = False
 
         self.ASR_MAX_WORKERS = 2
-        self.LLM_TRANSLATION_MAX_CONCURRENCY = 3
+        # "native" (NumPy over decoded PCM) or "ffmpeg" (silencedetect filter).
+        self.SILENCE_DETECTOR = "native"
+        # Decoded 16 kHz PCM files kept under TEMP_DIR for reuse.
+        self.PCM_CACHE_ENTRIES = 2
+        # Content-addressed cache of step results (transcripts, OCR events,
+        # probe data) under TEMP_DIR, evicted least-recently-used past the cap.
+        self.ARTIFACT_CACHE_ENABLED = True
+        self.ARTIFACT_CACHE_MAX_MB = 512
+        # Per-line translation memory (SQLite under TEMP_DIR) reused across jobs.
+        # Entries unused for the TTL or beyond the entry cap (least recently
+        # used first) are evicted by a background sweep every interval.
+        self.TRANSLATION_MEMORY_ENABLED = True
+        self.TRANSLATION_MEMORY_TTL_DAYS = 30
+        self.TRANSLATION_MEMORY_MAX_ENTRIES = 200_000
+        self.TRANSLATION_MEMORY_EVICT_INTERVAL_S = 3600
+        # Model replicas (CTranslate2 workers) for parallel chunk transcription
+        # and CPU threads per replica; 0 sizes them from the machine's cores.
+        self.ASR_MODEL_REPLICAS = 0
+        self.ASR_CPU_THREADS_PER_REPLICA = 0
+        # "batched" engine: speech regions found by one VAD pass are decoded
+        # this many 30 s windows per model call. Audio goes to the pipeline in
+        # spans of at most ASR_BATCHED_SPAN_S (cut at silences) so long
+        # recordings are never expanded to float32 in full.
+        self.ASR_BATCH_SIZE = 8
+        self.ASR_BATCHED_SPAN_S = 1800
+        # Whisper models stay loaded, keyed by (model, device, compute type),
+        # and are evicted least recently used once their estimated memory
+        # passes this budget; models in use are never evicted.
+        # ASR_PRELOAD_MODEL ("" = off) is loaded in the background at startup.
+        self.ASR_MODEL_CACHE_MB = 6144
+        self.ASR_PRELOAD_MODEL = ""
+        self.ASR_PRELOAD_DEVICE = "cpu"
+        # Split transcriptions with no language detect it once on this many
+        # speech-dense windows and pin it for every chunk; per-chunk
+        # detection is for genuinely multilingual media.
+        self.ASR_LANGUAGE_DETECT_WINDOWS = 3
+        self.ASR_PER_CHUNK_LANGUAGE = False
+        # Choose direct vs smart-split and the chunk length from the model
+        # replicas and the real-time factor measured on earlier jobs (kept in
+        # USER_DATA_DIR). Off: split past 15 min into ~10 min chunks.
+        self.ASR_ADAPTIVE_CHUNKING = True
+        # Translation batches in flight per provider: the adaptive limiter
+        # starts at the initial window and grows up to the max while the
+        # provider keeps up, halving on 429s.
+        self.LLM_TRANSLATION_INITIAL_CONCURRENCY = 3
+        self.LLM_TRANSLATION_MAX_CONCURRENCY = 16
+        self.LLM_TRANSLATION_MAX_RETRIES = 5
+        # Batches are packed by estimated tokens (source, glossary terms,
+        # context and expected reply) against the model's limits and a target
+        # per-request latency, up to this many lines unless a caller passes
+        # an explicit batch_size. Off: fixed batch_size batches.
+        self.LLM_TRANSLATION_TOKEN_BUDGET = True
+        self.LLM_TRANSLATION_MAX_BATCH_SEGMENTS = 40
+        self.LLM_TRANSLATION_TARGET_LATENCY_S = 20
+        # {"model-prefix": [context_window, max_output_tokens]} for models the
+        # built-in table does not know.
+        self.LLM_MODEL_TOKEN_LIMITS = {}
+        # Most glossary terms (and their prompt tokens) sent with one batch,
+        # most relevant first.
+        self.GLOSSARY_MAX_PROMPT_TERMS = 50
+        self.GLOSSARY_MAX_PROMPT_TOKENS = 1500
         self.ASR_MODEL_DIR = self.MODEL_DIR / "faster-whisper"
         self.OCR_MODEL_DIR = self.MODEL_DIR / "ocr"
 
@@ -137,6 +232,50 @@ class Settings:
             env.get("TASK_MAX_CONCURRENT"),
             self.TASK_MAX_CONCURRENT,
         )
+        self.TASK_POOL_LIMITS = _parse_int_dict(
+            env.get("TASK_POOL_LIMITS"),
+            DEFAULT_TASK_POOL_LIMITS,
+        )
+        self.TASK_PROGRESS_FLUSH_INTERVAL_MS = _parse_int(
+            env.get("TASK_PROGRESS_FLUSH_INTERVAL_MS"),
+            self.TASK_PROGRESS_FLUSH_INTERVAL_MS,
+        )
+        self.TASK_RESULT_INLINE_LIMIT_BYTES = _parse_int(
+            env.get("TASK_RESULT_INLINE_LIMIT_BYTES"),
+            self.TASK_RESULT_INLINE_LIMIT_BYTES,
+        )
+        self.TASK_KEEP_HISTORY_IN_MEMORY = _parse_bool(
+            env.get("TASK_KEEP_HISTORY_IN_MEMORY"),
+            self.TASK_KEEP_HISTORY_IN_MEMORY,
+        )
+        self.PIPELINE_CHECKPOINTS = _parse_bool(
+            env.get("PIPELINE_CHECKPOINTS"),
+            self.PIPELINE_CHECKPOINTS,
+        )
+        self.PIPELINE_STREAMING = _parse_bool(
+            env.get("PIPELINE_STREAMING"),
+            self.PIPELINE_STREAMING,
+        )
+        self.WS_PROGRESS_EVENTS_PER_SEC = _parse_int(
+            env.get("WS_PROGRESS_EVENTS_PER_SEC"),
+            self.WS_PROGRESS_EVENTS_PER_SEC,
+        )
+        self.WS_CLIENT_QUEUE_SIZE = _parse_int(
+            env.get("WS_CLIENT_QUEUE_SIZE"),
+            self.WS_CLIENT_QUEUE_SIZE,
+        )
+        self.DB_POOLED_CONNECTIONS = _parse_bool(
+            env.get("DB_POOLED_CONNECTIONS"),
+            self.DB_POOLED_CONNECTIONS,
+        )
+        self.DB_POOL_SIZE = _parse_int(env.get("DB_POOL_SIZE"), self.DB_POOL_SIZE)
+        synchronous = env.get("DB_SYNCHRONOUS", self.DB_SYNCHRONOUS).strip().upper()
+        if synchronous in {"OFF", "NORMAL", "FULL", "EXTRA"}:
+            self.DB_SYNCHRONOUS = synchronous
+        self.DB_BUSY_TIMEOUT_MS = _parse_int(
+            env.get("DB_BUSY_TIMEOUT_MS"),
+            self.DB_BUSY_TIMEOUT_MS,
+        )
 
         self.FFMPEG_PATH = env.get("FFMPEG_PATH", self.FFMPEG_PATH)
         self.FFPROBE_PATH = env.get("FFPROBE_PATH", self.FFPROBE_PATH)
@@ -150,10 +289,80 @@ class Settings:
         )
 
         self.ASR_MAX_WORKERS = _parse_int(env.get("ASR_MAX_WORKERS"), self.ASR_MAX_WORKERS)
+        silence_detector = env.get("SILENCE_DETECTOR", self.SILENCE_DETECTOR).strip().lower()
+        if silence_detector in {"native", "ffmpeg"}:
+            self.SILENCE_DETECTOR = silence_detector
+        self.PCM_CACHE_ENTRIES = _parse_int(env.get("PCM_CACHE_ENTRIES"), self.PCM_CACHE_ENTRIES)
+        self.ARTIFACT_CACHE_ENABLED = _parse_bool(env.get("ARTIFACT_CACHE_ENABLED"), self.ARTIFACT_CACHE_ENABLED)
+        self.ARTIFACT_CACHE_MAX_MB = _parse_int(env.get("ARTIFACT_CACHE_MAX_MB"), self.ARTIFACT_CACHE_MAX_MB)
+        self.TRANSLATION_MEMORY_ENABLED = _parse_bool(
+            env.get("TRANSLATION_MEMORY_ENABLED"),
+            self.TRANSLATION_MEMORY_ENABLED,
+        )
+        self.TRANSLATION_MEMORY_TTL_DAYS = _parse_int(
+            env.get("TRANSLATION_MEMORY_TTL_DAYS"),
+            self.TRANSLATION_MEMORY_TTL_DAYS,
+        )
+        self.TRANSLATION_MEMORY_MAX_ENTRIES = _parse_int(
+            env.get("TRANSLATION_MEMORY_MAX_ENTRIES"),
+            self.TRANSLATION_MEMORY_MAX_ENTRIES,
+        )
+        self.TRANSLATION_MEMORY_EVICT_INTERVAL_S = _parse_int(
+            env.get("TRANSLATION_MEMORY_EVICT_INTERVAL_S"),
+            self.TRANSLATION_MEMORY_EVICT_INTERVAL_S,
+        )
+        self.ASR_MODEL_REPLICAS = _parse_int(env.get("ASR_MODEL_REPLICAS"), self.ASR_MODEL_REPLICAS)
+        self.ASR_CPU_THREADS_PER_REPLICA = _parse_int(
+            env.get("ASR_CPU_THREADS_PER_REPLICA"),
+            self.ASR_CPU_THREADS_PER_REPLICA,
+        )
+        self.ASR_BATCH_SIZE = _parse_int(env.get("ASR_BATCH_SIZE"), self.ASR_BATCH_SIZE)
+        self.ASR_BATCHED_SPAN_S = _parse_int(env.get("ASR_BATCHED_SPAN_S"), self.ASR_BATCHED_SPAN_S)
+        self.ASR_MODEL_CACHE_MB = _parse_int(env.get("ASR_MODEL_CACHE_MB"), self.ASR_MODEL_CACHE_MB)
+        self.ASR_PRELOAD_MODEL = env.get("ASR_PRELOAD_MODEL", self.ASR_PRELOAD_MODEL).strip()
+        self.ASR_PRELOAD_DEVICE = env.get("ASR_PRELOAD_DEVICE", self.ASR_PRELOAD_DEVICE).strip() or "cpu"
+        self.ASR_LANGUAGE_DETECT_WINDOWS = _parse_int(
+            env.get("ASR_LANGUAGE_DETECT_WINDOWS"),
+            self.ASR_LANGUAGE_DETECT_WINDOWS,
+        )
+        self.ASR_PER_CHUNK_LANGUAGE = _parse_bool(env.get("ASR_PER_CHUNK_LANGUAGE"), self.ASR_PER_CHUNK_LANGUAGE)
+        self.ASR_ADAPTIVE_CHUNKING = _parse_bool(env.get("ASR_ADAPTIVE_CHUNKING"), self.ASR_ADAPTIVE_CHUNKING)
+        self.LLM_TRANSLATION_INITIAL_CONCURRENCY = _parse_int(
+            env.get("LLM_TRANSLATION_INITIAL_CONCURRENCY"),
+            self.LLM_TRANSLATION_INITIAL_CONCURRENCY,
+        )
         self.LLM_TRANSLATION_MAX_CONCURRENCY = _parse_int(
             env.get("LLM_TRANSLATION_MAX_CONCURRENCY"),
             self.LLM_TRANSLATION_MAX_CONCURRENCY,
         )
+        self.LLM_TRANSLATION_MAX_RETRIES = _parse_int(
+            env.get("LLM_TRANSLATION_MAX_RETRIES"),
+            self.LLM_TRANSLATION_MAX_RETRIES,
+        )
+        self.LLM_TRANSLATION_TOKEN_BUDGET = _parse_bool(
+            env.get("LLM_TRANSLATION_TOKEN_BUDGET"),
+            self.LLM_TRANSLATION_TOKEN_BUDGET,
+        )
+        self.LLM_TRANSLATION_MAX_BATCH_SEGMENTS = _parse_int(
+            env.get("LLM_TRANSLATION_MAX_BATCH_SEGMENTS"),
+            self.LLM_TRANSLATION_MAX_BATCH_SEGMENTS,
+        )
+        self.LLM_TRANSLATION_TARGET_LATENCY_S = _parse_int(
+            env.get("LLM_TRANSLATION_TARGET_LATENCY_S"),
+            self.LLM_TRANSLATION_TARGET_LATENCY_S,
+        )
+        self.LLM_MODEL_TOKEN_LIMITS = _parse_json_dict(
+            env.get("LLM_MODEL_TOKEN_LIMITS"),
+            self.LLM_MODEL_TOKEN_LIMITS,
+        )
+        self.GLOSSARY_MAX_PROMPT_TERMS = _parse_int(
+            env.get("GLOSSARY_MAX_PROMPT_TERMS"),
+            self.GLOSSARY_MAX_PROMPT_TERMS,
+        )
+        self.GLOSSARY_MAX_PROMPT_TOKENS = _parse_int(
+            env.get("GLOSSARY_MAX_PROMPT_TOKENS"),
+            self.GLOSSARY_MAX_PROMPT_TOKENS,
+        )
         self.LLM_MODEL = env.get("LLM_MODEL", self.LLM_MODEL)
         self.ASR_MODELS = _parse_json_dict(env.get("ASR_MODELS"), DEFAULT_ASR_MODELS)
         self.DOWNLOADER_PROXY = env.get("DOWNLOADER_PROXY", self.DOWNLOADER_PROXY)
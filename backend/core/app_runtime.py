@@ -10,6 +10,8 @@ from backend.core.tasks.registry import (
     register_all_task_handlers,
     validate_required_task_handlers,
 )
+from backend.services.translator.translation_memory import translation_memory
+from backend.utils.pcm_audio import pcm_cache
 
 
 class ApplicationRuntime:
@@ -27,7 +29,13 @@ class ApplicationRuntime:
         registered_count = self.register_services()
         configure_runtime_services(self._container)
         self.register_task_handlers()
+        pcm_cache.remove_stale_files()
         await self._container.get(Services.TASK_MANAGER).warm_start_async()
+        if translation_memory.enabled():
+            translation_memory.start_eviction()
+        if settings.ASR_PRELOAD_MODEL:
+            asr = self._container.get(Services.ASR)
+            asr.model_manager.preload(settings.ASR_PRELOAD_MODEL, settings.ASR_PRELOAD_DEVICE)
         return registered_count
 
     async def stop(self) -> None:
@@ -35,6 +43,8 @@ class ApplicationRuntime:
             await self._container.get(Services.TASK_MANAGER).shutdown_async()
         if self._container.is_instantiated(Services.BROWSER):
             await self._container.get(Services.BROWSER).stop()
+        translation_memory.close()
+        pcm_cache.clear()
         await shutdown_db()
         reset_runtime_services()
         self._container.reset()
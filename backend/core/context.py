@@ -9,6 +9,7 @@ class PipelineContext:
         self.data: Dict[str, Any] = {}
         self.history: List[str] = []
         self.trace: List[Dict[str, Any]] = []
+        self.cache_hits: set[str] = set()
 
     def set(self, key: str, value: Any):
         self.data[key] = value
@@ -44,11 +45,18 @@ class PipelineContext:
                 return value
         return None
 
+    def mark_cache_hit(self, step_name: str):
+        """Record that a step was served from the artifact cache."""
+        self.cache_hits.add(step_name)
+
     def add_trace(self, step_name: str, duration: float, status: str, error: str = None):
-        self.trace.append({
+        entry = {
             "step": step_name,
             "duration": round(duration, 3),
             "status": status,
             "error": error,
             "timestamp": time.time()
-        })
+        }
+        if step_name in self.cache_hits:
+            entry["cache"] = "hit"
+        self.trace.append(entry)
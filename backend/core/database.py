@@ -1,8 +1,11 @@
-from typing import AsyncGenerator
+import asyncio
+from typing import Any, AsyncGenerator, Awaitable, Callable
 from contextlib import asynccontextmanager
 
+from loguru import logger
+from sqlalchemy import event
 from sqlmodel import SQLModel, create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import NullPool
 
@@ -11,26 +14,71 @@ from backend.config import settings
 # Database URL (SQLite + aiosqlite)
 DATABASE_URL = f"sqlite+aiosqlite:///{settings.USER_DATA_DIR}/mediaflow.db"
 
+
+def _apply_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute(f"PRAGMA synchronous={settings.DB_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA busy_timeout={settings.DB_BUSY_TIMEOUT_MS}")
+    finally:
+        cursor.close()
+
+
+def build_engine(database_url: str, *, pooled: bool | None = None) -> AsyncEngine:
+    """
+    Build the async SQLite engine.
+
+    Pooled mode keeps a few persistent connections in WAL mode so readers never
+    block the writer and sessions skip connection setup; NullPool mode opens a
+    fresh connection per session with the default rollback journal.
+    """
+    use_pool = settings.DB_POOLED_CONNECTIONS if pooled is None else pooled
+    if not use_pool:
+        return create_async_engine(
+            database_url,
+            echo=False,
+            future=True,
+            connect_args={"check_same_thread": False}, # Required for SQLite + async
+            poolclass=NullPool,
+        )
+
+    async_engine = create_async_engine(
+        database_url,
+        echo=False,
+        future=True,
+        connect_args={"check_same_thread": False},
+        pool_size=max(1, settings.DB_POOL_SIZE),
+        max_overflow=0,
+        pool_pre_ping=False,
+    )
+    event.listen(async_engine.sync_engine, "connect", _apply_sqlite_pragmas)
+    return async_engine
+
+
 # Engine
-engine = create_async_engine(
-    DATABASE_URL, 
-    echo=False, 
-    future=True,
-    connect_args={"check_same_thread": False}, # Required for SQLite + async
-    poolclass=NullPool,
-)
+engine = build_engine(DATABASE_URL)
 
 # Session Factory
 async_session_maker = sessionmaker(
-    engine, 
-    class_=AsyncSession, 
+    engine,
+    class_=AsyncSession,
     expire_on_commit=False
 )
 
+def _create_missing_indexes(sync_conn) -> None:
+    # create_all skips tables that already exist, so indexes added to a model
+    # later would never reach databases created before them.
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+
+
 async def init_db():
     async with engine.begin() as conn:
         # Create tables
         await conn.run_sync(SQLModel.metadata.create_all)
+        await conn.run_sync(_create_missing_indexes)
 
 
 async def shutdown_db():
@@ -51,3 +99,90 @@ async def get_session_context():
             raise
         finally:
             await session.close()
+
+
+WriteJob = Callable[[AsyncSession], Awaitable[Any]]
+
+
+class DatabaseWriter:
+    """
+    Single writer coroutine for SQLite.
+
+    Jobs are coroutines that stage changes on a session without committing.
+    The writer drains whatever is queued (up to max_batch) into one session and
+    commits once, so concurrent task updates cost one transaction instead of
+    one each. If a batched commit fails, the jobs are replayed one by one so a
+    bad job only fails its own caller.
+    """
+
+    def __init__(self, *, max_batch: int = 64):
+        self._max_batch = max(1, max_batch)
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def submit(self, job: WriteJob) -> Any:
+        self._ensure_running()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((job, future))
+        return await future
+
+    async def stop(self) -> None:
+        worker = self._worker
+        if worker is None:
+            return
+        if self._loop is asyncio.get_running_loop() and not worker.done():
+            await self._queue.join()
+            worker.cancel()
+            await asyncio.gather(worker, return_exceptions=True)
+        self._worker = None
+        self._queue = None
+        self._loop = None
+
+    def _ensure_running(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._worker is not None and self._loop is loop and not self._worker.done():
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._worker = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self._max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await self._commit_batch(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _commit_batch(self, batch: list[tuple[WriteJob, asyncio.Future]]) -> None:
+        if len(batch) > 1:
+            try:
+                results = []
+                async with get_session_context() as session:
+                    for job, _future in batch:
+                        results.append(await job(session))
+                    await session.commit()
+            except Exception as e:
+                logger.warning(f"Batched write of {len(batch)} jobs failed, replaying individually: {e}")
+            else:
+                for (_job, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+                return
+
+        for job, future in batch:
+            try:
+                async with get_session_context() as session:
+                    result = await job(session)
+                    await session.commit()
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
@@ -1,18 +1,132 @@
+import asyncio
 import inspect
+import queue
+import threading
 import time
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from loguru import logger
 
+from backend.config import settings
+from backend.core.pipeline_checkpoints import (
+    data_delta,
+    digest_json,
+    fingerprint_files,
+    first_changed_file,
+    referenced_paths,
+    to_json_safe,
+)
 from backend.core.task_control import TaskCancelRequested, TaskPauseRequested
 from backend.models.schemas import PipelineStepRequest, TaskResult, FileRef
+from backend.models.task_model import PipelineCheckpoint
 from backend.core.context import PipelineContext
 from backend.core.runtime_access import RuntimeServices, TaskRuntimeContext
 from backend.core.steps import StepRegistry
+from backend.core.steps.transcribe import TranscribeStep
+from backend.core.steps.translate import TranslateStep
 
 
 class PipelineRunner:
-    def __init__(self, *, task_manager):
+    def __init__(self, *, task_manager, checkpoint_store=None):
+        """
+        checkpoint_store provides save_pipeline_checkpoint,
+        load_pipeline_checkpoints and clear_pipeline_checkpoints (TaskManager
+        does); without one every run starts from the first step.
+        """
         self.task_manager = task_manager
+        self.checkpoint_store = checkpoint_store
+
+    def _checkpoints_enabled(self, task_id: str | None) -> bool:
+        return bool(task_id) and self.checkpoint_store is not None and settings.PIPELINE_CHECKPOINTS
+
+    async def _restore_checkpoints(
+        self,
+        ctx: PipelineContext,
+        steps: List[PipelineStepRequest],
+        task_id: str | None,
+    ) -> int:
+        """
+        Replay the checkpoints of a previous run into ctx and return how many
+        leading steps can be skipped. Checkpoints from the first stale step on
+        are dropped, since everything after it will run again.
+        """
+        if not self._checkpoints_enabled(task_id):
+            return 0
+        try:
+            checkpoints = await self.checkpoint_store.load_pipeline_checkpoints(task_id)
+        except Exception as e:
+            logger.warning(f"Could not load checkpoints for {task_id}: {e}")
+            return 0
+
+        by_index = {checkpoint.step_index: checkpoint for checkpoint in checkpoints}
+        restored = 0
+        for index, step_req in enumerate(steps):
+            checkpoint = by_index.get(index)
+            if checkpoint is None:
+                break
+            reason = await self._stale_reason(checkpoint, step_req, ctx)
+            if reason:
+                logger.info(f"Re-running step {index + 1} ({step_req.step_name}): {reason}")
+                break
+            ctx.data.update(checkpoint.data)
+            ctx.history.append(step_req.step_name)
+            ctx.add_trace(step_req.step_name, 0.0, "restored")
+            restored += 1
+
+        if restored < len(checkpoints):
+            try:
+                await self.checkpoint_store.clear_pipeline_checkpoints(task_id, restored)
+            except Exception as e:
+                logger.warning(f"Could not drop stale checkpoints for {task_id}: {e}")
+        if restored:
+            logger.info(f"Pipeline {task_id} resumes after {restored} checkpointed step(s).")
+        return restored
+
+    @staticmethod
+    async def _stale_reason(
+        checkpoint: PipelineCheckpoint,
+        step_req: PipelineStepRequest,
+        ctx: PipelineContext,
+    ) -> str | None:
+        if checkpoint.step_name != step_req.step_name:
+            return f"step was {checkpoint.step_name}"
+        if checkpoint.params_digest != digest_json(to_json_safe(step_req.params.model_dump())):
+            return "parameters changed"
+        if checkpoint.input_digest != digest_json(to_json_safe(ctx.data)):
+            return "upstream outputs changed"
+        changed = await asyncio.to_thread(first_changed_file, checkpoint.files or [])
+        if changed:
+            return f"{changed} is missing or modified"
+        return None
+
+    async def _save_checkpoint(
+        self,
+        task_id: str | None,
+        step_index: int,
+        step_name: str,
+        params: dict,
+        data_before: dict,
+        ctx: PipelineContext,
+    ) -> None:
+        if not self._checkpoints_enabled(task_id):
+            return
+        try:
+            params = to_json_safe(params)
+            delta = data_delta(data_before, to_json_safe(ctx.data))
+            paths = referenced_paths(params)
+            paths += [path for path in referenced_paths(delta) if path not in paths]
+            checkpoint = PipelineCheckpoint(
+                task_id=task_id,
+                step_index=step_index,
+                step_name=step_name,
+                params_digest=digest_json(params),
+                input_digest=digest_json(data_before),
+                data=delta,
+                files=await asyncio.to_thread(fingerprint_files, paths),
+            )
+            await self.checkpoint_store.save_pipeline_checkpoint(checkpoint)
+        except Exception as e:
+            # A missing checkpoint only costs a re-run on resume.
+            logger.warning(f"Failed to checkpoint step {step_name} of {task_id}: {e}")
 
     async def _raise_if_control_requested(self, task_id: str | None) -> None:
         if not task_id:
@@ -29,54 +143,251 @@ class PipelineRunner:
                 await result
             return
 
-    async def run(self, steps: List[PipelineStepRequest], task_id: str = None) -> Dict[str, Any]:
+    @staticmethod
+    def _streams_into_next(steps: List[PipelineStepRequest], index: int, streaming: bool) -> bool:
+        """Whether steps[index] is a transcribe step that can feed the translate after it."""
+        if not streaming or index + 1 >= len(steps):
+            return False
+        if steps[index].step_name != "transcribe" or steps[index + 1].step_name != "translate":
+            return False
+        return isinstance(StepRegistry.get_step("transcribe"), TranscribeStep) and isinstance(
+            StepRegistry.get_step("translate"), TranslateStep
+        )
+
+    async def _run_step(
+        self,
+        ctx: PipelineContext,
+        task_id: str | None,
+        step_index: int,
+        step_req: PipelineStepRequest,
+    ) -> None:
+        start_time = time.time()
+        status = "success"
+        error_msg = None
+
+        try:
+            step_instance = StepRegistry.get_step(step_req.step_name)
+            params_dict = step_req.params.model_dump()
+            data_before = to_json_safe(ctx.data) if self._checkpoints_enabled(task_id) else {}
+            await step_instance.execute(ctx, params_dict, task_id)
+            ctx.history.append(step_req.step_name)
+        except Exception as step_err:
+            status = "failed"
+            error_msg = str(step_err)
+            raise step_err
+        finally:
+            duration = time.time() - start_time
+            ctx.add_trace(step_req.step_name, duration, status, error_msg)
+
+        await self._save_checkpoint(task_id, step_index, step_req.step_name, params_dict, data_before, ctx)
+
+    async def _run_streaming_pair(
+        self,
+        ctx: PipelineContext,
+        runtime: TaskRuntimeContext,
+        task_id: str | None,
+        step_index: int,
+        transcribe_req: PipelineStepRequest,
+        translate_req: PipelineStepRequest,
+    ) -> None:
+        """
+        Run transcribe and the translate step after it concurrently: finished
+        transcript chunks go through a queue into the translator, so LLM
+        batches for the start of the media run while ASR works on the rest.
+        Both steps still get their own trace entry, history and checkpoint.
+        """
+        transcribe_step = StepRegistry.get_step(transcribe_req.step_name)
+        translate_step = StepRegistry.get_step(translate_req.step_name)
+        transcribe_params = transcribe_req.params.model_dump()
+        translate_params = translate_req.params.model_dump()
+        start_time = time.time()
+        checkpoints_enabled = self._checkpoints_enabled(task_id)
+        data_before = to_json_safe(ctx.data) if checkpoints_enabled else {}
+
+        try:
+            audio_path = transcribe_step.resolve_audio_path(ctx, transcribe_params)
+            target_language = translate_step.require_target_language(translate_params)
+        except Exception as e:
+            ctx.add_trace(transcribe_req.step_name, time.time() - start_time, "failed", str(e))
+            raise
+
+        translator = RuntimeServices.translator()
+        segment_queue: "queue.Queue" = queue.Queue()
+        progress_lock = threading.Lock()
+        progress = {"asr": 0.0, "translated": 0, "seen": 0, "reported": 0.0}
+        # Per-worker wall clock; translation starts when the first chunk is handed over.
+        timings: Dict[str, float] = {}
+        translate_failed = threading.Event()
+
+        def transcribe_checkpoint() -> None:
+            # Once translation has failed the job is lost, so ASR stops at its
+            # next check instead of transcribing the rest of the media.
+            if translate_failed.is_set():
+                raise TaskCancelRequested("Translation failed; transcription stopped")
+            runtime.checkpoint()
+
+        def report_progress() -> None:
+            # Transcription fills the first half; translation of what has
+            # been transcribed so far fills the second half proportionally.
+            with progress_lock:
+                translated_ratio = progress["translated"] / progress["seen"] if progress["seen"] else 0.0
+                combined = max(progress["reported"], progress["asr"] * (1 + translated_ratio) / 2)
+                progress["reported"] = combined
+                message = (
+                    f"Transcribing {progress['asr']:.0f}% | "
+                    f"translated {progress['translated']}/{progress['seen']} segments"
+                )
+            runtime.submit_progress(round(combined, 1), message)
+
+        def on_asr_progress(value, _message: str) -> None:
+            transcribe_checkpoint()
+            progress["asr"] = float(value)
+            report_progress()
+
+        def on_segments(segments) -> None:
+            transcribe_checkpoint()
+            timings.setdefault("translate_start", time.time())
+            segment_queue.put(segments)
+
+        def on_translate_progress(translated: int, seen: int) -> None:
+            progress["translated"], progress["seen"] = translated, seen
+            report_progress()
+
+        def transcribe_worker():
+            try:
+                return transcribe_step.run_transcription(
+                    audio_path,
+                    transcribe_params,
+                    task_id,
+                    on_asr_progress,
+                    on_segments,
+                )
+            finally:
+                timings["transcribe_end"] = time.time()
+                segment_queue.put(None)
+
+        def translate_worker():
+            try:
+                return translator.translate_segment_stream(
+                    segment_queue,
+                    target_language=target_language,
+                    mode=translate_params.get("mode", "standard"),
+                    progress_callback=on_translate_progress,
+                    cancel_check=runtime.checkpoint,
+                )
+            except BaseException:
+                translate_failed.set()
+                raise
+            finally:
+                timings["translate_end"] = time.time()
+
+        transcribe_result, translated_segments = await asyncio.gather(
+            runtime.run_blocking(transcribe_worker),
+            runtime.run_blocking(translate_worker),
+            return_exceptions=True,
+        )
+        transcribe_duration = timings["transcribe_end"] - start_time
+        # Chunks are only handed over at the end when ASR does not stream (e.g. a cached transcript).
+        translate_start = timings.get("translate_start", timings["transcribe_end"])
+        translate_duration = max(0.0, timings["translate_end"] - translate_start)
+
+        if translate_failed.is_set():
+            # Surface the translation error, not the transcription stop it caused.
+            ctx.add_trace(transcribe_req.step_name, transcribe_duration, "failed", "Stopped after translation failed")
+            ctx.add_trace(translate_req.step_name, translate_duration, "failed", str(translated_segments))
+            raise translated_segments
+
+        status, error_msg = "success", None
+        try:
+            if isinstance(transcribe_result, BaseException):
+                raise transcribe_result
+            transcribe_step.apply_result(ctx, transcribe_result, audio_path, transcribe_params, runtime)
+            ctx.history.append(transcribe_req.step_name)
+        except Exception as step_err:
+            status, error_msg = "failed", str(step_err)
+            raise
+        finally:
+            ctx.add_trace(transcribe_req.step_name, transcribe_duration, status, error_msg)
+        await self._save_checkpoint(
+            task_id, step_index, transcribe_req.step_name, transcribe_params, data_before, ctx
+        )
+
+        data_before = to_json_safe(ctx.data) if checkpoints_enabled else {}
+        status, error_msg = "success", None
+        try:
+            if isinstance(translated_segments, BaseException):
+                raise translated_segments
+            translate_step.store_output(ctx, translate_params, translated_segments)
+            ctx.history.append(translate_req.step_name)
+        except Exception as step_err:
+            status, error_msg = "failed", str(step_err)
+            raise
+        finally:
+            ctx.add_trace(translate_req.step_name, translate_duration, status, error_msg)
+        await self._save_checkpoint(
+            task_id, step_index + 1, translate_req.step_name, translate_params, data_before, ctx
+        )
+
+    async def run(
+        self,
+        steps: List[PipelineStepRequest],
+        task_id: str = None,
+        streaming: Optional[bool] = None,
+    ) -> Dict[str, Any]:
+        """
+        Execute steps in order. With streaming (default PIPELINE_STREAMING),
+        a transcribe step directly followed by translate runs as one
+        overlapped stage; everything else runs strictly one after another.
+        """
         ctx = PipelineContext()
         runtime = TaskRuntimeContext.for_task(task_id, task_manager=self.task_manager)
+        streaming = settings.PIPELINE_STREAMING if streaming is None else streaming
         logger.info(f"Starting pipeline with {len(steps)} steps. TaskID: {task_id}")
 
         try:
             if task_id:
                 await runtime.update(status="running", cancelled=False, message="Starting pipeline...")
 
-            for i, step_req in enumerate(steps):
-                logger.info(f"Executing step {i+1}: {step_req.step_name}")
+            restored_steps = await self._restore_checkpoints(ctx, steps, task_id)
+            for i in range(restored_steps):
+                logger.info(f"Skipping step {i+1}: {steps[i].step_name} (restored from checkpoint)")
+
+            i = restored_steps
+            while i < len(steps):
+                step_req = steps[i]
+                fused = self._streams_into_next(steps, i, streaming)
+                step_label = (
+                    f"{step_req.step_name} + {steps[i + 1].step_name} (streaming)" if fused else step_req.step_name
+                )
+                logger.info(f"Executing step {i+1}: {step_label}")
 
                 if task_id:
                     await self._raise_if_control_requested(task_id)
 
                 try:
                     if task_id:
-                        await runtime.update(message=f"Executing step: {step_req.step_name}")
-
-                    start_time = time.time()
-                    status = "success"
-                    error_msg = None
-
-                    try:
-                        step_instance = StepRegistry.get_step(step_req.step_name)
-                        params_dict = step_req.params.model_dump()
-                        await step_instance.execute(ctx, params_dict, task_id)
-                        ctx.history.append(step_req.step_name)
-                    except Exception as step_err:
-                        status = "failed"
-                        error_msg = str(step_err)
-                        raise step_err
-                    finally:
-                        duration = time.time() - start_time
-                        ctx.add_trace(step_req.step_name, duration, status, error_msg)
+                        await runtime.update(message=f"Executing step: {step_label}")
+
+                    if fused:
+                        await self._run_streaming_pair(ctx, runtime, task_id, i, step_req, steps[i + 1])
+                    else:
+                        await self._run_step(ctx, task_id, i, step_req)
 
                 except (TaskPauseRequested, TaskCancelRequested):
                     raise
                 except Exception as e:
-                    logger.error(f"Pipeline failed at step {step_req.step_name}: {e}")
+                    failed_step = ctx.trace[-1]["step"] if ctx.trace else step_req.step_name
+                    logger.error(f"Pipeline failed at step {failed_step}: {e}")
                     if task_id:
                         await runtime.update(
                             status="failed",
                             error=str(e),
-                            message=f"Failed at {step_req.step_name}",
+                            message=f"Failed at {failed_step}",
                         )
                     raise e
 
+                i += 2 if fused else 1
+
             if task_id:
                 await self._raise_if_control_requested(task_id)
                 files = []
@@ -111,6 +422,8 @@ class PipelineRunner:
                     message="Pipeline completed",
                     result=task_result.model_dump(),
                 )
+                if self._checkpoints_enabled(task_id):
+                    await self.checkpoint_store.clear_pipeline_checkpoints(task_id)
 
             return {
                 "status": "completed",
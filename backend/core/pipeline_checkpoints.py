@@ -0,0 +1,86 @@
+"""
+Fingerprints for pipeline step checkpoints.
+
+A checkpoint records what a step added to the pipeline context plus the
+size, mtime and sampled fingerprint (artifact_cache.file_fingerprint) of
+every file it read or produced. On resume a step is skipped only while its
+parameters, the context it started from and all of those files are
+unchanged. Sampling keeps a checkpoint to a few MiB of reads per file, even
+for the multi-gigabyte source video every step references.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from backend.utils.artifact_cache import file_fingerprint
+
+
+def digest_json(value: Any) -> str:
+    payload = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def to_json_safe(value: Any) -> Any:
+    """Round-trip through JSON so Path and model values fit a JSON column."""
+    return json.loads(json.dumps(value, ensure_ascii=False, default=str))
+
+
+def data_delta(before: dict, after: dict) -> dict:
+    """Keys a step added or changed in ctx.data."""
+    return {
+        key: value
+        for key, value in after.items()
+        if key not in before or digest_json(before[key]) != digest_json(value)
+    }
+
+
+def referenced_paths(data: dict) -> list[str]:
+    """Paths named by *_path values and *_ref media refs that exist as files."""
+    paths = []
+    for key, value in data.items():
+        if key.endswith("_ref") and isinstance(value, dict):
+            value = value.get("path")
+        elif not key.endswith("_path"):
+            continue
+        if isinstance(value, os.PathLike):
+            value = os.fspath(value)
+        if isinstance(value, str) and value and value not in paths and Path(value).is_file():
+            paths.append(value)
+    return paths
+
+
+def fingerprint_files(paths: Iterable[str]) -> list[dict]:
+    fingerprints = []
+    for path in paths:
+        stat = Path(path).stat()
+        fingerprints.append({
+            "path": path,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "fingerprint": file_fingerprint(path),
+        })
+    return fingerprints
+
+
+def first_changed_file(fingerprints: Iterable[dict]) -> Optional[str]:
+    """
+    Path of the first file that no longer matches its fingerprint, or None.
+
+    A file whose size or mtime moved counts as changed; otherwise its
+    sampled fingerprint is compared, which catches edits that kept both.
+    Checkpoints written before fingerprints were sampled are checked on
+    size and mtime only.
+    """
+    for fingerprint in fingerprints:
+        path = Path(fingerprint["path"])
+        try:
+            stat = path.stat()
+        except OSError:
+            return fingerprint["path"]
+        if stat.st_size != fingerprint["size"] or stat.st_mtime_ns != fingerprint["mtime_ns"]:
+            return fingerprint["path"]
+        if "fingerprint" in fingerprint and file_fingerprint(str(path)) != fingerprint["fingerprint"]:
+            return fingerprint["path"]
+    return None
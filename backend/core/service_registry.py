@@ -10,7 +10,8 @@ from backend.core.service_assembly import ServiceAssembly, ServiceProvider
 def _create_pipeline_runner(container):
     from backend.core.pipeline import PipelineRunner
 
-    return PipelineRunner(task_manager=container.get(Services.TASK_MANAGER))
+    task_manager = container.get(Services.TASK_MANAGER)
+    return PipelineRunner(task_manager=task_manager, checkpoint_store=task_manager)
 
 
 def _create_task_orchestrator(container):
@@ -30,26 +31,37 @@ def _create_task_orchestrator(container):
 
 
 def _create_task_manager(container):
+    from backend.core.tasks.registry import TaskHandlerRegistry
     from backend.services.task_event_publisher import TaskEventPublisher
     from backend.services.task_queue_view import TaskQueueView
     from backend.services.task_control_service import TaskControlService
+    from backend.services.task_progress_store import TaskProgressStore
     from backend.services.task_repository import TaskRepository
     from backend.services.task_runtime_state import TaskRuntimeState
     from backend.services.task_manager import TaskManager
 
+    repository = TaskRepository()
     return TaskManager(
-        repository=TaskRepository(),
-        event_publisher=TaskEventPublisher(container.get(Services.WS_NOTIFIER)),
+        repository=repository,
+        event_publisher=TaskEventPublisher(
+            container.get(Services.WS_NOTIFIER),
+            max_patches_per_sec=settings.WS_PROGRESS_EVENTS_PER_SEC,
+        ),
         queue_view=TaskQueueView(),
         control_service=TaskControlService(),
         runtime_state=TaskRuntimeState(),
+        progress_store=TaskProgressStore(
+            repository,
+            flush_interval_s=settings.TASK_PROGRESS_FLUSH_INTERVAL_MS / 1000.0,
+        ),
+        resource_profile=TaskHandlerRegistry.resource_profile,
     )
 
 
 def _create_ws_notifier(_container):
     from backend.core.ws_notifier import WebSocketNotifier
 
-    return WebSocketNotifier()
+    return WebSocketNotifier(max_pending_per_client=settings.WS_CLIENT_QUEUE_SIZE)
 
 
 def _create_asr_service(_container):
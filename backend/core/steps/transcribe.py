@@ -11,7 +11,8 @@ class TranscribeStep(PipelineStep):
     def name(self) -> str:
         return "transcribe"
 
-    async def execute(self, ctx: PipelineContext, params: dict, task_id: str = None):
+    @staticmethod
+    def resolve_audio_path(ctx: PipelineContext, params: dict) -> str:
         # Try to get path from previous step (download) or params
         audio_path = (
             ctx.get_media_path("audio_ref", "audio_path", "video_path")
@@ -20,33 +21,38 @@ class TranscribeStep(PipelineStep):
         )
         if not audio_path:
             raise ValueError("Transcribe step requires 'audio_path' (or result from download step)")
+        return audio_path
 
-        model = params.get("model", "base")
-        device = params.get("device", "cpu")
-        language = params.get("language")
-        initial_prompt = params.get("initial_prompt")
-        
-        # Also run transcribe in executor because it blocks!
-        runtime = TaskRuntimeContext.for_task(task_id)
+    def run_transcription(
+        self,
+        audio_path: str,
+        params: dict,
+        task_id: str = None,
+        progress_callback=None,
+        segment_callback=None,
+    ):
+        """Blocking ASR call; segment_callback receives finalized segments as they are ready."""
         asr_service = RuntimeServices.asr()
-        progress_cb = runtime.build_progress_callback()
-        
-        result = await runtime.run_blocking(
-            lambda: asr_service.transcribe(
-                audio_path=audio_path,
-                model_name=model,
-                device=device,
-                language=language,
-                initial_prompt=initial_prompt,
-                task_id=task_id,
-                progress_callback=progress_cb
-            )
+        return asr_service.transcribe(
+            audio_path=audio_path,
+            model_name=params.get("model", "base"),
+            device=params.get("device", "cpu"),
+            language=params.get("language"),
+            initial_prompt=params.get("initial_prompt"),
+            task_id=task_id,
+            progress_callback=progress_callback,
+            segment_callback=segment_callback,
         )
-        
+
+    def apply_result(self, ctx: PipelineContext, result, audio_path: str, params: dict, runtime: TaskRuntimeContext):
         if not result.success:
             runtime.checkpoint()
             raise Exception(result.error or "Transcription failed")
 
+        if result.meta.get("cache") == "hit":
+            ctx.mark_cache_hit(self.name)
+
+        language = params.get("language")
         text = result.meta.get("text", "")
         segments = result.meta.get("segments", [])
         detected_language = result.meta.get("language", language or "auto")
@@ -79,6 +85,18 @@ class TranscribeStep(PipelineStep):
              
         logger.success(f"Step Transcribe finished. Text len: {len(text)}")
 
+    async def execute(self, ctx: PipelineContext, params: dict, task_id: str = None):
+        audio_path = self.resolve_audio_path(ctx, params)
+
+        # Also run transcribe in executor because it blocks!
+        runtime = TaskRuntimeContext.for_task(task_id)
+        progress_cb = runtime.build_progress_callback()
+        
+        result = await runtime.run_blocking(
+            lambda: self.run_transcription(audio_path, params, task_id, progress_cb)
+        )
+        self.apply_result(ctx, result, audio_path, params, runtime)
+
 
 # Register at module level
 StepRegistry.register(TranscribeStep())
@@ -13,6 +13,13 @@ class TranslateStep(PipelineStep):
     def name(self) -> str:
         return "translate"
 
+    @staticmethod
+    def require_target_language(params: dict) -> str:
+        target_language = params.get("target_language")
+        if not target_language:
+            raise ValueError("Translate step requires 'target_language' param")
+        return target_language
+
     async def execute(self, ctx: PipelineContext, params: dict, task_id: str = None):
         # 1. Input Validation
         segments_data = ctx.get("segments")
@@ -21,10 +28,7 @@ class TranslateStep(PipelineStep):
 
         segments = [SubtitleSegment(**s) if isinstance(s, dict) else s for s in segments_data]
 
-        target_language = params.get("target_language")
-        if not target_language:
-            raise ValueError("Translate step requires 'target_language' param")
-
+        target_language = self.require_target_language(params)
         mode = params.get("mode", "standard")
 
         # 2. Dependencies
@@ -40,10 +44,15 @@ class TranslateStep(PipelineStep):
                 progress_callback=runtime.build_progress_callback()
             )
         )
-        
+
+        self.store_output(ctx, params, translated_segments)
+
+    def store_output(self, ctx: PipelineContext, params: dict, translated_segments) -> None:
         if not translated_segments:
             raise Exception("Translation produced no segments")
 
+        target_language = params.get("target_language")
+
         # 4. Save Output
         # Determine output path based on input specific inputs if available
         # But usually we want it next to the source audio/video
@@ -2,12 +2,32 @@ from abc import ABC, abstractmethod
 from collections.abc import Awaitable, Callable
 from backend.models.task_model import Task
 
+# Resource pools the task scheduler runs tasks in. Each pool has its own
+# concurrency limit so one kind of work cannot occupy every worker.
+RESOURCE_NETWORK = "network"
+RESOURCE_COMPUTE = "compute"  # CPU/GPU inference: ASR, OCR, preprocessing
+RESOURCE_ENCODER = "encoder"
+RESOURCE_LLM = "llm"
+RESOURCE_CLASSES = (RESOURCE_NETWORK, RESOURCE_COMPUTE, RESOURCE_ENCODER, RESOURCE_LLM)
+
+# Higher runs first within a pool.
+PRIORITY_NORMAL = 0
+PRIORITY_INTERACTIVE = 10
+
+
 class TaskHandler(ABC):
     """
     Abstract base class for all task handlers.
     Each handler is responsible for rebuilding a runnable task coroutine.
     """
-    
+
+    resource_class: str = RESOURCE_COMPUTE
+    priority: int = PRIORITY_NORMAL
+
+    def get_resource_class(self, task: Task) -> str:
+        """Pool the task runs in; override when it depends on the request."""
+        return self.resource_class
+
     @abstractmethod
     def build_runner(self, task: Task) -> Callable[[], Awaitable[None]]:
         """
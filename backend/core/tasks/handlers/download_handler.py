@@ -1,7 +1,7 @@
 from collections.abc import Awaitable, Callable
 
 from backend.core.runtime_access import RuntimeServices
-from backend.core.tasks.base import TaskHandler
+from backend.core.tasks.base import RESOURCE_NETWORK, TaskHandler
 from backend.core.tasks.registry import TaskHandlerRegistry
 from backend.models.schemas import PipelineRequest
 from backend.models.task_model import Task
@@ -11,7 +11,9 @@ from backend.models.task_model import Task
 class DownloadHandler(TaskHandler):
     """Rebuilds single-step download tasks through the pipeline runner."""
 
+    resource_class = RESOURCE_NETWORK
+
     def build_runner(self, task: Task) -> Callable[[], Awaitable[None]]:
         req = PipelineRequest(**task.request_params)
         pipeline_runner = RuntimeServices.pipeline_runner()
-        return lambda: pipeline_runner.run(req.steps, task.id)
+        return lambda: pipeline_runner.run(req.steps, task.id, streaming=req.streaming)
@@ -2,19 +2,49 @@ from collections.abc import Awaitable, Callable
 from backend.models.task_model import Task
 from backend.models.schemas import PipelineRequest
 from backend.core.runtime_access import RuntimeServices
-from backend.core.tasks.base import TaskHandler
+from backend.core.tasks.base import (
+    RESOURCE_COMPUTE,
+    RESOURCE_ENCODER,
+    RESOURCE_LLM,
+    RESOURCE_NETWORK,
+    TaskHandler,
+)
 from backend.core.tasks.registry import TaskHandlerRegistry
 from loguru import logger
 
+STEP_RESOURCE_CLASSES = {
+    "download": RESOURCE_NETWORK,
+    "transcribe": RESOURCE_COMPUTE,
+    "translate": RESOURCE_LLM,
+    "synthesize": RESOURCE_ENCODER,
+}
+# Pools from heaviest to lightest; a pipeline runs in the heaviest pool any
+# of its steps needs.
+RESOURCE_WEIGHT_ORDER = (RESOURCE_COMPUTE, RESOURCE_ENCODER, RESOURCE_LLM, RESOURCE_NETWORK)
+
+
 @TaskHandlerRegistry.register("pipeline")
 class PipelineHandler(TaskHandler):
     """Handles general pipeline tasks (like video download/process)."""
 
+    def get_resource_class(self, task: Task) -> str:
+        # A pipeline holds one slot for its whole run, so it is counted against
+        # the pool of its heaviest step: a download + transcribe pipeline must
+        # not run ASR outside the compute pool's limit. Download-only
+        # pipelines (playlists) stay in the network pool.
+        steps = (task.request_params or {}).get("steps") or []
+        pools = {
+            STEP_RESOURCE_CLASSES.get(step.get("step_name"), self.resource_class)
+            for step in steps
+            if isinstance(step, dict)
+        }
+        return next((pool for pool in RESOURCE_WEIGHT_ORDER if pool in pools), self.resource_class)
+
     def build_runner(self, task: Task) -> Callable[[], Awaitable[None]]:
         try:
             req = PipelineRequest(**task.request_params)
             pipeline_runner = RuntimeServices.pipeline_runner()
-            return lambda: pipeline_runner.run(req.steps, task.id)
+            return lambda: pipeline_runner.run(req.steps, task.id, streaming=req.streaming)
         except Exception as e:
             logger.error(f"Failed to resume pipeline task {task.id}: {e}")
             raise
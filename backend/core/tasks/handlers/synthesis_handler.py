@@ -2,7 +2,7 @@ from collections.abc import Awaitable, Callable
 from backend.models.schemas import SynthesisRequest
 from backend.models.task_model import Task
 from backend.application.synthesis_service import run_synthesis_task
-from backend.core.tasks.base import TaskHandler
+from backend.core.tasks.base import RESOURCE_ENCODER, TaskHandler
 from backend.core.tasks.registry import TaskHandlerRegistry
 from loguru import logger
 
@@ -10,6 +10,8 @@ from loguru import logger
 class SynthesisHandler(TaskHandler):
     """Handles video synthesis tasks."""
 
+    resource_class = RESOURCE_ENCODER
+
     def build_runner(self, task: Task) -> Callable[[], Awaitable[None]]:
         try:
             req = SynthesisRequest(**task.request_params)
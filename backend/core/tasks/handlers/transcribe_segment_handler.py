@@ -3,7 +3,7 @@ from collections.abc import Awaitable, Callable
 from backend.application.transcription_service import supported_kwargs
 from backend.core.runtime_access import RuntimeServices
 from backend.core.task_runner import BackgroundTaskRunner
-from backend.core.tasks.base import TaskHandler
+from backend.core.tasks.base import PRIORITY_INTERACTIVE, TaskHandler
 from backend.core.tasks.registry import TaskHandlerRegistry
 from backend.models.schemas import TranscribeSegmentRequest
 from backend.models.task_model import Task
@@ -13,6 +13,9 @@ from backend.models.task_model import Task
 class TranscribeSegmentHandler(TaskHandler):
     """Handles long segment transcription tasks."""
 
+    # Editor requests a user is waiting on; run ahead of queued batch work.
+    priority = PRIORITY_INTERACTIVE
+
     def build_runner(self, task: Task) -> Callable[[], Awaitable[None]]:
         req = TranscribeSegmentRequest(**task.request_params)
         service = RuntimeServices.asr()
@@ -4,7 +4,7 @@ from backend.application.translation_service import (
     TranslationRequest,
     run_translation_task,
 )
-from backend.core.tasks.base import TaskHandler
+from backend.core.tasks.base import RESOURCE_LLM, TaskHandler
 from backend.core.tasks.registry import TaskHandlerRegistry
 from backend.models.task_model import Task
 
@@ -13,6 +13,8 @@ from backend.models.task_model import Task
 class TranslateHandler(TaskHandler):
     """Handles translation tasks."""
 
+    resource_class = RESOURCE_LLM
+
     def build_runner(self, task: Task) -> Callable[[], Awaitable[None]]:
         req = TranslationRequest(**task.request_params)
         return lambda: run_translation_task(task.id, req)
@@ -1,7 +1,8 @@
 from importlib import import_module
 from typing import Dict, Type, Optional
 from backend.config import settings
-from backend.core.tasks.base import TaskHandler
+from backend.core.tasks.base import PRIORITY_NORMAL, RESOURCE_COMPUTE, TaskHandler
+from backend.models.task_model import Task
 from loguru import logger
 
 
@@ -57,6 +58,14 @@ class TaskHandlerRegistry:
             return None
         return handler_cls()
 
+    @classmethod
+    def resource_profile(cls, task: Task) -> tuple[str, int]:
+        """(resource pool, priority) for scheduling a task, from its handler."""
+        handler = cls.get(task.type)
+        if handler is None:
+            return RESOURCE_COMPUTE, PRIORITY_NORMAL
+        return handler.get_resource_class(task), handler.priority
+
     @classmethod
     def clear(cls) -> None:
         cls._handlers.clear()
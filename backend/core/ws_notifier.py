@@ -4,50 +4,117 @@ WebSocket connection management and broadcast.
 Separated from TaskManager (Issue #4) to follow Single Responsibility:
   - TaskManager: task CRUD + DB persistence
   - WebSocketNotifier: connection lifecycle + push notifications
+
+Each client gets a bounded send queue drained by its own sender coroutine, so
+broadcasting never awaits a socket and one slow window cannot stall the task
+loop. A client whose queue overflows is disconnected; the renderer reconnects
+and resyncs from the snapshot sent on connect.
 """
 
-from typing import List
+import asyncio
+from typing import Dict, List
 from fastapi import WebSocket
 from loguru import logger
 
+# WebSocket close code 1013: "Try Again Later".
+_SLOW_CLIENT_CLOSE_CODE = 1013
+
+
+class _ClientChannel:
+    def __init__(self, websocket: WebSocket, max_pending: int):
+        self.websocket = websocket
+        self.queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=max_pending)
+        self.sender: asyncio.Task | None = None
+
 
 class WebSocketNotifier:
     """Manages WebSocket connections and broadcasts task updates."""
 
-    def __init__(self):
+    def __init__(self, max_pending_per_client: int = 256):
         self.active_connections: List[WebSocket] = []
+        self._max_pending_per_client = max(1, max_pending_per_client)
+        self._channels: Dict[int, _ClientChannel] = {}
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
+        channel = _ClientChannel(websocket, self._max_pending_per_client)
+        channel.sender = asyncio.create_task(self._send_loop(channel))
+        self._channels[id(websocket)] = channel
         self.active_connections.append(websocket)
         logger.info(f"WebSocket connected. Total: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket):
+        channel = self._channels.pop(id(websocket), None)
+        if channel and channel.sender and channel.sender is not asyncio.current_task():
+            channel.sender.cancel()
         if websocket in self.active_connections:
             self.active_connections.remove(websocket)
             logger.info(f"WebSocket disconnected. Total: {len(self.active_connections)}")
 
-    async def broadcast(self, message: dict):
-        """Broadcast message to all connected clients."""
-        disconnected = []
-        for connection in self.active_connections:
+    def broadcast_nowait(self, message: dict) -> None:
+        """Queue a message for every client without waiting on any socket."""
+        for channel in list(self._channels.values()):
             try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.warning(f"Failed to send to client: {e}")
-                disconnected.append(connection)
+                channel.queue.put_nowait(message)
+            except asyncio.QueueFull:
+                logger.warning("WebSocket client fell behind; dropping connection so it can resync.")
+                self.disconnect(channel.websocket)
+                asyncio.create_task(self._close_quietly(channel.websocket))
 
-        for connection in disconnected:
-            self.disconnect(connection)
+    async def broadcast(self, message: dict):
+        """Broadcast message to all connected clients."""
+        self.broadcast_nowait(message)
 
     async def send_snapshot(self, websocket: WebSocket, tasks_data: list):
         """Send all current tasks to a specific client (initial sync)."""
+        message = {
+            "type": "snapshot",
+            "tasks": tasks_data,
+        }
+        channel = self._channels.get(id(websocket))
+        if channel is not None:
+            try:
+                channel.queue.put_nowait(message)
+                return
+            except asyncio.QueueFull:
+                pass
         try:
-            await websocket.send_json({
-                "type": "snapshot",
-                "tasks": tasks_data,
-            })
+            await websocket.send_json(message)
         except Exception as e:
             logger.error(f"Error sending snapshot: {repr(e)}")
             if "disconnect" in str(e).lower() or "closed" in str(e).lower():
                 raise
+
+    async def drain(self) -> None:
+        """Wait until every queued message has been handed to its socket."""
+        await asyncio.gather(
+            *(channel.queue.join() for channel in list(self._channels.values())),
+        )
+
+    async def _send_loop(self, channel: _ClientChannel) -> None:
+        while True:
+            message = await channel.queue.get()
+            try:
+                await channel.websocket.send_json(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Failed to send to client: {e}")
+                self.disconnect(channel.websocket)
+                self._discard_pending(channel)
+                return
+            finally:
+                channel.queue.task_done()
+
+    @staticmethod
+    def _discard_pending(channel: _ClientChannel) -> None:
+        while not channel.queue.empty():
+            channel.queue.get_nowait()
+            channel.queue.task_done()
+
+    @staticmethod
+    async def _close_quietly(websocket: WebSocket) -> None:
+        try:
+            await websocket.close(code=_SLOW_CLIENT_CLOSE_CODE)
+        except Exception:
+            pass
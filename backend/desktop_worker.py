@@ -15,6 +15,8 @@ from backend.desktop.worker_context import emit, emit_error
 from backend.core.container import container
 from backend.core.runtime_access import configure_runtime_services
 from backend.core.service_registry import register_desktop_worker_services
+from backend.services.translator.translation_memory import translation_memory
+from backend.utils.pcm_audio import pcm_cache
 
 _worker_runtime_bootstrapped = False
 
@@ -70,6 +72,9 @@ def ensure_worker_runtime_bootstrapped() -> None:
     container.clear()
     register_desktop_worker_services(container)
     configure_runtime_services(container)
+    pcm_cache.remove_stale_files()
+    if translation_memory.enabled():
+        translation_memory.start_eviction()
     _worker_runtime_bootstrapped = True
 
 
@@ -134,6 +139,9 @@ def main() -> None:
                 emit_error(str(request_id) if request_id is not None else None, str(exc))
             traceback.print_exc(file=sys.stderr)
 
+    pcm_cache.clear()
+    translation_memory.close()
+
 
 if __name__ == "__main__":
     main()
@@ -28,7 +28,7 @@ class MediaReference(BaseModel):
     role: Optional[str] = None
     origin: Optional[str] = None
 
-TranscriptionEngine = Literal["builtin", "cli"]
+TranscriptionEngine = Literal["builtin", "cli", "batched"]
 
 class TranscribeRequest(MediaInputModel):
     MEDIA_INPUT_SPECS = (("audio_path", "audio_ref"),)
@@ -64,6 +64,9 @@ class TaskResponse(BaseModel):
     status: str
     message: str = "Task started"
 
+class TaskMoveRequest(BaseModel):
+    position: int = Field(ge=1, description="1-based position in the pending queue")
+
 # Step Params (used in PipelineStepRequest discriminated union)
 
 class DownloadParams(BaseModel):
@@ -205,6 +208,8 @@ class PipelineRequest(BaseModel):
     pipeline_id: str = "default_ingest_flow"
     task_name: Optional[str] = None
     steps: List[PipelineStepRequest]
+    # Overlap transcribe and translate; None falls back to PIPELINE_STREAMING.
+    streaming: Optional[bool] = None
 
 class PlaylistItem(BaseModel):
     """Single item in a playlist."""
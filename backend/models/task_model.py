@@ -6,11 +6,11 @@ from pydantic import ConfigDict
 class Task(SQLModel, table=True):
     id: str = Field(primary_key=True)
     name: Optional[str] = Field(default=None) # User friendly name
-    type: str  # "download", "transcribe", etc.
-    status: str  # "pending", "running", "completed", "failed", "cancelled", "paused"
+    type: str = Field(index=True)  # "download", "transcribe", etc.
+    status: str = Field(index=True)  # "pending", "running", "completed", "failed", "cancelled", "paused"
     progress: float = Field(default=0.0)
     message: str = Field(default="")
-    created_at: float = Field(default_factory=time.time)
+    created_at: float = Field(default_factory=time.time, index=True)
     
     # JSON Fields (Use explicit column type for SQLite compatibility)
     result: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON))
@@ -19,3 +19,29 @@ class Task(SQLModel, table=True):
     request_params: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON))
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class TaskResultRecord(SQLModel, table=True):
+    """Large result fields split off a Task row; see task_result_compactor."""
+
+    __tablename__ = "task_result"
+
+    task_id: str = Field(primary_key=True)
+    payload: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON))
+    size_bytes: int = Field(default=0)
+    updated_at: float = Field(default_factory=time.time)
+
+
+class PipelineCheckpoint(SQLModel, table=True):
+    """Outputs of one completed pipeline step, used to skip it on resume."""
+
+    __tablename__ = "pipeline_checkpoint"
+
+    task_id: str = Field(primary_key=True)
+    step_index: int = Field(primary_key=True)
+    step_name: str
+    params_digest: str
+    input_digest: str
+    data: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON))
+    files: List[Dict[str, Any]] = Field(default_factory=list, sa_column=Column(JSON))
+    created_at: float = Field(default_factory=time.time)
@@ -0,0 +1,144 @@
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from loguru import logger
+
+from backend.config import settings
+
+# Fixed plan used with one replica or with ASR_ADAPTIVE_CHUNKING off: split
+# only long files (to bound memory and stream chunks), into ~10 min chunks.
+LEGACY_SPLIT_THRESHOLD_S = 900
+LEGACY_CHUNK_S = 600
+# Compute seconds per audio second on one replica, assumed until a job on
+# that model/device has been measured.
+DEFAULT_RTF = {"cpu": 0.25, "cuda": 0.04}
+# Wall-clock cost of each chunk beyond decoding it (slicing, VAD, the first
+# window's warm-up). A chunk should take at least MIN_CHUNK_WORK_FACTOR times
+# this to run, so the overhead stays a small share.
+CHUNK_OVERHEAD_S = 2.0
+MIN_CHUNK_WORK_FACTOR = 15
+# Chunks planned per replica, so longest-first scheduling can even out the
+# tail instead of one replica finishing the last big chunk alone.
+CHUNKS_PER_REPLICA = 2
+MIN_CHUNK_S = 60
+MAX_CHUNK_S = 900
+# Below this much expected compute a file is transcribed directly.
+MIN_SPLIT_WORK_S = 30
+# Weight of the newest measurement in the smoothed RTF.
+RTF_SMOOTHING = 0.3
+
+
+@dataclass(frozen=True)
+class ChunkPlan:
+    strategy: str  # "direct" or "smart_split"
+    chunk_s: float
+    rtf: float
+    replicas: int
+
+    def as_meta(self) -> dict:
+        return {
+            "strategy": self.strategy,
+            "chunk_s": round(self.chunk_s, 1),
+            "rtf": round(self.rtf, 4),
+            "replicas": self.replicas,
+        }
+
+
+def default_rtf(device: str) -> float:
+    return DEFAULT_RTF.get(device, DEFAULT_RTF["cpu"])
+
+
+def plan_transcription(duration: float, replicas: int, rtf: float, adaptive: bool = True) -> ChunkPlan:
+    """
+    Strategy and target chunk length for a file of the given duration.
+
+    replicas is the number of model instances that can transcribe at once
+    (sized from the machine's cores, see resolve_model_parallelism) and rtf
+    the expected real-time factor of one of them. Chunks aim for
+    CHUNKS_PER_REPLICA per replica, but never so short that per-chunk
+    overhead dominates, within MIN_CHUNK_S..MAX_CHUNK_S. Files shorter than
+    two such chunks, or too quick to be worth splitting, go direct. Files
+    past LEGACY_SPLIT_THRESHOLD_S are always split.
+    """
+    replicas = max(1, replicas)
+    if not adaptive or replicas == 1:
+        strategy = "smart_split" if duration > LEGACY_SPLIT_THRESHOLD_S else "direct"
+        return ChunkPlan(strategy, LEGACY_CHUNK_S, rtf, replicas)
+
+    floor_s = CHUNK_OVERHEAD_S * MIN_CHUNK_WORK_FACTOR / max(rtf, 1e-3)
+    chunk_s = min(MAX_CHUNK_S, max(MIN_CHUNK_S, floor_s, duration / (replicas * CHUNKS_PER_REPLICA)))
+    split = duration > LEGACY_SPLIT_THRESHOLD_S or (
+        duration >= 2 * chunk_s and duration * rtf >= MIN_SPLIT_WORK_S
+    )
+    return ChunkPlan("smart_split" if split else "direct", chunk_s, rtf, replicas)
+
+
+class RtfHistory:
+    """
+    Smoothed real-time factor per (model, device), persisted as JSON under
+    USER_DATA_DIR so later jobs plan their chunks from what this machine
+    actually achieved. Writes go to a temporary file and are swapped in.
+    """
+
+    FILENAME = "asr_rtf_history.json"
+
+    def __init__(self, path: Optional[Path] = None):
+        self._path = path
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, dict]] = None
+
+    def _file(self) -> Path:
+        return Path(self._path or Path(settings.USER_DATA_DIR) / self.FILENAME)
+
+    @staticmethod
+    def _key(model_name: str, device: str) -> str:
+        return f"{model_name}|{device}"
+
+    def _load_locked(self) -> Dict[str, dict]:
+        if self._entries is None:
+            self._entries = {}
+            path = self._file()
+            if path.exists():
+                try:
+                    data = json.loads(path.read_text(encoding="utf-8"))
+                    self._entries = {key: value for key, value in data.items() if isinstance(value, dict)}
+                except Exception as e:
+                    logger.warning(f"Ignoring unreadable RTF history {path}: {e}")
+        return self._entries
+
+    def get(self, model_name: str, device: str) -> Optional[float]:
+        with self._lock:
+            entry = self._load_locked().get(self._key(model_name, device))
+        return float(entry["rtf"]) if entry and entry.get("rtf") else None
+
+    def record(self, model_name: str, device: str, audio_s: float, compute_s: float) -> Optional[float]:
+        """Fold one measurement (compute seconds for audio seconds) in; returns the new smoothed RTF."""
+        if audio_s <= 0 or compute_s <= 0:
+            return None
+        measured = compute_s / audio_s
+        with self._lock:
+            entries = self._load_locked()
+            key = self._key(model_name, device)
+            entry = entries.get(key) or {}
+            previous = entry.get("rtf")
+            rtf = measured if not previous else (1 - RTF_SMOOTHING) * float(previous) + RTF_SMOOTHING * measured
+            entries[key] = {"rtf": round(rtf, 5), "samples": int(entry.get("samples", 0)) + 1}
+            self._save_locked(entries)
+        return rtf
+
+    def _save_locked(self, entries: Dict[str, dict]) -> None:
+        path = self._file()
+        temp_path = path.with_name(f"{path.name}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_text(json.dumps(entries, indent=2), encoding="utf-8")
+            os.replace(temp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to save RTF history {path}: {e}")
+
+
+rtf_history = RtfHistory()
@@ -1,12 +1,19 @@
-from typing import List, Any
+from typing import Any, Callable, List, Optional, Tuple
 from pathlib import Path
 import shutil
+import time
 from loguru import logger
 from backend.config import settings
 from backend.models.schemas import SubtitleSegment
 from backend.utils.audio_processor import AudioProcessor
+from backend.utils.pcm_audio import PcmAudio
 from backend.utils.subtitle_manager import SubtitleManager
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# Whisper scores language on one 30 s window of audio.
+_LANGUAGE_WINDOW_S = 30.0
+# Below this mean probability the pre-pass result is not pinned.
+_MIN_PINNED_LANGUAGE_PROBABILITY = 0.5
 
 class CoreStrategies:
     def __init__(self, executor: ThreadPoolExecutor):
@@ -30,60 +37,417 @@ class CoreStrategies:
         segments_list = list(segments_gen)
         return SubtitleManager.refine_segments(segments_list, max_chars=50)
 
-    def transcribe_smart_split(self, audio_path: str, duration: float, model: Any, language: str, initial_prompt: str, progress_callback) -> List[SubtitleSegment]:
-        """Handle long audio files by splitting them based on silence."""
+    def transcribe_clip(self, samples: Any, offset: float, model: Any, language: str, initial_prompt: str = None) -> List[SubtitleSegment]:
+        """Transcribe one short in-memory clip; segment times are shifted by offset."""
+        return self._process_chunk((samples, offset), model, language, initial_prompt)
+
+    def transcribe_smart_split(
+        self,
+        audio_path: str,
+        duration: float,
+        model: Any,
+        language: str,
+        initial_prompt: str,
+        progress_callback,
+        max_parallel: int = 1,
+        chunk_stats: Optional[List[dict]] = None,
+        on_chunk_ready: Optional[Callable[[float, List[SubtitleSegment]], None]] = None,
+        language_info: Optional[dict] = None,
+        target_chunk_s: float = 600,
+    ) -> List[SubtitleSegment]:
+        """
+        Handle long audio files by splitting them based on silence, into
+        chunks of about target_chunk_s with boundaries snapped to silences.
+
+        The media is decoded to 16 kHz PCM once; silence detection and every
+        chunk read from that buffer, and chunks go to the model as arrays
+        without touching WORKSPACE_DIR. If that decode fails the older path
+        (ffmpeg silencedetect plus one WAV file per chunk) is used instead.
+
+        Up to max_parallel chunks are in flight at once (one per model replica),
+        longest first, and a new chunk is submitted as soon as one finishes so
+        no replica sits idle behind a slow chunk. Per-chunk timings are appended
+        to chunk_stats when a list is given. on_chunk_ready(offset, segments)
+        is called for each chunk in timeline order, as soon as it and every
+        chunk before it have finished.
+
+        With no language given, it is detected once up front (see
+        pin_language) and used for every chunk; the detection is written to
+        language_info when a dict is given.
+        """
         logger.info("Long audio detected. Using VAD Smart Splitting strategy.")
+        if progress_callback: progress_callback(10, "Decoding audio...")
+
+        try:
+            pcm = PcmAudio.decode(audio_path)
+        except Exception as e:
+            logger.warning(f"Single-pass PCM decode failed ({e}); falling back to chunk files.")
+            return self._transcribe_chunk_files(
+                audio_path, duration, model, language, initial_prompt, progress_callback,
+                max_parallel, chunk_stats, on_chunk_ready, target_chunk_s,
+            )
+
+        with pcm:
+            duration = pcm.duration or duration
+            silence_intervals = AudioProcessor.detect_silence_in_pcm(pcm)
+            split_points = AudioProcessor.calculate_split_points(duration, silence_intervals, target_chunk_s)
+            logger.info(f"Calculated {len(split_points)} split points: {[f'{p:.1f}s' for p in split_points]}")
+
+            bounds = list(zip([0.0] + split_points, split_points + [duration]))
+            chunks = [
+                (lambda start=start, end=end: pcm.slice(start, end), start, end - start)
+                for start, end in bounds
+            ]
+            language = self.pin_language(pcm, silence_intervals, model, language, len(chunks), language_info)
+            if progress_callback: progress_callback(20, f"Split into {len(chunks)} chunks. Starting transcription...")
+            return self._transcribe_chunks(
+                chunks, model, language, initial_prompt, progress_callback, max_parallel, chunk_stats,
+                on_chunk_ready,
+            )
+
+    def transcribe_batched(
+        self,
+        audio_path: str,
+        duration: float,
+        model: Any,
+        language: str,
+        initial_prompt: str,
+        progress_callback,
+        batch_size: int = 8,
+        chunk_stats: Optional[List[dict]] = None,
+        on_chunk_ready: Optional[Callable[[float, List[SubtitleSegment]], None]] = None,
+        language_info: Optional[dict] = None,
+    ) -> List[SubtitleSegment]:
+        """
+        Decode speech regions in batches instead of one window per call.
+
+        The media is decoded to 16 kHz PCM once and handed to faster-whisper's
+        BatchedInferencePipeline, which runs VAD over it a single time, packs
+        the speech regions into windows of up to 30 s and decodes batch_size
+        windows per model call. Audio longer than ASR_BATCHED_SPAN_S is fed in
+        spans cut at silences; each span's segments are refined on their word
+        timestamps, shifted to absolute time and passed to
+        on_chunk_ready(offset, segments) in timeline order. When there are
+        several spans and no language, it is pinned once as for smart-split.
+        """
+        from faster_whisper import BatchedInferencePipeline
+
+        logger.info(f"Batched speech-region transcription ({duration:.2f}s, batch size {batch_size}).")
+        if progress_callback: progress_callback(10, "Decoding audio...")
+        pipeline = BatchedInferencePipeline(model)
+
+        try:
+            pcm = PcmAudio.decode(audio_path)
+        except Exception as e:
+            logger.warning(f"Single-pass PCM decode failed ({e}); letting the pipeline decode {audio_path}.")
+            spans = [(lambda: audio_path, 0.0, duration)]
+            return self._transcribe_spans_batched(
+                spans, duration, pipeline, language, initial_prompt, progress_callback, batch_size,
+                chunk_stats, on_chunk_ready,
+            )
+
+        with pcm:
+            duration = pcm.duration or duration
+            split_points: List[float] = []
+            span_s = max(60, settings.ASR_BATCHED_SPAN_S)
+            if duration > span_s:
+                silence_intervals = AudioProcessor.detect_silence_in_pcm(pcm)
+                split_points = AudioProcessor.calculate_split_points(duration, silence_intervals, span_s)
+            bounds = list(zip([0.0] + split_points, split_points + [duration]))
+            spans = [
+                (lambda start=start, end=end: pcm.slice(start, end), start, end - start)
+                for start, end in bounds
+            ]
+            if split_points:
+                language = self.pin_language(pcm, silence_intervals, model, language, len(spans), language_info)
+            return self._transcribe_spans_batched(
+                spans, duration, pipeline, language, initial_prompt, progress_callback, batch_size,
+                chunk_stats, on_chunk_ready,
+            )
+
+    def _transcribe_spans_batched(
+        self,
+        spans: List[Tuple[Callable[[], Any], float, float]],
+        duration: float,
+        pipeline: Any,
+        language: str,
+        initial_prompt: str,
+        progress_callback,
+        batch_size: int,
+        chunk_stats: Optional[List[dict]],
+        on_chunk_ready: Optional[Callable[[float, List[SubtitleSegment]], None]],
+    ) -> List[SubtitleSegment]:
+        all_segments: List[SubtitleSegment] = []
+        total_s = duration or sum(span_duration for _load, _offset, span_duration in spans) or 1.0
+        reported = -1
+        if progress_callback: progress_callback(20, "Transcribing speech regions in batches...")
+
+        for load_audio, offset, span_duration in spans:
+            started_at = time.perf_counter()
+            segs, _info = pipeline.transcribe(
+                load_audio(),
+                batch_size=max(1, batch_size),
+                beam_size=5,
+                language=language,
+                vad_filter=True,
+                initial_prompt=initial_prompt,
+                word_timestamps=True,
+            )
+            segs_list = []
+            for seg in segs:
+                segs_list.append(seg)
+                progress = 20 + int(min(1.0, (offset + seg.end) / total_s) * 70)
+                if progress_callback and progress > reported:
+                    reported = progress
+                    progress_callback(progress, f"Transcribed {offset + seg.end:.0f}s / {total_s:.0f}s")
+
+            span_segments = self._offset_segments(
+                SubtitleManager.refine_segments(segs_list, max_chars=50), offset
+            )
+            elapsed_s = time.perf_counter() - started_at
+            rtf = elapsed_s / span_duration if span_duration > 0 else 0.0
+            logger.info(
+                f"Span at {offset:.1f}s ({span_duration:.1f}s audio) took {elapsed_s:.1f}s (RTF {rtf:.2f})"
+            )
+            if chunk_stats is not None:
+                chunk_stats.append({
+                    "offset": round(offset, 3),
+                    "duration": round(span_duration, 3),
+                    "elapsed_s": round(elapsed_s, 3),
+                    "rtf": round(rtf, 4),
+                })
+            all_segments.extend(span_segments)
+            if on_chunk_ready is not None:
+                on_chunk_ready(offset, span_segments)
+
+        return all_segments
+
+    def pin_language(
+        self,
+        pcm: PcmAudio,
+        silence_intervals: List[Tuple[float, float]],
+        model: Any,
+        language: Optional[str],
+        chunk_count: int,
+        language_info: Optional[dict] = None,
+    ) -> Optional[str]:
+        """
+        The language to pass to every chunk of a split transcription.
+
+        Whisper otherwise detects the language on each chunk separately: one
+        extra encoder pass per chunk, and chunks may disagree. Instead up to
+        ASR_LANGUAGE_DETECT_WINDOWS of the most speech-dense 30 s windows
+        (by the silence intervals already computed, never more windows than
+        chunks) are scored, their language probabilities summed and the best
+        language pinned if its mean probability reaches
+        _MIN_PINNED_LANGUAGE_PROBABILITY. ASR_PER_CHUNK_LANGUAGE keeps
+        per-chunk detection for genuinely multilingual media.
+        """
+        if language or settings.ASR_PER_CHUNK_LANGUAGE or chunk_count < 2:
+            return language
+
+        windows = self._speech_dense_windows(
+            pcm.duration, silence_intervals, min(chunk_count, max(1, settings.ASR_LANGUAGE_DETECT_WINDOWS)),
+        )
+        started_at = time.perf_counter()
+        totals: dict = {}
+        try:
+            for start in windows:
+                _language, _probability, all_probabilities = model.detect_language(
+                    audio=pcm.slice(start, start + _LANGUAGE_WINDOW_S),
+                )
+                for candidate, probability in all_probabilities:
+                    totals[candidate] = totals.get(candidate, 0.0) + probability
+        except Exception as e:
+            logger.warning(f"Language pre-pass failed ({e}); detecting per chunk.")
+            return None
+        if not totals:
+            return None
+
+        detected, score = max(totals.items(), key=lambda item: item[1])
+        probability = score / len(windows)
+        pinned = probability >= _MIN_PINNED_LANGUAGE_PROBABILITY
+        logger.info(
+            f"Detected language {detected} (p={probability:.2f}) on {len(windows)} window(s) "
+            f"in {time.perf_counter() - started_at:.1f}s; "
+            f"{'pinned for all chunks' if pinned else 'too uncertain, detecting per chunk'}."
+        )
+        if language_info is not None:
+            language_info.update({
+                "language": detected,
+                "probability": round(probability, 4),
+                "windows": [round(start, 3) for start in windows],
+                "pinned": pinned,
+            })
+        return detected if pinned else None
+
+    @staticmethod
+    def _speech_dense_windows(
+        duration: float,
+        silence_intervals: List[Tuple[float, float]],
+        count: int,
+    ) -> List[float]:
+        """Start times of the count 30 s windows with the least silence, in timeline order."""
+        starts = [float(start) for start in range(0, max(1, int(duration - _LANGUAGE_WINDOW_S) + 1), int(_LANGUAGE_WINDOW_S))]
+        silences = sorted(silence_intervals)
+        scored = []
+        first = 0
+        for start in starts:
+            end = start + _LANGUAGE_WINDOW_S
+            while first < len(silences) and silences[first][1] <= start:
+                first += 1
+            silent = 0.0
+            for silence_start, silence_end in silences[first:]:
+                if silence_start >= end:
+                    break
+                silent += min(end, silence_end) - max(start, silence_start)
+            scored.append((silent, start))
+        return sorted(start for _silent, start in sorted(scored)[:count])
+
+    def _transcribe_chunk_files(
+        self,
+        audio_path: str,
+        duration: float,
+        model: Any,
+        language: str,
+        initial_prompt: str,
+        progress_callback,
+        max_parallel: int,
+        chunk_stats: Optional[List[dict]],
+        on_chunk_ready: Optional[Callable[[float, List[SubtitleSegment]], None]] = None,
+        target_chunk_s: float = 600,
+    ) -> List[SubtitleSegment]:
         if progress_callback: progress_callback(10, "Splitting audio...")
 
         silence_intervals = AudioProcessor.detect_silence(audio_path)
-        split_points = AudioProcessor.calculate_split_points(duration, silence_intervals)
+        split_points = AudioProcessor.calculate_split_points(duration, silence_intervals, target_chunk_s)
         logger.info(f"Calculated {len(split_points)} split points: {[f'{p:.1f}s' for p in split_points]}")
         
         chunk_dir = settings.WORKSPACE_DIR / f"chunks_{Path(audio_path).stem}"
         chunk_dir.mkdir(parents=True, exist_ok=True)
-        
-        chunks = AudioProcessor.split_audio_physically(audio_path, split_points, chunk_dir)
-        logger.info(f"Split into {len(chunks)} physical chunks.")
-        
-        if progress_callback: progress_callback(20, f"Split into {len(chunks)} chunks. Starting transcription...")
 
+        try:
+            chunk_files = AudioProcessor.split_audio_physically(audio_path, split_points, chunk_dir)
+            logger.info(f"Split into {len(chunk_files)} physical chunks.")
+            
+            if progress_callback: progress_callback(20, f"Split into {len(chunk_files)} chunks. Starting transcription...")
+
+            chunks = [
+                (lambda path=path: path, offset, chunk_duration)
+                for (path, offset), chunk_duration in zip(
+                    chunk_files,
+                    self._chunk_durations(chunk_files, duration),
+                )
+            ]
+            return self._transcribe_chunks(
+                chunks, model, language, initial_prompt, progress_callback, max_parallel, chunk_stats,
+                on_chunk_ready,
+            )
+        finally:
+            if chunk_dir.exists():
+                shutil.rmtree(chunk_dir, ignore_errors=True)
+
+    def _transcribe_chunks(
+        self,
+        chunks: List[Tuple[Callable[[], Any], float, float]],
+        model: Any,
+        language: str,
+        initial_prompt: str,
+        progress_callback,
+        max_parallel: int,
+        chunk_stats: Optional[List[dict]],
+        on_chunk_ready: Optional[Callable[[float, List[SubtitleSegment]], None]] = None,
+    ) -> List[SubtitleSegment]:
+        """
+        Transcribe (load_audio, offset, duration) chunks, loading each one's
+        audio only when it is submitted so at most max_parallel are held.
+        """
         all_segments = []
+        # Finished chunks waiting for an earlier one before on_chunk_ready.
+        timeline = sorted(offset for _load, offset, _duration in chunks)
+        next_ready = 0
+        finished: dict = {}
         total_chunks = len(chunks)
         completed_chunks = 0
-        
+        completed_audio_s = 0.0
+        started_at = time.perf_counter()
+
+        # Longest chunks first so the last ones to finish are the short ones.
+        pending = sorted(chunks, key=lambda item: item[2], reverse=True)
+        in_flight: dict = {}
+        max_parallel = max(1, max_parallel)
+
         try:
-            futures = {}
-            for chunk in chunks:
-                future = self.executor.submit(
-                    self._process_chunk, 
-                    chunk, model, language, initial_prompt
-                )
-                futures[future] = chunk
-            
-            for future in as_completed(futures):
-                res = future.result()
-                all_segments.extend(res)
-                completed_chunks += 1
-                
-                if progress_callback:
-                    progress = 20 + int((completed_chunks / total_chunks) * 70)
-                    progress_callback(progress, f"Transcribed {completed_chunks}/{total_chunks} chunks")
+            while pending or in_flight:
+                while pending and len(in_flight) < max_parallel:
+                    load_audio, offset, chunk_duration = pending.pop(0)
+                    future = self.executor.submit(
+                        self._process_chunk_timed,
+                        (load_audio(), offset), model, language, initial_prompt
+                    )
+                    in_flight[future] = (offset, chunk_duration)
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    offset, chunk_duration = in_flight.pop(future)
+                    res, elapsed_s = future.result()
+                    all_segments.extend(res)
+                    if on_chunk_ready is not None:
+                        finished[offset] = res
+                        while next_ready < len(timeline) and timeline[next_ready] in finished:
+                            ready_offset = timeline[next_ready]
+                            on_chunk_ready(ready_offset, finished.pop(ready_offset))
+                            next_ready += 1
+                    completed_chunks += 1
+                    completed_audio_s += chunk_duration
+
+                    rtf = elapsed_s / chunk_duration if chunk_duration > 0 else 0.0
+                    logger.info(
+                        f"Chunk at {offset:.1f}s ({chunk_duration:.1f}s audio) took {elapsed_s:.1f}s "
+                        f"(RTF {rtf:.2f})"
+                    )
+                    if chunk_stats is not None:
+                        chunk_stats.append({
+                            "offset": round(offset, 3),
+                            "duration": round(chunk_duration, 3),
+                            "elapsed_s": round(elapsed_s, 3),
+                            "rtf": round(rtf, 4),
+                        })
+
+                    if progress_callback:
+                        progress = 20 + int((completed_chunks / total_chunks) * 70)
+                        wall_s = time.perf_counter() - started_at
+                        speed = completed_audio_s / wall_s if wall_s > 0 else 0.0
+                        progress_callback(
+                            progress,
+                            f"Transcribed {completed_chunks}/{total_chunks} chunks ({speed:.1f}x realtime)",
+                        )
 
         except Exception as e:
             logger.error(f"Chunk transcription failed: {e}")
+            for future in in_flight:
+                future.cancel()
             raise e
-        finally:
-            if chunk_dir.exists():
-                shutil.rmtree(chunk_dir, ignore_errors=True)
         
         return all_segments
 
+    @staticmethod
+    def _chunk_durations(chunks, total_duration: float) -> List[float]:
+        offsets = [offset for _path, offset in chunks]
+        ends = offsets[1:] + [total_duration]
+        return [max(0.0, end - start) for start, end in zip(offsets, ends)]
+
+    def _process_chunk_timed(self, chunk_info, model: Any, language: str, initial_prompt: str):
+        started_at = time.perf_counter()
+        segments = self._process_chunk(chunk_info, model, language, initial_prompt)
+        return segments, time.perf_counter() - started_at
+
     def _process_chunk(self, chunk_info, model: Any, language: str, initial_prompt: str) -> List[SubtitleSegment]:
-        """Process a single audio chunk."""
-        c_path, c_offset = chunk_info
+        """Process a single audio chunk (a file path or 16 kHz float32 samples)."""
+        c_audio, c_offset = chunk_info
         logger.info(f"Transcribing chunk starting at {c_offset:.1f}s...")
         segs, _ = model.transcribe(
-            c_path, 
+            c_audio, 
             beam_size=5, 
             language=language, 
             vad_filter=True,
@@ -94,14 +458,13 @@ class CoreStrategies:
         # Convert generator to list
         segs_list = list(segs)
         
-        # Refine relative to chunk
+        # Refine relative to chunk, then move to absolute time
         refined_local = SubtitleManager.refine_segments(segs_list, max_chars=50)
-        
-        # Apply Offset
-        chunk_segments = []
-        for s in refined_local:
-            s.start += c_offset
-            s.end += c_offset
-            chunk_segments.append(s)
-            
-        return chunk_segments
+        return self._offset_segments(refined_local, c_offset)
+
+    @staticmethod
+    def _offset_segments(segments: List[SubtitleSegment], offset: float) -> List[SubtitleSegment]:
+        for segment in segments:
+            segment.start += offset
+            segment.end += offset
+        return segments
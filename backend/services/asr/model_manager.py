@@ -2,8 +2,10 @@ import os
 import shutil
 import threading
 import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Iterator, NamedTuple, Optional, Tuple
 
 from loguru import logger
 from tqdm.auto import tqdm
@@ -14,6 +16,32 @@ from backend.core.task_control import TaskControlRequested
 
 ModelProgressCallback = Optional[Callable[[float, str], None]]
 
+# CPU threads given to each replica when sizing from the core count; past
+# about four threads a single CTranslate2 instance stops scaling well.
+_AUTO_THREADS_PER_REPLICA = 4
+
+
+def resolve_model_parallelism(device: str) -> tuple[int, int]:
+    """
+    (replicas, cpu_threads) for a Whisper model on the given device.
+
+    Replicas map to CTranslate2's num_workers: independent model instances
+    that let concurrent transcribe() calls run in parallel instead of queuing
+    on one. On CPU the cores are split between them; on CUDA a single replica
+    is the default since each one costs a full copy of the weights in VRAM.
+    cpu_threads 0 leaves CTranslate2's own default in place.
+    """
+    cores = os.cpu_count() or 1
+    threads = settings.ASR_CPU_THREADS_PER_REPLICA
+    if threads <= 0:
+        threads = min(_AUTO_THREADS_PER_REPLICA, cores)
+    replicas = settings.ASR_MODEL_REPLICAS
+    if replicas <= 0:
+        replicas = max(1, cores // threads) if device != "cuda" else 1
+    if device == "cuda":
+        return replicas, 0
+    return replicas, threads
+
 
 class _SilentTqdm(tqdm):
     def __init__(self, *args, **kwargs):
@@ -199,10 +227,69 @@ class _ModelDownloadProgressReporter:
         return f"{value:.1f} {units[unit_index]}"
 
 
+ModelKey = Tuple[str, str, str]
+
+# float16 weight sizes by Whisper size class, for models with no local folder.
+_FALLBACK_MODEL_MB = {"tiny": 75, "base": 145, "small": 485, "medium": 1530, "turbo": 1620, "large": 3090}
+
+
+def default_compute_type(device: str) -> str:
+    return "float16" if device == "cuda" else "int8"
+
+
+def estimate_model_bytes(model_path: str, model_name: str, compute_type: str) -> int:
+    """
+    Resident size of a loaded model: its weight files on disk (stored as
+    float16), halved when CTranslate2 quantizes them to int8 on load. Falls
+    back to the size class in the name when the path is not a local folder.
+    """
+    weights = 0
+    path = Path(model_path)
+    if path.is_dir():
+        weights = sum(item.stat().st_size for item in path.glob("*.bin") if item.is_file())
+    if weights <= 0:
+        size_class = next((name for name in _FALLBACK_MODEL_MB if name in model_name), "large")
+        weights = _FALLBACK_MODEL_MB[size_class] * 1024 * 1024
+    if compute_type.startswith("int8"):
+        weights //= 2
+    return weights
+
+
+class AcquiredModel(NamedTuple):
+    """A model pinned by ModelManager.acquire() and how many replicas it was loaded with."""
+
+    model: Any
+    replicas: int
+
+
+class _CachedModel:
+    __slots__ = ("model", "replicas", "bytes", "last_used")
+
+    def __init__(self, model: Any, replicas: int, size_bytes: int):
+        self.model = model
+        self.replicas = replicas
+        self.bytes = size_bytes
+        self.last_used = time.time()
+
+
 class ModelManager:
+    """
+    Downloads Whisper models and keeps loaded ones in an LRU cache keyed by
+    (model, device, compute type), bounded by ASR_MODEL_CACHE_MB of
+    estimated memory. Callers that hold a model across a long transcription
+    take it through acquire() so it is never evicted while in use.
+    """
+
     def __init__(self):
-        self._model_instance = None
-        self._current_model_name = None
+        self._models: "OrderedDict[ModelKey, _CachedModel]" = OrderedDict()
+        self._pins: Dict[ModelKey, int] = {}
+        self._load_locks: Dict[ModelKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._load_seconds = 0.0
+        self._preload_thread: Optional[threading.Thread] = None
 
     @property
     def model_map(self):
@@ -400,36 +487,172 @@ class ModelManager:
                 progress_callback=progress_callback,
             )
 
-    def load_model(self, model_name: str, device: str, progress_callback=None) -> Any:
+    @staticmethod
+    def _key(model_name: str, device: str, compute_type: Optional[str]) -> ModelKey:
+        return model_name, device, compute_type or default_compute_type(device)
+
+    def load_model(
+        self,
+        model_name: str,
+        device: str,
+        progress_callback=None,
+        compute_type: Optional[str] = None,
+    ) -> Any:
         """
-        Load or reload the Whisper model securely from the local models directory.
+        Return the cached Whisper model for (model, device, compute type),
+        loading it from the local models directory on a miss.
         """
-        if self._model_instance and self._current_model_name == model_name:
-            return self._model_instance
+        key = self._key(model_name, device, compute_type)
+        cached = self._cache_hit(key)
+        if cached is not None:
+            return cached
 
-        logger.info(f"Loading Whisper Model: {model_name} on {device}...")
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+        with load_lock:
+            # Another caller may have loaded it while we waited.
+            cached = self._cache_hit(key)
+            if cached is not None:
+                return cached
+            return self._load(key, progress_callback)
+
+    def _cache_hit(self, key: ModelKey) -> Any:
+        with self._lock:
+            entry = self._models.get(key)
+            if entry is None:
+                return None
+            self._models.move_to_end(key)
+            entry.last_used = time.time()
+            self._hits += 1
+            return entry.model
+
+    def _load(self, key: ModelKey, progress_callback=None) -> Any:
+        model_name, device, compute_type = key
+        replicas, cpu_threads = resolve_model_parallelism(device)
+        logger.info(
+            f"Loading Whisper Model: {model_name} on {device} ({compute_type}, "
+            f"{replicas} replica(s), {cpu_threads or 'default'} CPU threads each)..."
+        )
 
         from faster_whisper import WhisperModel
 
         try:
-            compute_type = "float16" if device == "cuda" else "int8"
             local_model_path = self.ensure_model_downloaded(model_name, progress_callback)
 
             if progress_callback:
                 progress_callback(8, f"Initializing {model_name} on {device}...")
-            self._model_instance = WhisperModel(
+            started_at = time.perf_counter()
+            model = WhisperModel(
                 local_model_path,
                 device=device,
                 compute_type=compute_type,
                 download_root=None,
+                cpu_threads=cpu_threads,
+                num_workers=replicas,
             )
-            self._current_model_name = model_name
-            logger.success(f"Model {model_name} loaded successfully.")
-            if progress_callback:
-                progress_callback(10, "Model loaded successfully.")
-            return self._model_instance
+            load_s = time.perf_counter() - started_at
         except TaskControlRequested:
             raise
         except Exception as e:
             logger.error(f"Failed to load model {model_name}: {e}")
             raise RuntimeError(f"Model loading failed: {e}")
+
+        entry = _CachedModel(model, replicas, estimate_model_bytes(local_model_path, model_name, compute_type))
+        with self._lock:
+            self._misses += 1
+            self._load_seconds += load_s
+            self._models[key] = entry
+            self._evict_locked()
+        logger.success(f"Model {model_name} loaded successfully in {load_s:.1f}s.")
+        if progress_callback:
+            progress_callback(10, "Model loaded successfully.")
+        return model
+
+    @contextmanager
+    def acquire(
+        self,
+        model_name: str,
+        device: str,
+        progress_callback=None,
+        compute_type: Optional[str] = None,
+    ) -> Iterator[AcquiredModel]:
+        """
+        load_model() that keeps the model pinned in the cache until the block
+        exits. Yields the model with the replica count of that cache entry, so
+        callers plan for the model they hold rather than the last one loaded.
+        """
+        key = self._key(model_name, device, compute_type)
+        with self._lock:
+            self._pins[key] = self._pins.get(key, 0) + 1
+        try:
+            model = self.load_model(model_name, device, progress_callback, compute_type)
+            with self._lock:
+                entry = self._models.get(key)
+                replicas = entry.replicas if entry is not None else 1
+            yield AcquiredModel(model, replicas)
+        finally:
+            with self._lock:
+                remaining = self._pins.get(key, 1) - 1
+                if remaining > 0:
+                    self._pins[key] = remaining
+                else:
+                    self._pins.pop(key, None)
+                self._evict_locked()
+
+    def _evict_locked(self) -> None:
+        budget = max(0, settings.ASR_MODEL_CACHE_MB) * 1024 * 1024
+        used = sum(entry.bytes for entry in self._models.values())
+        # The most recently used model always stays, even alone over budget.
+        for key in list(self._models)[:-1]:
+            if used <= budget:
+                break
+            if self._pins.get(key):
+                continue
+            entry = self._models.pop(key)
+            used -= entry.bytes
+            self._evictions += 1
+            self._load_locks.pop(key, None)
+            logger.info(f"Evicted Whisper model {key[0]} ({key[1]}, {key[2]}) from the model cache.")
+        if used > budget and len(self._models) > 1:
+            logger.warning(
+                f"Whisper models in use need {used / 1024 / 1024:.0f} MB, "
+                f"over ASR_MODEL_CACHE_MB={settings.ASR_MODEL_CACHE_MB}."
+            )
+
+    def preload(self, model_name: str, device: str = "cpu") -> threading.Thread:
+        """Load a model on a daemon thread so the first job finds it cached."""
+
+        def run() -> None:
+            try:
+                self.load_model(model_name, device)
+            except Exception as e:
+                logger.warning(f"Preloading Whisper model {model_name} failed: {e}")
+
+        self._preload_thread = threading.Thread(target=run, name=f"asr-preload-{model_name}", daemon=True)
+        self._preload_thread.start()
+        return self._preload_thread
+
+    def stats(self) -> dict:
+        with self._lock:
+            requests = self._hits + self._misses
+            return {
+                "models": [
+                    {
+                        "model": model_name,
+                        "device": device,
+                        "compute_type": compute_type,
+                        "mb": round(entry.bytes / 1024 / 1024, 1),
+                        "replicas": entry.replicas,
+                        "in_use": self._pins.get((model_name, device, compute_type), 0),
+                        "last_used": entry.last_used,
+                    }
+                    for (model_name, device, compute_type), entry in self._models.items()
+                ],
+                "budget_mb": settings.ASR_MODEL_CACHE_MB,
+                "used_mb": round(sum(entry.bytes for entry in self._models.values()) / 1024 / 1024, 1),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / requests, 4) if requests else 0.0,
+                "evictions": self._evictions,
+                "load_seconds": round(self._load_seconds, 3),
+            }
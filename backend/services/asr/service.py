@@ -1,6 +1,8 @@
 import os
 import time
 import shutil
+from functools import lru_cache
+from importlib import metadata
 from pathlib import Path
 from typing import List, Optional
 from concurrent.futures import ThreadPoolExecutor
@@ -13,33 +15,51 @@ from backend.utils.segment_refiner import SegmentRefiner
 from backend.core.adapters.faster_whisper import FasterWhisperAdapter, FasterWhisperConfig
 from backend.core.task_control import TaskControlRequested
 from backend.services.media_refs import create_media_ref
+from backend.utils.artifact_cache import artifact_cache
+from backend.utils.pcm_audio import pcm_cache
 
-from .model_manager import ModelManager
+from .chunk_planner import ChunkPlan, default_rtf, plan_transcription, rtf_history
+from .model_manager import ModelManager, resolve_model_parallelism
 from .core_strategies import CoreStrategies
 
+
+@lru_cache(maxsize=1)
+def _asr_engine_version() -> str:
+    """Cache-key version for transcripts: changes whenever faster-whisper does."""
+    try:
+        return f"faster-whisper {metadata.version('faster-whisper')}"
+    except metadata.PackageNotFoundError:
+        return "faster-whisper unknown"
+
 class ASRService:
     def __init__(self):
-        self.executor = ThreadPoolExecutor(max_workers=settings.ASR_MAX_WORKERS)
+        # Enough threads to keep every CPU model replica busy with a chunk.
+        cpu_replicas, _threads = resolve_model_parallelism("cpu")
+        self.executor = ThreadPoolExecutor(max_workers=max(settings.ASR_MAX_WORKERS, cpu_replicas))
         self.model_manager = ModelManager()
         self.adapter = FasterWhisperAdapter()
         self.core_strategies = CoreStrategies(self.executor)
 
-    def transcribe(self, audio_path: str, model_name: str = "base", device: str = "cpu", language: str = None, task_id: str = None, initial_prompt: str = None, progress_callback=None, generate_peaks: bool = True, engine: str = "builtin") -> TaskResult:
+    def transcribe(self, audio_path: str, model_name: str = "base", device: str = "cpu", language: str = None, task_id: str = None, initial_prompt: str = None, progress_callback=None, generate_peaks: bool = True, engine: str = "builtin", use_cache: bool = True, segment_callback=None) -> TaskResult:
         """
         Main entry point for transcription. Dispatches to specific strategies.
+
+        Finished transcripts are kept in the artifact cache keyed by the
+        media's fingerprint, model, language, prompt and engine, so
+        transcribing the same file again skips the model entirely.
+
+        segment_callback(segments) receives final segments as they become
+        available, in timeline order with sequential ids. Smart-split and
+        batched runs emit each chunk or span as soon as it is done (normalized
+        per chunk); every other path emits the whole transcript once at the end.
+
+        engine "batched" runs VAD once over the decoded audio and decodes the
+        speech regions ASR_BATCH_SIZE windows at a time, whatever the duration.
         """
         if not os.path.exists(audio_path):
             logger.error(f"Audio file not found: {audio_path}")
             return TaskResult(success=False, error=f"File not found: {audio_path}")
 
-        # Calculate duration once for all paths
-        try:
-            duration = AudioProcessor.get_audio_duration(audio_path)
-            logger.info(f"Audio Duration: {duration:.2f}s")
-        except Exception as e:
-            logger.error(f"Failed to get duration: {e}")
-            duration = 0.0
-
         # Engine selection is request-driven. Do not silently switch engines.
         cli_available = (
             hasattr(settings, "FASTER_WHISPER_CLI_PATH")
@@ -48,12 +68,50 @@ class ASRService:
         use_cli = engine == "cli"
         if use_cli and not cli_available:
             return TaskResult(success=False, error="CLI transcription engine is unavailable")
-        if use_cli:
-            logger.info("Faster-Whisper CLI enabled. Using CLI transcription path.")
+
+        cache_params = {
+            "model": model_name,
+            "language": language,
+            "initial_prompt": initial_prompt,
+            "engine": engine,
+        }
+        if segment_callback is not None:
+            # Streamed transcripts are normalized per chunk, not globally.
+            cache_params["streaming"] = True
+        cached = artifact_cache.get(audio_path, "transcribe", cache_params, _asr_engine_version()) if use_cache else None
+        cache_hit = isinstance(cached, dict)
 
         final_segments = []
-        
-        if use_cli:
+        chunk_stats: list[dict] = []
+        language_info: dict = {}
+        plan_meta: dict = {}
+        streamed_segments: list[SubtitleSegment] = []
+        streamed = False
+
+        def emit_chunk(_offset: float, chunk_segments: List[SubtitleSegment]) -> None:
+            ready = SegmentRefiner.normalize_segments(sorted(chunk_segments, key=lambda s: s.start))
+            for segment in ready:
+                segment.id = str(len(streamed_segments) + 1)
+                streamed_segments.append(segment)
+            if ready:
+                segment_callback([segment.model_copy() for segment in ready])
+
+        if cache_hit:
+            logger.info(f"Reusing cached transcript for {audio_path}.")
+            duration = float(cached.get("duration") or 0.0)
+            final_segments = [SubtitleSegment(**segment) for segment in cached.get("segments", [])]
+            language_info = cached.get("language_detection") or {}
+        else:
+            # Calculate duration once for all paths
+            try:
+                duration = AudioProcessor.get_audio_duration(audio_path)
+                logger.info(f"Audio Duration: {duration:.2f}s")
+            except Exception as e:
+                logger.error(f"Failed to get duration: {e}")
+                duration = 0.0
+
+        if use_cli and not cache_hit:
+            logger.info("Faster-Whisper CLI enabled. Using CLI transcription path.")
             output_dir = settings.WORKSPACE_DIR / f"cli_out_{Path(audio_path).stem}_{int(time.time())}"
             try:
                 # 1. Ensure model is available locally
@@ -105,34 +163,77 @@ class ASRService:
                      except OSError:
                          pass
 
-        if not use_cli:
-            # 1. Load Model
-            model = self.model_manager.load_model(model_name, device, progress_callback)
-
-            # 2. Analyze Audio
-            logger.info(f"Audio Duration: {duration:.2f}s")
+        if not use_cli and not cache_hit:
+            # 1. Load Model (pinned in the model cache until the strategy returns)
+            with self.model_manager.acquire(model_name, device, progress_callback) as (model, replicas):
+                # 2. Analyze Audio
+                logger.info(f"Audio Duration: {duration:.2f}s")
 
-            # 3. Strategy Decision
-            if duration > 900:
-                all_segments = self.core_strategies.transcribe_smart_split(
-                    audio_path, duration, model, language, initial_prompt, progress_callback
-                )
-            else:
-                all_segments = self.core_strategies.transcribe_direct(
-                    audio_path, duration, model, language, initial_prompt, progress_callback
-                )
+                # 3. Strategy Decision
+                if engine == "batched":
+                    all_segments = self.core_strategies.transcribe_batched(
+                        audio_path, duration, model, language, initial_prompt, progress_callback,
+                        batch_size=settings.ASR_BATCH_SIZE,
+                        chunk_stats=chunk_stats,
+                        on_chunk_ready=emit_chunk if segment_callback is not None else None,
+                        language_info=language_info,
+                    )
+                    streamed = segment_callback is not None
+                else:
+                    plan = self._plan_transcription(model_name, device, duration, replicas)
+                    logger.info(
+                        f"Plan: {plan.strategy} ({plan.replicas} replica(s), RTF {plan.rtf:.3f}"
+                        + (f", ~{plan.chunk_s:.0f}s chunks)" if plan.strategy == "smart_split" else ")")
+                    )
+                    started_at = time.perf_counter()
+                    if plan.strategy == "smart_split":
+                        all_segments = self.core_strategies.transcribe_smart_split(
+                            audio_path, duration, model, language, initial_prompt, progress_callback,
+                            max_parallel=plan.replicas,
+                            chunk_stats=chunk_stats,
+                            on_chunk_ready=emit_chunk if segment_callback is not None else None,
+                            language_info=language_info,
+                            target_chunk_s=plan.chunk_s,
+                        )
+                        streamed = segment_callback is not None
+                        # Per-replica RTF: chunk compute time over chunk audio.
+                        audio_s = sum(stat["duration"] for stat in chunk_stats)
+                        compute_s = sum(stat["elapsed_s"] for stat in chunk_stats)
+                    else:
+                        all_segments = self.core_strategies.transcribe_direct(
+                            audio_path, duration, model, language, initial_prompt, progress_callback
+                        )
+                        audio_s, compute_s = duration, time.perf_counter() - started_at
+                    rtf_history.record(model_name, device, audio_s, compute_s)
+                    plan_meta = plan.as_meta()
 
             # 4. Sort and assign to final_segments
             if progress_callback: progress_callback(95, "Finalizing segments...")
             all_segments.sort(key=lambda x: x.start)
-            final_segments = all_segments
+            final_segments = streamed_segments if streamed else all_segments
 
         # Unified post-processing for both CLI and Python API paths
-        logger.info("Applying smart segment merging...")
-        if final_segments:
-            final_segments = SegmentRefiner.normalize_segments(final_segments)
-        else:
-            final_segments = []
+        if not cache_hit:
+            logger.info("Applying smart segment merging...")
+            if not final_segments:
+                final_segments = []
+            elif not streamed:
+                final_segments = SegmentRefiner.normalize_segments(final_segments)
+            if use_cache:
+                artifact_cache.put(
+                    audio_path,
+                    "transcribe",
+                    cache_params,
+                    {
+                        "duration": duration,
+                        "segments": [s.model_dump() for s in final_segments],
+                        **({"language_detection": language_info} if language_info else {}),
+                    },
+                    _asr_engine_version(),
+                )
+
+        if segment_callback is not None and not streamed and final_segments:
+            segment_callback([segment.model_copy() for segment in final_segments])
 
         # Generate full text
         full_text = "\n".join([s.text for s in final_segments])
@@ -158,16 +259,31 @@ class ASRService:
             files=files,
             meta={
                 "task_id": task_id or "sync_task",
-                "language": language or "auto",
+                "language": language or (language_info.get("language") if language_info.get("pinned") else None) or "auto",
                 "duration": duration,
                 "segments": [s.model_dump() for s in final_segments],
                 "text": full_text,
                 "srt_path": str(srt_path),
                 "subtitle_ref": subtitle_ref,
                 "output_ref": subtitle_ref,
+                **({"chunk_stats": chunk_stats} if chunk_stats else {}),
+                **({"language_detection": language_info} if language_info else {}),
+                **({"asr_plan": plan_meta} if plan_meta else {}),
+                **({"cache": "hit"} if cache_hit else {}),
             }
         )
 
+    @staticmethod
+    def _plan_transcription(model_name: str, device: str, duration: float, replicas: int) -> ChunkPlan:
+        """Direct or smart-split, and chunk length, from the acquired model's replicas and its RTF history."""
+        rtf = rtf_history.get(model_name, device) or default_rtf(device)
+        return plan_transcription(
+            duration,
+            replicas,
+            rtf,
+            adaptive=settings.ASR_ADAPTIVE_CHUNKING,
+        )
+
     @staticmethod
     def _is_cli_cuda_unavailable_error(error: Exception) -> bool:
         message = str(error).lower()
@@ -190,9 +306,62 @@ class ASRService:
         progress_callback=None,
     ) -> TaskResult:
         """
-        Transcribe a specific segment of the audio file.
-        This is a synchronous blocking call designed for short segments (<60s).
+        Transcribe start..end of the audio file; segment times are absolute.
+
+        This is the editor's "re-transcribe this line" path, so it skips the
+        full-job machinery: the clip is sliced from the cached 16 kHz decode of
+        the source (pcm_cache, one decode per media file) and handed to the
+        cached model as samples, with no temporary WAV, ffprobe, transcript
+        cache or SRT file. The CLI engine needs a file and still goes through
+        transcribe() on an extracted clip.
         """
+        if engine == "cli":
+            return self._transcribe_segment_file(
+                audio_path, start, end, model_name, device, language, engine, task_id, progress_callback,
+            )
+
+        started_at = time.perf_counter()
+        try:
+            with pcm_cache.open(audio_path) as pcm:
+                samples = pcm.slice(start, end)
+            with self.model_manager.acquire(model_name, device, progress_callback) as acquired:
+                segments = self.core_strategies.transcribe_clip(samples, start, acquired.model, language)
+        except TaskControlRequested:
+            raise
+        except Exception as e:
+            logger.error(f"Segment transcription failed: {e}")
+            return TaskResult(success=False, error=str(e))
+
+        segments = SegmentRefiner.normalize_segments(sorted(segments, key=lambda s: s.start))
+        logger.info(
+            f"Segment {start:.2f}-{end:.2f}s transcribed in {(time.perf_counter() - started_at) * 1000:.0f} ms "
+            f"({len(segments)} segments)."
+        )
+        if progress_callback: progress_callback(100, "Completed")
+        return TaskResult(
+            success=True,
+            meta={
+                "task_id": task_id or "sync_task",
+                "language": language or "auto",
+                "duration": max(0.0, end - start),
+                "segments": [s.model_dump() for s in segments],
+                "text": "\n".join(s.text for s in segments),
+            },
+        )
+
+    def _transcribe_segment_file(
+        self,
+        audio_path: str,
+        start: float,
+        end: float,
+        model_name: str,
+        device: str,
+        language: str,
+        engine: str,
+        task_id: str,
+        progress_callback,
+    ) -> TaskResult:
+        """Extract start..end to a temporary WAV and run the full transcribe() on it."""
         import uuid
         temp_id = str(uuid.uuid4())[:8]
         segment_filename = f"segment_{temp_id}.wav"
@@ -214,6 +383,7 @@ class ASRService:
                 task_id=task_id or f"seg_{temp_id}",
                 progress_callback=progress_callback,
                 generate_peaks=False,  # Disable redundant peak generation
+                use_cache=False,  # The extracted clip is a one-off temp file
             )
             
             # 3. Adjust timestamps relative to original audio
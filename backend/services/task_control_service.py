@@ -44,10 +44,11 @@ class TaskControlService:
             return False
 
         if task.status == "pending":
-            task_manager._stop_requests[task_id] = "pause"
+            if task_id in task_manager._running_ids:
+                # Dispatched but not started yet; the runner picks this up.
+                task_manager._stop_requests[task_id] = "pause"
             task_manager._queued_ids.discard(task_id)
-            if task_id in task_manager._queued_order:
-                task_manager._queued_order.remove(task_id)
+            task_manager._queued_order.discard(task_id)
             await task_manager.update_task(
                 task_id,
                 status="paused",
@@ -69,10 +70,11 @@ class TaskControlService:
             return False
 
         if task.status == "pending":
-            task_manager._stop_requests[task_id] = "cancel"
+            if task_id in task_manager._running_ids:
+                # Dispatched but not started yet; the runner picks this up.
+                task_manager._stop_requests[task_id] = "cancel"
             task_manager._queued_ids.discard(task_id)
-            if task_id in task_manager._queued_order:
-                task_manager._queued_order.remove(task_id)
+            task_manager._queued_order.discard(task_id)
             await task_manager.update_task(
                 task_id,
                 status="cancelled",
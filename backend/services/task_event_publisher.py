@@ -1,3 +1,5 @@
+import asyncio
+import time
 from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
@@ -5,20 +7,96 @@ if TYPE_CHECKING:
 
 
 class TaskEventPublisher:
-    def __init__(self, notifier: Optional["WebSocketNotifier"] = None):
+    """
+    Turns task payloads into compact WebSocket events.
+
+    The first payload seen for a task, and any payload that changes its status,
+    is broadcast in full as an "update". Everything else is diffed against the
+    last payload broadcast for that task and sent as a "patch" carrying only the
+    changed fields. Patches are rate-limited per task; changes arriving inside
+    the window are merged and delivered by a trailing flush, so the latest value
+    always reaches clients.
+    """
+
+    def __init__(
+        self,
+        notifier: Optional["WebSocketNotifier"] = None,
+        *,
+        max_patches_per_sec: float = 4.0,
+    ):
         self._notifier = notifier
+        self._min_patch_interval_s = 1.0 / max_patches_per_sec if max_patches_per_sec > 0 else 0.0
+        self._last_payloads: dict[str, dict] = {}
+        self._last_patch_at: dict[str, float] = {}
+        self._pending_patches: dict[str, dict] = {}
+        self._patch_timers: dict[str, asyncio.TimerHandle] = {}
 
     def set_notifier(self, notifier: "WebSocketNotifier") -> None:
         self._notifier = notifier
 
     async def publish_update(self, task_payload: dict) -> None:
-        if self._notifier:
+        if not self._notifier:
+            return
+
+        task_id = task_payload["id"]
+        previous = self._last_payloads.get(task_id)
+        self._last_payloads[task_id] = task_payload
+
+        if previous is None or previous.get("status") != task_payload.get("status"):
+            self._cancel_patch(task_id)
             await self._notifier.broadcast({"type": "update", "task": task_payload})
+            return
+
+        changes = {
+            key: value
+            for key, value in task_payload.items()
+            if key not in previous or previous[key] != value
+        }
+        if not changes:
+            return
+
+        self._pending_patches.setdefault(task_id, {}).update(changes)
+        wait_s = self._last_patch_at.get(task_id, 0.0) + self._min_patch_interval_s - time.monotonic()
+        if wait_s <= 0:
+            self._flush_patch(task_id)
+        elif task_id not in self._patch_timers:
+            self._patch_timers[task_id] = asyncio.get_running_loop().call_later(
+                wait_s,
+                self._flush_patch,
+                task_id,
+            )
 
     async def publish_delete(self, task_id: str) -> None:
+        self._forget(task_id)
         if self._notifier:
             await self._notifier.broadcast({"type": "delete", "task_id": task_id})
 
     async def publish_snapshot(self, tasks_payload: list[dict]) -> None:
+        for task_id in list(self._last_payloads):
+            self._forget(task_id)
+        self._last_payloads.update({payload["id"]: payload for payload in tasks_payload})
         if self._notifier:
             await self._notifier.broadcast({"type": "snapshot", "tasks": tasks_payload})
+
+    def forget(self, task_id: str) -> None:
+        """Drop diff state for a task that is no longer tracked in memory."""
+        self._forget(task_id)
+
+    def _flush_patch(self, task_id: str) -> None:
+        self._patch_timers.pop(task_id, None)
+        changes = self._pending_patches.pop(task_id, None)
+        if not changes or not self._notifier:
+            return
+        self._last_patch_at[task_id] = time.monotonic()
+        self._notifier.broadcast_nowait({"type": "patch", "task_id": task_id, "changes": changes})
+
+    def _cancel_patch(self, task_id: str) -> None:
+        timer = self._patch_timers.pop(task_id, None)
+        if timer:
+            timer.cancel()
+        self._pending_patches.pop(task_id, None)
+
+    def _forget(self, task_id: str) -> None:
+        self._cancel_patch(task_id)
+        self._last_payloads.pop(task_id, None)
+        self._last_patch_at.pop(task_id, None)
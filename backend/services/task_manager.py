@@ -12,11 +12,14 @@ from backend.core.task_control import (
     TaskControlRequested,
     TaskPauseRequested,
 )
-from backend.models.task_model import Task
+from backend.core.tasks.base import PRIORITY_NORMAL, RESOURCE_CLASSES, RESOURCE_COMPUTE
+from backend.models.task_model import PipelineCheckpoint, Task
 from backend.services.task_control_service import TaskControlService
 from backend.services.task_event_publisher import TaskEventPublisher
+from backend.services.task_progress_store import TaskProgressStore
 from backend.services.task_queue_view import TaskQueueView
 from backend.services.task_repository import TaskRepository
+from backend.services.task_result_compactor import merge_task_result
 from backend.services.task_runtime_state import TaskRuntimeState
 
 if TYPE_CHECKING:
@@ -33,6 +36,9 @@ class TaskManager:
         control_service: TaskControlService,
         runtime_state: TaskRuntimeState,
         notifier: Optional["WebSocketNotifier"] = None,
+        progress_store: Optional[TaskProgressStore] = None,
+        keep_history_in_memory: Optional[bool] = None,
+        resource_profile: Optional[Callable[[Task], tuple[str, int]]] = None,
     ):
         self.tasks: Dict[str, Task] = {}
         resolved_notifier = notifier
@@ -44,7 +50,29 @@ class TaskManager:
         self._queue_view = queue_view
         self._control_service = control_service
         self._runtime_state = runtime_state
-        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._progress_store = progress_store or TaskProgressStore(
+            repository,
+            flush_interval_s=settings.TASK_PROGRESS_FLUSH_INTERVAL_MS / 1000.0,
+        )
+        # When False only runtime-scope tasks stay in self.tasks; history is
+        # paged from SQLite on demand.
+        self._keep_history_in_memory = (
+            settings.TASK_KEEP_HISTORY_IN_MEMORY
+            if keep_history_in_memory is None
+            else keep_history_in_memory
+        )
+        # (resource pool, priority) for a task; defaults to one compute pool.
+        self._resource_profile = resource_profile or (lambda _task: (RESOURCE_COMPUTE, PRIORITY_NORMAL))
+        self._max_concurrent = max(1, settings.TASK_MAX_CONCURRENT)
+        self._pool_limits = {
+            pool: max(1, settings.TASK_POOL_LIMITS.get(pool, self._max_concurrent))
+            for pool in RESOURCE_CLASSES
+        }
+        # One wake-up queue per pool; workers pop the head of their pool's order.
+        self._pool_signals: dict[str, asyncio.Queue[str]] = {
+            pool: asyncio.Queue() for pool in RESOURCE_CLASSES
+        }
+        self._running_pools: Dict[str, str] = {}
         self._queued_ids = self._runtime_state.queued_ids
         self._queued_order = self._runtime_state.queued_order
         self._running_ids = self._runtime_state.running_ids
@@ -54,7 +82,6 @@ class TaskManager:
         self._workers: list[asyncio.Task] = []
         self._threadsafe_update_futures: set[concurrent.futures.Future] = set()
         self._accept_threadsafe_updates = True
-        self._max_concurrent = max(1, settings.TASK_MAX_CONCURRENT)
         self._startup_load_task: asyncio.Task | None = None
         self._tasks_loaded = asyncio.Event()
 
@@ -62,6 +89,7 @@ class TaskManager:
         """Initialize DB, load tasks, and start queue workers."""
         await init_db()
         self._start_workers()
+        self._progress_store.start()
         await self.load_tasks()
 
     async def warm_start_async(self):
@@ -73,6 +101,7 @@ class TaskManager:
         """
         await init_db()
         self._start_workers()
+        self._progress_store.start()
 
         if self._startup_load_task and not self._startup_load_task.done():
             return
@@ -87,12 +116,15 @@ class TaskManager:
             await asyncio.gather(self._startup_load_task, return_exceptions=True)
             self._startup_load_task = None
         await self.drain_threadsafe_updates()
+        await self._progress_store.stop()
         for worker in self._workers:
             worker.cancel()
         if self._workers:
             await asyncio.gather(*self._workers, return_exceptions=True)
         self._workers.clear()
+        await self._repository.close()
         self._runtime_state.clear()
+        self._running_pools.clear()
         self._execution_specs.clear()
         self._threadsafe_update_futures.clear()
         self._accept_threadsafe_updates = True
@@ -127,14 +159,23 @@ class TaskManager:
     def _start_workers(self):
         if self._workers:
             return
-        for index in range(self._max_concurrent):
-            self._workers.append(asyncio.create_task(self._worker_loop(index)))
-        logger.info(f"Started {len(self._workers)} task queue workers.")
+        for pool, limit in self._pool_limits.items():
+            for index in range(limit):
+                self._workers.append(asyncio.create_task(self._worker_loop(pool, index)))
+        logger.info(f"Started {len(self._workers)} task queue workers across pools {self._pool_limits}.")
 
-    async def _worker_loop(self, worker_index: int):
+    async def _worker_loop(self, pool: str, worker_index: int):
+        signals = self._pool_signals[pool]
         while True:
-            task_id = await self._queue.get()
-            self._runtime_state.unmark_queued(task_id)
+            # Queue entries only wake a worker; the task it runs is whichever
+            # is at the head of its pool's order, so priority and reordering
+            # take effect.
+            await signals.get()
+            task_id = self._runtime_state.pop_next_queued(pool)
+            if task_id is None:
+                # The task this wake-up was for left the queue (paused, cancelled or deleted).
+                signals.task_done()
+                continue
             try:
                 task = self.get_task(task_id)
                 if not task:
@@ -160,14 +201,15 @@ class TaskManager:
                     continue
 
                 self._runtime_state.mark_running(task_id)
-                logger.info(f"[Queue:{worker_index}] Starting task {task_id}")
+                self._running_pools[task_id] = pool
+                logger.info(f"[Queue:{pool}:{worker_index}] Starting task {task_id}")
                 await runner()
             except TaskControlRequested as e:
-                logger.info(f"[Queue:{worker_index}] Task {task_id} stopped cooperatively: {e}")
+                logger.info(f"[Queue:{pool}:{worker_index}] Task {task_id} stopped cooperatively: {e}")
             except asyncio.CancelledError:
                 raise
             except Exception as e:
-                logger.exception(f"[Queue:{worker_index}] Task {task_id} crashed: {e}")
+                logger.exception(f"[Queue:{pool}:{worker_index}] Task {task_id} crashed: {e}")
                 if task_id in self.tasks:
                     await self.update_task(
                         task_id,
@@ -177,14 +219,20 @@ class TaskManager:
                     )
             finally:
                 self._runtime_state.unmark_running(task_id)
+                self._running_pools.pop(task_id, None)
                 if task_id in self._delete_after_stop:
                     await self._finalize_delete(task_id)
-                self._queue.task_done()
+                else:
+                    self._evict_if_history(task_id)
+                signals.task_done()
 
     async def load_tasks(self):
         """Load tasks from DB on startup."""
         try:
-            persisted_tasks = await self._repository.load_all()
+            if self._keep_history_in_memory:
+                persisted_tasks = await self._repository.load_all()
+            else:
+                persisted_tasks = await self._repository.load_all(runtime_only=True)
             self.tasks = {**persisted_tasks, **self.tasks}
             logger.info(f"Loaded {len(self.tasks)} tasks from SQLite.")
         except Exception as e:
@@ -211,11 +259,25 @@ class TaskManager:
 
     def get_queue_summary(self) -> dict:
         return self._queue_view.get_queue_summary(
-            self._max_concurrent,
+            self.get_pool_summary(),
             self._running_ids,
             self._queued_ids,
         )
 
+    def get_pool_summary(self) -> dict:
+        running_by_pool: Dict[str, int] = {}
+        for pool in self._running_pools.values():
+            running_by_pool[pool] = running_by_pool.get(pool, 0) + 1
+        return self._queue_view.get_pool_summary(
+            self._pool_limits,
+            running_by_pool,
+            self._queued_order.queued_by_pool(),
+        )
+
+    async def wait_until_idle(self) -> None:
+        """Wait until every queued task has been dispatched and finished."""
+        await asyncio.gather(*(signals.join() for signals in self._pool_signals.values()))
+
     def get_tasks_snapshot(self) -> list:
         """Return serialized list of all tasks (for WebSocket snapshot)."""
         return [self.serialize_task(task) for task in self.tasks.values()]
@@ -254,14 +316,36 @@ class TaskManager:
         if task_id in self._running_ids or task_id in self._queued_ids:
             return
 
+        pool, priority = self._resource_profile(task)
+        if pool not in self._pool_signals:
+            pool = RESOURCE_COMPUTE
         self.clear_stop_request(task_id)
-        self._runtime_state.mark_queued(task_id)
+        self._runtime_state.mark_queued(task_id, pool, priority)
         updates = {"status": "pending", "cancelled": False}
         if queued_message is not None:
             updates["message"] = queued_message
         await self.update_task(task_id, **updates)
-        await self._queue.put(task_id)
-        logger.info(f"Queued task {task_id}. pending={len(self._queued_ids)} running={len(self._running_ids)}")
+        await self._pool_signals[pool].put(task_id)
+        logger.info(f"Queued task {task_id} in {pool} pool. pending={len(self._queued_ids)} running={len(self._running_ids)}")
+
+    async def move_queued_task(self, task_id: str, position: int) -> Optional[int]:
+        """
+        Move a queued task to a 1-based position in its pool's queue. Returns the position it
+        landed at, or None if the task is not waiting in the queue.
+        """
+        old_position = self._queued_order.position(task_id)
+        if task_id not in self._queued_ids or old_position is None:
+            return None
+        new_position = self._queued_order.move(task_id, position)
+        pool = self._queued_order.pool_of(task_id)
+
+        # Only tasks between the old and new slot changed position.
+        low, high = sorted((old_position, new_position))
+        for affected_position in range(low, high + 1):
+            task = self.tasks.get(self._queued_order.at(pool, affected_position))
+            if task is not None:
+                await self._event_publisher.publish_update(self.serialize_task(task))
+        return new_position
 
     def has_stop_request(self, task_id: str) -> bool:
         return self._control_service.has_stop_request(self._stop_requests, task_id)
@@ -291,14 +375,33 @@ class TaskManager:
         )
 
     async def update_task(self, task_id: str, **kwargs):
+        cached_task = self.tasks.get(task_id)
+        if cached_task is not None and self._progress_store.is_coalescable(kwargs):
+            # Progress ticks only touch the cache; the store flushes them in batches.
+            if self._progress_store.stage(cached_task, **kwargs):
+                await self._event_publisher.publish_update(self.serialize_task(cached_task))
+            return
+
+        kwargs = {**self._progress_store.take(task_id), **kwargs}
         updated_task = await self._repository.update_task(
             task_id,
-            cached_task=self.tasks.get(task_id),
+            cached_task=cached_task,
             **kwargs,
         )
         if updated_task:
             self.tasks[task_id] = updated_task
             await self._event_publisher.publish_update(self.serialize_task(updated_task))
+            self._evict_if_history(task_id)
+
+    def _evict_if_history(self, task_id: str) -> None:
+        if self._keep_history_in_memory or task_id in self._running_ids:
+            return
+        task = self.tasks.get(task_id)
+        if task is None or self._queue_view.get_persistence_scope(task) != "history":
+            return
+        self.tasks.pop(task_id, None)
+        self._execution_specs.pop(task_id, None)
+        self._event_publisher.forget(task_id)
 
     async def pause_task(self, task_id: str) -> bool:
         return await self._control_service.pause_task(self, task_id)
@@ -316,8 +419,7 @@ class TaskManager:
 
         if task and task.status in {"pending", "paused"}:
             self._queued_ids.discard(task_id)
-            if task_id in self._queued_order:
-                self._queued_order.remove(task_id)
+            self._queued_order.discard(task_id)
             self._delete_after_stop.discard(task_id)
             self.clear_stop_request(task_id)
             self._execution_specs.pop(task_id, None)
@@ -329,12 +431,13 @@ class TaskManager:
         task_exists = await self._repository.delete_task(task_id)
         if task_exists:
             self._queued_ids.discard(task_id)
-            if task_id in self._queued_order:
-                self._queued_order.remove(task_id)
+            self._queued_order.discard(task_id)
             self._running_ids.discard(task_id)
+            self._running_pools.pop(task_id, None)
             self.clear_stop_request(task_id)
             self._execution_specs.pop(task_id, None)
             self._delete_after_stop.discard(task_id)
+            self._progress_store.discard(task_id)
             self.tasks.pop(task_id, None)
 
             await self._event_publisher.publish_delete(task_id)
@@ -344,8 +447,10 @@ class TaskManager:
 
     async def delete_all_tasks(self) -> int:
         count = await self._repository.delete_all_tasks()
+        self._progress_store.clear()
         self.tasks.clear()
         self._runtime_state.clear()
+        self._running_pools.clear()
         self._execution_specs.clear()
 
         await self._event_publisher.publish_snapshot([])
@@ -378,6 +483,73 @@ class TaskManager:
                     cancelled_count += 1
         return cancelled_count
 
+    async def query_tasks(
+        self,
+        *,
+        statuses: Optional[list[str]] = None,
+        task_types: Optional[list[str]] = None,
+        created_after: Optional[float] = None,
+        created_before: Optional[float] = None,
+        search: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> dict:
+        """
+        One filtered page of tasks from SQLite, newest first.
+
+        Rows that are also held in memory are served from memory, since their
+        progress may be ahead of what the write-behind store has flushed.
+        """
+        rows, total = await self._repository.query_tasks(
+            statuses=statuses,
+            task_types=task_types,
+            created_after=created_after,
+            created_before=created_before,
+            search=search,
+            limit=limit,
+            offset=offset,
+        )
+        return {
+            "items": [self.serialize_task(self.tasks.get(row.id, row)) for row in rows],
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+        }
+
+    async def fetch_task(self, task_id: str) -> Optional[Task]:
+        """Task from memory, or from SQLite if it is history not kept in memory."""
+        task = self.get_task(task_id)
+        if task is not None or self._keep_history_in_memory:
+            return task
+        return await self._repository.get(task_id)
+
+    async def load_task(self, task_id: str) -> Optional[Task]:
+        """Like fetch_task, but keeps the task in memory so it can be re-run."""
+        task = await self.fetch_task(task_id)
+        if task is not None:
+            self.tasks.setdefault(task_id, task)
+        return self.tasks.get(task_id)
+
+    async def get_task_result(self, task_id: str) -> Optional[dict]:
+        """Full result for one task, loading detached fields from the side table."""
+        task = await self.fetch_task(task_id)
+        if not task:
+            return None
+        if not isinstance(task.result, dict) or "result_ref" not in task.result:
+            return task.result
+        # The task may be the in-memory copy, so merge its own compact result
+        # rather than re-reading the row.
+        return merge_task_result(task.result, await self._repository.load_detached_result(task_id))
+
+    async def save_pipeline_checkpoint(self, checkpoint: PipelineCheckpoint) -> None:
+        await self._repository.save_checkpoint(checkpoint)
+
+    async def load_pipeline_checkpoints(self, task_id: str) -> list[PipelineCheckpoint]:
+        return await self._repository.load_checkpoints(task_id)
+
+    async def clear_pipeline_checkpoints(self, task_id: str, from_step: int = 0) -> None:
+        await self._repository.clear_checkpoints(task_id, from_step)
+
     def get_task(self, task_id: str) -> Optional[Task]:
         return self.tasks.get(task_id)
 
@@ -0,0 +1,89 @@
+import asyncio
+from typing import Any
+
+from loguru import logger
+
+from backend.models.task_model import Task
+from backend.services.task_repository import (
+    SETTLED_TASK_STATUSES,
+    TaskRepository,
+    clamp_progress,
+)
+
+
+class TaskProgressStore:
+    """
+    Write-behind layer for high-frequency task progress.
+
+    Progress/message ticks are applied to the cached Task immediately and
+    coalesced per task; they reach SQLite in one batched transaction per flush
+    interval. Any update carrying other fields (status, result, error...) is a
+    durable write and absorbs the task's pending ticks first. Both kinds of
+    write share the repository's single FIFO writer, so a flush can never land
+    after a newer durable write.
+    """
+
+    COALESCABLE_FIELDS = frozenset({"progress", "message"})
+
+    def __init__(self, repository: TaskRepository, *, flush_interval_s: float = 1.0):
+        self._repository = repository
+        self._flush_interval_s = max(0.05, flush_interval_s)
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._flush_task: asyncio.Task | None = None
+
+    def is_coalescable(self, fields: dict[str, Any]) -> bool:
+        return bool(fields) and self.COALESCABLE_FIELDS.issuperset(fields)
+
+    def stage(self, task: Task, **fields) -> bool:
+        """Apply a progress tick to the cached task. Returns False if it was dropped."""
+        if task.status in SETTLED_TASK_STATUSES:
+            return False
+        if "progress" in fields:
+            fields["progress"] = clamp_progress(fields["progress"])
+        for key, value in fields.items():
+            setattr(task, key, value)
+        self._pending.setdefault(task.id, {}).update(fields)
+        return True
+
+    def take(self, task_id: str) -> dict[str, Any]:
+        return self._pending.pop(task_id, {})
+
+    def discard(self, task_id: str) -> None:
+        self._pending.pop(task_id, None)
+
+    def clear(self) -> None:
+        self._pending.clear()
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    async def flush(self) -> int:
+        if not self._pending:
+            return 0
+        batch, self._pending = self._pending, {}
+        try:
+            return await self._repository.apply_progress_batch(batch)
+        except Exception as e:
+            logger.error(f"Failed to flush {len(batch)} task progress updates: {e}")
+            for task_id, fields in batch.items():
+                self._pending[task_id] = {**fields, **self._pending.get(task_id, {})}
+            return 0
+
+    def start(self) -> None:
+        if self._flush_task and not self._flush_task.done():
+            return
+        self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        if self._flush_task:
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        await self.flush()
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval_s)
+            await self.flush()
+
@@ -0,0 +1,258 @@
+from typing import Iterator, Optional
+
+
+class TaskQueueOrder:
+    """
+    Ordered set of queued task ids.
+
+    Each id owns an integer slot; a Fenwick tree over slot occupancy turns
+    "how many queued tasks sit before this slot" into an O(log n) prefix sum,
+    so position lookup, removal and finding the k-th task are all O(log n).
+    Slots are laid out with gaps, letting a task be moved between two
+    neighbours by taking a free slot between them; when a gap or either end
+    runs out the layout is rebuilt, which is O(n) but rare (amortized O(1)).
+    """
+
+    _SPACING = 32
+    _MIN_CAPACITY = 1024
+
+    def __init__(self):
+        self._slots: dict[str, int] = {}
+        self._ids_by_slot: dict[int, str] = {}
+        self._relayout([])
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._slots
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.to_list())
+
+    def to_list(self) -> list[str]:
+        return [self._ids_by_slot[slot] for slot in sorted(self._ids_by_slot)]
+
+    def clear(self) -> None:
+        self._slots.clear()
+        self._ids_by_slot.clear()
+        self._relayout([])
+
+    def append(self, task_id: str) -> None:
+        self.discard(task_id)
+        slot = self._high + self._SPACING
+        if slot > self._capacity:
+            self._relayout(self.to_list() + [task_id])
+            return
+        self._high = slot
+        self._occupy(task_id, slot)
+
+    def appendleft(self, task_id: str) -> None:
+        self.discard(task_id)
+        slot = self._low - self._SPACING
+        if slot < 1:
+            self._relayout([task_id] + self.to_list())
+            return
+        self._low = slot
+        self._occupy(task_id, slot)
+
+    def remove(self, task_id: str) -> None:
+        slot = self._slots.pop(task_id)
+        del self._ids_by_slot[slot]
+        self._add(slot, -1)
+
+    def discard(self, task_id: str) -> None:
+        if task_id in self._slots:
+            self.remove(task_id)
+
+    def position(self, task_id: str) -> Optional[int]:
+        """1-based position of task_id, or None if it is not queued."""
+        slot = self._slots.get(task_id)
+        if slot is None:
+            return None
+        return self._prefix_sum(slot)
+
+    def at(self, position: int) -> Optional[str]:
+        """Task id at a 1-based position, or None if out of range."""
+        if position < 1 or position > len(self._slots):
+            return None
+        return self._ids_by_slot[self._find_kth(position)]
+
+    def peek(self) -> Optional[str]:
+        return self.at(1)
+
+    def popleft(self) -> Optional[str]:
+        task_id = self.peek()
+        if task_id is not None:
+            self.remove(task_id)
+        return task_id
+
+    def move(self, task_id: str, position: int) -> int:
+        """
+        Move a queued task to a 1-based position, clamped to the queue bounds.
+        Returns the position it ended up at.
+        """
+        if task_id not in self._slots:
+            raise KeyError(task_id)
+        self.remove(task_id)
+        target = min(max(1, position), len(self._slots) + 1)
+        if target == 1:
+            self.appendleft(task_id)
+        elif target == len(self._slots) + 1:
+            self.append(task_id)
+        else:
+            before = self._find_kth(target - 1)
+            after = self._find_kth(target)
+            if after - before > 1:
+                self._occupy(task_id, (before + after) // 2)
+            else:
+                order = self.to_list()
+                order.insert(target - 1, task_id)
+                self._relayout(order)
+        return target
+
+    def _occupy(self, task_id: str, slot: int) -> None:
+        self._slots[task_id] = slot
+        self._ids_by_slot[slot] = task_id
+        self._add(slot, 1)
+
+    def _relayout(self, order: list[str]) -> None:
+        # Leave room for as many front insertions as there are queued tasks
+        # and three times as many appends before the next rebuild.
+        count = len(order)
+        self._capacity = max(self._MIN_CAPACITY, 4 * (count + 1) * self._SPACING)
+        self._tree = [0] * (self._capacity + 1)
+        self._slots.clear()
+        self._ids_by_slot.clear()
+        base = self._capacity // 4
+        self._low = base
+        self._high = base - self._SPACING
+        for index, task_id in enumerate(order):
+            slot = base + index * self._SPACING
+            self._slots[task_id] = slot
+            self._ids_by_slot[slot] = task_id
+            self._tree[slot] += 1
+            self._high = slot
+        # Build the Fenwick tree in place from the occupancy counts.
+        for index in range(1, self._capacity + 1):
+            parent = index + (index & -index)
+            if parent <= self._capacity:
+                self._tree[parent] += self._tree[index]
+
+    def _add(self, slot: int, delta: int) -> None:
+        while slot <= self._capacity:
+            self._tree[slot] += delta
+            slot += slot & -slot
+
+    def _prefix_sum(self, slot: int) -> int:
+        total = 0
+        while slot > 0:
+            total += self._tree[slot]
+            slot -= slot & -slot
+        return total
+
+    def _find_kth(self, k: int) -> int:
+        slot = 0
+        step = 1 << self._capacity.bit_length()
+        while step:
+            candidate = slot + step
+            if candidate <= self._capacity and self._tree[candidate] < k:
+                slot = candidate
+                k -= self._tree[candidate]
+            step >>= 1
+        return slot + 1
+
+
+class PooledTaskQueue:
+    """
+    Ready queues for the scheduler, one TaskQueueOrder per resource pool.
+
+    A task's position is its place in its own pool's queue, since that is
+    what it waits behind. Higher-priority tasks are inserted ahead of every
+    queued task of lower priority in the same pool; tasks of equal priority
+    stay first-in first-out.
+    """
+
+    def __init__(self):
+        self._orders: dict[str, TaskQueueOrder] = {}
+        self._pool_by_id: dict[str, str] = {}
+        self._priority_by_id: dict[str, int] = {}
+        self._priority_counts: dict[str, dict[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._pool_by_id)
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._pool_by_id
+
+    def clear(self) -> None:
+        self._orders.clear()
+        self._pool_by_id.clear()
+        self._priority_by_id.clear()
+        self._priority_counts.clear()
+
+    def push(self, task_id: str, pool: str, priority: int = 0) -> int:
+        """Queue a task and return its 1-based position in its pool."""
+        self.discard(task_id)
+        order = self._orders.setdefault(pool, TaskQueueOrder())
+        counts = self._priority_counts.setdefault(pool, {})
+        ahead = sum(count for level, count in counts.items() if level >= priority)
+        order.append(task_id)
+        if ahead < len(order) - 1:
+            order.move(task_id, ahead + 1)
+        counts[priority] = counts.get(priority, 0) + 1
+        self._pool_by_id[task_id] = pool
+        self._priority_by_id[task_id] = priority
+        return order.position(task_id)
+
+    def discard(self, task_id: str) -> None:
+        pool = self._pool_by_id.pop(task_id, None)
+        if pool is None:
+            return
+        self._orders[pool].discard(task_id)
+        priority = self._priority_by_id.pop(task_id)
+        counts = self._priority_counts[pool]
+        counts[priority] -= 1
+        if not counts[priority]:
+            del counts[priority]
+
+    def remove(self, task_id: str) -> None:
+        if task_id not in self._pool_by_id:
+            raise KeyError(task_id)
+        self.discard(task_id)
+
+    def pop(self, pool: str) -> Optional[str]:
+        order = self._orders.get(pool)
+        task_id = order.peek() if order else None
+        if task_id is not None:
+            self.discard(task_id)
+        return task_id
+
+    def pool_of(self, task_id: str) -> Optional[str]:
+        return self._pool_by_id.get(task_id)
+
+    def position(self, task_id: str) -> Optional[int]:
+        pool = self._pool_by_id.get(task_id)
+        return self._orders[pool].position(task_id) if pool is not None else None
+
+    def at(self, pool: str, position: int) -> Optional[str]:
+        order = self._orders.get(pool)
+        return order.at(position) if order else None
+
+    def move(self, task_id: str, position: int) -> int:
+        """
+        Move a task within its pool's queue. The position is clamped to the
+        span of tasks with the same priority, so a move never puts a task
+        ahead of higher-priority work or behind lower-priority work.
+        """
+        pool = self._pool_by_id.get(task_id)
+        if pool is None:
+            raise KeyError(task_id)
+        priority = self._priority_by_id[task_id]
+        counts = self._priority_counts[pool]
+        first = sum(count for level, count in counts.items() if level > priority) + 1
+        last = first + counts[priority] - 1
+        return self._orders[pool].move(task_id, min(max(position, first), last))
+
+    def queued_by_pool(self) -> dict[str, int]:
+        return {pool: len(order) for pool, order in self._orders.items() if len(order)}
@@ -2,27 +2,28 @@ from typing import Optional
 
 from backend.contracts import TASK_CONTRACT_VERSION, TASK_LIFECYCLE
 from backend.models.task_model import Task
+from backend.services.task_queue_order import PooledTaskQueue, TaskQueueOrder
+
+# Statuses whose tasks belong to the live queue rather than history.
+RUNTIME_SCOPE_STATUSES = frozenset({"pending", "running", "paused", "processing_result"})
 
 
 class TaskQueueView:
     @staticmethod
     def get_persistence_scope(task: Task) -> str:
-        return "runtime" if task.status in {"pending", "running", "paused", "processing_result"} else "history"
+        return "runtime" if task.status in RUNTIME_SCOPE_STATUSES else "history"
 
     @staticmethod
     def get_lifecycle(task: Task) -> str:
-        if task.status in {"pending", "running", "paused", "processing_result"}:
+        if task.status in RUNTIME_SCOPE_STATUSES:
             return TASK_LIFECYCLE["resumable"]
         return TASK_LIFECYCLE["history_only"]
 
     @staticmethod
-    def get_queue_position(task_id: str, queued_ids: set[str], queued_order: list[str]) -> Optional[int]:
+    def get_queue_position(task_id: str, queued_ids: set[str], queued_order: PooledTaskQueue | TaskQueueOrder) -> Optional[int]:
         if task_id not in queued_ids:
             return None
-        for index, queued_id in enumerate(queued_order, start=1):
-            if queued_id == task_id:
-                return index
-        return None
+        return queued_order.position(task_id)
 
     def serialize_task(
         self,
@@ -30,7 +31,7 @@ class TaskQueueView:
         *,
         running_ids: set[str],
         queued_ids: set[str],
-        queued_order: list[str],
+        queued_order: PooledTaskQueue | TaskQueueOrder,
     ) -> dict:
         data = task.model_dump(mode="json")
         queue_state = "idle"
@@ -59,9 +60,25 @@ class TaskQueueView:
         return data
 
     @staticmethod
-    def get_queue_summary(max_concurrent: int, running_ids: set[str], queued_ids: set[str]) -> dict:
+    def get_pool_summary(
+        pool_limits: dict[str, int],
+        running_by_pool: dict[str, int],
+        queued_by_pool: dict[str, int],
+    ) -> dict:
+        return {
+            pool: {
+                "limit": limit,
+                "running": running_by_pool.get(pool, 0),
+                "queued": queued_by_pool.get(pool, 0),
+            }
+            for pool, limit in pool_limits.items()
+        }
+
+    @staticmethod
+    def get_queue_summary(pools: dict[str, dict], running_ids: set[str], queued_ids: set[str]) -> dict:
         return {
-            "max_concurrent": max_concurrent,
+            "max_concurrent": sum(pool["limit"] for pool in pools.values()),
             "running": len(running_ids),
             "queued": len(queued_ids),
+            "pools": pools,
         }
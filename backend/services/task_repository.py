@@ -4,13 +4,19 @@ import uuid
 from typing import Dict, Optional
 
 from loguru import logger
-from sqlmodel import delete, select
+from sqlmodel import col, delete, func, select
 
-from backend.core.database import get_session_context
-from backend.models.task_model import Task
+from backend.config import settings
+from backend.core.database import DatabaseWriter, get_session_context
+from backend.models.task_model import PipelineCheckpoint, Task, TaskResultRecord
+from backend.services.task_queue_view import RUNTIME_SCOPE_STATUSES
+from backend.services.task_result_compactor import split_task_result
 
+# Statuses that only an explicit status change may move a task out of.
+SETTLED_TASK_STATUSES = frozenset({"completed", "failed", "cancelled", "paused"})
 
-def _clamp_progress(value):
+
+def clamp_progress(value):
     try:
         return max(0.0, min(100.0, float(value)))
     except (TypeError, ValueError):
@@ -18,25 +24,82 @@ def _clamp_progress(value):
 
 
 class TaskRepository:
-    async def load_all(self) -> dict[str, Task]:
-        tasks_by_id: dict[str, Task] = {}
-        async with get_session_context() as session:
+    """SQLite persistence for tasks. Every write is funnelled through one DatabaseWriter."""
+
+    def __init__(
+        self,
+        writer: Optional[DatabaseWriter] = None,
+        *,
+        result_inline_limit_bytes: Optional[int] = None,
+    ):
+        self._writer = writer or DatabaseWriter()
+        self._result_inline_limit_bytes = (
+            settings.TASK_RESULT_INLINE_LIMIT_BYTES
+            if result_inline_limit_bytes is None
+            else result_inline_limit_bytes
+        )
+
+    async def close(self) -> None:
+        await self._writer.stop()
+
+    async def load_all(self, runtime_only: bool = False) -> dict[str, Task]:
+        async def _load(session) -> dict[str, Task]:
+            tasks_by_id: dict[str, Task] = {}
             statement = select(Task)
+            if runtime_only:
+                statement = statement.where(col(Task.status).in_(RUNTIME_SCOPE_STATUSES))
             result = await session.execute(statement)
-            tasks = result.scalars().all()
-
-            for task in tasks:
+            for task in result.scalars().all():
                 if task.status in ["running", "pending"]:
                     task.status = "paused"
                     task.message = "Interrupted by restart"
                     task.cancelled = False
                     session.add(task)
                 tasks_by_id[task.id] = task
+            return tasks_by_id
 
-            if tasks:
-                await session.commit()
+        return await self._writer.submit(_load)
 
-        return tasks_by_id
+    async def get(self, task_id: str) -> Optional[Task]:
+        async with get_session_context() as session:
+            return await session.get(Task, task_id)
+
+    async def query_tasks(
+        self,
+        *,
+        statuses: Optional[list[str]] = None,
+        task_types: Optional[list[str]] = None,
+        created_after: Optional[float] = None,
+        created_before: Optional[float] = None,
+        search: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[list[Task], int]:
+        """One page of tasks, newest first, plus the total matching the filters."""
+        conditions = []
+        if statuses:
+            conditions.append(col(Task.status).in_(statuses))
+        if task_types:
+            conditions.append(col(Task.type).in_(task_types))
+        if created_after is not None:
+            conditions.append(col(Task.created_at) >= created_after)
+        if created_before is not None:
+            conditions.append(col(Task.created_at) < created_before)
+        if search:
+            conditions.append(col(Task.name).contains(search, autoescape=True))
+
+        async with get_session_context() as session:
+            count_statement = select(func.count()).select_from(Task).where(*conditions)
+            total = (await session.execute(count_statement)).scalar_one()
+            statement = (
+                select(Task)
+                .where(*conditions)
+                .order_by(col(Task.created_at).desc())
+                .offset(max(0, offset))
+                .limit(max(1, limit))
+            )
+            result = await session.execute(statement)
+            return list(result.scalars().all()), total
 
     async def create_task(
         self,
@@ -67,63 +130,140 @@ class TaskRepository:
             request_params=request_params,
         )
 
-        async with get_session_context() as session:
+        async def _create(session) -> Task:
             session.add(new_task)
-            await session.commit()
-            await session.refresh(new_task)
+            return new_task
 
-        return new_task
+        return await self._writer.submit(_create)
 
     async def update_task(self, task_id: str, cached_task: Optional[Task] = None, **kwargs) -> Task | None:
-        updated_task = None
         if "progress" in kwargs:
-            kwargs["progress"] = _clamp_progress(kwargs["progress"])
+            kwargs["progress"] = clamp_progress(kwargs["progress"])
+        detached = None
+        if "result" in kwargs:
+            kwargs["result"], detached = split_task_result(
+                task_id,
+                kwargs["result"],
+                self._result_inline_limit_bytes,
+            )
 
-        async with get_session_context() as session:
+        async def _update(session) -> Task | None:
             db_task = await session.get(Task, task_id)
             if db_task:
                 incoming_status = kwargs.get("status")
-                if db_task.status in {"completed", "failed", "cancelled", "paused"} and incoming_status is None:
+                if db_task.status in SETTLED_TASK_STATUSES and incoming_status is None:
                     return None
                 for key, value in kwargs.items():
                     if hasattr(db_task, key):
                         setattr(db_task, key, value)
+                session.add(db_task)
+                if "result" in kwargs:
+                    await self._store_detached_result(session, task_id, kwargs["result"], detached)
+                return db_task
+
+            logger.warning(f"Task {task_id} not found in DB during update.")
+            if not cached_task:
+                return None
+            for key, value in kwargs.items():
+                if hasattr(cached_task, key):
+                    setattr(cached_task, key, value)
+            if "result" in kwargs:
+                # Keep the detached fields reachable for the cached copy.
+                await self._store_detached_result(session, task_id, kwargs["result"], detached)
+            return cached_task
+
+        return await self._writer.submit(_update)
 
+    @staticmethod
+    async def _store_detached_result(session, task_id: str, compact: Optional[dict], detached: Optional[dict]) -> None:
+        record = await session.get(TaskResultRecord, task_id)
+        if detached is None:
+            if record:
+                await session.delete(record)
+            return
+        if record is None:
+            record = TaskResultRecord(task_id=task_id)
+        record.payload = detached
+        record.size_bytes = compact["result_ref"]["size_bytes"]
+        record.updated_at = time.time()
+        session.add(record)
+
+    async def load_detached_result(self, task_id: str) -> Optional[dict]:
+        """Return the fields split off a task's result, if any."""
+        async with get_session_context() as session:
+            record = await session.get(TaskResultRecord, task_id)
+            return record.payload if record else None
+
+    async def apply_progress_batch(self, updates: dict[str, dict]) -> int:
+        """Persist coalesced progress/message fields for many tasks in one transaction."""
+        if not updates:
+            return 0
+
+        async def _apply(session) -> int:
+            applied = 0
+            statement = select(Task).where(col(Task.id).in_(list(updates)))
+            result = await session.execute(statement)
+            for db_task in result.scalars().all():
+                if db_task.status in SETTLED_TASK_STATUSES:
+                    continue
+                for key, value in updates[db_task.id].items():
+                    if hasattr(db_task, key):
+                        setattr(db_task, key, value)
                 session.add(db_task)
-                await session.commit()
-                await session.refresh(db_task)
-                updated_task = db_task
-            else:
-                logger.warning(f"Task {task_id} not found in DB during update.")
-                if not cached_task:
-                    return None
-                for key, value in kwargs.items():
-                    if hasattr(cached_task, key):
-                        setattr(cached_task, key, value)
-                updated_task = cached_task
+                applied += 1
+            return applied
 
-        return updated_task
+        return await self._writer.submit(_apply)
 
     async def delete_task(self, task_id: str) -> bool:
-        async with get_session_context() as session:
+        async def _delete(session) -> bool:
             db_task = await session.get(Task, task_id)
             if not db_task:
                 return False
             await session.delete(db_task)
-            await session.commit()
+            record = await session.get(TaskResultRecord, task_id)
+            if record:
+                await session.delete(record)
+            await session.execute(delete(PipelineCheckpoint).where(col(PipelineCheckpoint.task_id) == task_id))
             return True
 
+        return await self._writer.submit(_delete)
+
     async def delete_all_tasks(self) -> int:
-        count = 0
+        async def _delete_all(session) -> int:
+            statement = select(func.count()).select_from(Task)
+            count = (await session.execute(statement)).scalar_one()
+            if count > 0:
+                await session.execute(delete(Task))
+            await session.execute(delete(TaskResultRecord))
+            await session.execute(delete(PipelineCheckpoint))
+            return count
+
+        return await self._writer.submit(_delete_all)
+
+    async def save_checkpoint(self, checkpoint: PipelineCheckpoint) -> None:
+        async def _save(session) -> None:
+            await session.merge(checkpoint)
+
+        await self._writer.submit(_save)
+
+    async def load_checkpoints(self, task_id: str) -> list[PipelineCheckpoint]:
         async with get_session_context() as session:
-            statement = select(Task)
-            result = await session.execute(statement)
-            tasks = result.scalars().all()
-            count = len(tasks)
+            statement = (
+                select(PipelineCheckpoint)
+                .where(col(PipelineCheckpoint.task_id) == task_id)
+                .order_by(col(PipelineCheckpoint.step_index))
+            )
+            return list((await session.execute(statement)).scalars().all())
 
-            if count > 0:
-                delete_statement = delete(Task)
-                await session.execute(delete_statement)
-                await session.commit()
+    async def clear_checkpoints(self, task_id: str, from_step: int = 0) -> None:
+        """Drop a task's checkpoints for step_index >= from_step."""
+        async def _clear(session) -> None:
+            await session.execute(
+                delete(PipelineCheckpoint).where(
+                    col(PipelineCheckpoint.task_id) == task_id,
+                    col(PipelineCheckpoint.step_index) >= from_step,
+                )
+            )
 
-        return count
+        await self._writer.submit(_clear)
@@ -0,0 +1,101 @@
+import json
+from typing import Any, Optional
+
+# Result fields that grow with media length. Paths are (container, key) where
+# container None means the top level of the result dict.
+DETACHABLE_RESULT_FIELDS: tuple[tuple[Optional[str], str], ...] = (
+    (None, "segments"),
+    (None, "events"),
+    ("meta", "segments"),
+    ("meta", "text"),
+    ("meta", "events"),
+    ("meta", "execution_trace"),
+)
+
+TEXT_PREVIEW_CHARS = 200
+
+
+def _field_name(container: Optional[str], key: str) -> str:
+    return f"{container}.{key}" if container else key
+
+
+def _json_size(value: Any) -> int:
+    return len(json.dumps(value, ensure_ascii=False, default=str))
+
+
+def split_task_result(
+    task_id: str,
+    result: Optional[dict],
+    inline_limit_bytes: int,
+) -> tuple[Optional[dict], Optional[dict]]:
+    """
+    Split a task result into the compact dict kept on the task row and the
+    detached fields stored separately.
+
+    Results at or under inline_limit_bytes are returned unchanged. Larger ones
+    have detachable fields moved out, biggest first, until the rest fits; the
+    moved fields are summarized (list lengths, text previews) under a
+    ``result_ref`` entry.
+    """
+    if not isinstance(result, dict):
+        return result, None
+    total_size = _json_size(result)
+    if total_size <= inline_limit_bytes:
+        return result, None
+
+    compact = dict(result)
+    if isinstance(compact.get("meta"), dict):
+        compact["meta"] = dict(compact["meta"])
+
+    candidates = []
+    for container, key in DETACHABLE_RESULT_FIELDS:
+        holder = compact if container is None else compact.get(container)
+        if isinstance(holder, dict) and key in holder:
+            candidates.append((_json_size(holder[key]), container, key, holder))
+
+    # Move the biggest fields out first so small ones (e.g. a short trace the
+    # task monitor renders) stay inline whenever that is enough.
+    detached: dict[str, Any] = {}
+    summary: dict[str, Any] = {}
+    remaining_size = total_size
+    for size, container, key, holder in sorted(candidates, key=lambda item: item[0], reverse=True):
+        if remaining_size <= inline_limit_bytes:
+            break
+        name = _field_name(container, key)
+        value = holder.pop(key)
+        detached[name] = value
+        remaining_size -= size
+        if isinstance(value, (list, dict)):
+            summary[name] = {"count": len(value)}
+        elif isinstance(value, str):
+            summary[name] = {"preview": value[:TEXT_PREVIEW_CHARS]}
+
+    if not detached:
+        return result, None
+
+    compact["result_ref"] = {
+        "task_id": task_id,
+        "fields": sorted(detached),
+        "summary": summary,
+        "size_bytes": total_size,
+    }
+    return compact, detached
+
+
+def merge_task_result(compact: Optional[dict], detached: Optional[dict]) -> Optional[dict]:
+    """Rebuild the full result from its compact row value and detached fields."""
+    if not isinstance(compact, dict) or not compact.get("result_ref"):
+        return compact
+
+    full = dict(compact)
+    full.pop("result_ref", None)
+    if isinstance(full.get("meta"), dict):
+        full["meta"] = dict(full["meta"])
+
+    for container, key in DETACHABLE_RESULT_FIELDS:
+        name = _field_name(container, key)
+        if not detached or name not in detached:
+            continue
+        holder = full if container is None else full.setdefault(container, {})
+        holder[key] = detached[name]
+    return full
@@ -1,7 +1,13 @@
+from typing import Optional
+
+from backend.core.tasks.base import PRIORITY_NORMAL, RESOURCE_COMPUTE
+from backend.services.task_queue_order import PooledTaskQueue
+
+
 class TaskRuntimeState:
     def __init__(self):
         self.queued_ids: set[str] = set()
-        self.queued_order: list[str] = []
+        self.queued_order = PooledTaskQueue()
         self.running_ids: set[str] = set()
         self.stop_requests: dict[str, str] = {}
         self.delete_after_stop: set[str] = set()
@@ -13,14 +19,24 @@ class TaskRuntimeState:
         self.stop_requests.clear()
         self.delete_after_stop.clear()
 
-    def mark_queued(self, task_id: str) -> None:
+    def mark_queued(
+        self,
+        task_id: str,
+        pool: str = RESOURCE_COMPUTE,
+        priority: int = PRIORITY_NORMAL,
+    ) -> None:
         self.queued_ids.add(task_id)
-        self.queued_order.append(task_id)
+        self.queued_order.push(task_id, pool, priority)
 
     def unmark_queued(self, task_id: str) -> None:
         self.queued_ids.discard(task_id)
-        if task_id in self.queued_order:
-            self.queued_order.remove(task_id)
+        self.queued_order.discard(task_id)
+
+    def pop_next_queued(self, pool: str = RESOURCE_COMPUTE) -> Optional[str]:
+        task_id = self.queued_order.pop(pool)
+        if task_id is not None:
+            self.queued_ids.discard(task_id)
+        return task_id
 
     def mark_running(self, task_id: str) -> None:
         self.running_ids.add(task_id)
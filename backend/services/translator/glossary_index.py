@@ -0,0 +1,128 @@
+import threading
+from collections import deque
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+class _Node:
+    __slots__ = ("children", "fail", "outputs", "depth")
+
+    def __init__(self, depth: int = 0, fail: "_Node | None" = None):
+        self.children: Dict[str, "_Node"] = {}
+        # Until the next relink a new node fails to the root, never to itself.
+        self.fail: "_Node" = fail if fail is not None else self
+        # Keys of the patterns ending exactly here; suffix matches are
+        # reached by following fail links.
+        self.outputs: Set[str] = set()
+        self.depth = depth
+
+
+class GlossaryIndex:
+    """
+    Aho–Corasick matcher over glossary sources, case-insensitive.
+
+    One pass over the text finds every source it contains, whatever the
+    number of terms, and matches plain substrings so CJK sources need no
+    word boundaries. add/remove only touch the trie path of that source;
+    failure links are recomputed lazily (one BFS over the trie) before the
+    next search after an edit. Edits and searches share one lock, so the
+    index can be used from several translation workers at once.
+    """
+
+    def __init__(self):
+        self._root = _Node()
+        self._patterns: Dict[str, str] = {}
+        self._dirty = False
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def fold(text: str) -> str:
+        return (text or "").lower()
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def add(self, key: str, source: str) -> None:
+        with self._lock:
+            self._add_locked(key, source)
+
+    def _add_locked(self, key: str, source: str) -> None:
+        if key in self._patterns:
+            self._remove_locked(key)
+        pattern = self.fold(source)
+        if not pattern:
+            return
+        node = self._root
+        for char in pattern:
+            child = node.children.get(char)
+            if child is None:
+                child = _Node(node.depth + 1, fail=self._root)
+                node.children[char] = child
+            node = child
+        node.outputs.add(key)
+        self._patterns[key] = pattern
+        self._dirty = True
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            self._remove_locked(key)
+
+    def _remove_locked(self, key: str) -> None:
+        pattern = self._patterns.pop(key, None)
+        if pattern is None:
+            return
+        path = [self._root]
+        for char in pattern:
+            path.append(path[-1].children[char])
+        path[-1].outputs.discard(key)
+        # Prune the branch back to the last node still in use.
+        for depth in range(len(pattern), 0, -1):
+            node = path[depth]
+            if node.outputs or node.children:
+                break
+            del path[depth - 1].children[pattern[depth - 1]]
+        self._dirty = True
+
+    def rebuild(self, entries: Iterable[Tuple[str, str]]) -> None:
+        with self._lock:
+            self._root = _Node()
+            self._patterns = {}
+            for key, source in entries:
+                self._add_locked(key, source)
+
+    def _link_locked(self) -> None:
+        root = self._root
+        root.fail = root
+        queue = deque()
+        for child in root.children.values():
+            child.fail = root
+            queue.append(child)
+        while queue:
+            node = queue.popleft()
+            for char, child in node.children.items():
+                fail = node.fail
+                while fail is not root and char not in fail.children:
+                    fail = fail.fail
+                target = fail.children.get(char)
+                child.fail = target if target is not None and target is not child else root
+                queue.append(child)
+        self._dirty = False
+
+    def search(self, text: str) -> Dict[str, List[int]]:
+        """Start offsets of every occurrence of each indexed source in text, by key."""
+        folded = self.fold(text)
+        found: Dict[str, List[int]] = {}
+        with self._lock:
+            if self._dirty:
+                self._link_locked()
+            root = self._root
+            node = root
+            for index, char in enumerate(folded):
+                while node is not root and char not in node.children:
+                    node = node.fail
+                node = node.children.get(char, root)
+                match = node
+                while match is not root:
+                    for key in match.outputs:
+                        found.setdefault(key, []).append(index - match.depth + 1)
+                    match = match.fail
+        return found
@@ -1,40 +1,120 @@
-
+import hashlib
 import json
 import os
+import threading
 import uuid
-from typing import List, Optional
+from typing import Dict, List, Optional
 from loguru import logger
+from backend.config import settings
 from backend.models.schemas import GlossaryTerm
+from backend.services.translator.glossary_index import GlossaryIndex
+from backend.services.translator.translation_rate_limiter import estimate_tokens
 
 DATA_DIR = os.path.join(os.getcwd(), "data")
+# Legacy whole-file store, migrated into the journal on first load.
 GLOSSARY_FILE = os.path.join(DATA_DIR, "glossary.json")
+# Append-only JSON lines: {"op": "put", "term": {...}} or {"op": "delete", "id": ...}.
+GLOSSARY_JOURNAL = os.path.join(DATA_DIR, "glossary.jsonl")
+# The journal is rewritten as one put per term once it holds this many
+# lines and more than twice as many as there are terms.
+JOURNAL_COMPACT_MIN_LINES = 200
+
 
 class GlossaryService:
     def __init__(self):
         self._ensure_data_dir()
-        self.terms: List[GlossaryTerm] = self._load_terms()
+        # Guards _terms, the index and the journal together, so translation
+        # workers never see a key the index knows but _terms has dropped.
+        self._lock = threading.RLock()
+        self._terms: Dict[str, GlossaryTerm] = {}
+        self._journal_lines = 0
+        self._version: Optional[str] = None
+        self._index = GlossaryIndex()
+        self._load_terms()
+        self._index.rebuild((term.id, term.source) for term in self._terms.values())
 
     def _ensure_data_dir(self):
         if not os.path.exists(DATA_DIR):
             os.makedirs(DATA_DIR, exist_ok=True)
 
-    def _load_terms(self) -> List[GlossaryTerm]:
+    @property
+    def terms(self) -> List[GlossaryTerm]:
+        with self._lock:
+            return list(self._terms.values())
+
+    def _load_terms(self) -> None:
+        if os.path.exists(GLOSSARY_JOURNAL):
+            self._replay_journal()
+            return
         if not os.path.exists(GLOSSARY_FILE):
-            return []
+            return
         try:
             with open(GLOSSARY_FILE, "r", encoding="utf-8") as f:
                 data = json.load(f)
-                return [GlossaryTerm(**item) for item in data]
+            self._terms = {term.id: term for term in (GlossaryTerm(**item) for item in data)}
         except Exception as e:
             logger.error(f"Failed to load glossary: {e}")
-            return []
+            return
+        self._compact()
+        logger.info(f"Migrated {len(self._terms)} glossary terms to {GLOSSARY_JOURNAL}")
+
+    def _replay_journal(self) -> None:
+        try:
+            with open(GLOSSARY_JOURNAL, "r", encoding="utf-8") as f:
+                for line_number, line in enumerate(f, start=1):
+                    if not line.strip():
+                        continue
+                    self._journal_lines += 1
+                    try:
+                        record = json.loads(line)
+                        if record.get("op") == "put":
+                            term = GlossaryTerm(**record["term"])
+                            self._terms[term.id] = term
+                        elif record.get("op") == "delete":
+                            self._terms.pop(record.get("id"), None)
+                    except Exception as e:
+                        # A torn final write loses only that edit.
+                        logger.warning(f"Skipping unreadable glossary journal line {line_number}: {e}")
+        except Exception as e:
+            logger.error(f"Failed to load glossary: {e}")
+
+    @property
+    def version(self) -> str:
+        """Changes whenever a term's source or target does; part of translation memory keys."""
+        with self._lock:
+            if self._version is None:
+                pairs = sorted((term.source, term.target) for term in self._terms.values())
+                self._version = hashlib.sha256(json.dumps(pairs, ensure_ascii=False).encode("utf-8")).hexdigest()[:16]
+            return self._version
 
-    def _save_terms(self):
+    def _append(self, record: dict) -> None:
+        self._version = None
         try:
-            with open(GLOSSARY_FILE, "w", encoding="utf-8") as f:
-                json.dump([t.dict() for t in self.terms], f, ensure_ascii=False, indent=2)
+            with open(GLOSSARY_JOURNAL, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._journal_lines += 1
         except Exception as e:
             logger.error(f"Failed to save glossary: {e}")
+            return
+        if self._journal_lines >= JOURNAL_COMPACT_MIN_LINES and self._journal_lines > 2 * len(self._terms):
+            self._compact()
+
+    def _compact(self) -> None:
+        temp_path = f"{GLOSSARY_JOURNAL}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                for term in self._terms.values():
+                    f.write(json.dumps({"op": "put", "term": term.model_dump()}, ensure_ascii=False) + "\n")
+            os.replace(temp_path, GLOSSARY_JOURNAL)
+            self._journal_lines = len(self._terms)
+        except Exception as e:
+            logger.error(f"Failed to compact glossary journal: {e}")
+
+    def _put(self, term: GlossaryTerm) -> None:
+        with self._lock:
+            self._terms[term.id] = term
+            self._index.add(term.id, term.source)
+            self._append({"op": "put", "term": term.model_dump()})
 
     def list_terms(self) -> List[GlossaryTerm]:
         return self.terms
@@ -47,40 +127,94 @@ class GlossaryService:
             note=note,
             category=category
         )
-        self.terms.append(term)
-        self._save_terms()
+        self._put(term)
         logger.info(f"Added glossary term: {source} -> {target}")
         return term
 
     def update_term(self, term_id: str, updates: dict) -> Optional[GlossaryTerm]:
-        for term in self.terms:
-            if term.id == term_id:
-                if "source" in updates: term.source = updates["source"]
-                if "target" in updates: term.target = updates["target"]
-                if "note" in updates: term.note = updates["note"]
-                if "category" in updates: term.category = updates["category"]
-                self._save_terms()
-                return term
-        return None
+        with self._lock:
+            term = self._terms.get(term_id)
+            if term is None:
+                return None
+            # A copy, so a concurrent lookup never sees a half-updated term.
+            term = term.model_copy(
+                update={key: updates[key] for key in ("source", "target", "note", "category") if key in updates}
+            )
+            self._put(term)
+            return term
 
     def delete_term(self, term_id: str) -> bool:
-        original_len = len(self.terms)
-        self.terms = [t for t in self.terms if t.id != term_id]
-        if len(self.terms) < original_len:
-            self._save_terms()
+        with self._lock:
+            if term_id not in self._terms:
+                return False
+            self._index.remove(term_id)
+            del self._terms[term_id]
+            self._append({"op": "delete", "id": term_id})
             return True
-        return False
 
-    def get_relevant_terms(self, text: str) -> List[GlossaryTerm]:
+    @staticmethod
+    def _prompt_tokens(term: GlossaryTerm) -> int:
+        # Matches the "- source -> target" (+ note) lines of the glossary prompt block.
+        return estimate_tokens(f"- {term.source} -> {term.target}") + (estimate_tokens(term.note) if term.note else 0) + 2
+
+    def get_relevant_terms(
+        self,
+        text: str,
+        max_terms: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+    ) -> List[GlossaryTerm]:
         """
-        Simple keyword matching to find terms relevant to the provided text.
-        Case-insensitive matching.
+        Terms whose source occurs in text (case-insensitive substring, so CJK
+        needs no word boundaries), most relevant first: terms not only found
+        inside a longer matched term, then by occurrences and source length.
+        Capped at max_terms / max_tokens of prompt text
+        (GLOSSARY_MAX_PROMPT_TERMS / GLOSSARY_MAX_PROMPT_TOKENS by default).
         """
-        relevant = []
-        text_lower = text.lower()
-        for term in self.terms:
-            if term.source.lower() in text_lower:
-                relevant.append(term)
-        return relevant
+        with self._lock:
+            matches = self._index.search(text)
+            terms = {key: self._terms[key] for key in matches if key in self._terms}
+        matches = {key: starts for key, starts in matches.items() if key in terms}
+        if not matches:
+            return []
+        max_terms = settings.GLOSSARY_MAX_PROMPT_TERMS if max_terms is None else max_terms
+        max_tokens = settings.GLOSSARY_MAX_PROMPT_TOKENS if max_tokens is None else max_tokens
+
+        spans = [
+            (start, start + len(self._index.fold(terms[key].source)))
+            for key, starts in matches.items()
+            for start in starts
+        ]
 
+        def covered(key: str) -> bool:
+            length = len(self._index.fold(terms[key].source))
+            return all(
+                any(
+                    other_start <= start and start + length <= other_end and other_end - other_start > length
+                    for other_start, other_end in spans
+                )
+                for start in matches[key]
+            )
 
+        ranked = sorted(
+            matches,
+            key=lambda key: (
+                covered(key),
+                -len(matches[key]),
+                -len(terms[key].source),
+                matches[key][0],
+            ),
+        )
+        relevant: List[GlossaryTerm] = []
+        used_tokens = 0
+        for key in ranked:
+            term = terms[key]
+            cost = self._prompt_tokens(term)
+            if max_terms and len(relevant) >= max_terms:
+                break
+            if max_tokens and relevant and used_tokens + cost > max_tokens:
+                continue
+            relevant.append(term)
+            used_tokens += cost
+        if len(relevant) < len(matches):
+            logger.debug(f"[Glossary] {len(matches)} terms matched, {len(relevant)} kept within the prompt budget")
+        return relevant
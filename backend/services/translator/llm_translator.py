@@ -1,4 +1,5 @@
 import json
+import sys
 from typing import Callable, Dict, List, Literal, Optional
 
 from loguru import logger
@@ -7,13 +8,14 @@ from pydantic import BaseModel
 from backend.config import settings
 from backend.models.schemas import SubtitleSegment
 from backend.services.translator.text_normalizer import normalize_text_for_target_language
-from backend.services.translator.translation_cache import TranslationCache
 from backend.services.translator.translation_client import TranslationClientFactory
+from backend.services.translator.translation_batch_planner import TokenBudget
 from backend.services.translator.translation_batch_runner import (
     build_translation_batches,
     checkpoint,
     normalize_batch_size,
     resolve_max_concurrency,
+    run_streaming_translation_batches,
     run_translation_batches,
 )
 from backend.services.translator.translation_models import (
@@ -22,14 +24,30 @@ from backend.services.translator.translation_models import (
     TranslationOutcome,
     TranslationResponse,
 )
+from backend.services.translator.translation_memory import translation_memory
+from backend.services.translator.translation_rate_limiter import (
+    estimate_tokens,
+    get_concurrency_limiter,
+    transient_llm_error,
+)
 from backend.services.translator.translation_prompts import TranslationPromptBuilder
 from backend.services.translator.translation_response_parser import TranslationResponseParser
+from backend.services.translator.translation_usage import (
+    MeteredClient,
+    TranslationUsage,
+    active_usage,
+    record_job_usage,
+    run_with_usage,
+)
 from backend.services.translator.translation_validator import TranslationResponseValidator
 
+# Lines per batch when token budgeting is off and the caller gives no batch_size.
+DEFAULT_BATCH_SIZE = 10
+
 
 class LLMTranslator:
     def __init__(self, *, settings_manager, glossary_service):
-        self._cache = TranslationCache()
+        self._memory = translation_memory
         self.model = settings.LLM_MODEL
         self._glossary_service = glossary_service
         self._client_factory = TranslationClientFactory(settings_manager)
@@ -51,8 +69,106 @@ class LLMTranslator:
             mode,
             context_before=batch.context_before,
             cancel_check=cancel_check,
+            memory_keys=batch.memory_keys,
+        )
+
+    def _metered(self, usage: TranslationUsage):
+        """_translate_planned_batch with every LLM request counted against usage."""
+
+        def translate_batch(batch, target_language, mode, cancel_check=None):
+            result = run_with_usage(
+                usage,
+                self._translate_planned_batch,
+                batch,
+                target_language,
+                mode,
+                cancel_check,
+            )
+            # Counted once the batch succeeds, so retried attempts only add requests.
+            usage.add_batch()
+            usage.add_segments(len(batch.segments))
+            return result
+
+        return translate_batch
+
+    def _glossary_term_tokens(self, text: str) -> int:
+        return sum(
+            estimate_tokens(f"{term.source}: {term.target}") + 4
+            for term in self._glossary_service.get_relevant_terms(text)
+        )
+
+    def _token_budget(self, batch_size: Optional[int]) -> Optional[TokenBudget]:
+        """Token-packing plan for this job, or None for fixed batch_size batches."""
+        if not settings.LLM_TRANSLATION_TOKEN_BUDGET:
+            return None
+        return TokenBudget.for_model(
+            self._client_factory.active_model() or self.model,
+            max_segments=batch_size or settings.LLM_TRANSLATION_MAX_BATCH_SEGMENTS,
+            term_tokens=self._glossary_term_tokens,
         )
 
+    @staticmethod
+    def _log_usage(usage: TranslationUsage) -> None:
+        summary = record_job_usage(usage)
+        logger.info(
+            f"[Translate] Usage: {summary['requests']} requests, {summary['batches']} batches for "
+            f"{summary['segments']} segments ({summary['requests_per_segment']} requests/segment, "
+            f"{summary['tokens_per_segment']} tokens/segment)"
+        )
+
+    def _glossary_version(self) -> str:
+        return getattr(self._glossary_service, "version", "")
+
+    def _remembered_segments(
+        self,
+        segments: List[SubtitleSegment],
+        keys: List[str],
+        remembered: Dict[str, str],
+        model_name: str,
+        target_language: str,
+        mode: str,
+    ) -> Dict[int, SubtitleSegment]:
+        """Map memory hits onto their segments by position, re-storing text the normalizer changed."""
+        mapped: Dict[int, SubtitleSegment] = {}
+        renormalized = []
+        for position, (segment, key) in enumerate(zip(segments, keys)):
+            if key not in remembered:
+                continue
+            mapped[position] = self._response_validator.map_segment(
+                segment,
+                remembered[key],
+                target_language=target_language,
+            )
+            if mapped[position].text != remembered[key]:
+                renormalized.append((key, mapped[position].text))
+        if renormalized:
+            self._memory.put_many(renormalized, model_name, target_language, mode)
+        return mapped
+
+    def _recall_from_memory(
+        self,
+        segments: List[SubtitleSegment],
+        target_language: str,
+        mode: str,
+    ) -> tuple[List[SubtitleSegment], Optional[List[str]], Dict[int, SubtitleSegment]]:
+        """
+        Split segments into those still to translate (with their memory keys)
+        and translations remembered from earlier runs, by position.
+        """
+        model_name = self._client_factory.active_model()
+        if mode == "intelligent" or not model_name:
+            return segments, None, {}
+        keys = self._memory.segment_keys(
+            segments, None, model_name, target_language, mode, self._glossary_version()
+        )
+        remembered = self._remembered_segments(
+            segments, keys, self._memory.get_many(keys), model_name, target_language, mode
+        )
+        if not remembered:
+            return segments, keys, {}
+        missing = [position for position in range(len(segments)) if position not in remembered]
+        return [segments[position] for position in missing], [keys[position] for position in missing], remembered
+
     @staticmethod
     def _checkpoint(cancel_check: Optional[Callable[[], None]]) -> None:
         checkpoint(cancel_check)
@@ -117,23 +233,23 @@ class LLMTranslator:
                     cacheable = False
                     result.append(segment)
             except Exception as exc:
+                if transient_llm_error(exc):
+                    raise
                 logger.warning(f"[LLM] Single-line failed for [{segment.id}]: {exc}")
                 cacheable = False
                 result.append(segment)
         return TranslationOutcome(segments=result, cacheable=cacheable)
 
-    def _translate_with_correction(
+    def _request_rows(
         self,
         client,
         model_name: str,
         system_prompt: str,
-        segments: List[SubtitleSegment],
         input_json_str: str,
-        target_language: str,
-        mode_label: str = "Standard",
+        mode_label: str,
         cancel_check: Optional[Callable[[], None]] = None,
-    ) -> TranslationOutcome:
-        segment_count = len(segments)
+    ) -> Optional[TranslationResponse]:
+        """One structured request, with parse-failure recovery; None if no response could be read."""
         messages = [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": input_json_str},
@@ -148,6 +264,8 @@ class LLMTranslator:
                 temperature=0.3,
             )
         except Exception as exc:
+            if transient_llm_error(exc):
+                raise
             recovered = self._response_parser.recover_structured_response_from_exception(
                 exc,
                 TranslationResponse,
@@ -162,38 +280,174 @@ class LLMTranslator:
                     mode_label,
                 )
             if recovered is None:
-                logger.warning(
-                    f"[LLM] {mode_label}: batch request failed, falling back to single-line for all {segment_count} segments: {exc}"
-                )
-                return self._translate_single_fallback(
+                logger.warning(f"[LLM] {mode_label}: batch request failed: {exc}")
+                return None
+            logger.warning(
+                f"[LLM] {mode_label}: recovered batch response after structured parse failure"
+            )
+            resp = recovered
+        self._log_llm_response(mode_label, resp)
+        return resp
+
+    def _translate_with_correction(
+        self,
+        client,
+        model_name: str,
+        system_prompt: str,
+        segments: List[SubtitleSegment],
+        input_json_str: str,
+        target_language: str,
+        mode_label: str = "Standard",
+        cancel_check: Optional[Callable[[], None]] = None,
+        build_request: Optional[Callable[[List[SubtitleSegment]], tuple[str, str]]] = None,
+    ) -> TranslationOutcome:
+        """
+        Translate a batch in one request. If the response does not validate,
+        keep the rows that came back intact and recover only the rest (see
+        _recover_rows); without build_request the rest go line by line.
+        """
+        segment_count = len(segments)
+        resp = self._request_rows(client, model_name, system_prompt, input_json_str, mode_label, cancel_check)
+        if resp is None:
+            salvaged: Dict[int, SubtitleSegment] = {}
+        else:
+            logger.info(f"[LLM IO] {mode_label}: input {segment_count}, output {len(resp.segments)}")
+            is_valid, error_msg, mapped = self._response_validator.validate(resp, segments, target_language)
+            if is_valid:
+                return TranslationOutcome(segments=mapped, cacheable=True)
+            salvaged = self._response_validator.salvage(resp, segments, target_language)
+            logger.warning(
+                f"[LLM] {mode_label}: validation failed, kept {len(salvaged)}/{segment_count} rows, "
+                f"recovering the rest: {error_msg}"
+            )
+
+        failing = [segments[position] for position in range(segment_count) if position not in salvaged]
+        if build_request is None:
+            recovered = self._translate_single_fallback(
+                client,
+                model_name,
+                failing,
+                target_language,
+                mode_label,
+                cancel_check=cancel_check,
+            )
+        else:
+            recovered = self._recover_rows(
+                client,
+                model_name,
+                failing,
+                target_language,
+                mode_label,
+                build_request,
+                cancel_check=cancel_check,
+                resend=bool(salvaged),
+            )
+        fresh = iter(recovered.segments)
+        result = [
+            salvaged[position] if position in salvaged else next(fresh)
+            for position in range(segment_count)
+        ]
+        return TranslationOutcome(segments=result, cacheable=recovered.cacheable)
+
+    def _recover_rows(
+        self,
+        client,
+        model_name: str,
+        segments: List[SubtitleSegment],
+        target_language: str,
+        mode_label: str,
+        build_request: Callable[[List[SubtitleSegment]], tuple[str, str]],
+        cancel_check: Optional[Callable[[], None]] = None,
+        resend: bool = True,
+    ) -> TranslationOutcome:
+        """
+        Re-request only rows a batch response got wrong. A lone row goes to
+        the single-line prompt; otherwise the rows are re-sent as one batch,
+        intact rows are kept, and if the reply fixed none of them the rows are
+        halved and the halves recovered one after the other. A few bad lines
+        cost O(log n) requests instead of one request per line. The halves run
+        inside the batch's single concurrency-limiter slot, so recovery never
+        sends more requests than the provider's window admits, and a cancel
+        request stops before the next half. resend=False skips straight to
+        halving (these exact rows just failed together).
+        """
+        if not segments:
+            return TranslationOutcome(segments=[], cacheable=True)
+        if len(segments) == 1:
+            return self._translate_single_fallback(
+                client,
+                model_name,
+                segments,
+                target_language,
+                mode_label,
+                cancel_check=cancel_check,
+            )
+
+        salvaged: Dict[int, SubtitleSegment] = {}
+        if resend:
+            system_prompt, user_content = build_request(segments)
+            resp = self._request_rows(client, model_name, system_prompt, user_content, mode_label, cancel_check)
+            if resp is not None:
+                salvaged = self._response_validator.salvage(resp, segments, target_language)
+        failing = [position for position in range(len(segments)) if position not in salvaged]
+        if not failing:
+            return TranslationOutcome(segments=[salvaged[position] for position in range(len(segments))], cacheable=True)
+
+        failing_segments = [segments[position] for position in failing]
+        if salvaged:
+            parts = [failing_segments]
+        else:
+            middle = len(failing_segments) // 2
+            parts = [failing_segments[:middle], failing_segments[middle:]]
+        logger.info(
+            f"[LLM] {mode_label}: {len(failing)}/{len(segments)} rows still invalid, "
+            f"retrying as {len(parts)} request(s)"
+        )
+
+        outcomes = []
+        for part in parts:
+            self._checkpoint(cancel_check)
+            outcomes.append(
+                self._recover_rows(
                     client,
                     model_name,
-                    segments,
+                    part,
                     target_language,
                     mode_label,
+                    build_request,
                     cancel_check=cancel_check,
                 )
-            logger.warning(
-                f"[LLM] {mode_label}: recovered batch response after structured parse failure"
             )
-            resp = recovered
 
-        self._log_llm_response(mode_label, resp)
-        logger.info(f"[LLM IO] {mode_label}: input {segment_count}, output {len(resp.segments)}")
-
-        is_valid, error_msg, mapped = self._response_validator.validate(resp, segments, target_language)
-        if is_valid:
-            return TranslationOutcome(segments=mapped, cacheable=True)
+        fresh = iter(segment for outcome in outcomes for segment in outcome.segments)
+        result = [
+            salvaged[position] if position in salvaged else next(fresh)
+            for position in range(len(segments))
+        ]
+        return TranslationOutcome(
+            segments=result,
+            cacheable=all(outcome.cacheable for outcome in outcomes),
+        )
 
-        logger.warning(f"[LLM] {mode_label}: validation failed, falling back to single-line: {error_msg}")
-        return self._translate_single_fallback(
-            client,
-            model_name,
-            segments,
-            target_language,
-            mode_label,
-            cancel_check=cancel_check,
+    def _row_request(
+        self,
+        segments: List[SubtitleSegment],
+        target_language: str,
+        mode: str,
+        context_before: Optional[List[SubtitleSegment]],
+    ) -> tuple[str, str]:
+        """System prompt and user content for a standard/proofread request over segments."""
+        subtitle_rows = [{"id": str(segment.id), "source_text": segment.text} for segment in segments]
+        user_content = self._prompt_builder.build_user_content(subtitle_rows, mode, context_before)
+        relevant_terms = self._glossary_service.get_relevant_terms(" ".join(segment.text for segment in segments))
+        base_system_prompt = self._prompt_builder.build_base_system_prompt(target_language, relevant_terms)
+        build_system_prompt = (
+            self._prompt_builder.build_standard_system_prompt
+            if mode == "standard"
+            else self._prompt_builder.build_proofread_system_prompt
         )
+        system_prompt = build_system_prompt(base_system_prompt, len(segments), bool(context_before))
+        return system_prompt, user_content
 
     def _translate_batch_struct(
         self,
@@ -202,55 +456,53 @@ class LLMTranslator:
         mode: Literal["standard", "proofread", "intelligent"],
         context_before: Optional[List[SubtitleSegment]] = None,
         cancel_check: Optional[Callable[[], None]] = None,
+        memory_keys: Optional[List[str]] = None,
     ) -> List[SubtitleSegment]:
+        """
+        memory_keys are given when the caller already looked the segments up
+        in translation memory (and they all missed); otherwise the batch is
+        looked up here and only the missing lines are sent to the LLM.
+        """
         self._checkpoint(cancel_check)
         client, model_name = self._client_factory.get_client()
         if not client:
             raise ValueError("LLM Client not initialized (Check Settings)")
-
-        subtitle_rows = [{"id": str(segment.id), "source_text": segment.text} for segment in segments]
-        subtitle_dict = {row["id"]: row["source_text"] for row in subtitle_rows}
-        segment_count = len(segments)
+        usage = active_usage()
+        if usage is not None:
+            client = MeteredClient(client, usage)
+        glossary_version = self._glossary_version()
+
+        if mode in ("standard", "proofread") and memory_keys is None:
+            previous = context_before[-1] if context_before else None
+            keys = self._memory.segment_keys(
+                segments, previous, model_name, target_language, mode, glossary_version
+            )
+            remembered = self._memory.get_many(keys)
+            if remembered:
+                mapped = self._remembered_segments(
+                    segments, keys, remembered, model_name, target_language, mode
+                )
+                missing = [position for position in range(len(segments)) if position not in mapped]
+                if missing:
+                    translated = self._translate_batch_struct(
+                        [segments[position] for position in missing],
+                        target_language,
+                        mode,
+                        context_before=context_before,
+                        cancel_check=cancel_check,
+                        memory_keys=[keys[position] for position in missing],
+                    )
+                    mapped.update(zip(missing, translated))
+                return [mapped[position] for position in range(len(segments))]
+            memory_keys = keys
 
         if mode in ("standard", "proofread"):
-            cached = self._cache.get(subtitle_dict, model_name, target_language, mode)
-            if cached:
-                normalized_cached = {
-                    str(segment.id): self._response_validator.map_segment(
-                        segment,
-                        cached.get(str(segment.id), segment.text),
-                        target_language=target_language,
-                    ).text
-                    for segment in segments
-                }
-                if normalized_cached != cached:
-                    self._cache.put(subtitle_dict, model_name, target_language, mode, normalized_cached)
-                return [
-                    self._response_validator.map_segment(
-                        segment,
-                        normalized_cached.get(str(segment.id), segment.text),
-                        target_language=target_language,
-                    )
-                    for segment in segments
-                ]
+            mode_label = "Standard" if mode == "standard" else "Proofread"
 
-        user_content = self._prompt_builder.build_user_content(
-            subtitle_rows,
-            mode,
-            context_before,
-        )
-        relevant_terms = self._glossary_service.get_relevant_terms(" ".join(subtitle_dict.values()))
-        base_system_prompt = self._prompt_builder.build_base_system_prompt(
-            target_language,
-            relevant_terms,
-        )
+            def build_request(rows: List[SubtitleSegment]) -> tuple[str, str]:
+                return self._row_request(rows, target_language, mode, context_before)
 
-        if mode == "standard":
-            system_prompt = self._prompt_builder.build_standard_system_prompt(
-                base_system_prompt,
-                segment_count,
-                bool(context_before),
-            )
+            system_prompt, user_content = build_request(segments)
             outcome = self._translate_with_correction(
                 client,
                 model_name,
@@ -258,83 +510,78 @@ class LLMTranslator:
                 segments,
                 user_content,
                 target_language,
-                "Standard",
+                mode_label,
                 cancel_check=cancel_check,
+                build_request=build_request,
             )
             self._checkpoint(cancel_check)
-            if outcome.cacheable:
-                self._cache.put(
-                    subtitle_dict,
+            if outcome.cacheable and len(outcome.segments) == len(memory_keys):
+                self._memory.put_many(
+                    zip(memory_keys, (segment.text for segment in outcome.segments)),
                     model_name,
                     target_language,
                     mode,
-                    {str(segment.id): segment.text for segment in outcome.segments},
                 )
             return outcome.segments
 
-        if mode == "proofread":
-            system_prompt = self._prompt_builder.build_proofread_system_prompt(
-                base_system_prompt,
-                segment_count,
-                bool(context_before),
-            )
-            outcome = self._translate_with_correction(
-                client,
-                model_name,
-                system_prompt,
-                segments,
-                user_content,
-                target_language,
-                "Proofread",
-                cancel_check=cancel_check,
-            )
-            self._checkpoint(cancel_check)
-            if outcome.cacheable:
-                self._cache.put(
-                    subtitle_dict,
-                    model_name,
-                    target_language,
-                    mode,
-                    {str(segment.id): segment.text for segment in outcome.segments},
-                )
-            return outcome.segments
+        subtitle_rows = [{"id": str(segment.id), "source_text": segment.text} for segment in segments]
+        subtitle_dict = {row["id"]: row["source_text"] for row in subtitle_rows}
+
+        user_content = self._prompt_builder.build_user_content(
+            subtitle_rows,
+            mode,
+            context_before,
+        )
+        relevant_terms = self._glossary_service.get_relevant_terms(" ".join(subtitle_dict.values()))
+        base_system_prompt = self._prompt_builder.build_base_system_prompt(
+            target_language,
+            relevant_terms,
+        )
 
         if mode == "intelligent":
             system_prompt = self._prompt_builder.build_intelligent_system_prompt(
                 base_system_prompt,
                 target_language,
             )
-            messages = [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_content},
-            ]
-            self._log_llm_messages("Intelligent", messages)
-            self._checkpoint(cancel_check)
-            try:
-                resp = client.chat.completions.create(
-                    model=model_name,
-                    response_model=IntelligentTranslationResponse,
-                    messages=messages,
-                    temperature=0.7,
-                )
-            except Exception as exc:
-                recovered = self._response_parser.recover_structured_response_from_exception(
-                    exc,
-                    IntelligentTranslationResponse,
-                    "Intelligent",
-                )
-                if recovered is None:
-                    recovered = self._response_parser.request_raw_structured_response(
-                        client,
-                        model_name,
-                        messages,
+            batch_key = self._memory.batch_key(segments, model_name, target_language, mode, glossary_version)
+            remembered = self._memory.get_many([batch_key]).get(batch_key)
+            if remembered is not None:
+                resp = IntelligentTranslationResponse.model_validate_json(remembered)
+            else:
+                messages = [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_content},
+                ]
+                self._log_llm_messages("Intelligent", messages)
+                self._checkpoint(cancel_check)
+                try:
+                    resp = client.chat.completions.create(
+                        model=model_name,
+                        response_model=IntelligentTranslationResponse,
+                        messages=messages,
+                        temperature=0.7,
+                    )
+                except Exception as exc:
+                    if transient_llm_error(exc):
+                        raise
+                    recovered = self._response_parser.recover_structured_response_from_exception(
+                        exc,
                         IntelligentTranslationResponse,
                         "Intelligent",
                     )
-                if recovered is None:
-                    raise
-                logger.warning("[LLM] Intelligent: recovered batch response after structured parse failure")
-                resp = recovered
+                    if recovered is None:
+                        recovered = self._response_parser.request_raw_structured_response(
+                            client,
+                            model_name,
+                            messages,
+                            IntelligentTranslationResponse,
+                            "Intelligent",
+                        )
+                    if recovered is None:
+                        raise
+                    logger.warning("[LLM] Intelligent: recovered batch response after structured parse failure")
+                    resp = recovered
+                self._memory.put_many([(batch_key, resp.model_dump_json())], model_name, target_language, mode)
 
             self._log_llm_response("Intelligent", resp)
             logger.info(f"[LLM IO] Intelligent: input {len(segments)} -> output {len(resp.segments)}")
@@ -376,47 +623,125 @@ class LLMTranslator:
         segments: List[SubtitleSegment],
         target_language: str,
         mode: str = "standard",
-        batch_size: int = 10,
+        batch_size: Optional[int] = None,
         progress_callback=None,
         max_concurrency: Optional[int] = None,
         cancel_check: Optional[Callable[[], None]] = None,
     ) -> List[SubtitleSegment]:
+        """
+        Translate segments in concurrent batches. Batches are packed by
+        estimated tokens (see TokenBudget) with batch_size, when given, as the
+        most lines per batch; with LLM_TRANSLATION_TOKEN_BUDGET off they are
+        cut every batch_size lines.
+        """
         if not segments:
             logger.warning("[Translate] Received empty segments list.")
             return []
 
-        self._cache.cleanup()
         self._checkpoint(cancel_check)
 
         effective_mode = mode if mode in ["standard", "intelligent", "proofread"] else "standard"
-        normalized_batch_size = normalize_batch_size(batch_size)
-        batches = build_translation_batches(segments, normalized_batch_size, effective_mode)
+        normalized_batch_size = normalize_batch_size(batch_size or DEFAULT_BATCH_SIZE)
+        budget = self._token_budget(batch_size)
+        usage = TranslationUsage(effective_mode)
+        pending, memory_keys, remembered = self._recall_from_memory(segments, target_language, effective_mode)
+        usage.add_segments(len(remembered))
+        batches = build_translation_batches(
+            pending,
+            normalized_batch_size,
+            effective_mode,
+            timeline=segments,
+            memory_keys=memory_keys,
+            budget=budget,
+        )
         total_batches = len(batches)
         resolved_max_concurrency = resolve_max_concurrency(total_batches, max_concurrency)
 
         logger.info(
-            f"Starting translation: {len(segments)} segments, mode={effective_mode}, "
-            f"batch_size={normalized_batch_size}, batches={total_batches}, "
+            f"Starting translation: {len(segments)} segments ({len(remembered)} from memory), "
+            f"mode={effective_mode}, batches={total_batches} "
+            f"({'token-packed' if budget else f'batch_size={normalized_batch_size}'}), "
+            f"max_concurrency={resolved_max_concurrency}"
+        )
+
+        translated_segments: List[SubtitleSegment] = []
+        if batches:
+            translated_segments = run_translation_batches(
+                batches=batches,
+                target_language=target_language,
+                mode=effective_mode,
+                max_concurrency=resolved_max_concurrency,
+                translate_batch=self._metered(usage),
+                progress_callback=progress_callback,
+                cancel_check=cancel_check,
+                limiter=get_concurrency_limiter(self._client_factory.active_provider_id()),
+            )
+        if remembered:
+            fresh = iter(translated_segments)
+            translated_segments = [
+                remembered[position] if position in remembered else next(fresh)
+                for position in range(len(segments))
+            ]
+
+        if effective_mode == "intelligent":
+            for index, segment in enumerate(translated_segments):
+                segment.id = str(index + 1)
+
+        logger.info(f"[Translate] Done. Total segments: {len(translated_segments)}")
+        self._log_usage(usage)
+
+        if progress_callback:
+            progress_callback(100, "Translation completed")
+
+        return translated_segments
+
+    def translate_segment_stream(
+        self,
+        segment_queue,
+        target_language: str,
+        mode: str = "standard",
+        batch_size: Optional[int] = None,
+        progress_callback=None,
+        max_concurrency: Optional[int] = None,
+        cancel_check: Optional[Callable[[], None]] = None,
+    ) -> List[SubtitleSegment]:
+        """
+        Like translate_segments, but consumes segment lists from a queue
+        (terminated by None) so batches start while the producer is still
+        running. progress_callback receives (translated, seen) counts.
+        """
+        self._checkpoint(cancel_check)
+
+        effective_mode = mode if mode in ["standard", "intelligent", "proofread"] else "standard"
+        normalized_batch_size = normalize_batch_size(batch_size or DEFAULT_BATCH_SIZE)
+        budget = self._token_budget(batch_size)
+        usage = TranslationUsage(effective_mode)
+        # The batch count is unknown up front; cap only by the configured limit.
+        resolved_max_concurrency = resolve_max_concurrency(sys.maxsize, max_concurrency)
+
+        logger.info(
+            f"Starting streaming translation: mode={effective_mode}, "
+            f"{'token-packed batches' if budget else f'batch_size={normalized_batch_size}'}, "
             f"max_concurrency={resolved_max_concurrency}"
         )
 
-        translated_segments = run_translation_batches(
-            batches=batches,
+        translated_segments = run_streaming_translation_batches(
+            segment_queue=segment_queue,
+            batch_size=normalized_batch_size,
             target_language=target_language,
             mode=effective_mode,
             max_concurrency=resolved_max_concurrency,
-            translate_batch=self._translate_planned_batch,
+            translate_batch=self._metered(usage),
             progress_callback=progress_callback,
             cancel_check=cancel_check,
+            limiter=get_concurrency_limiter(self._client_factory.active_provider_id()),
+            budget=budget,
         )
 
         if effective_mode == "intelligent":
             for index, segment in enumerate(translated_segments):
                 segment.id = str(index + 1)
 
-        logger.info(f"[Translate] Done. Total segments: {len(translated_segments)}")
-
-        if progress_callback:
-            progress_callback(100, "Translation completed")
-
+        logger.info(f"[Translate] Stream done. Total segments: {len(translated_segments)}")
+        self._log_usage(usage)
         return translated_segments
@@ -0,0 +1,125 @@
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from backend.config import settings
+from backend.models.schemas import SubtitleSegment
+from backend.services.translator.translation_rate_limiter import estimate_tokens
+
+# (context window, max output tokens) by model-name prefix; the longest
+# matching prefix wins. LLM_MODEL_TOKEN_LIMITS adds or overrides entries.
+MODEL_TOKEN_LIMITS: dict[str, Tuple[int, int]] = {
+    "gpt-4o": (128_000, 16_384),
+    "gpt-4.1": (1_000_000, 32_768),
+    "gpt-4-turbo": (128_000, 4_096),
+    "gpt-4": (8_192, 4_096),
+    "gpt-3.5-turbo": (16_385, 4_096),
+    "o1": (200_000, 100_000),
+    "o3": (200_000, 100_000),
+    "o4": (200_000, 100_000),
+    "deepseek": (64_000, 8_192),
+    "qwen": (32_768, 8_192),
+    "glm": (128_000, 4_096),
+    "moonshot": (128_000, 8_192),
+    "claude": (200_000, 8_192),
+    "gemini": (1_000_000, 8_192),
+}
+DEFAULT_TOKEN_LIMITS = (16_000, 4_096)
+
+# System prompt and instructions before any glossary terms or rows.
+PROMPT_OVERHEAD_TOKENS = 600
+# JSON framing per row ({"id": ..., "text": ...}) in the request and the response.
+ROW_OVERHEAD_TOKENS = 12
+# Translations run somewhat longer than their source in tokens, and CJK
+# targets cost about a token per character.
+OUTPUT_EXPANSION = 1.5
+# Decode speed assumed when turning the target latency into an output budget.
+ASSUMED_OUTPUT_TOKENS_PER_S = 40
+# Share of the model's output limit a batch may plan for, leaving room for
+# the estimate being low.
+OUTPUT_LIMIT_SAFETY = 0.5
+
+
+def model_token_limits(model: Optional[str]) -> Tuple[int, int]:
+    name = (model or "").lower()
+    overrides = {
+        str(prefix).lower(): tuple(limits)
+        for prefix, limits in (settings.LLM_MODEL_TOKEN_LIMITS or {}).items()
+    }
+    table = {**MODEL_TOKEN_LIMITS, **overrides}
+    matches = [prefix for prefix in table if name.startswith(prefix)]
+    if not matches:
+        return DEFAULT_TOKEN_LIMITS
+    context_window, max_output = table[max(matches, key=len)]
+    return int(context_window), int(max_output)
+
+
+def expected_output_tokens(segment: SubtitleSegment) -> int:
+    return int(estimate_tokens(segment.text) * OUTPUT_EXPANSION) + ROW_OVERHEAD_TOKENS
+
+
+def input_tokens(segment: SubtitleSegment) -> int:
+    return estimate_tokens(segment.text) + ROW_OVERHEAD_TOKENS
+
+
+@dataclass(frozen=True)
+class TokenBudget:
+    """
+    How much one translation request may carry. Batches are packed in
+    timeline order until the next line would push the prompt past
+    max_input_tokens or the expected reply past max_output_tokens, or the
+    batch reaches max_segments.
+    """
+
+    max_input_tokens: int
+    max_output_tokens: int
+    max_segments: int
+    term_tokens: Optional[Callable[[str], int]] = None
+
+    @classmethod
+    def for_model(
+        cls,
+        model: Optional[str],
+        max_segments: int,
+        term_tokens: Optional[Callable[[str], int]] = None,
+    ) -> "TokenBudget":
+        context_window, max_output = model_token_limits(model)
+        latency_output = max(1, settings.LLM_TRANSLATION_TARGET_LATENCY_S) * ASSUMED_OUTPUT_TOKENS_PER_S
+        output_budget = max(ROW_OVERHEAD_TOKENS, int(min(max_output * OUTPUT_LIMIT_SAFETY, latency_output)))
+        input_budget = max(ROW_OVERHEAD_TOKENS, context_window - max_output - PROMPT_OVERHEAD_TOKENS)
+        return cls(
+            max_input_tokens=input_budget,
+            max_output_tokens=output_budget,
+            max_segments=max(1, int(max_segments)),
+            term_tokens=term_tokens,
+        )
+
+    def segment_input_tokens(self, segment: SubtitleSegment) -> int:
+        glossary = self.term_tokens(segment.text) if self.term_tokens is not None else 0
+        return input_tokens(segment) + glossary
+
+
+def next_batch_size(
+    pending: Sequence[SubtitleSegment],
+    context_before: Optional[List[SubtitleSegment]],
+    budget: TokenBudget,
+    final: bool,
+) -> Optional[int]:
+    """
+    Size of the batch to cut from the front of pending, or None when more
+    segments could still join it (only possible while final is False).
+    A single line that alone exceeds the budget is sent on its own.
+    """
+    used_input = sum(input_tokens(segment) for segment in context_before or [])
+    used_output = 0
+    for count, segment in enumerate(pending):
+        if count >= budget.max_segments:
+            return count
+        used_input += budget.segment_input_tokens(segment)
+        used_output += expected_output_tokens(segment)
+        if count and (used_input > budget.max_input_tokens or used_output > budget.max_output_tokens):
+            return count
+    if len(pending) >= budget.max_segments:
+        return budget.max_segments
+    if final and pending:
+        return len(pending)
+    return None
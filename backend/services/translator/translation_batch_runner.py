@@ -1,14 +1,28 @@
-import threading
-from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
-from typing import Any, Callable, List, Optional
+import asyncio
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, List, Optional
+
+from loguru import logger
 
 from backend.config import settings
 from backend.models.schemas import SubtitleSegment
+from backend.services.translator.translation_batch_planner import TokenBudget, next_batch_size
 from backend.services.translator.translation_models import TranslationBatch
+from backend.services.translator.translation_rate_limiter import (
+    AdaptiveConcurrencyLimiter,
+    backoff_delay,
+    estimate_tokens,
+    retry_after_seconds,
+    transient_llm_error,
+)
 
 
 CONTEXT_OVERLAP = 3
-DEFAULT_TRANSLATION_MAX_CONCURRENCY = 3
+DEFAULT_TRANSLATION_MAX_CONCURRENCY = 16
+# How often a running job re-checks pause/cancel requests.
+CANCEL_POLL_INTERVAL_S = 0.05
 
 
 def normalize_batch_size(batch_size: int) -> int:
@@ -35,151 +49,398 @@ def resolve_max_concurrency(total_batches: int, requested: Optional[int]) -> int
     return max(1, min(total_batches, normalized))
 
 
+def _cut_size(
+    pending: List[SubtitleSegment],
+    context_before: Optional[List[SubtitleSegment]],
+    batch_size: int,
+    budget: Optional[TokenBudget],
+    final: bool,
+) -> Optional[int]:
+    if budget is not None:
+        return next_batch_size(pending, context_before, budget, final)
+    if len(pending) >= batch_size:
+        return batch_size
+    return len(pending) if final and pending else None
+
+
 def build_translation_batches(
     segments: List[SubtitleSegment],
     batch_size: int,
     mode: str,
+    timeline: Optional[List[SubtitleSegment]] = None,
+    memory_keys: Optional[List[str]] = None,
+    budget: Optional[TokenBudget] = None,
 ) -> List[TranslationBatch]:
+    """
+    Cut segments into batches of batch_size, or packed by token budget when
+    one is given. When segments are a subset of timeline (the lines
+    translation memory could not answer), each batch's context is taken
+    from the lines just before it in the full timeline.
+    """
     normalized_batch_size = normalize_batch_size(batch_size)
     batches: List[TranslationBatch] = []
+    context_source = timeline if timeline is not None else segments
+    positions = {id(segment): position for position, segment in enumerate(context_source)}
 
-    for index, start in enumerate(range(0, len(segments), normalized_batch_size), start=1):
-        batch_segments = segments[start:start + normalized_batch_size]
+    start = 0
+    while start < len(segments):
+        timeline_start = positions.get(id(segments[start]), start)
         context_before: Optional[List[SubtitleSegment]] = None
-        if mode != "intelligent" and start > 0:
-            context_start = max(0, start - CONTEXT_OVERLAP)
-            context_before = segments[context_start:start]
+        if mode != "intelligent" and timeline_start > 0:
+            context_start = max(0, timeline_start - CONTEXT_OVERLAP)
+            context_before = context_source[context_start:timeline_start]
+        # No batch is longer than its cap, so the planner never needs to look further.
+        cap = budget.max_segments if budget is not None else normalized_batch_size
+        size = _cut_size(segments[start:start + cap + 1], context_before, normalized_batch_size, budget, final=True)
         batches.append(
             TranslationBatch(
-                index=index,
-                segments=batch_segments,
+                index=len(batches) + 1,
+                segments=segments[start:start + size],
                 context_before=context_before,
+                memory_keys=memory_keys[start:start + size] if memory_keys is not None else None,
             )
         )
+        start += size
 
     return batches
 
 
+class StreamingBatchPlanner:
+    """
+    Incremental build_translation_batches: segments arrive in timeline order
+    and full batches are released as soon as they can be formed, with the
+    same boundaries and context overlap as planning the whole list at once.
+    """
+
+    def __init__(self, batch_size: int, mode: str, budget: Optional[TokenBudget] = None):
+        self.batch_size = normalize_batch_size(batch_size)
+        self.mode = mode
+        self.budget = budget
+        self._buffer: List[SubtitleSegment] = []
+        self._tail: List[SubtitleSegment] = []
+        self._next_index = 1
+        self.seen = 0
+
+    def add(self, segments: List[SubtitleSegment]) -> List[TranslationBatch]:
+        self._buffer.extend(segments)
+        self.seen += len(segments)
+        return self._drain(final=False)
+
+    def close(self) -> List[TranslationBatch]:
+        return self._drain(final=True)
+
+    def _context(self) -> Optional[List[SubtitleSegment]]:
+        if self.mode != "intelligent" and self._tail:
+            return self._tail[-CONTEXT_OVERLAP:]
+        return None
+
+    def _drain(self, final: bool) -> List[TranslationBatch]:
+        batches = []
+        while self._buffer:
+            size = _cut_size(self._buffer, self._context(), self.batch_size, self.budget, final)
+            if size is None:
+                break
+            batches.append(self._cut(size))
+        return batches
+
+    def _cut(self, size: int) -> TranslationBatch:
+        batch_segments = self._buffer[:size]
+        del self._buffer[:size]
+        batch = TranslationBatch(
+            index=self._next_index,
+            segments=batch_segments,
+            context_before=self._context(),
+        )
+        self._next_index += 1
+        self._tail = batch_segments
+        return batch
+
+
 def checkpoint(cancel_check: Optional[Callable[[], None]]) -> None:
     if cancel_check is not None:
         cancel_check()
 
 
+TranslateBatchFn = Callable[[TranslationBatch, str, str, Optional[Callable[[], None]]], List[SubtitleSegment]]
+
+
+def _batch_tokens(batch: TranslationBatch, result: List[SubtitleSegment]) -> int:
+    context = batch.context_before or []
+    return sum(estimate_tokens(segment.text) for segment in [*context, *batch.segments, *result])
+
+
+class _BatchScheduler:
+    """
+    Runs translation batches on an asyncio loop, at most max_concurrency of
+    this job's at a time and only while the provider's shared limiter has a
+    free slot, so concurrent jobs together stay within its window. The
+    blocking LLM calls run on worker threads; transient provider errors (429,
+    timeouts, 5xx) are fed to the limiter and retried with jittered backoff,
+    anything else fails the job at once.
+    """
+
+    def __init__(
+        self,
+        *,
+        translate_batch: TranslateBatchFn,
+        target_language: str,
+        mode: str,
+        max_concurrency: int,
+        limiter: Optional[AdaptiveConcurrencyLimiter],
+        cancel_check: Optional[Callable[[], None]],
+        total_label: str = "",
+    ):
+        self.translate_batch = translate_batch
+        self.target_language = target_language
+        self.mode = mode
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.limiter = limiter or AdaptiveConcurrencyLimiter(
+            "local", initial=self.max_concurrency, maximum=self.max_concurrency
+        )
+        self.cancel_check = cancel_check
+        self.total_label = total_label
+        self.max_retries = max(0, int(settings.LLM_TRANSLATION_MAX_RETRIES))
+        self.executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        self._in_flight = 0
+        self._slots: Optional[asyncio.Condition] = None
+
+    async def _acquire(self) -> None:
+        # This job's own cap first, then a slot in the provider's shared window.
+        async with self._slots:
+            await self._slots.wait_for(lambda: self._in_flight < self.max_concurrency)
+            self._in_flight += 1
+        try:
+            await self.limiter.acquire()
+        except BaseException:
+            await self._release_local()
+            raise
+
+    async def _release(self) -> None:
+        self.limiter.release()
+        await self._release_local()
+
+    async def _release_local(self) -> None:
+        async with self._slots:
+            self._in_flight -= 1
+            self._slots.notify_all()
+
+    async def run_batch(self, batch: TranslationBatch) -> List[SubtitleSegment]:
+        loop = asyncio.get_running_loop()
+        attempt = 0
+        while True:
+            await self._acquire()
+            error: Optional[Exception] = None
+            try:
+                checkpoint(self.cancel_check)
+                started_at = time.monotonic()
+                try:
+                    result = await loop.run_in_executor(
+                        self.executor,
+                        self.translate_batch,
+                        batch,
+                        self.target_language,
+                        self.mode,
+                        self.cancel_check,
+                    )
+                except Exception as exc:
+                    error = exc
+                else:
+                    self.limiter.on_success(time.monotonic() - started_at, _batch_tokens(batch, result))
+            finally:
+                # Exactly once per admission, also when a failing sibling or
+                # the cancel watcher cancels this batch mid-call.
+                await self._release()
+
+            if error is None:
+                return result
+            transient = transient_llm_error(error)
+            if transient is None or attempt >= self.max_retries:
+                raise RuntimeError(
+                    "Translation failed before single-line fallback could complete. "
+                    f"Batch {batch.index}{self.total_label}. Last error: {error}"
+                ) from error
+            retry_after = retry_after_seconds(transient)
+            self.limiter.on_transient_error(transient, retry_after)
+            delay = backoff_delay(attempt, retry_after)
+            attempt += 1
+            logger.warning(
+                f"[Translate] Batch {batch.index} hit {type(transient).__name__}; "
+                f"retry {attempt}/{self.max_retries} in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+
+    async def _watch_cancel(self) -> None:
+        while True:
+            checkpoint(self.cancel_check)
+            await asyncio.sleep(CANCEL_POLL_INTERVAL_S)
+
+    async def run(self, work: Callable[[], Awaitable[None]]) -> None:
+        """Run work() alongside the cancel watcher; the first failure cancels everything."""
+        self._slots = asyncio.Condition()
+        tasks = [asyncio.ensure_future(work())]
+        if self.cancel_check is not None:
+            tasks.append(asyncio.ensure_future(self._watch_cancel()))
+        try:
+            done, _pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            # Do not wait for batches still on worker threads after a failure.
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def _gather_fail_fast(aws) -> list:
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def run_coroutine_blocking(coro):
+    """asyncio.run from sync code, even when called on a thread that already runs a loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as runner:
+        return runner.submit(asyncio.run, coro).result()
+
+
 def run_translation_batches(
     *,
     batches: List[TranslationBatch],
     target_language: str,
     mode: str,
     max_concurrency: int,
-    translate_batch: Callable[[TranslationBatch, str, str, Optional[Callable[[], None]]], List[SubtitleSegment]],
+    translate_batch: TranslateBatchFn,
     progress_callback: Optional[Callable[[int, str], None]] = None,
     cancel_check: Optional[Callable[[], None]] = None,
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None,
 ) -> List[SubtitleSegment]:
     total_batches = len(batches)
     translated_batches: List[Optional[List[SubtitleSegment]]] = [None] * total_batches
     completed_batches = 0
-    progress_lock = threading.Lock()
+    scheduler = _BatchScheduler(
+        translate_batch=translate_batch,
+        target_language=target_language,
+        mode=mode,
+        max_concurrency=max_concurrency,
+        limiter=limiter,
+        cancel_check=cancel_check,
+        total_label=f"/{total_batches}",
+    )
 
     def notify_progress(message: str) -> None:
-        if not progress_callback:
-            return
-        with progress_lock:
+        if progress_callback:
             checkpoint(cancel_check)
-            progress_callback(
-                int((completed_batches / total_batches) * 100),
-                message,
-            )
+            progress_callback(int((completed_batches / total_batches) * 100), message)
+
+    async def translate_one(batch: TranslationBatch) -> None:
+        nonlocal completed_batches
+        translated_batches[batch.index - 1] = await scheduler.run_batch(batch)
+        completed_batches += 1
+        notify_progress(f"Translated {completed_batches}/{total_batches} batches ({mode})...")
+
+    async def work() -> None:
+        await _gather_fail_fast(translate_one(batch) for batch in batches)
 
     notify_progress(
-        f"Translating 0/{total_batches} batches ({mode}, concurrency={max_concurrency})..."
+        f"Translating 0/{total_batches} batches ({mode}, concurrency<={scheduler.max_concurrency})..."
     )
+    run_coroutine_blocking(scheduler.run(work))
 
-    def store_batch_result(batch: TranslationBatch, result: List[SubtitleSegment]) -> None:
-        nonlocal completed_batches
-        translated_batches[batch.index - 1] = result
-        with progress_lock:
-            checkpoint(cancel_check)
-            completed_batches += 1
-            if progress_callback:
-                progress_callback(
-                    int((completed_batches / total_batches) * 100),
-                    f"Translated {completed_batches}/{total_batches} batches ({mode})...",
-                )
-
-    if max_concurrency == 1:
-        for batch in batches:
-            checkpoint(cancel_check)
-            try:
-                result = translate_batch(batch, target_language, mode, cancel_check)
-            except Exception as exc:
-                raise RuntimeError(
-                    "Translation failed before single-line fallback could complete. "
-                    f"Batch {batch.index}/{total_batches}. Last error: {exc}"
-                ) from exc
-            store_batch_result(batch, result)
-    else:
-        executor = ThreadPoolExecutor(max_workers=max_concurrency)
-        batch_iter = iter(batches)
-        pending: dict[Any, TranslationBatch] = {}
-        fast_abort = False
-
-        def submit_next_batch() -> bool:
+    return [
+        segment
+        for batch_result in translated_batches
+        if batch_result is not None
+        for segment in batch_result
+    ]
+
+
+def run_streaming_translation_batches(
+    *,
+    segment_queue: "queue.Queue[Optional[List[SubtitleSegment]]]",
+    batch_size: int,
+    target_language: str,
+    mode: str,
+    max_concurrency: int,
+    translate_batch: TranslateBatchFn,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    cancel_check: Optional[Callable[[], None]] = None,
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    budget: Optional[TokenBudget] = None,
+) -> List[SubtitleSegment]:
+    """
+    Translate segments while they are still being produced.
+
+    segment_queue yields lists of segments in timeline order and None once
+    the producer is done. Batches are planned with StreamingBatchPlanner and
+    scheduled as soon as they fill up, so translation of the first minutes
+    overlaps with transcription of the rest. progress_callback receives
+    (translated segments, segments seen so far) because the total is not
+    known until the stream ends.
+    """
+    planner = StreamingBatchPlanner(batch_size, mode, budget)
+    translated_batches: dict[int, List[SubtitleSegment]] = {}
+    translated_segments = 0
+    scheduler = _BatchScheduler(
+        translate_batch=translate_batch,
+        target_language=target_language,
+        mode=mode,
+        max_concurrency=max_concurrency,
+        limiter=limiter,
+        cancel_check=cancel_check,
+    )
+    # Blocking queue reads get their own thread so a stalled producer
+    # never occupies a translation worker.
+    reader = ThreadPoolExecutor(max_workers=1)
+
+    def notify_progress() -> None:
+        if progress_callback:
             checkpoint(cancel_check)
-            try:
-                next_batch = next(batch_iter)
-            except StopIteration:
-                return False
-
-            future = executor.submit(
-                translate_batch,
-                next_batch,
-                target_language,
-                mode,
-                cancel_check,
-            )
-            pending[future] = next_batch
-            return True
+            progress_callback(translated_segments, planner.seen)
 
+    async def translate_one(batch: TranslationBatch) -> None:
+        nonlocal translated_segments
+        translated_batches[batch.index] = await scheduler.run_batch(batch)
+        translated_segments += len(batch.segments)
+        notify_progress()
+
+    async def work() -> None:
+        loop = asyncio.get_running_loop()
+        tasks: set = set()
+        read = loop.run_in_executor(reader, segment_queue.get)
         try:
-            while len(pending) < max_concurrency and submit_next_batch():
-                pass
-
-            while pending:
-                checkpoint(cancel_check)
-                done, _ = wait(
-                    tuple(pending.keys()),
-                    timeout=0.05,
-                    return_when=FIRST_COMPLETED,
-                )
-                if not done:
-                    continue
-
-                for future in done:
-                    batch = pending.pop(future)
-                    try:
-                        result = future.result()
-                    except Exception as exc:
-                        fast_abort = True
-                        for pending_future in pending:
-                            pending_future.cancel()
-                        raise RuntimeError(
-                            "Translation failed before single-line fallback could complete. "
-                            f"Batch {batch.index}/{total_batches}. Last error: {exc}"
-                        ) from exc
-
-                    store_batch_result(batch, result)
-
-                    while len(pending) < max_concurrency and submit_next_batch():
-                        pass
-        except Exception:
-            fast_abort = True
-            raise
+            while read is not None or tasks:
+                # Wake on the next queue item or a finished batch, so a failed
+                # batch surfaces without waiting for the producer.
+                waiting = {read, *tasks} if read is not None else tasks
+                done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+                for task in done - {read}:
+                    tasks.discard(task)
+                    task.result()
+                if read in done:
+                    item = read.result()
+                    batches = planner.close() if item is None else planner.add(item)
+                    tasks.update(asyncio.ensure_future(translate_one(batch)) for batch in batches)
+                    notify_progress()
+                    read = None if item is None else loop.run_in_executor(reader, segment_queue.get)
         finally:
-            executor.shutdown(wait=not fast_abort, cancel_futures=True)
+            for task in tasks:
+                task.cancel()
+
+    try:
+        run_coroutine_blocking(scheduler.run(work))
+    finally:
+        reader.shutdown(wait=False)
 
     return [
         segment
-        for batch_result in translated_batches
-        if batch_result is not None
-        for segment in batch_result
+        for index in sorted(translated_batches)
+        for segment in translated_batches[index]
     ]
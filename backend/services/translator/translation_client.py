@@ -1,23 +1,88 @@
+import threading
+
 from loguru import logger
 
+from backend.config import settings
+
+# Idle keep-alive connections are dropped after this long; providers usually
+# close them server-side after 60-120s.
+KEEPALIVE_EXPIRY_S = 30.0
+
 
 class TranslationClientFactory:
+    """
+    Hands out one long-lived instructor-patched OpenAI client per provider.
+
+    Building a client per batch also built a fresh httpx pool, so every batch
+    paid TCP+TLS setup. The shared client keeps up to
+    LLM_TRANSLATION_MAX_CONCURRENCY connections alive, one per concurrent
+    batch. It is rebuilt when the active provider (or its URL/key) changes;
+    the previous client is left to in-flight batches and garbage collection.
+    """
+
+    _lock = threading.Lock()
+    _client_key: tuple | None = None
+    _client = None
+
     def __init__(self, settings_manager):
         self._settings_manager = settings_manager
 
-    def get_client(self):
-        import instructor
-        from openai import OpenAI
+    @staticmethod
+    def _provider_key(provider) -> tuple:
+        return (provider.id, provider.base_url, provider.api_key, settings.LLM_TRANSLATION_MAX_CONCURRENCY)
 
-        provider = self._settings_manager.get_active_llm_provider()
-        if not provider:
-            logger.error("No active LLM provider found in settings.")
-            return None, None
+    @staticmethod
+    def _build_client(provider):
+        import httpx
+        import instructor
+        from openai import DefaultHttpxClient, OpenAI
 
-        client = instructor.patch(
+        pool_size = max(1, int(settings.LLM_TRANSLATION_MAX_CONCURRENCY))
+        http_client = DefaultHttpxClient(
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+                keepalive_expiry=KEEPALIVE_EXPIRY_S,
+            )
+        )
+        return instructor.patch(
             OpenAI(
                 api_key=provider.api_key,
                 base_url=provider.base_url,
+                http_client=http_client,
+                # 429s and timeouts are retried by the batch runner, which
+                # also adapts concurrency to them.
+                max_retries=0,
             )
         )
+
+    def get_client(self):
+        provider = self._settings_manager.get_active_llm_provider()
+        if not provider:
+            logger.error("No active LLM provider found in settings.")
+            return None, None
+
+        key = self._provider_key(provider)
+        cls = TranslationClientFactory
+        with cls._lock:
+            if cls._client is None or cls._client_key != key:
+                logger.info(f"[Translate] Creating pooled LLM client for provider {provider.id}")
+                cls._client = self._build_client(provider)
+                cls._client_key = key
+            client = cls._client
         return client, provider.model
+
+    def active_model(self):
+        provider = self._settings_manager.get_active_llm_provider()
+        return provider.model if provider else None
+
+    def active_provider_id(self) -> str:
+        provider = self._settings_manager.get_active_llm_provider()
+        return provider.id if provider else "default"
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drop the shared client so the next get_client builds a new one."""
+        with cls._lock:
+            cls._client = None
+            cls._client_key = None
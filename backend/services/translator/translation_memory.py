@@ -0,0 +1,325 @@
+import hashlib
+import json
+import re
+import shutil
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from backend.config import settings
+from backend.models.schemas import SubtitleSegment
+
+MEMORY_SCHEMA_VERSION = 1
+_WHITESPACE = re.compile(r"\s+")
+# SQLite's default limit on host parameters per statement is 999.
+_LOOKUP_CHUNK = 500
+# Rows deleted per statement during eviction, so lookups are not held off
+# behind one long delete.
+_EVICT_CHUNK = 5000
+# Directory of the per-batch JSON files the memory replaced.
+_LEGACY_CACHE_DIRNAME = "translation_cache"
+
+
+def normalize_source_text(text: str) -> str:
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text or "")).strip()
+
+
+def _digest(*parts: str) -> str:
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+class TranslationMemory:
+    """
+    Per-sentence translation memory in one SQLite file.
+
+    A line's key is its normalized source text, a hash of the line before it,
+    the model, target language, mode and glossary version, so editing one
+    subtitle line only invalidates that line and the one after it, and batch
+    size or id shifts do not matter at all. Intelligent mode, which
+    re-segments, is memoized per batch under a key over all of its lines.
+
+    Lookups never scan: rows are found by primary key and expired ones are
+    ignored. Expiry (TRANSLATION_MEMORY_TTL_DAYS since last use) and the
+    entry cap are enforced by evict(), run from a background thread started
+    with start_eviction().
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self._path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._evict_stop = threading.Event()
+        self._evict_thread: Optional[threading.Thread] = None
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    @property
+    def path(self) -> Path:
+        return Path(self._path or settings.TEMP_DIR / "translation_memory.sqlite3")
+
+    @staticmethod
+    def enabled() -> bool:
+        return settings.TRANSLATION_MEMORY_ENABLED
+
+    @staticmethod
+    def _ttl_s() -> float:
+        return max(0, settings.TRANSLATION_MEMORY_TTL_DAYS) * 86400
+
+    @staticmethod
+    def segment_key(
+        text: str,
+        previous_text: Optional[str],
+        model: str,
+        language: str,
+        mode: str,
+        glossary_version: str = "",
+    ) -> str:
+        context = _digest(normalize_source_text(previous_text)) if previous_text is not None else ""
+        return _digest(
+            f"v{MEMORY_SCHEMA_VERSION}",
+            "segment",
+            normalize_source_text(text),
+            context,
+            model or "",
+            language,
+            mode,
+            glossary_version,
+        )
+
+    def segment_keys(
+        self,
+        segments: Sequence[SubtitleSegment],
+        previous: Optional[SubtitleSegment],
+        model: str,
+        language: str,
+        mode: str,
+        glossary_version: str = "",
+    ) -> List[str]:
+        """Keys for consecutive segments; previous is the line just before the first one."""
+        keys = []
+        for segment in segments:
+            keys.append(
+                self.segment_key(
+                    segment.text,
+                    previous.text if previous is not None else None,
+                    model,
+                    language,
+                    mode,
+                    glossary_version,
+                )
+            )
+            previous = segment
+        return keys
+
+    @staticmethod
+    def batch_key(
+        segments: Sequence[SubtitleSegment],
+        model: str,
+        language: str,
+        mode: str,
+        glossary_version: str = "",
+    ) -> str:
+        texts = json.dumps([normalize_source_text(segment.text) for segment in segments], ensure_ascii=False)
+        return _digest(f"v{MEMORY_SCHEMA_VERSION}", "batch", texts, model or "", language, mode, glossary_version)
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS translation_memory ("
+                " key TEXT PRIMARY KEY,"
+                " translation TEXT NOT NULL,"
+                " model TEXT,"
+                " target_language TEXT,"
+                " mode TEXT,"
+                " created_at REAL NOT NULL,"
+                " last_used REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS translation_memory_last_used"
+                " ON translation_memory (last_used)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        if not self.enabled():
+            return {}
+        unique = list(dict.fromkeys(keys))
+        found: Dict[str, str] = {}
+        now = time.time()
+        fresh_after = now - self._ttl_s() if self._ttl_s() else 0.0
+        try:
+            with self._lock:
+                conn = self._connection()
+                for start in range(0, len(unique), _LOOKUP_CHUNK):
+                    chunk = unique[start:start + _LOOKUP_CHUNK]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        "SELECT key, translation FROM translation_memory"
+                        f" WHERE key IN ({placeholders}) AND last_used >= ?",
+                        [*chunk, fresh_after],
+                    ).fetchall()
+                    found.update(rows)
+                if found:
+                    conn.executemany(
+                        "UPDATE translation_memory SET last_used = ? WHERE key = ?",
+                        [(now, key) for key in found],
+                    )
+                self.hits += len(found)
+                self.misses += len(unique) - len(found)
+        except sqlite3.Error as e:
+            logger.warning(f"[TranslationMemory] Lookup failed: {e}")
+            return {}
+        if found:
+            logger.debug(f"[TranslationMemory] {len(found)}/{len(unique)} hits")
+        return found
+
+    def put_many(self, entries: Iterable[Tuple[str, str]], model: str, language: str, mode: str) -> None:
+        if not self.enabled():
+            return
+        now = time.time()
+        rows = [(key, translation, model, language, mode, now, now) for key, translation in entries]
+        if not rows:
+            return
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute("BEGIN")
+                try:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO translation_memory"
+                        " (key, translation, model, target_language, mode, created_at, last_used)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                except sqlite3.Error:
+                    conn.execute("ROLLBACK")
+                    raise
+                conn.execute("COMMIT")
+                self.stores += len(rows)
+        except sqlite3.Error as e:
+            logger.warning(f"[TranslationMemory] Failed to store {len(rows)} entries: {e}")
+
+    def _delete_chunked(self, select_sql: str, params: Sequence) -> int:
+        deleted = 0
+        while True:
+            with self._lock:
+                cursor = self._connection().execute(
+                    f"DELETE FROM translation_memory WHERE key IN ({select_sql} LIMIT {_EVICT_CHUNK})",
+                    params,
+                )
+                count = max(0, cursor.rowcount)
+                self.evictions += count
+            deleted += count
+            if count < _EVICT_CHUNK:
+                return deleted
+
+    def evict(self) -> int:
+        """Drop entries unused for longer than the TTL, then the least recently used beyond the cap."""
+        if not self.path.exists() and self._conn is None:
+            return 0
+        evicted = 0
+        try:
+            if self._ttl_s():
+                evicted += self._delete_chunked(
+                    "SELECT key FROM translation_memory WHERE last_used < ?",
+                    [time.time() - self._ttl_s()],
+                )
+            max_entries = max(0, settings.TRANSLATION_MEMORY_MAX_ENTRIES)
+            with self._lock:
+                (count,) = self._connection().execute("SELECT COUNT(*) FROM translation_memory").fetchone()
+            excess = count - max_entries
+            while excess > 0:
+                with self._lock:
+                    cursor = self._connection().execute(
+                        "DELETE FROM translation_memory WHERE key IN"
+                        " (SELECT key FROM translation_memory ORDER BY last_used LIMIT ?)",
+                        [min(excess, _EVICT_CHUNK)],
+                    )
+                    removed = max(0, cursor.rowcount)
+                    self.evictions += removed
+                if removed == 0:
+                    break
+                evicted += removed
+                excess -= removed
+        except sqlite3.Error as e:
+            logger.warning(f"[TranslationMemory] Eviction failed: {e}")
+        if evicted:
+            logger.info(f"[TranslationMemory] Evicted {evicted} entries")
+        return evicted
+
+    def _remove_legacy_cache(self) -> None:
+        legacy_dir = settings.TEMP_DIR / _LEGACY_CACHE_DIRNAME
+        if legacy_dir.is_dir():
+            shutil.rmtree(legacy_dir, ignore_errors=True)
+            logger.info(f"[TranslationMemory] Removed legacy cache directory {legacy_dir}")
+
+    def _eviction_loop(self, interval_s: float) -> None:
+        self._remove_legacy_cache()
+        while not self._evict_stop.is_set():
+            self.evict()
+            self._evict_stop.wait(interval_s)
+
+    def start_eviction(self, interval_s: Optional[float] = None) -> None:
+        """Sweep expired and excess entries now and then every interval, off the request path."""
+        if self._evict_thread is not None and self._evict_thread.is_alive():
+            return
+        interval = interval_s if interval_s is not None else settings.TRANSLATION_MEMORY_EVICT_INTERVAL_S
+        self._evict_stop.clear()
+        self._evict_thread = threading.Thread(
+            target=self._eviction_loop,
+            args=(max(1.0, float(interval)),),
+            name="translation-memory-eviction",
+            daemon=True,
+        )
+        self._evict_thread.start()
+
+    def stop_eviction(self) -> None:
+        self._evict_stop.set()
+        if self._evict_thread is not None:
+            self._evict_thread.join(timeout=5)
+            self._evict_thread = None
+
+    def stats(self) -> dict:
+        entries = 0
+        if self.enabled() and (self._conn is not None or self.path.exists()):
+            try:
+                with self._lock:
+                    (entries,) = self._connection().execute(
+                        "SELECT COUNT(*) FROM translation_memory"
+                    ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"[TranslationMemory] Failed to count entries: {e}")
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled(),
+            "entries": entries,
+            "max_entries": settings.TRANSLATION_MEMORY_MAX_ENTRIES,
+            "ttl_days": settings.TRANSLATION_MEMORY_TTL_DAYS,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+        }
+
+    def close(self) -> None:
+        self.stop_eviction()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+translation_memory = TranslationMemory()
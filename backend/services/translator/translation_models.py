@@ -42,3 +42,5 @@ class TranslationBatch:
     index: int
     segments: List[SubtitleSegment]
     context_before: Optional[List[SubtitleSegment]]
+    # Translation memory keys of segments, computed against the full timeline.
+    memory_keys: Optional[List[str]] = None
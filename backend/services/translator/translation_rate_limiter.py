@@ -0,0 +1,254 @@
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from loguru import logger
+
+from backend.config import settings
+
+# Additive increase: about +1 batch per window's worth of successes.
+AIMD_DECREASE_FACTOR = 0.5
+# A batch whose per-token latency exceeds this multiple of the best observed
+# one counts as congestion and shrinks the window gently.
+LATENCY_CONGESTION_FACTOR = 2.0
+LATENCY_DECREASE_FACTOR = 0.9
+BACKOFF_BASE_S = 1.0
+BACKOFF_CAP_S = 30.0
+THROUGHPUT_WINDOW_S = 60.0
+# Waiting batches re-check the window at least this often, since it can
+# grow without a slot being released.
+ADMISSION_RECHECK_S = 1.0
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough LLM token count: ~4 Latin characters or one CJK character per token."""
+    if not text:
+        return 0
+    ascii_chars = sum(1 for char in text if ord(char) < 128)
+    return max(1, ascii_chars // 4 + (len(text) - ascii_chars))
+
+
+def _error_chain(exc: BaseException):
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        yield exc
+        exc = exc.__cause__ or exc.__context__
+
+
+def transient_llm_error(exc: BaseException) -> Optional[BaseException]:
+    """
+    The rate-limit, timeout, connection or 5xx provider error behind exc, if
+    any. These are worth retrying; anything else (bad request, auth, parse
+    failures) is returned as None.
+    """
+    try:
+        import openai
+    except ImportError:
+        return None
+
+    for error in _error_chain(exc):
+        if isinstance(error, (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)):
+            return error
+        if isinstance(error, openai.APIStatusError) and (error.status_code == 429 or error.status_code >= 500):
+            return error
+    return None
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    return getattr(exc, "status_code", None) == 429
+
+
+def retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """Retry-After (seconds or HTTP date) or retry-after-ms from a provider error response."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return max(0.0, float(retry_after_ms) / 1000)
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """Full-jitter exponential backoff, or the server's Retry-After plus a little jitter."""
+    if retry_after is not None:
+        return retry_after + random.uniform(0, min(1.0, retry_after * 0.1 + 0.1))
+    return random.uniform(0, min(BACKOFF_CAP_S, BACKOFF_BASE_S * (2 ** attempt)))
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency window for one LLM provider.
+
+    The window grows by roughly one batch per window of successful batches
+    and is halved on a 429 (at most once per cooldown), with new batches held
+    back until the provider's Retry-After has passed. Slow batches relative
+    to the best observed per-token latency shrink it gently, so throughput
+    converges on what the provider's quota allows instead of a fixed number.
+    Thread-safe; shared by every job that talks to the same provider, and
+    batches from all of them are admitted against the one window. Jobs run
+    their own event loops, so waiters are woken across loops.
+    """
+
+    def __init__(self, provider: str, initial: Optional[int] = None, maximum: Optional[int] = None):
+        self.provider = provider
+        self.maximum = max(1, int(maximum or settings.LLM_TRANSLATION_MAX_CONCURRENCY))
+        start = initial if initial is not None else settings.LLM_TRANSLATION_INITIAL_CONCURRENCY
+        self._window = float(min(self.maximum, max(1, int(start))))
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._best_latency_per_token: Optional[float] = None
+        self._tokens: deque[tuple[float, int]] = deque()
+        self._waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self.in_flight = 0
+        self.completed = 0
+        self.rate_limited = 0
+        self.retries = 0
+
+    @property
+    def limit(self) -> int:
+        with self._lock:
+            return max(1, int(self._window))
+
+    def pause_remaining(self) -> float:
+        with self._lock:
+            return max(0.0, self._paused_until - time.monotonic())
+
+    async def acquire(self) -> None:
+        """Wait until the provider is not paused and the shared window has a free slot, then take it."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                pause = self._paused_until - time.monotonic()
+                if pause <= 0 and self.in_flight < max(1, int(self._window)):
+                    self.in_flight += 1
+                    return
+                waiter = loop.create_future()
+                self._waiters.append((loop, waiter))
+            try:
+                await asyncio.wait_for(waiter, timeout=pause if pause > 0 else ADMISSION_RECHECK_S)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                with self._lock:
+                    if (loop, waiter) in self._waiters:
+                        self._waiters.remove((loop, waiter))
+
+    def release(self) -> None:
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+            self._wake_waiters_locked()
+
+    def _wake_waiters_locked(self) -> None:
+        waiters, self._waiters = self._waiters, []
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve_waiter, waiter)
+            except RuntimeError:
+                # That job's loop has already closed.
+                pass
+
+    def on_success(self, latency_s: float, tokens: int) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self.completed += 1
+            self._tokens.append((now, tokens))
+            self._trim_tokens(now)
+            per_token = latency_s / max(1, tokens)
+            best = self._best_latency_per_token
+            if best is None or per_token < best:
+                self._best_latency_per_token = per_token
+            elif per_token > best * LATENCY_CONGESTION_FACTOR:
+                self._decrease_locked(now, LATENCY_DECREASE_FACTOR)
+                return
+            self._window = min(float(self.maximum), self._window + 1.0 / self._window)
+            self._wake_waiters_locked()
+
+    def on_transient_error(self, exc: BaseException, retry_after: Optional[float]) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self.retries += 1
+            if is_rate_limit_error(exc):
+                self.rate_limited += 1
+                self._paused_until = max(self._paused_until, now + (retry_after or BACKOFF_BASE_S))
+                self._decrease_locked(now, AIMD_DECREASE_FACTOR)
+            else:
+                self._decrease_locked(now, LATENCY_DECREASE_FACTOR)
+
+    def _decrease_locked(self, now: float, factor: float) -> None:
+        # One burst of failures from the same window only counts once.
+        if now - self._last_decrease < BACKOFF_BASE_S:
+            return
+        self._last_decrease = now
+        previous = self._window
+        self._window = max(1.0, self._window * factor)
+        if int(previous) != int(self._window):
+            logger.info(f"[Translate] {self.provider}: concurrency {int(previous)} -> {int(self._window)}")
+
+    def _trim_tokens(self, now: float) -> None:
+        while self._tokens and now - self._tokens[0][0] > THROUGHPUT_WINDOW_S:
+            self._tokens.popleft()
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        with self._lock:
+            self._trim_tokens(now)
+            tokens = sum(count for _ts, count in self._tokens)
+            span = now - self._tokens[0][0] if self._tokens else 0.0
+            return {
+                "provider": self.provider,
+                "concurrency": max(1, int(self._window)),
+                "max_concurrency": self.maximum,
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "retries": self.retries,
+                "rate_limited": self.rate_limited,
+                "tokens_per_s": round(tokens / max(span, 1.0), 1) if tokens else 0.0,
+                "paused_s": round(max(0.0, self._paused_until - now), 2),
+            }
+
+
+def _resolve_waiter(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+_limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_concurrency_limiter(provider: str) -> AdaptiveConcurrencyLimiter:
+    with _limiters_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None or limiter.maximum != max(1, int(settings.LLM_TRANSLATION_MAX_CONCURRENCY)):
+            limiter = AdaptiveConcurrencyLimiter(provider)
+            _limiters[provider] = limiter
+        return limiter
+
+
+def concurrency_stats() -> list[dict]:
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return [limiter.stats() for limiter in limiters]
@@ -4,6 +4,8 @@ from json_repair import repair_json
 from loguru import logger
 from pydantic import BaseModel
 
+from backend.services.translator.translation_rate_limiter import transient_llm_error
+
 
 class TranslationResponseParser:
     @staticmethod
@@ -103,6 +105,8 @@ class TranslationResponseParser:
                 temperature=0.3,
             )
         except Exception as error:
+            if transient_llm_error(error):
+                raise
             recovered = self.recover_structured_response_from_exception(
                 error,
                 response_model,
@@ -0,0 +1,151 @@
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from backend.services.translator.translation_rate_limiter import estimate_tokens
+
+# Finished jobs kept for GET /translate/stats.
+RECENT_JOBS = 20
+
+_active = threading.local()
+
+
+class TranslationUsage:
+    """
+    LLM requests and tokens spent on one translation job. Tokens come from
+    the provider's usage report when it sends one and are estimated from
+    the prompt otherwise. Thread-safe; batches record into it from worker
+    threads.
+    """
+
+    def __init__(self, mode: str, segments: int = 0):
+        self.mode = mode
+        self.segments = segments
+        self.batches = 0
+        self.requests = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+
+    def add_segments(self, count: int) -> None:
+        with self._lock:
+            self.segments += count
+
+    def add_batch(self) -> None:
+        with self._lock:
+            self.batches += 1
+
+    def add_request(self, prompt_tokens: int, completion_tokens: int) -> None:
+        with self._lock:
+            self.requests += 1
+            self.prompt_tokens += prompt_tokens
+            self.completion_tokens += completion_tokens
+
+    def summary(self) -> dict:
+        with self._lock:
+            tokens = self.prompt_tokens + self.completion_tokens
+            per_segment = max(1, self.segments)
+            return {
+                "mode": self.mode,
+                "segments": self.segments,
+                "batches": self.batches,
+                "requests": self.requests,
+                "prompt_tokens": self.prompt_tokens,
+                "completion_tokens": self.completion_tokens,
+                "requests_per_segment": round(self.requests / per_segment, 3),
+                "tokens_per_segment": round(tokens / per_segment, 1),
+                "duration_s": round(time.time() - self.started_at, 2),
+            }
+
+
+def active_usage() -> Optional[TranslationUsage]:
+    """The usage the current worker thread's batch records into, if any."""
+    return getattr(_active, "usage", None)
+
+
+def run_with_usage(usage: TranslationUsage, fn, *args):
+    """Call fn(*args) with usage active on this thread."""
+    previous = active_usage()
+    _active.usage = usage
+    try:
+        return fn(*args)
+    finally:
+        _active.usage = previous
+
+
+def _reported_usage(response) -> tuple[Optional[int], Optional[int]]:
+    # instructor keeps the raw ChatCompletion on the parsed model.
+    raw = getattr(response, "_raw_response", None) or response
+    usage = getattr(raw, "usage", None)
+    prompt = getattr(usage, "prompt_tokens", None)
+    completion = getattr(usage, "completion_tokens", None)
+    if isinstance(prompt, int) and isinstance(completion, int):
+        return prompt, completion
+    return None, None
+
+
+def _estimated_prompt_tokens(messages) -> int:
+    return sum(estimate_tokens(str(message.get("content") or "")) for message in messages or [])
+
+
+class _MeteredCompletions:
+    def __init__(self, completions, usage: TranslationUsage):
+        self._completions = completions
+        self._usage = usage
+
+    def create(self, **kwargs):
+        try:
+            response = self._completions.create(**kwargs)
+        except Exception:
+            self._usage.add_request(_estimated_prompt_tokens(kwargs.get("messages")), 0)
+            raise
+        prompt, completion = _reported_usage(response)
+        if prompt is None:
+            prompt, completion = _estimated_prompt_tokens(kwargs.get("messages")), 0
+        self._usage.add_request(prompt, completion)
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self._completions, name)
+
+
+class _MeteredChat:
+    def __init__(self, chat, usage: TranslationUsage):
+        self._chat = chat
+        self.completions = _MeteredCompletions(chat.completions, usage)
+
+    def __getattr__(self, name):
+        return getattr(self._chat, name)
+
+
+class MeteredClient:
+    """Wraps an LLM client so every chat completion is counted against a job's usage."""
+
+    def __init__(self, client, usage: TranslationUsage):
+        self._client = client
+        self._usage = usage
+
+    @property
+    def chat(self):
+        return _MeteredChat(self._client.chat, self._usage)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+_recent_jobs: deque = deque(maxlen=RECENT_JOBS)
+_recent_lock = threading.Lock()
+
+
+def record_job_usage(usage: TranslationUsage) -> dict:
+    summary = usage.summary()
+    with _recent_lock:
+        _recent_jobs.append(summary)
+    return summary
+
+
+def recent_job_usage() -> list[dict]:
+    with _recent_lock:
+        return list(_recent_jobs)
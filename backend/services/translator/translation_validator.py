@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from backend.models.schemas import SubtitleSegment
 from backend.services.translator.text_normalizer import normalize_text_for_target_language
@@ -83,6 +83,38 @@ class TranslationResponseValidator:
         error += f" You MUST return exactly {len(segments)} segments with IDs: {expected_ids}."
         return False, error, []
 
+    def salvage(
+        self,
+        resp: TranslationResponse,
+        segments: List[SubtitleSegment],
+        target_language: str,
+    ) -> Dict[int, SubtitleSegment]:
+        """
+        Rows of an invalid response that can still be trusted, by input
+        position: the id appears once, source_text matches that input line
+        exactly and the translation is not empty.
+        """
+        response_ids = [str(segment.id) for segment in resp.segments]
+        positions = {str(segment.id): position for position, segment in enumerate(segments)}
+        salvaged: Dict[int, SubtitleSegment] = {}
+        for translated in resp.segments:
+            segment_id = str(translated.id)
+            position = positions.get(segment_id)
+            if position is None or response_ids.count(segment_id) > 1:
+                continue
+            original = segments[position]
+            if translated.source_text != original.text:
+                continue
+            if not isinstance(translated.text, str) or not translated.text.strip():
+                continue
+            salvaged[position] = self.map_segment(
+                original,
+                translated.text,
+                target_language=target_language,
+                source_text=translated.source_text,
+            )
+        return salvaged
+
     @staticmethod
     def map_segment(
         original: SubtitleSegment,
@@ -4,6 +4,7 @@ import subprocess
 import ffmpeg
 from loguru import logger
 from backend.config import settings
+from backend.utils.artifact_cache import artifact_cache
 
 class MediaProber:
     _nvenc_available: bool | None = None  # Cached detection result
@@ -21,6 +22,19 @@ class MediaProber:
         )
         return "\n".join(part for part in (result.stdout, result.stderr) if part)
 
+    @staticmethod
+    def probe(video_path: str) -> dict:
+        """
+        ffprobe output for a file, served from the artifact cache when the
+        same media was probed before. Failures raise and are not cached.
+        """
+        cached = artifact_cache.get(video_path, "probe", {}, settings.FFPROBE_PATH)
+        if cached is not None:
+            return cached
+        probe = ffmpeg.probe(video_path, cmd=settings.FFPROBE_PATH)
+        artifact_cache.put(video_path, "probe", {}, probe, settings.FFPROBE_PATH)
+        return probe
+
     @staticmethod
     def detect_nvenc() -> bool:
         """Detect if h264_nvenc encoder is available in ffmpeg."""
@@ -42,7 +56,7 @@ class MediaProber:
     def get_duration(video_path: str) -> float:
         """Get video duration in seconds using ffprobe."""
         try:
-            probe = ffmpeg.probe(video_path, cmd=settings.FFPROBE_PATH)
+            probe = MediaProber.probe(video_path)
             return float(probe['format']['duration'])
         except Exception as e:
             logger.debug(f"Duration probe failed, trying ffmpeg fallback: {e}")
@@ -60,7 +74,7 @@ class MediaProber:
     def has_audio(video_path: str) -> bool:
         """Return whether the media file contains at least one audio stream."""
         try:
-            probe = ffmpeg.probe(video_path, cmd=settings.FFPROBE_PATH)
+            probe = MediaProber.probe(video_path)
             return any(stream.get('codec_type') == 'audio' for stream in probe.get('streams', []))
         except Exception as e:
             logger.debug(f"Audio probe failed, trying ffmpeg fallback: {e}")
@@ -75,7 +89,7 @@ class MediaProber:
     def probe_resolution(video_path: str):
         try:
             # Use show_streams AND show_format to be safe, though streams is usually enough
-            probe = ffmpeg.probe(video_path, cmd=settings.FFPROBE_PATH)
+            probe = MediaProber.probe(video_path)
             video_info = next(s for s in probe['streams'] if s['codec_type'] == 'video')
             w = int(video_info['width'])
             h = int(video_info['height'])
@@ -0,0 +1,169 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Optional
+
+from loguru import logger
+
+from backend.config import settings
+
+# Bytes hashed from the start, middle and end of a file for its fingerprint.
+FINGERPRINT_SAMPLE_BYTES = 1 << 20
+ARTIFACT_SCHEMA_VERSION = 1
+
+
+def file_fingerprint(path: str) -> str:
+    """
+    Cheap content identity for large media: size, mtime and a hash of three
+    1 MiB samples. Reading at most 3 MiB keeps a lookup in the milliseconds
+    even for multi-gigabyte videos.
+    """
+    stat = os.stat(path)
+    sha = hashlib.sha256(f"{stat.st_size}|{stat.st_mtime_ns}".encode("ascii"))
+    with open(path, "rb") as handle:
+        offsets = {0, max(0, stat.st_size // 2 - FINGERPRINT_SAMPLE_BYTES // 2),
+                   max(0, stat.st_size - FINGERPRINT_SAMPLE_BYTES)}
+        for offset in sorted(offsets):
+            handle.seek(offset)
+            sha.update(handle.read(FINGERPRINT_SAMPLE_BYTES))
+    return sha.hexdigest()
+
+
+class ArtifactCache:
+    """
+    Content-addressed store for step results under TEMP_DIR.
+
+    Keys combine the source file's fingerprint, the step name, its normalized
+    params and an engine/model version string, so re-running the same step on
+    the same media returns the stored JSON instead of recomputing it. Entry
+    mtimes double as last-use times; once the directory grows past max_bytes
+    the least recently used entries are deleted.
+    """
+
+    def __init__(self, root: Optional[Path] = None, max_bytes: Optional[int] = None):
+        self._root = root
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._sizes: Optional[dict[Path, int]] = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def root(self) -> Path:
+        return Path(self._root or settings.TEMP_DIR / "artifact_cache")
+
+    @property
+    def max_bytes(self) -> int:
+        if self._max_bytes is not None:
+            return self._max_bytes
+        return settings.ARTIFACT_CACHE_MAX_MB * 1024 * 1024
+
+    @staticmethod
+    def enabled() -> bool:
+        return settings.ARTIFACT_CACHE_ENABLED
+
+    @staticmethod
+    def key(source_path: str, step: str, params: dict, version: str = "") -> str:
+        payload = json.dumps(
+            {
+                "schema": ARTIFACT_SCHEMA_VERSION,
+                "source": file_fingerprint(source_path),
+                "step": step,
+                "params": params,
+                "version": version,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, source_path: str, step: str, params: dict, version: str = "") -> Optional[Any]:
+        if not self.enabled():
+            return None
+        try:
+            path = self._entry_path(self.key(source_path, step, params, version))
+            value = json.loads(path.read_text("utf-8"))["value"]
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:
+            logger.warning(f"[ArtifactCache] Unreadable {step} entry: {e}")
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        logger.debug(f"[ArtifactCache] HIT {step} for {source_path}")
+        return value
+
+    def put(self, source_path: str, step: str, params: dict, value: Any, version: str = "") -> None:
+        if not self.enabled():
+            return
+        try:
+            path = self._entry_path(self.key(source_path, step, params, version))
+            path.parent.mkdir(parents=True, exist_ok=True)
+            payload = json.dumps(
+                {"step": step, "source": str(source_path), "created_at": time.time(), "value": value},
+                ensure_ascii=False,
+                default=str,
+            )
+            tmp_path = path.with_suffix(f".{uuid.uuid4().hex[:8]}.tmp")
+            tmp_path.write_text(payload, "utf-8")
+            os.replace(tmp_path, path)
+            with self._lock:
+                sizes = self._load_sizes()
+                sizes[path] = len(payload.encode("utf-8"))
+                self._evict_locked(sizes)
+        except Exception as e:
+            logger.warning(f"[ArtifactCache] Failed to store {step} result: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in list(self._load_sizes()):
+                path.unlink(missing_ok=True)
+            self._sizes = {}
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(self._load_sizes().values())
+
+    def _load_sizes(self) -> dict[Path, int]:
+        if self._sizes is None:
+            self._sizes = {}
+            if self.root.exists():
+                for path in self.root.glob("*/*.json"):
+                    try:
+                        self._sizes[path] = path.stat().st_size
+                    except OSError:
+                        pass
+        return self._sizes
+
+    def _evict_locked(self, sizes: dict[Path, int]) -> None:
+        total = sum(sizes.values())
+        if total <= self.max_bytes:
+            return
+
+        def last_used(path: Path) -> float:
+            try:
+                return path.stat().st_mtime
+            except OSError:
+                return 0.0
+
+        for path in sorted(sizes, key=last_used):
+            if total <= self.max_bytes:
+                break
+            total -= sizes.pop(path)
+            path.unlink(missing_ok=True)
+
+
+artifact_cache = ArtifactCache()
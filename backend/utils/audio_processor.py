@@ -1,9 +1,19 @@
+import math
 import re
 import subprocess
+from bisect import bisect_left, bisect_right
 from pathlib import Path
 from typing import List, Tuple
+
+import numpy as np
 from loguru import logger
 from backend.config import settings
+from backend.utils.pcm_audio import PcmAudio, pcm_cache
+
+# Frame length for energy-based silence detection on decoded PCM.
+SILENCE_FRAME_SECONDS = 0.01
+# How far above the threshold a frame must rise to end a silence.
+SILENCE_HYSTERESIS_DB = 3.0
 
 class AudioProcessor:
     @staticmethod
@@ -30,14 +40,33 @@ class AudioProcessor:
     @staticmethod
     def detect_silence(audio_path: str, silence_thresh: str = "-30dB", min_silence_dur: float = 0.5) -> List[Tuple[float, float]]:
         """
-        Detect silence intervals using ffmpeg silencedetect filter.
+        Detect silence intervals.
         Returns a list of (start, end) tuples for silence.
+
+        silence_thresh takes the same forms as ffmpeg's silencedetect noise
+        option ("-30dB" or an amplitude ratio such as "0.03"). With
+        SILENCE_DETECTOR="native" the file is decoded once (cached across
+        calls) and analysed with NumPy; the ffmpeg filter is used otherwise,
+        or if the native path fails.
         """
-        logger.info("Detecting silence intervals...")
         if not Path(audio_path).exists():
              logger.error(f"Audio file not found: {audio_path}")
              return []
 
+        if settings.SILENCE_DETECTOR == "native":
+            try:
+                thresh_db = AudioProcessor.parse_silence_threshold(silence_thresh)
+                with pcm_cache.open(audio_path) as pcm:
+                    return AudioProcessor.detect_silence_in_pcm(pcm, thresh_db, min_silence_dur)
+            except Exception as e:
+                logger.warning(f"Native silence detection failed ({e}); using ffmpeg silencedetect.")
+
+        return AudioProcessor._detect_silence_ffmpeg(audio_path, silence_thresh, min_silence_dur)
+
+    @staticmethod
+    def _detect_silence_ffmpeg(audio_path: str, silence_thresh: str = "-30dB", min_silence_dur: float = 0.5) -> List[Tuple[float, float]]:
+        """Detect silence intervals using ffmpeg silencedetect filter."""
+        logger.info("Detecting silence intervals...")
         cmd = [
             settings.FFMPEG_PATH,
             "-i", audio_path,
@@ -77,12 +106,86 @@ class AudioProcessor:
             logger.warning(f"Silence detection failed: {e}")
             return []
 
+    @staticmethod
+    def parse_silence_threshold(silence_thresh) -> float:
+        """Convert a silencedetect-style threshold ("-30dB" or "0.03") to dBFS."""
+        text = str(silence_thresh).strip()
+        if text.lower().endswith("db"):
+            return float(text[:-2])
+        ratio = float(text)
+        if ratio <= 0:
+            raise ValueError(f"Invalid silence threshold: {silence_thresh!r}")
+        return 20.0 * math.log10(ratio)
+
+    @staticmethod
+    def detect_silence_in_pcm(
+        pcm: PcmAudio,
+        silence_thresh_db: float = -30.0,
+        min_silence_dur: float = 0.5,
+        hysteresis_db: float = SILENCE_HYSTERESIS_DB,
+    ) -> List[Tuple[float, float]]:
+        """
+        Detect silence intervals on already-decoded PCM.
+
+        Frames are 10 ms. Silence starts at a frame whose RMS level drops below
+        silence_thresh_db (dBFS) and only ends once a frame rises above
+        silence_thresh_db + hysteresis_db, so noise hovering at the threshold
+        does not chop one pause into many. Runs lasting at least
+        min_silence_dur become intervals. Like ffmpeg's silencedetect, silence
+        still running at the end of the file is not reported.
+        """
+        frame = max(1, int(pcm.sample_rate * SILENCE_FRAME_SECONDS))
+        frame_count = len(pcm) // frame
+        if frame_count == 0:
+            return []
+
+        mean_square = np.empty(frame_count, dtype=np.float32)
+        # Work through the buffer in blocks so a long memory-mapped file never
+        # needs a full float copy.
+        block_frames = 1 << 16
+        for first in range(0, frame_count, block_frames):
+            last = min(frame_count, first + block_frames)
+            block = np.asarray(pcm.samples[first * frame:last * frame], dtype=np.float32)
+            mean_square[first:last] = np.square(block).reshape(-1, frame).mean(axis=1)
+
+        enter = (10.0 ** (silence_thresh_db / 20.0) * 32768.0) ** 2
+        leave = (10.0 ** ((silence_thresh_db + max(0.0, hysteresis_db)) / 20.0) * 32768.0) ** 2
+
+        # Two-threshold state machine without a Python loop: frames below
+        # `enter` set the state to silent, frames above `leave` clear it, and
+        # every frame in between carries forward the last decided state.
+        decided = (mean_square < enter) | (mean_square > leave)
+        last_decided = np.maximum.accumulate(np.where(decided, np.arange(frame_count), -1))
+        silent = (last_decided >= 0) & (mean_square[np.maximum(last_decided, 0)] < enter)
+
+        edges = np.diff(np.concatenate(([0], silent.astype(np.int8), [0])))
+        run_starts = np.flatnonzero(edges == 1)
+        run_ends = np.flatnonzero(edges == -1)
+        min_frames = max(1, int(np.ceil(min_silence_dur / SILENCE_FRAME_SECONDS)))
+
+        frame_s = frame / pcm.sample_rate
+        intervals = [
+            (start * frame_s, end * frame_s)
+            for start, end in zip(run_starts.tolist(), run_ends.tolist())
+            if end - start >= min_frames and end < frame_count
+        ]
+        logger.debug(f"Detected {len(intervals)} silence intervals in decoded PCM.")
+        return intervals
+
     @staticmethod
     def calculate_split_points(total_duration: float, silence_intervals: List[Tuple[float, float]], target_chunk_duration: float = 600) -> List[float]:
         """
         Calculate safe split points based on silence intervals.
-        Target chunk duration default: 600s (10 minutes).
+        Target chunk duration default: 600s (10 minutes). Silence is searched
+        for within +/- 60 s of each target, or a quarter of the chunk length
+        for chunks shorter than 4 minutes.
+
+        Silences are sorted by start once, so each window lookup is a pair of
+        binary searches rather than a scan over every interval.
         """
+        silences = sorted(silence_intervals, key=lambda interval: interval[0])
+        starts = [s for s, _e in silences]
+
         split_points = []
         current_time = 0.0
         
@@ -92,18 +195,25 @@ class AudioProcessor:
             # Find closest silence interval to target_time
             best_split_point = None
             
-            # Search window: target_time +/- 60 seconds (1 minute)
-            search_start = max(current_time + 60, target_time - 60) 
-            search_end = min(total_duration - 10, target_time + 60)
-            
-            valid_silences = [
-                (s, e) for s, e in silence_intervals 
-                if s >= search_start and s <= search_end
-            ]
+            # Search window: target_time +/- 60 seconds (1 minute), narrower for short chunks
+            window = min(60.0, target_chunk_duration / 4)
+            search_start = max(current_time + window, target_time - window)
+            search_end = min(total_duration - 10, target_time + window)
+
+            lo = bisect_left(starts, search_start)
+            hi = bisect_right(starts, search_end)
             
-            if valid_silences:
-                # Pick the middle of the longest silence near target
-                closest_silence = min(valid_silences, key=lambda x: abs(x[0] - target_time))
+            if lo < hi:
+                # Nearest start on either side of the target; on a tie the
+                # earlier silence wins.
+                right = bisect_left(starts, target_time, lo, hi)
+                candidates = []
+                if right > lo:
+                    candidates.append(bisect_left(starts, starts[right - 1], lo, right))
+                if right < hi:
+                    candidates.append(right)
+                closest = min(candidates, key=lambda index: abs(starts[index] - target_time))
+                closest_silence = silences[closest]
                 # Split in the middle of silence
                 best_split_point = (closest_silence[0] + closest_silence[1]) / 2
             else:
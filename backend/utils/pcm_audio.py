@@ -0,0 +1,229 @@
+import subprocess
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+import numpy as np
+from loguru import logger
+
+from backend.config import settings
+
+# Whisper models consume 16 kHz mono float32.
+PCM_SAMPLE_RATE = 16000
+# Decodes younger than this are left alone by the startup sweep; another
+# process sharing TEMP_DIR may still be writing them.
+STALE_PCM_MIN_AGE_S = 300
+
+
+def default_pcm_dir() -> Path:
+    """Where decodes go unless a caller picks a directory; the startup sweep cleans it."""
+    return Path(settings.TEMP_DIR) / "pcm"
+
+
+class PcmAudio:
+    """
+    Media decoded once to 16 kHz mono PCM.
+
+    The decode writes raw s16le samples to a file under TEMP_DIR/pcm which is
+    then memory-mapped, so a two-hour recording costs ~230 MB of page cache
+    rather than resident memory, and any time range can be sliced out as a
+    float32 array that WhisperModel.transcribe accepts directly. Use it as a
+    context manager (or call close()) to release the mapping and delete the
+    file.
+    """
+
+    def __init__(
+        self,
+        samples: np.ndarray,
+        sample_rate: int = PCM_SAMPLE_RATE,
+        backing_path: Optional[Path] = None,
+    ):
+        self._samples = samples
+        self.sample_rate = sample_rate
+        self._backing_path = backing_path
+
+    @classmethod
+    def decode(cls, audio_path: str, work_dir: Optional[Path] = None) -> "PcmAudio":
+        if not Path(audio_path).exists():
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+
+        work_dir = Path(work_dir or default_pcm_dir())
+        work_dir.mkdir(parents=True, exist_ok=True)
+        pcm_path = work_dir / f"pcm_{Path(audio_path).stem}_{uuid.uuid4().hex[:8]}.s16le"
+
+        cmd = [
+            settings.FFMPEG_PATH, "-y",
+            "-i", audio_path,
+            "-vn",
+            "-ac", "1",
+            "-ar", str(PCM_SAMPLE_RATE),
+            "-f", "s16le",
+            "-c:a", "pcm_s16le",
+            str(pcm_path),
+        ]
+        try:
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True, shell=False)
+        except Exception:
+            pcm_path.unlink(missing_ok=True)
+            raise
+
+        if pcm_path.stat().st_size < 2:
+            # np.memmap cannot map an empty file.
+            pcm_path.unlink(missing_ok=True)
+            return cls(np.zeros(0, dtype=np.int16))
+
+        samples = np.memmap(pcm_path, dtype=np.int16, mode="r")
+        logger.info(f"Decoded {audio_path} to {len(samples) / PCM_SAMPLE_RATE:.1f}s of 16 kHz PCM.")
+        return cls(samples, PCM_SAMPLE_RATE, pcm_path)
+
+    def __enter__(self) -> "PcmAudio":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    @property
+    def samples(self) -> np.ndarray:
+        return self._samples
+
+    @property
+    def duration(self) -> float:
+        return len(self._samples) / self.sample_rate
+
+    def slice(self, start: float, end: Optional[float] = None) -> np.ndarray:
+        """float32 samples in [-1, 1) for start..end seconds (end None = to the end)."""
+        first = max(0, int(round(start * self.sample_rate)))
+        last = len(self._samples) if end is None else min(len(self._samples), int(round(end * self.sample_rate)))
+        return self._samples[first:last].astype(np.float32) / 32768.0
+
+    def close(self) -> None:
+        mapping = getattr(self._samples, "_mmap", None)
+        self._samples = np.zeros(0, dtype=np.int16)
+        if mapping is not None:
+            try:
+                mapping.close()
+            except (BufferError, ValueError):
+                pass
+        if self._backing_path is not None:
+            try:
+                self._backing_path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning(f"Failed to remove PCM cache {self._backing_path}: {e}")
+            self._backing_path = None
+
+
+class _CacheEntry:
+    def __init__(self, pcm: PcmAudio):
+        self.pcm = pcm
+        self.refs = 0
+
+
+class PcmAudioCache:
+    """
+    Keeps the most recent decodes around so repeated work on one file (the
+    editor re-running silence detection while the user tunes the threshold)
+    decodes it once. Entries are keyed on path, size and mtime, so an edited
+    file is decoded afresh. Entries in use are never closed; if the cache is
+    over capacity they are evicted once released.
+    """
+
+    def __init__(self, max_entries: int = 2, work_dir: Optional[Path] = None):
+        self._max_entries = max(0, max_entries)
+        self._work_dir = work_dir
+        self._entries: "OrderedDict[tuple, _CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(audio_path: str) -> tuple:
+        path = Path(audio_path).resolve()
+        stat = path.stat()
+        return str(path), stat.st_size, stat.st_mtime_ns
+
+    @contextmanager
+    def open(self, audio_path: str) -> Iterator[PcmAudio]:
+        key = self._key(audio_path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                entry.refs += 1
+
+        if entry is None:
+            pcm = PcmAudio.decode(audio_path, self._dir())
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None:
+                    entry = _CacheEntry(pcm)
+                    self._entries[key] = entry
+                    pcm = None
+                entry.refs += 1
+            if pcm is not None:
+                # Another caller decoded the same file meanwhile; keep theirs.
+                pcm.close()
+
+        try:
+            yield entry.pcm
+        finally:
+            with self._lock:
+                entry.refs -= 1
+                stale = self._evict_locked()
+            for pcm in stale:
+                pcm.close()
+
+    def clear(self) -> None:
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if entry.refs == 0]
+            stale = [self._entries.pop(key).pcm for key in keys]
+        for pcm in stale:
+            pcm.close()
+
+    def remove_stale_files(self, min_age_s: float = STALE_PCM_MIN_AGE_S) -> int:
+        """
+        Delete decodes left in the work directory by a run that did not shut
+        down cleanly. Files backing this cache's entries, and files modified
+        in the last min_age_s seconds, are kept. Returns the number removed.
+        """
+        with self._lock:
+            in_use = {entry.pcm._backing_path for entry in self._entries.values()}
+        work_dir = self._dir()
+        if not work_dir.is_dir():
+            return 0
+        cutoff = time.time() - min_age_s
+        removed = 0
+        for path in work_dir.glob("*.s16le"):
+            try:
+                if path in in_use or path.stat().st_mtime > cutoff:
+                    continue
+                path.unlink()
+                removed += 1
+            except OSError as e:
+                # Still mapped by another process (Windows) or already gone.
+                logger.debug(f"Kept PCM cache file {path}: {e}")
+        if removed:
+            logger.info(f"Removed {removed} stale PCM cache file(s) from {work_dir}")
+        return removed
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _dir(self) -> Path:
+        return Path(self._work_dir or default_pcm_dir())
+
+    def _evict_locked(self) -> list[PcmAudio]:
+        stale = []
+        for key in list(self._entries):
+            if len(self._entries) <= self._max_entries:
+                break
+            if self._entries[key].refs == 0:
+                stale.append(self._entries.pop(key).pcm)
+        return stale
+
+
+pcm_cache = PcmAudioCache(max_entries=settings.PCM_CACHE_ENTRIES)
@@ -65,7 +65,7 @@ contextBridge.exposeInMainWorld("electronAPI", {
       role?: string;
       origin?: string;
     } | null;
-    engine?: "builtin" | "cli";
+    engine?: "builtin" | "cli" | "batched";
     model: string;
     device: string;
     language?: string | null;
@@ -166,7 +166,7 @@ contextBridge.exposeInMainWorld("electronAPI", {
     audio_path: string;
     start: number;
     end: number;
-    engine?: "builtin" | "cli";
+    engine?: "builtin" | "cli" | "batched";
     model?: string;
     device?: string;
     language?: string;
@@ -5,6 +5,7 @@ import { usePreprocessingStore } from "../stores/preprocessingStore";
 
 const useTaskContextMock = vi.fn();
 const getOcrResultsMock = vi.fn();
+const loadFullTaskResultMock = vi.fn();
 
 vi.mock("../context/taskContext", () => ({
   useTaskContext: () => useTaskContextMock(),
@@ -19,6 +20,28 @@ vi.mock("../services/domain", () => ({
   },
 }));
 
+vi.mock("../services/tasks/taskResultLoader", async (importOriginal) => ({
+  ...(await importOriginal<typeof import("../services/tasks/taskResultLoader")>()),
+  loadFullTaskResult: (...args: unknown[]) => loadFullTaskResultMock(...args),
+}));
+
+const hookArgs = {
+  videoPath: "E:/video.mp4",
+  videoRef: {
+    path: "E:/canonical/video.mp4",
+    name: "video.mp4",
+  },
+  roi: null,
+  canvasRef: { current: null },
+  videoResolution: { w: 1920, h: 1080 },
+  activeTool: "extract",
+  ocrEngine: "rapid",
+  enhanceModel: "RealESRGAN-x4plus",
+  enhanceScale: "4x",
+  enhanceMethod: "realesrgan",
+  cleanMethod: "telea",
+};
+
 describe("useOCRProcessor", () => {
   beforeEach(() => {
     vi.clearAllMocks();
@@ -108,4 +131,37 @@ describe("useOCRProcessor", () => {
     expect(usePreprocessingStore.getState().preprocessingActiveTaskId).toBeNull();
     expect(usePreprocessingStore.getState().preprocessingIsProcessing).toBe(false);
   });
+
+  it("loads detached OCR events for completed tasks with large results", async () => {
+    const task = {
+      id: "extract-large",
+      type: "extract",
+      status: "completed",
+      progress: 100,
+      created_at: 1,
+      request_params: {
+        video_ref: {
+          path: "E:/canonical/video.mp4",
+          name: "video.mp4",
+        },
+      },
+      result: {
+        result_ref: { task_id: "extract-large", fields: ["events"] },
+      },
+    };
+    useTaskContextMock.mockReturnValue({ addTask: vi.fn(), tasks: [task] });
+    loadFullTaskResultMock.mockResolvedValue({
+      ...task,
+      result: { events: [{ start: 2, end: 3, text: "detached", box: [] }] },
+    });
+
+    renderHook(() => useOCRProcessor(hookArgs));
+
+    await waitFor(() => {
+      expect(usePreprocessingStore.getState().ocrResults).toEqual([
+        { start: 2, end: 3, text: "detached", box: [] },
+      ]);
+    });
+    expect(loadFullTaskResultMock).toHaveBeenCalledWith(task);
+  });
 });
@@ -60,4 +60,41 @@ describe("useTaskStore", () => {
 
     expect(result.current.tasks.map((task) => task.id)).toEqual(["task-supported"]);
   });
+
+  it("merges patch events into the existing task and ignores unknown ids", () => {
+    const { result } = renderHook(() => useTaskStore());
+
+    act(() => {
+      result.current.applyMessage({
+        type: "update",
+        task: {
+          id: "task-patched",
+          type: "transcribe",
+          status: "running",
+          progress: 10,
+          message: "step 1",
+          created_at: 1,
+          task_contract_version: SUPPORTED_TASK_CONTRACT_VERSION,
+        },
+      });
+      result.current.applyMessage({
+        type: "patch",
+        task_id: "task-patched",
+        changes: { progress: 55, message: "step 5" },
+      });
+      result.current.applyMessage({
+        type: "patch",
+        task_id: "task-missing",
+        changes: { progress: 99 },
+      });
+    });
+
+    expect(result.current.tasks).toHaveLength(1);
+    expect(result.current.tasks[0]).toMatchObject({
+      id: "task-patched",
+      status: "running",
+      progress: 55,
+      message: "step 5",
+    });
+  });
 });
@@ -4,6 +4,8 @@ import { getApiBase, getApiUrl } from "./runtime";
 export type {
   MessageResponse,
   CountResponse,
+  TaskPage,
+  TaskQueryFilters,
   StatusMessageResponse,
   TaskResponse,
   HealthResponse,
@@ -38,6 +40,8 @@ export type {
 import type {
   MessageResponse,
   CountResponse,
+  TaskPage,
+  TaskQueryFilters,
   StatusMessageResponse,
   TaskResponse,
   HealthResponse,
@@ -64,7 +68,7 @@ import type {
   EnhanceVideoRequest,
   CleanVideoRequest,
 } from "../types/api";
-import type { Task } from "../types/task";
+import type { Task, TaskResult } from "../types/task";
 
 // ─── Internal Generic Request Wrapper ────────────────────────────
 
@@ -231,6 +235,23 @@ export const apiClient = {
     return request<Task[]>("/tasks/");
   },
 
+  queryTasks: (filters: TaskQueryFilters = {}) => {
+    const params = new URLSearchParams();
+    filters.status?.forEach((status) => params.append("status", status));
+    filters.type?.forEach((type) => params.append("type", type));
+    if (filters.createdAfter !== undefined) params.set("created_after", String(filters.createdAfter));
+    if (filters.createdBefore !== undefined) params.set("created_before", String(filters.createdBefore));
+    if (filters.q) params.set("q", filters.q);
+    if (filters.limit !== undefined) params.set("limit", String(filters.limit));
+    if (filters.offset !== undefined) params.set("offset", String(filters.offset));
+    const query = params.toString();
+    return request<TaskPage>(`/tasks/page${query ? `?${query}` : ""}`);
+  },
+
+  getTaskResult: (taskId: string) => {
+    return request<{ task_id: string; result: TaskResult | null }>(`/tasks/${taskId}/result`);
+  },
+
   pauseAllTasks: () => {
     return request<CountResponse>("/tasks/pause-all", { method: "POST" });
   },
@@ -239,6 +260,13 @@ export const apiClient = {
     return request<CountResponse>("/tasks/cancel-all", { method: "POST" });
   },
 
+  moveTask: (taskId: string, position: number) => {
+    return request<MessageResponse & { task_id: string; queue_position: number }>(
+      `/tasks/${taskId}/move`,
+      { method: "POST", body: JSON.stringify({ position }) },
+    );
+  },
+
   pauseTask: (taskId: string) => {
     return request<StatusMessageResponse>(`/tasks/${taskId}/pause`, {
       method: "POST",
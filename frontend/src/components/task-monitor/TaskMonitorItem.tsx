@@ -15,13 +15,15 @@ import {
   Trash2,
   Video,
 } from "lucide-react";
+import { useEffect, useState } from "react";
 import { useTranslation } from "react-i18next";
-import type { Task, TaskResult } from "../../types/task";
+import type { Task, TaskResult, TaskTraceItem } from "../../types/task";
 import { fileService } from "../../services/fileService";
 import {
   createTaskDiagnostic,
   type RuntimeExecutionSummary,
 } from "../../services/debug/runtimeDiagnostics";
+import { loadFullTaskResult } from "../../services/tasks/taskResultLoader";
 import { canRetryTask } from "../../services/tasks/taskRetry";
 import {
   hasTaskSubtitleMedia,
@@ -118,6 +120,7 @@ export function TaskMonitorItem({
   const typeInfo = useTaskTypeInfo(task);
   const hasVideo = task.status === "completed" && hasTaskVideoMedia(task);
   const hasSubtitle = task.status === "completed" && hasTaskSubtitleMedia(task);
+  const trace = useExecutionTrace(task, expanded);
 
   return (
     <div className="p-4 border-b border-white/5 hover:bg-white/[0.02] transition-colors group relative">
@@ -204,7 +207,7 @@ export function TaskMonitorItem({
                 </div>
               )}
 
-              {task.result?.meta?.execution_trace && (
+              {trace.available && (
                 <button
                   onClick={() => onToggleExpand(task.id)}
                   className="p-1.5 rounded-lg hover:bg-white/10 text-slate-400 transition-colors ml-1"
@@ -259,10 +262,10 @@ export function TaskMonitorItem({
         </div>
       </div>
 
-      {expanded && task.result?.meta?.execution_trace && (
+      {expanded && trace.items && (
         <div className="mt-3 pl-[52px]">
           <div className="bg-black/30 rounded-lg overflow-hidden border border-white/5">
-            <TaskTraceView trace={task.result.meta.execution_trace} />
+            <TaskTraceView trace={trace.items} />
           </div>
         </div>
       )}
@@ -270,6 +273,35 @@ export function TaskMonitorItem({
   );
 }
 
+/** The task's execution trace, fetched when the panel is expanded if it was detached from a large result. */
+function useExecutionTrace(task: TaskWithDetails, expanded: boolean) {
+  const inlineTrace = task.result?.meta?.execution_trace;
+  const detached = Boolean(task.result?.result_ref?.fields?.includes("meta.execution_trace"));
+  const [loaded, setLoaded] = useState<{ taskId: string; items: TaskTraceItem[] } | null>(null);
+  const loadedItems = loaded?.taskId === task.id ? loaded.items : undefined;
+
+  useEffect(() => {
+    if (!expanded || inlineTrace || !detached || loadedItems) return;
+    let cancelled = false;
+    void loadFullTaskResult(task)
+      .then((fullTask) => {
+        const items = fullTask.result?.meta?.execution_trace;
+        if (!cancelled && items) {
+          setLoaded({ taskId: task.id, items });
+        }
+      })
+      .catch(() => undefined);
+    return () => {
+      cancelled = true;
+    };
+  }, [expanded, inlineTrace, detached, loadedItems, task]);
+
+  return {
+    available: Boolean(inlineTrace) || detached,
+    items: inlineTrace ?? loadedItems,
+  };
+}
+
 function TaskNavigationButton({
   task,
   destination,
@@ -2,8 +2,8 @@ import { Settings, Play } from "lucide-react";
 import { useTranslation } from 'react-i18next';
 
 interface TranscriptionConfigProps {
-  engine: "builtin" | "cli";
-  setEngine: (engine: "builtin" | "cli") => void;
+  engine: "builtin" | "cli" | "batched";
+  setEngine: (engine: "builtin" | "cli" | "batched") => void;
   model: string;
   setModel: (model: string) => void;
   device: string;
@@ -43,11 +43,12 @@ export function TranscriptionConfig({
           <div className="relative group">
             <select
               value={engine}
-              onChange={(e) => setEngine(e.target.value as "builtin" | "cli")}
+              onChange={(e) => setEngine(e.target.value as "builtin" | "cli" | "batched")}
               className="w-full h-10 bg-black/40 border border-white/10 rounded-lg px-3 text-xs text-white focus:outline-none focus:border-purple-500/50 focus:ring-1 focus:ring-purple-500/50 appearance-none cursor-pointer hover:bg-black/60 transition-all shadow-sm font-medium truncate pr-8"
             >
               <option value="builtin" className="bg-[#1a1a1a]">{t('config.engines.builtin')}</option>
               <option value="cli" className="bg-[#1a1a1a]">{t('config.engines.cli')}</option>
+              <option value="batched" className="bg-[#1a1a1a]">{t('config.engines.batched')}</option>
             </select>
             <div className="absolute right-3 top-1/2 -translate-y-1/2 pointer-events-none opacity-50">
               <svg width="10" height="6" viewBox="0 0 10 6" fill="none" xmlns="http://www.w3.org/2000/svg"><path d="M1 1L5 5L9 1" stroke="currentColor" strokeWidth="1.5" strokeLinecap="round" strokeLinejoin="round"/></svg>
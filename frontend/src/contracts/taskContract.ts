@@ -24,8 +24,16 @@ export interface TaskStructuredMediaRefs {
   output_ref?: TaskMediaRef | null;
 }
 
+export interface TaskResultRef {
+  task_id: string;
+  fields: string[];
+  summary?: Record<string, { count?: number; preview?: string }>;
+  size_bytes?: number;
+}
+
 export interface TaskResultShape extends TaskStructuredMediaRefs {
   success?: boolean;
+  result_ref?: TaskResultRef | null;
   files?: TaskFileRef[];
   segments?: Array<{ id: number | string; start: number; end: number; text: string }>;
   text?: string;
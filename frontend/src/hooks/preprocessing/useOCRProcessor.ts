@@ -7,7 +7,8 @@ import {
 } from "../../services/domain";
 import type { OCRTextEvent } from "../../types/api";
 import type { ROIRect } from "./useROIInteraction";
-import type { TaskResult } from "../../types/task";
+import type { Task, TaskResult } from "../../types/task";
+import { hasDetachedResult, loadFullTaskResult } from "../../services/tasks/taskResultLoader";
 import { usePreprocessingStore } from "../../stores/preprocessingStore";
 import {
   findRecoverablePreprocessingTask,
@@ -189,10 +190,18 @@ export function useOCRProcessor({
     if (!task) return;
 
     if (task.status === "completed") {
-      const result = task.result as OCRTaskResult | undefined;
+      const applyCompletedTask = (resolvedTask: Task) => {
+        const result = resolvedTask.result as OCRTaskResult | undefined;
+        setOcrResults(result?.events ?? []);
+      };
       setTimeout(() => {
         clearActiveTask();
-        setOcrResults(result?.events ?? []);
+        // Large event lists are detached from the task and fetched on demand.
+        if (hasDetachedResult(task)) {
+          void loadFullTaskResult(task).catch(() => task).then(applyCompletedTask);
+        } else {
+          applyCompletedTask(task);
+        }
       }, 0);
     } else if (
       task.status === "failed" ||
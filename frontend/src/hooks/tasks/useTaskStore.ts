@@ -6,6 +6,7 @@ import { normalizeTaskForRenderer } from "../../context/taskSources/shared";
 export type TaskSocketMessage =
   | { type: "snapshot"; tasks: Task[] }
   | { type: "update"; task: Task }
+  | { type: "patch"; task_id: string; changes: Partial<Task> }
   | { type: "delete"; task_id: string };
 
 function sortTasks(tasks: Task[]): Task[] {
@@ -45,6 +46,27 @@ export function useTaskStore() {
       return;
     }
 
+    if (message.type === "patch") {
+      setTasks((prev) => {
+        const index = prev.findIndex((task) => task.id === message.task_id);
+        if (index === -1) {
+          return prev;
+        }
+        const patchedTask = normalizeTaskForRenderer(
+          { ...prev[index], ...message.changes },
+          "event:patch",
+        );
+        if (!patchedTask) {
+          return prev;
+        }
+
+        const next = [...prev];
+        next[index] = patchedTask;
+        return sortTasks(next);
+      });
+      return;
+    }
+
     setTasks((prev) => prev.filter((task) => task.id !== message.task_id));
   }, []);
 
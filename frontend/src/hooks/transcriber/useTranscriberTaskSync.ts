@@ -9,6 +9,7 @@ import {
   mapTaskToTranscribeResult,
   selectTaskById,
 } from "../tasks/taskSelectors";
+import { hasDetachedResult, loadFullTaskResult } from "../../services/tasks/taskResultLoader";
 
 type UseTranscriberTaskSyncParams = {
   tasks: Task[];
@@ -52,10 +53,29 @@ export function useTranscriberTaskSync({
       return;
     }
 
-    const mappedResult = mapTaskToTranscribeResult(completedTask, fileRef, filePath);
-    if (mappedResult) {
-      setResult(mappedResult);
+    const applyCompletedTask = (resolvedTask: Task) => {
+      const mappedResult = mapTaskToTranscribeResult(resolvedTask, fileRef, filePath);
+      if (mappedResult) {
+        setResult(mappedResult);
+      }
+    };
+
+    if (!hasDetachedResult(completedTask)) {
+      applyCompletedTask(completedTask);
+      return;
     }
+
+    let cancelled = false;
+    void loadFullTaskResult(completedTask)
+      .catch(() => completedTask)
+      .then((resolvedTask) => {
+        if (!cancelled) {
+          applyCompletedTask(resolvedTask);
+        }
+      });
+    return () => {
+      cancelled = true;
+    };
   }, [tasks, tasksSettled, activeTaskId, currentResult, filePath, fileRef, setResult]);
 
   useEffect(() => {
@@ -64,9 +84,16 @@ export function useTranscriberTaskSync({
     const task = selectTaskById(tasks, activeTaskId);
     if (task) {
       if (task.status === "completed") {
-        const mappedResult = mapTaskToTranscribeResult(task, fileRef, filePath);
-        if (mappedResult) {
-          setResult(mappedResult);
+        const applyCompletedTask = (resolvedTask: Task) => {
+          const mappedResult = mapTaskToTranscribeResult(resolvedTask, fileRef, filePath);
+          if (mappedResult) {
+            setResult(mappedResult);
+          }
+        };
+        if (hasDetachedResult(task)) {
+          void loadFullTaskResult(task).catch(() => task).then(applyCompletedTask);
+        } else {
+          applyCompletedTask(task);
         }
         setExecutionMode("task_submission");
         setActiveTaskId(null);
@@ -13,6 +13,7 @@ import {
   selectTaskById,
 } from "../tasks/taskSelectors";
 import type { MediaReference } from "../../services/ui/mediaReference";
+import { hasDetachedResult, loadFullTaskResult } from "../../services/tasks/taskResultLoader";
 
 type UseTranslationTaskSyncParams = {
   tasks: Task[];
@@ -108,25 +109,44 @@ export function useTranslationTaskSync({
       return;
     }
 
-    const segments = getTranslationTaskSegments(completedTask);
-    if (segments.length === 0) {
+    const applyCompletedTask = (resolvedTask: Task) => {
+      const segments = getTranslationTaskSegments(resolvedTask);
+      if (segments.length === 0) {
+        return;
+      }
+
+      const taskMediaRefs = getTranslationTaskMediaRefs(resolvedTask);
+      const completedTaskMode =
+        getTranslationTaskMode(resolvedTask) ?? activeTaskModeRef.current;
+      setTargetSegments(segments);
+      if (taskMediaRefs.sourceSubtitleRef) {
+        setSourceFileRef(taskMediaRefs.sourceSubtitleRef);
+      }
+      setTargetSubtitleRef(taskMediaRefs.targetSubtitleRef);
+      setResultMode(completedTaskMode);
+      setTaskStatus("completed");
+      setProgress(100);
+      setTaskError(null);
+      setExecutionMode("task_submission");
+      setActiveMode(null);
+    };
+
+    if (!hasDetachedResult(completedTask)) {
+      applyCompletedTask(completedTask);
       return;
     }
 
-    const taskMediaRefs = getTranslationTaskMediaRefs(completedTask);
-    const completedTaskMode =
-      getTranslationTaskMode(completedTask) ?? activeTaskModeRef.current;
-    setTargetSegments(segments);
-    if (taskMediaRefs.sourceSubtitleRef) {
-      setSourceFileRef(taskMediaRefs.sourceSubtitleRef);
-    }
-    setTargetSubtitleRef(taskMediaRefs.targetSubtitleRef);
-    setResultMode(completedTaskMode);
-    setTaskStatus("completed");
-    setProgress(100);
-    setTaskError(null);
-    setExecutionMode("task_submission");
-    setActiveMode(null);
+    let cancelled = false;
+    void loadFullTaskResult(completedTask)
+      .catch(() => completedTask)
+      .then((resolvedTask) => {
+        if (!cancelled) {
+          applyCompletedTask(resolvedTask);
+        }
+      });
+    return () => {
+      cancelled = true;
+    };
   }, [
     activeTaskModeRef,
     currentTargetSegments.length,
@@ -190,16 +210,23 @@ export function useTranslationTaskSync({
     }
 
     if (task.status === "completed") {
-      const segments = getTranslationTaskSegments(task);
       const completedTaskMode =
         getTranslationTaskMode(task) ?? activeTaskModeRef.current;
-      if (segments.length > 0) {
-        setTargetSegments(segments);
-        if (taskMediaRefs.sourceSubtitleRef) {
-          setSourceFileRef(taskMediaRefs.sourceSubtitleRef);
+      const applySegments = (resolvedTask: Task) => {
+        const segments = getTranslationTaskSegments(resolvedTask);
+        if (segments.length > 0) {
+          setTargetSegments(segments);
+          if (taskMediaRefs.sourceSubtitleRef) {
+            setSourceFileRef(taskMediaRefs.sourceSubtitleRef);
+          }
+          setTargetSubtitleRef(taskMediaRefs.targetSubtitleRef);
+          setResultMode(completedTaskMode);
         }
-        setTargetSubtitleRef(taskMediaRefs.targetSubtitleRef);
-        setResultMode(completedTaskMode);
+      };
+      if (hasDetachedResult(task)) {
+        void loadFullTaskResult(task).catch(() => task).then(applySegments);
+      } else {
+        applySegments(task);
       }
       setTaskStatus("processing_result");
       setProgress(100);
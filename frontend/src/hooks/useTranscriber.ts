@@ -40,7 +40,7 @@ export function useTranscriber() {
   const [device, setDevice] = useState(
     () => restoreStoredAsrExecutionPreferences().device,
   );
-  const [engine, setEngine] = useState<"builtin" | "cli">(
+  const [engine, setEngine] = useState<"builtin" | "cli" | "batched">(
     () => restoreStoredAsrExecutionPreferences().engine,
   );
 
@@ -20,7 +20,7 @@ export const editorService = {
     audio_ref?: MediaReference | null;
     start: number;
     end: number;
-    engine?: "builtin" | "cli";
+    engine?: "builtin" | "cli" | "batched";
     model?: string;
     device?: string;
     language?: string;
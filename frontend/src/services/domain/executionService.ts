@@ -146,7 +146,7 @@ export const executionService = {
   async transcribe(payload: {
     audio_path?: string | null;
     audio_ref?: MediaReference | null;
-    engine?: "builtin" | "cli";
+    engine?: "builtin" | "cli" | "batched";
     model: string;
     device: string;
     language?: string | null;
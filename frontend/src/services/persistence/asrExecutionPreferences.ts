@@ -1,7 +1,7 @@
 import { parseVersionedSnapshot, serializeVersionedSnapshot } from "./versionedSnapshot";
 
 export type AsrExecutionPreferences = {
-  engine: "builtin" | "cli";
+  engine: "builtin" | "cli" | "batched";
   model: string;
   device: string;
 };
@@ -23,7 +23,10 @@ function normalizeAsrExecutionPreferences(
   payload: Partial<AsrExecutionPreferences> | null | undefined,
 ): AsrExecutionPreferences {
   return {
-    engine: payload?.engine === "cli" ? "cli" : "builtin",
+    engine:
+      payload?.engine === "cli" || payload?.engine === "batched"
+        ? payload.engine
+        : DEFAULT_ASR_EXECUTION_PREFERENCES.engine,
     model:
       typeof payload?.model === "string" && payload.model.trim()
         ? payload.model
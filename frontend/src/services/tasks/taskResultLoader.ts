@@ -0,0 +1,13 @@
+import type { Task, TaskResult } from "../../types/task";
+
+/** Large results (segments, OCR events) are kept out of task lists and fetched on demand. */
+export const hasDetachedResult = (task: Task): boolean => Boolean(task.result?.result_ref);
+
+export async function loadFullTaskResult(task: Task): Promise<Task> {
+  if (!hasDetachedResult(task)) {
+    return task;
+  }
+  const { apiClient } = await import("../../api/client");
+  const response = await apiClient.getTaskResult(task.id);
+  return response.result ? { ...task, result: response.result as TaskResult } : task;
+}
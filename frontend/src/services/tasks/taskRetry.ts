@@ -227,7 +227,7 @@ async function submitTranscribeRetry(task: Task): Promise<RetrySubmission | null
     return null;
   }
 
-  const engine = params.engine === "cli" ? "cli" : "builtin";
+  const engine = params.engine === "cli" || params.engine === "batched" ? params.engine : "builtin";
   const model = typeof params.model === "string" ? params.model : "base";
   const device = typeof params.device === "string" ? params.device : "cpu";
   const language = readOptionalString(params.language);
@@ -264,7 +264,7 @@ async function submitTranscribeRetry(task: Task): Promise<RetrySubmission | null
         }
       : {
           audio_ref: audioRef,
-          engine: (params.engine as "builtin" | "cli" | undefined) ?? "builtin",
+          engine: (params.engine as "builtin" | "cli" | "batched" | undefined) ?? "builtin",
           model: typeof params.model === "string" ? params.model : "base",
           device: typeof params.device === "string" ? params.device : "cpu",
           language: typeof params.language === "string" ? params.language : undefined,
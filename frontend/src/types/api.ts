@@ -6,7 +6,7 @@
  * re‑declaring inline.
  */
 
-import type { SubtitleSegment } from "./task";
+import type { SubtitleSegment, Task } from "./task";
 import type { MediaReference } from "../services/ui/mediaReference";
 import type {
   DesktopSynthesizeDirectResult,
@@ -26,6 +26,25 @@ export interface CountResponse extends MessageResponse {
   count: number;
 }
 
+/** Filters for the paged task listing (`GET /tasks/page`). */
+export interface TaskQueryFilters {
+  status?: string[];
+  type?: string[];
+  createdAfter?: number;
+  createdBefore?: number;
+  q?: string;
+  limit?: number;
+  offset?: number;
+}
+
+/** One page of tasks, newest first. */
+export interface TaskPage {
+  items: Task[];
+  total: number;
+  limit: number;
+  offset: number;
+}
+
 /** Endpoints that return a message + status (resume, etc.). */
 export interface StatusMessageResponse extends MessageResponse {
   status: string;
@@ -75,6 +94,7 @@ export interface PipelineRequest {
   pipeline_id: string;
   task_name?: string;
   steps: PipelineStep[];
+  streaming?: boolean;
 }
 
 // ─── Analyze ────────────────────────────────────────────────────
@@ -245,7 +265,7 @@ export interface TranscribeSegmentRequest {
   audio_ref?: MediaReference | null;
   start: number;
   end: number;
-  engine?: "builtin" | "cli";
+  engine?: "builtin" | "cli" | "batched";
   model?: string;
   device?: string;
   language?: string;
@@ -266,7 +286,7 @@ export interface TranscribeSegmentResponse {
   message?: string;
 }
 
-export type TranscriptionEngine = "builtin" | "cli";
+export type TranscriptionEngine = "builtin" | "cli" | "batched";
 
 // ─── Translate ──────────────────────────────────────────────────
 
@@ -292,10 +312,17 @@ export interface TranslationTaskStatus {
   result?: Pick<TaskResultShape, "segments" | "meta">;
 }
 
+export interface TaskPoolSummary {
+  limit: number;
+  running: number;
+  queued: number;
+}
+
 export interface TaskQueueSummaryResponse {
   max_concurrent: number;
   running: number;
   queued: number;
+  pools: Record<string, TaskPoolSummary>;
 }
 
 // ─── OCR ────────────────────────────────────────────────────────
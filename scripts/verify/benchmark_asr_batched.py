@@ -0,0 +1,57 @@
+"""
+Benchmark: direct / smart-split transcription vs batched speech regions.
+
+Loads one Whisper model through ModelManager and transcribes the same media
+with CoreStrategies.transcribe_direct (one model.transcribe call with
+per-call VAD), transcribe_smart_split (silence-cut chunks across the model
+replicas) and transcribe_batched (one VAD pass, speech windows decoded
+ASR_BATCH_SIZE at a time). Prints wall time, real-time factor and segment
+count for each; the model is downloaded on first use.
+
+Usage:
+    python scripts/verify/benchmark_asr_batched.py <media> [model] [device] [batch_size]
+"""
+import sys
+import time
+
+from backend.services.asr import ASRService
+from backend.utils.audio_processor import AudioProcessor
+
+
+def _run(label: str, duration: float, transcribe) -> None:
+    started_at = time.perf_counter()
+    segments = transcribe()
+    elapsed_s = time.perf_counter() - started_at
+    rtf = elapsed_s / duration if duration > 0 else 0.0
+    print(f"{label:<12} {elapsed_s:8.1f}s  RTF {rtf:.3f}  {len(segments)} segments")
+
+
+def main(media_path: str, model_name: str, device: str, batch_size: int) -> None:
+    asr = ASRService()
+    strategies = asr.core_strategies
+    duration = AudioProcessor.get_audio_duration(media_path)
+    print(f"{media_path}: {duration:.1f}s audio, model {model_name} on {device}")
+
+    with asr.model_manager.acquire(model_name, device) as (model, replicas):
+        _run("direct", duration, lambda: strategies.transcribe_direct(
+            media_path, duration, model, None, None, None,
+        ))
+        _run("smart-split", duration, lambda: strategies.transcribe_smart_split(
+            media_path, duration, model, None, None, None,
+            max_parallel=replicas,
+        ))
+        _run("batched", duration, lambda: strategies.transcribe_batched(
+            media_path, duration, model, None, None, None, batch_size=batch_size,
+        ))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    main(
+        sys.argv[1],
+        sys.argv[2] if len(sys.argv) > 2 else "base",
+        sys.argv[3] if len(sys.argv) > 3 else "cpu",
+        int(sys.argv[4]) if len(sys.argv) > 4 else 8,
+    )
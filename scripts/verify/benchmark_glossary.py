@@ -0,0 +1,72 @@
+"""
+Benchmark: glossary term lookup per translation batch.
+
+Builds a synthetic glossary (mixed Latin and CJK sources) and times the old
+per-term `source.lower() in text.lower()` scan against the Aho–Corasick
+GlossaryIndex on the same batch texts, plus the cost of one edit.
+
+Usage:
+    python scripts/verify/benchmark_glossary.py [terms] [batches]
+"""
+import random
+import sys
+import time
+
+from backend.services.translator.glossary_index import GlossaryIndex
+
+CJK = "机器学习深度网络模型数据训练推理向量语言视觉音频"
+
+
+def _sources(count: int, rng: random.Random) -> list[str]:
+    sources = []
+    for index in range(count):
+        if index % 3 == 0:
+            sources.append("".join(rng.choice(CJK) for _ in range(rng.randint(2, 5))))
+        else:
+            sources.append(f"term{index} {rng.choice(['model', 'layer', 'loss', 'token'])}")
+    return sources
+
+
+def _batch(sources: list[str], rng: random.Random) -> str:
+    words = [rng.choice(sources) if rng.random() < 0.1 else "lorem ipsum dolor" for _ in range(120)]
+    return " ".join(words)
+
+
+def main(term_count: int, batch_count: int) -> None:
+    rng = random.Random(7)
+    sources = _sources(term_count, rng)
+    batches = [_batch(sources, rng) for _ in range(batch_count)]
+
+    started_at = time.perf_counter()
+    naive = [[s for s in sources if s.lower() in text.lower()] for text in batches]
+    naive_s = time.perf_counter() - started_at
+
+    index = GlossaryIndex()
+    started_at = time.perf_counter()
+    index.rebuild(enumerate(sources))
+    index.search("")
+    build_s = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    indexed = [index.search(text) for text in batches]
+    indexed_s = time.perf_counter() - started_at
+
+    assert [sorted(set(found)) for found in naive] == [
+        sorted({sources[key] for key in found}) for found in indexed
+    ]
+
+    started_at = time.perf_counter()
+    index.add(term_count, "new glossary term")
+    index.search(batches[0])
+    edit_s = time.perf_counter() - started_at
+
+    print(f"{term_count} terms, {batch_count} batches")
+    print(f"per-term scan   {naive_s / batch_count * 1000:8.2f} ms/batch")
+    print(f"Aho-Corasick    {indexed_s / batch_count * 1000:8.2f} ms/batch  (build {build_s * 1000:.1f} ms)")
+    print(f"edit + relink   {edit_s * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    terms = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    main(terms, count)
@@ -0,0 +1,117 @@
+"""
+Benchmark: per-batch LLM client vs the pooled TranslationClientFactory client.
+
+Starts a local OpenAI-compatible stub (/v1/chat/completions) that adds a
+fixed delay to every new TCP connection to stand in for TCP+TLS setup against
+a remote provider, then sends the same number of chat completions with
+LLM_TRANSLATION_MAX_CONCURRENCY workers twice: once building a new client
+per batch (the old behaviour) and once through the shared factory client.
+Prints per-batch latency and how many connections the stub accepted.
+
+Usage:
+    python scripts/verify/benchmark_llm_client.py [batches] [handshake_ms]
+"""
+import json
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+from backend.config import settings
+from backend.services.translator.translation_client import TranslationClientFactory
+
+RESPONSE = {
+    "id": "stub",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "stub-model",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "ok"}, "finish_reason": "stop"}],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    handshake_s = 0.0
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        with StubHandler.lock:
+            StubHandler.connections += 1
+        time.sleep(StubHandler.handshake_s)
+        super().setup()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.dumps(RESPONSE).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _run(batches: int, get_client) -> tuple[list[float], int]:
+    StubHandler.connections = 0
+    latencies: list[float] = []
+
+    def one_batch(_index: int) -> None:
+        started_at = time.perf_counter()
+        client, model = get_client()
+        client.chat.completions.create(model=model, messages=[{"role": "user", "content": "hi"}])
+        latencies.append(time.perf_counter() - started_at)
+
+    with ThreadPoolExecutor(max_workers=max(1, settings.LLM_TRANSLATION_MAX_CONCURRENCY)) as pool:
+        list(pool.map(one_batch, range(batches)))
+    return latencies, StubHandler.connections
+
+
+def _report(label: str, latencies: list[float], connections: int) -> None:
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(
+        f"{label:<18} mean {statistics.mean(latencies) * 1000:7.1f} ms  "
+        f"p95 {p95 * 1000:7.1f} ms  connections {connections}"
+    )
+
+
+def main(batches: int, handshake_ms: float) -> None:
+    StubHandler.handshake_s = handshake_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    provider = SimpleNamespace(
+        id="stub",
+        base_url=f"http://127.0.0.1:{server.server_port}/v1",
+        api_key="stub-key",
+        model="stub-model",
+    )
+    factory = TranslationClientFactory(SimpleNamespace(get_active_llm_provider=lambda: provider))
+
+    def fresh_client():
+        # What get_client did before: a new client and pool for every batch.
+        return TranslationClientFactory._build_client(provider), provider.model
+
+    try:
+        # Import openai/instructor before timing anything.
+        TranslationClientFactory._build_client(provider)
+        print(f"{batches} batches, concurrency {settings.LLM_TRANSLATION_MAX_CONCURRENCY}, "
+              f"simulated handshake {handshake_ms:.0f} ms")
+        _report("client per batch", *_run(batches, fresh_client))
+        TranslationClientFactory.reset()
+        _report("pooled client", *_run(batches, factory.get_client))
+    finally:
+        TranslationClientFactory.reset()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    handshake = float(sys.argv[2]) if len(sys.argv) > 2 else 40.0
+    main(count, handshake)
@@ -0,0 +1,97 @@
+"""
+Benchmark: ffmpeg silencedetect vs the native NumPy silence detector.
+
+Synthesizes a speech-like WAV (tone bursts separated by pauses over a low
+noise floor), then runs AudioProcessor._detect_silence_ffmpeg and the native
+path (decode once, then detect_silence_in_pcm) on it. Prints the wall time of
+each, the time of a repeat native call served from the PCM cache, and how
+closely the two sets of intervals agree.
+
+Usage:
+    python scripts/verify/benchmark_silence_detection.py [minutes]
+"""
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+
+import numpy as np
+
+from backend.utils.audio_processor import AudioProcessor
+from backend.utils.pcm_audio import PCM_SAMPLE_RATE, PcmAudioCache
+
+THRESHOLD = "-30dB"
+MIN_SILENCE = 0.5
+
+
+def _write_fixture(path: Path, minutes: float) -> None:
+    rng = np.random.default_rng(0)
+    total = int(minutes * 60 * PCM_SAMPLE_RATE)
+    samples = rng.normal(0, 30, total)
+    position = 0
+    while position < total:
+        burst = int(rng.uniform(1.0, 8.0) * PCM_SAMPLE_RATE)
+        t = np.arange(min(burst, total - position)) / PCM_SAMPLE_RATE
+        samples[position:position + len(t)] += np.sin(2 * np.pi * rng.uniform(120, 400) * t) * 6000
+        position += burst + int(rng.uniform(0.2, 2.0) * PCM_SAMPLE_RATE)
+
+    with wave.open(str(path), "wb") as handle:
+        handle.setnchannels(1)
+        handle.setsampwidth(2)
+        handle.setframerate(PCM_SAMPLE_RATE)
+        handle.writeframes(np.clip(samples, -32768, 32767).astype(np.int16).tobytes())
+
+
+def _timed(fn):
+    started_at = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started_at
+
+
+def _boundary_error(reference, candidate) -> tuple[int, float]:
+    """Matched interval count and worst start/end offset between matches."""
+    if not reference or not candidate:
+        return 0, 0.0
+    starts = np.array([start for start, _end in candidate])
+    matched, worst = 0, 0.0
+    for start, end in reference:
+        index = int(np.abs(starts - start).argmin())
+        other_start, other_end = candidate[index]
+        if other_start < end and start < other_end:
+            matched += 1
+            worst = max(worst, abs(other_start - start), abs(other_end - end))
+    return matched, worst
+
+
+def main(minutes: float) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        audio_path = Path(tmp) / "fixture.wav"
+        _write_fixture(audio_path, minutes)
+        cache = PcmAudioCache(max_entries=1, work_dir=Path(tmp))
+        thresh_db = AudioProcessor.parse_silence_threshold(THRESHOLD)
+
+        def native():
+            with cache.open(str(audio_path)) as pcm:
+                return AudioProcessor.detect_silence_in_pcm(pcm, thresh_db, MIN_SILENCE)
+
+        ffmpeg_intervals, ffmpeg_s = _timed(
+            lambda: AudioProcessor._detect_silence_ffmpeg(str(audio_path), THRESHOLD, MIN_SILENCE)
+        )
+        native_intervals, native_s = _timed(native)
+        _cached, cached_s = _timed(native)
+        cache.clear()
+
+    print(f"audio: {minutes:.1f} min")
+    print(f"ffmpeg silencedetect: {ffmpeg_s:8.3f}s  {len(ffmpeg_intervals)} intervals")
+    print(f"native (decode+scan): {native_s:8.3f}s  {len(native_intervals)} intervals")
+    print(f"native (cached PCM):  {cached_s:8.3f}s")
+    if native_s > 0:
+        print(f"speedup: {ffmpeg_s / native_s:.2f}x cold, {ffmpeg_s / max(cached_s, 1e-9):.1f}x cached")
+    matched, worst = _boundary_error(ffmpeg_intervals, native_intervals)
+    print(f"agreement: {matched}/{len(ffmpeg_intervals)} ffmpeg intervals matched, worst boundary offset {worst * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    count = float(sys.argv[1]) if len(sys.argv) > 1 else 30.0
+    main(count)
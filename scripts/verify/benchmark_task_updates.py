@@ -0,0 +1,75 @@
+"""
+Micro-benchmark: task updates/sec against SQLite.
+
+Runs TASK_MAX_CONCURRENT simulated tasks that each emit progress updates
+through TaskRepository.update_task, once with the legacy NullPool engine
+(one connection per update, rollback journal) and once with the pooled WAL
+engine, and prints the throughput of each.
+
+Usage:
+    python scripts/verify/benchmark_task_updates.py [updates_per_task]
+"""
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import SQLModel
+
+import backend.core.database as db_module
+from backend.config import settings
+from backend.services.task_repository import TaskRepository
+
+
+async def _run_mode(db_path: Path, pooled: bool, tasks: int, updates_per_task: int) -> float:
+    engine = db_module.build_engine(f"sqlite+aiosqlite:///{db_path}", pooled=pooled)
+    db_module.engine = engine
+    db_module.async_session_maker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    repository = TaskRepository()
+    task_ids = [
+        (await repository.create_task("benchmark", request_params={"index": index})).id
+        for index in range(tasks)
+    ]
+    for task_id in task_ids:
+        await repository.update_task(task_id, status="running")
+
+    async def emit(task_id: str):
+        for step in range(updates_per_task):
+            await repository.update_task(
+                task_id,
+                status="running",
+                progress=step * 100.0 / updates_per_task,
+                message=f"step {step}",
+            )
+
+    started = time.perf_counter()
+    await asyncio.gather(*(emit(task_id) for task_id in task_ids))
+    elapsed = time.perf_counter() - started
+
+    await repository.close()
+    await engine.dispose()
+    return tasks * updates_per_task / elapsed
+
+
+async def main(updates_per_task: int) -> None:
+    tasks = max(1, settings.TASK_MAX_CONCURRENT)
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for label, pooled in [("nullpool", False), ("pooled-wal", True)]:
+            db_path = Path(tmp) / f"{label}.db"
+            results[label] = await _run_mode(db_path, pooled, tasks, updates_per_task)
+            print(f"{label:>10}: {results[label]:8.1f} updates/sec ({tasks} tasks x {updates_per_task} updates)")
+
+    speedup = results["pooled-wal"] / results["nullpool"]
+    print(f"   speedup: {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    asyncio.run(main(count))
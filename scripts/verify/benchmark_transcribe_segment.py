@@ -0,0 +1,72 @@
+"""
+Benchmark: editor re-transcription latency for short clips.
+
+Picks clips of the given length at random offsets in the media and times
+ASRService.transcribe_segment on each (sliced from the cached PCM decode,
+warm model, no files) against the previous path (ffmpeg clip extraction to
+WORKSPACE_DIR plus a full transcribe() with ffprobe and an SRT). The model
+is loaded and the source decoded once before timing, as they are for an
+editor session. Prints p50 / p95 latency of each path.
+
+Usage:
+    python scripts/verify/benchmark_transcribe_segment.py <media> [model] [clips] [clip_s]
+"""
+import random
+import statistics
+import sys
+import time
+
+from backend.services.asr import ASRService
+from backend.utils.audio_processor import AudioProcessor
+
+TARGET_P50_MS = 500
+
+
+def _percentiles(samples_ms: list[float]) -> tuple[float, float]:
+    ordered = sorted(samples_ms)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return statistics.median(ordered), p95
+
+
+def _time(call) -> float:
+    started_at = time.perf_counter()
+    result = call()
+    if not result.success:
+        raise RuntimeError(result.error)
+    return (time.perf_counter() - started_at) * 1000
+
+
+def main(media_path: str, model_name: str, clips: int, clip_s: float) -> None:
+    asr = ASRService()
+    duration = AudioProcessor.get_audio_duration(media_path)
+    rng = random.Random(0)
+    starts = [rng.uniform(0, max(0.0, duration - clip_s)) for _ in range(clips)]
+
+    # Warm-up: loads the model and decodes the source into the PCM cache.
+    asr.transcribe_segment(media_path, 0.0, min(clip_s, duration), model_name=model_name)
+
+    fast = [_time(lambda: asr.transcribe_segment(media_path, s, s + clip_s, model_name=model_name)) for s in starts]
+    old = [
+        _time(lambda: asr._transcribe_segment_file(
+            media_path, s, s + clip_s, model_name, "cpu", None, "builtin", None, None,
+        ))
+        for s in starts
+    ]
+
+    for label, samples in (("cached PCM", fast), ("clip file", old)):
+        p50, p95 = _percentiles(samples)
+        print(f"{label:<11} p50 {p50:7.0f} ms  p95 {p95:7.0f} ms")
+    p50 = _percentiles(fast)[0]
+    print(f"target p50 {TARGET_P50_MS} ms: {'met' if p50 <= TARGET_P50_MS else 'missed'}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    main(
+        sys.argv[1],
+        sys.argv[2] if len(sys.argv) > 2 else "base",
+        int(sys.argv[3]) if len(sys.argv) > 3 else 20,
+        float(sys.argv[4]) if len(sys.argv) > 4 else 3.0,
+    )
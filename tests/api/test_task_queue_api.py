@@ -119,7 +119,10 @@ def test_queue_summary_limits_concurrency_to_two(isolated_api_client):
 
     queue_summary = client.get("/api/v1/tasks/queue/summary")
     assert queue_summary.status_code == 200
-    assert queue_summary.json() == {"max_concurrent": 2, "running": 2, "queued": 1}
+    summary = queue_summary.json()
+    assert (summary["running"], summary["queued"]) == (2, 1)
+    assert summary["pools"]["compute"] == {"limit": 2, "running": 2, "queued": 1}
+    assert summary["max_concurrent"] == sum(pool["limit"] for pool in summary["pools"].values())
 
     tasks_response = client.get("/api/v1/tasks/")
     assert tasks_response.status_code == 200
@@ -139,7 +142,7 @@ def test_queue_summary_limits_concurrency_to_two(isolated_api_client):
     queue_summary_later = client.get("/api/v1/tasks/queue/summary")
     assert queue_summary_later.status_code == 200
     later_payload = queue_summary_later.json()
-    assert later_payload["max_concurrent"] == 2
+    assert later_payload["pools"]["compute"]["limit"] == 2
     assert later_payload["queued"] == 0
     assert later_payload["running"] in {0, 1}
 
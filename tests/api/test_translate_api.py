@@ -45,3 +45,20 @@ def test_translate_endpoint_returns_400_for_client_value_errors(monkeypatch):
 
     assert response.status_code == 400
     assert response.json()["detail"] == "bad translation request"
+
+
+def test_translate_stats_reports_provider_limiters():
+    from backend.services.translator.translation_rate_limiter import get_concurrency_limiter
+
+    limiter = get_concurrency_limiter("stats-test")
+    limiter.on_success(0.5, 120)
+    client = TestClient(app)
+
+    response = client.get("/api/v1/translate/stats")
+
+    assert response.status_code == 200
+    entry = next(item for item in response.json()["providers"] if item["provider"] == "stats-test")
+    assert entry["completed"] == 1
+    assert entry["in_flight"] == 0
+    assert entry["tokens_per_s"] > 0
+    assert {"hits", "misses", "evictions", "entries"} <= set(response.json()["memory"])
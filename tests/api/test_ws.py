@@ -3,6 +3,7 @@ import asyncio
 import time
 import queue
 import threading
+import weakref
 from pathlib import Path
 from fastapi.testclient import TestClient
 from backend.config import settings
@@ -50,7 +51,15 @@ def _create_audio_file(name: str) -> Path:
     return audio_path
 
 
+_TASK_VIEWS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
 def _receive_until(websocket, predicate, limit: int = 30):
+    """
+    Receive until predicate matches. Patches are folded into the last full view
+    of their task and handed to the predicate as an equivalent "update".
+    """
+    views = _TASK_VIEWS.setdefault(websocket, {})
     last_message = None
     for _ in range(limit):
         result_queue: queue.Queue = queue.Queue(maxsize=1)
@@ -72,12 +81,22 @@ def _receive_until(websocket, predicate, limit: int = 30):
         kind, value = result_queue.get_nowait()
         if kind == "error":
             raise value
-        last_message = value
+        last_message = _fold_task_message(views, value)
         if predicate(last_message):
             return last_message
     raise AssertionError(f"Did not receive expected websocket payload. Last message: {last_message}")
 
 
+def _fold_task_message(views: dict, message: dict) -> dict:
+    if message.get("type") == "update":
+        views[message["task"]["id"]] = dict(message["task"])
+    elif message.get("type") == "patch":
+        task = {**views.get(message["task_id"], {"id": message["task_id"]}), **message["changes"]}
+        views[message["task_id"]] = task
+        return {"type": "update", "task": task}
+    return message
+
+
 def _wait_for_terminal_tasks(client, task_ids: list[str], timeout_s: float = 10.0):
     terminal_states = {"completed", "failed", "cancelled", "paused"}
     deadline = time.time() + timeout_s
@@ -168,7 +187,8 @@ async def test_task_update_broadcast(isolated_api_client: TestClient):
     )
     
     await task_manager.update_task("test_task", status="running", message="Test Message")
-    
+    await notifier.drain()
+
     print(f"DEBUG MESSAGES: {mock_ws.sent_messages}")
     msg = mock_ws.sent_messages[-1]
     assert msg["type"] == "update"
@@ -7,6 +7,23 @@ from pathlib import Path
 import shutil
 import uuid
 
+@pytest.fixture(autouse=True)
+def disable_artifact_cache(monkeypatch):
+    """Keep step results from leaking between tests; cache tests opt back in."""
+    from backend.config import settings
+
+    monkeypatch.setattr(settings, "ARTIFACT_CACHE_ENABLED", False)
+    monkeypatch.setattr(settings, "TRANSLATION_MEMORY_ENABLED", False)
+
+
+@pytest.fixture(autouse=True)
+def isolated_rtf_history(monkeypatch, tmp_path):
+    """Keep transcription speed measurements out of the real user data dir."""
+    from backend.services.asr.chunk_planner import RtfHistory
+
+    monkeypatch.setattr("backend.services.asr.service.rtf_history", RtfHistory(tmp_path / "asr_rtf_history.json"))
+
+
 @pytest.fixture
 def client():
     """FastAPI test client fixture."""
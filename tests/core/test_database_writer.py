@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import SQLModel
+
+import backend.core.database as db_module
+from backend.core.database import DatabaseWriter
+from backend.models.task_model import Task
+
+
+@pytest.fixture
+async def writer_db(monkeypatch):
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    monkeypatch.setattr(db_module, "engine", engine)
+    monkeypatch.setattr(
+        db_module,
+        "async_session_maker",
+        sessionmaker(engine, class_=AsyncSession, expire_on_commit=False),
+    )
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_writer_commits_concurrent_jobs_in_one_batch(writer_db, monkeypatch):
+    writer = DatabaseWriter()
+    batch_sizes = []
+    original_commit_batch = writer._commit_batch
+
+    async def recording_commit_batch(batch):
+        batch_sizes.append(len(batch))
+        await original_commit_batch(batch)
+
+    monkeypatch.setattr(writer, "_commit_batch", recording_commit_batch)
+
+    def make_job(task_id: str):
+        async def _job(session):
+            session.add(Task(id=task_id, type="test", status="pending"))
+            return task_id
+        return _job
+
+    results = await asyncio.gather(*(writer.submit(make_job(f"t{i}")) for i in range(10)))
+    await writer.stop()
+
+    assert results == [f"t{i}" for i in range(10)]
+    assert sum(batch_sizes) == 10
+    assert len(batch_sizes) < 10
+
+    async with db_module.get_session_context() as session:
+        assert await session.get(Task, "t9") is not None
+
+
+@pytest.mark.asyncio
+async def test_writer_isolates_failing_job_from_its_batch(writer_db):
+    writer = DatabaseWriter()
+
+    async def good_job(session):
+        session.add(Task(id="good", type="test", status="pending"))
+        return "ok"
+
+    async def bad_job(session):
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        writer.submit(good_job),
+        writer.submit(bad_job),
+        return_exceptions=True,
+    )
+    await writer.stop()
+
+    assert results[0] == "ok"
+    assert isinstance(results[1], RuntimeError)
+    async with db_module.get_session_context() as session:
+        assert await session.get(Task, "good") is not None
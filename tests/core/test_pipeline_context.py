@@ -18,3 +18,14 @@ def test_pipeline_context_media_adapter_sets_primary_path_and_structured_refs():
     assert ctx.get("context_ref")["path"] == "E:/subs/demo_CN.srt"
     assert ctx.get("output_ref")["path"] == "E:/subs/demo_CN.srt"
     assert ctx.get_media_path("subtitle_ref", "srt_path", "subtitle_path") == "E:/subs/demo_CN.srt"
+
+
+def test_pipeline_context_trace_reports_cache_hits():
+    ctx = PipelineContext()
+
+    ctx.mark_cache_hit("transcribe")
+    ctx.add_trace("download", 1.5, "success")
+    ctx.add_trace("transcribe", 0.004, "success")
+
+    assert "cache" not in ctx.trace[0]
+    assert ctx.trace[1]["cache"] == "hit"
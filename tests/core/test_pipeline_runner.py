@@ -1,3 +1,6 @@
+import os
+import threading
+import time
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from backend.core.pipeline import PipelineRunner
@@ -71,3 +74,275 @@ async def test_pipeline_runner_step_failure():
         failure_call = mock_tm.update_task.call_args_list[-1]
         assert failure_call.kwargs["status"] == "failed"
         assert "Step Failed" in failure_call.kwargs["error"]
+
+
+class InMemoryCheckpointStore:
+    def __init__(self):
+        self.checkpoints = {}
+
+    async def save_pipeline_checkpoint(self, checkpoint):
+        self.checkpoints[(checkpoint.task_id, checkpoint.step_index)] = checkpoint
+
+    async def load_pipeline_checkpoints(self, task_id):
+        return [cp for (tid, _), cp in sorted(self.checkpoints.items()) if tid == task_id]
+
+    async def clear_pipeline_checkpoints(self, task_id, from_step=0):
+        for key in [key for key in self.checkpoints if key[0] == task_id and key[1] >= from_step]:
+            del self.checkpoints[key]
+
+
+class RecordingStep:
+    """Writes one output file per run and records how often it ran."""
+
+    def __init__(self, name, output_dir, fail_times=0):
+        self.name = name
+        self.output_dir = output_dir
+        self.fail_times = fail_times
+        self.runs = 0
+
+    async def execute(self, ctx, params, task_id=None):
+        self.runs += 1
+        if self.fail_times:
+            self.fail_times -= 1
+            raise RuntimeError(f"{self.name} failed")
+        output = self.output_dir / f"{self.name}.out"
+        output.write_text(f"{self.name} from {sorted(ctx.data)}")
+        ctx.set(f"{self.name}_path", str(output))
+
+
+def _checkpointed_pipeline(tmp_path, *, synth_failures=1):
+    from backend.models.schemas import TranscribeStepRequest, SynthesizeStepRequest, TranscribeParams, SynthesizeParams
+
+    mock_tm = AsyncMock()
+    mock_tm.is_cancelled = MagicMock(return_value=False)
+    store = InMemoryCheckpointStore()
+    runner = PipelineRunner(task_manager=mock_tm, checkpoint_store=store)
+    steps = {
+        "download": RecordingStep("download", tmp_path),
+        "transcribe": RecordingStep("transcribe", tmp_path),
+        "synthesize": RecordingStep("synthesize", tmp_path, fail_times=synth_failures),
+    }
+    requests = [
+        DownloadStepRequest(step_name="download", params=DownloadParams(url="https://example.com/video")),
+        TranscribeStepRequest(step_name="transcribe", params=TranscribeParams(model="small")),
+        SynthesizeStepRequest(step_name="synthesize", params=SynthesizeParams()),
+    ]
+    return runner, store, steps, requests
+
+
+@pytest.mark.asyncio
+async def test_pipeline_resume_skips_checkpointed_steps(tmp_path):
+    runner, store, steps, requests = _checkpointed_pipeline(tmp_path)
+
+    with patch.object(StepRegistry, "get_step", side_effect=lambda name: steps[name]):
+        with pytest.raises(RuntimeError, match="synthesize failed"):
+            await runner.run(requests, task_id="task-resume")
+        assert sorted(index for _, index in store.checkpoints) == [0, 1]
+
+        result = await runner.run(requests, task_id="task-resume")
+
+    assert result["status"] == "completed"
+    assert result["history"] == ["download", "transcribe", "synthesize"]
+    assert [steps[name].runs for name in ["download", "transcribe", "synthesize"]] == [1, 1, 2]
+    assert result["final_data"]["transcribe_path"] == str(tmp_path / "transcribe.out")
+    # A completed pipeline has nothing left to resume.
+    assert store.checkpoints == {}
+
+
+@pytest.mark.asyncio
+async def test_pipeline_resume_reruns_from_step_whose_output_changed(tmp_path):
+    runner, store, steps, requests = _checkpointed_pipeline(tmp_path)
+
+    with patch.object(StepRegistry, "get_step", side_effect=lambda name: steps[name]):
+        with pytest.raises(RuntimeError):
+            await runner.run(requests, task_id="task-stale")
+
+        (tmp_path / "transcribe.out").write_text("edited by hand, different size")
+        result = await runner.run(requests, task_id="task-stale")
+
+    assert result["status"] == "completed"
+    assert [steps[name].runs for name in ["download", "transcribe", "synthesize"]] == [1, 2, 2]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_resume_reruns_step_whose_params_changed(tmp_path):
+    from backend.models.schemas import TranscribeStepRequest, TranscribeParams
+
+    runner, store, steps, requests = _checkpointed_pipeline(tmp_path)
+
+    with patch.object(StepRegistry, "get_step", side_effect=lambda name: steps[name]):
+        with pytest.raises(RuntimeError):
+            await runner.run(requests, task_id="task-params")
+
+        requests[1] = TranscribeStepRequest(step_name="transcribe", params=TranscribeParams(model="large-v3"))
+        result = await runner.run(requests, task_id="task-params")
+
+    assert result["status"] == "completed"
+    assert [steps[name].runs for name in ["download", "transcribe", "synthesize"]] == [1, 2, 2]
+
+
+class StreamingASR:
+    """Emits two transcript chunks and only finishes once the first was consumed."""
+
+    def __init__(self, srt_path):
+        self.srt_path = srt_path
+        self.first_chunk_consumed = threading.Event()
+
+    def transcribe(self, audio_path, segment_callback=None, progress_callback=None, **kwargs):
+        from backend.models.schemas import FileRef, SubtitleSegment, TaskResult
+
+        first = [SubtitleSegment(id="1", start=0.0, end=1.0, text="hello")]
+        second = [SubtitleSegment(id="2", start=1.0, end=2.0, text="world")]
+        segment_callback(first)
+        progress_callback(50, "chunk 1")
+        assert self.first_chunk_consumed.wait(timeout=5)
+        segment_callback(second)
+        progress_callback(100, "Completed")
+        return TaskResult(
+            success=True,
+            files=[FileRef(type="subtitle", path=str(self.srt_path), label="transcription")],
+            meta={"text": "hello\nworld", "segments": [s.model_dump() for s in first + second]},
+        )
+
+
+class StreamingTranslator:
+    def __init__(self, asr):
+        self.asr = asr
+
+    def translate_segment_stream(self, segment_queue, target_language, mode="standard", progress_callback=None, **kwargs):
+        translated = []
+        while (chunk := segment_queue.get()) is not None:
+            translated.extend(s.model_copy(update={"text": s.text.upper()}) for s in chunk)
+            self.asr.first_chunk_consumed.set()
+            progress_callback(len(translated), len(translated))
+        return translated
+
+
+@pytest.mark.asyncio
+async def test_pipeline_streams_transcript_chunks_into_translation(tmp_path):
+    from backend.core.runtime_access import RuntimeServices
+    from backend.models.schemas import TranscribeStepRequest, TranslateStepRequest, TranscribeParams, TranslateParams
+
+    audio_path = tmp_path / "talk.wav"
+    audio_path.write_bytes(b"RIFF")
+    mock_tm = AsyncMock()
+    mock_tm.is_cancelled = MagicMock(return_value=False)
+    mock_tm.raise_if_control_requested = MagicMock()
+    mock_tm.submit_threadsafe_update = MagicMock()
+    store = InMemoryCheckpointStore()
+    saved_indexes = []
+    save_checkpoint = store.save_pipeline_checkpoint
+
+    async def record_checkpoint(checkpoint):
+        saved_indexes.append(checkpoint.step_index)
+        await save_checkpoint(checkpoint)
+
+    store.save_pipeline_checkpoint = record_checkpoint
+    runner = PipelineRunner(task_manager=mock_tm, checkpoint_store=store)
+    asr = StreamingASR(tmp_path / "talk.srt")
+    requests = [
+        TranscribeStepRequest(step_name="transcribe", params=TranscribeParams(audio_path=str(audio_path))),
+        TranslateStepRequest(step_name="translate", params=TranslateParams(target_language="English")),
+    ]
+
+    with patch.object(RuntimeServices, "asr", return_value=asr), \
+         patch.object(RuntimeServices, "translator", return_value=StreamingTranslator(asr)), \
+         patch.object(RuntimeServices, "task_manager", return_value=mock_tm):
+        result = await runner.run(requests, task_id="task-stream", streaming=True)
+
+    assert result["status"] == "completed"
+    assert result["history"] == ["transcribe", "translate"]
+    assert [s["text"] for s in result["final_data"]["translated_segments"]] == ["HELLO", "WORLD"]
+    assert result["final_data"]["srt_path"] == str(tmp_path / "talk_EN.srt")
+    progress = [c.kwargs["progress"] for c in mock_tm.submit_threadsafe_update.call_args_list]
+    assert progress == sorted(progress) and progress[-1] == 100.0
+    # Both steps still checkpoint under their own index.
+    assert saved_indexes == [0, 1]
+
+
+class SlowStreamingASR:
+    """Hands over one chunk, then keeps transcribing until told to stop."""
+
+    def __init__(self):
+        self.progress_calls = 0
+        self.finished = False
+
+    def transcribe(self, audio_path, segment_callback=None, progress_callback=None, **kwargs):
+        from backend.models.schemas import SubtitleSegment
+
+        time.sleep(0.2)
+        segment_callback([SubtitleSegment(id="1", start=0.0, end=1.0, text="hello")])
+        for value in range(200):
+            time.sleep(0.01)
+            self.progress_calls += 1
+            progress_callback(value / 2, "transcribing")
+        self.finished = True
+
+
+class FailingStreamingTranslator:
+    def translate_segment_stream(self, segment_queue, **kwargs):
+        segment_queue.get()
+        raise RuntimeError("provider rejected the batch")
+
+
+@pytest.mark.asyncio
+async def test_pipeline_stream_stops_transcription_when_translation_fails(tmp_path):
+    from backend.core.runtime_access import RuntimeServices
+    from backend.models.schemas import TranscribeStepRequest, TranslateStepRequest, TranscribeParams, TranslateParams
+
+    audio_path = tmp_path / "talk.wav"
+    audio_path.write_bytes(b"RIFF")
+    mock_tm = AsyncMock()
+    mock_tm.is_cancelled = MagicMock(return_value=False)
+    mock_tm.raise_if_control_requested = MagicMock()
+    mock_tm.submit_threadsafe_update = MagicMock()
+    runner = PipelineRunner(task_manager=mock_tm, checkpoint_store=InMemoryCheckpointStore())
+    asr = SlowStreamingASR()
+    requests = [
+        TranscribeStepRequest(step_name="transcribe", params=TranscribeParams(audio_path=str(audio_path))),
+        TranslateStepRequest(step_name="translate", params=TranslateParams(target_language="English")),
+    ]
+
+    traces = []
+    add_trace = PipelineContext.add_trace
+
+    def record_trace(ctx, step_name, duration, status, error=None):
+        traces.append((step_name, duration, status))
+        add_trace(ctx, step_name, duration, status, error)
+
+    with patch.object(RuntimeServices, "asr", return_value=asr), \
+         patch.object(RuntimeServices, "translator", return_value=FailingStreamingTranslator()), \
+         patch.object(PipelineContext, "add_trace", record_trace), \
+         patch.object(RuntimeServices, "task_manager", return_value=mock_tm), \
+         pytest.raises(RuntimeError, match="provider rejected"):
+        await runner.run(requests, task_id="task-stream-fail", streaming=True)
+
+    # ASR stopped at its next check instead of running to the end.
+    assert not asr.finished
+    assert asr.progress_calls < 10
+    # Translation is timed from the first chunk, not from the start of ASR.
+    (transcribe, transcribe_s, _), (translate, translate_s, status) = traces
+    assert (transcribe, translate, status) == ("transcribe", "translate", "failed")
+    assert transcribe_s >= 0.2 > translate_s
+    failure = mock_tm.update_task.call_args_list[-1].kwargs
+    assert failure["status"] == "failed"
+    assert failure["message"] == "Failed at translate"
+
+
+
+def test_checkpoint_fingerprints_are_sampled_and_catch_same_size_edits(tmp_path):
+    from backend.core import pipeline_checkpoints
+    from backend.utils.artifact_cache import file_fingerprint
+
+    media = tmp_path / "source.mp4"
+    media.write_bytes(b"\0" * 4096)
+    fingerprints = pipeline_checkpoints.fingerprint_files([str(media)])
+
+    assert fingerprints[0]["fingerprint"] == file_fingerprint(str(media))
+    assert "sha256" not in fingerprints[0]
+    assert pipeline_checkpoints.first_changed_file(fingerprints) is None
+
+    with media.open("r+b") as handle:
+        handle.write(b"edited")
+    os.utime(media, ns=(media.stat().st_atime_ns, fingerprints[0]["mtime_ns"]))
+    assert pipeline_checkpoints.first_changed_file(fingerprints) == str(media)
@@ -1,13 +1,22 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
+import numpy as np
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 from backend.services.asr import ASRService
+from backend.services.asr.model_manager import AcquiredModel
 from backend.utils.subtitle_manager import SubtitleManager
 from backend.utils.audio_processor import AudioProcessor
 from backend.utils.segment_refiner import SegmentRefiner
 from backend.models.schemas import FileRef, TaskResult
 from backend.models.schemas import SubtitleSegment
 from backend.core.task_control import TaskPauseRequested
+from backend.utils.pcm_audio import PCM_SAMPLE_RATE, PcmAudio
 
 @pytest.fixture
 def asr_service():
@@ -201,3 +210,446 @@ def test_transcribe_does_not_fallback_to_internal_engine_on_pause(asr_service, m
         )
 
     assert load_calls["count"] == 0
+
+
+def test_smart_split_keeps_replicas_busy_and_reports_chunk_stats(asr_service, monkeypatch, tmp_path):
+    chunks = [(f"chunk_{index}.wav", index * 600.0) for index in range(5)]
+    monkeypatch.setattr(
+        "backend.services.asr.core_strategies.PcmAudio.decode",
+        lambda path: (_ for _ in ()).throw(RuntimeError("no ffmpeg")),
+    )
+    monkeypatch.setattr(AudioProcessor, "detect_silence", lambda path: [])
+    monkeypatch.setattr(AudioProcessor, "calculate_split_points", lambda duration, silences, target_chunk_s=600: [600.0 * i for i in range(1, 5)])
+    monkeypatch.setattr(AudioProcessor, "split_audio_physically", lambda path, points, out_dir: chunks)
+    monkeypatch.setattr("backend.services.asr.core_strategies.settings.WORKSPACE_DIR", tmp_path)
+
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+
+    def fake_process_chunk(chunk_info, model, language, initial_prompt):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.02)
+        with lock:
+            active["now"] -= 1
+        path, offset = chunk_info
+        return [SubtitleSegment(id="1", start=offset, end=offset + 1.0, text=path)]
+
+    monkeypatch.setattr(asr_service.core_strategies, "_process_chunk", fake_process_chunk)
+    asr_service.core_strategies.executor = ThreadPoolExecutor(max_workers=4)
+    stats = []
+
+    segments = asr_service.core_strategies.transcribe_smart_split(
+        "long.wav", 2700.0, MagicMock(), None, None, None,
+        max_parallel=2,
+        chunk_stats=stats,
+    )
+
+    assert len(segments) == 5
+    assert active["peak"] == 2
+    assert sorted(entry["offset"] for entry in stats) == [0.0, 600.0, 1200.0, 1800.0, 2400.0]
+    assert next(entry for entry in stats if entry["offset"] == 2400.0)["duration"] == 300.0
+    assert all(entry["elapsed_s"] > 0 for entry in stats)
+
+
+def test_smart_split_releases_chunks_in_timeline_order(asr_service, monkeypatch, tmp_path):
+    chunks = [(f"chunk_{index}.wav", index * 600.0) for index in range(4)]
+    monkeypatch.setattr(
+        "backend.services.asr.core_strategies.PcmAudio.decode",
+        lambda path: (_ for _ in ()).throw(RuntimeError("no ffmpeg")),
+    )
+    monkeypatch.setattr(AudioProcessor, "detect_silence", lambda path: [])
+    monkeypatch.setattr(AudioProcessor, "calculate_split_points", lambda duration, silences, target_chunk_s=600: [600.0 * i for i in range(1, 4)])
+    monkeypatch.setattr(AudioProcessor, "split_audio_physically", lambda path, points, out_dir: chunks)
+    monkeypatch.setattr("backend.services.asr.core_strategies.settings.WORKSPACE_DIR", tmp_path)
+
+    def fake_process_chunk(chunk_info, model, language, initial_prompt):
+        path, offset = chunk_info
+        # Earlier chunks finish last.
+        time.sleep(0.04 - offset / 60000)
+        return [SubtitleSegment(id="1", start=offset, end=offset + 1.0, text=path)]
+
+    monkeypatch.setattr(asr_service.core_strategies, "_process_chunk", fake_process_chunk)
+    asr_service.core_strategies.executor = ThreadPoolExecutor(max_workers=4)
+    released = []
+
+    asr_service.core_strategies.transcribe_smart_split(
+        "long.wav", 2400.0, MagicMock(), None, None, None,
+        max_parallel=4,
+        on_chunk_ready=lambda offset, segments: released.append((offset, [s.text for s in segments])),
+    )
+
+    assert released == [(index * 600.0, [f"chunk_{index}.wav"]) for index in range(4)]
+
+
+def _tone_with_gaps(layout):
+    """16 kHz int16 PCM from (seconds, is_silent) pieces."""
+    pieces = []
+    for seconds, is_silent in layout:
+        count = int(seconds * PCM_SAMPLE_RATE)
+        if is_silent:
+            pieces.append(np.zeros(count, dtype=np.int16))
+        else:
+            t = np.arange(count) / PCM_SAMPLE_RATE
+            pieces.append((np.sin(2 * np.pi * 440 * t) * 8000).astype(np.int16))
+    return np.concatenate(pieces)
+
+
+def test_detect_silence_in_pcm_finds_gaps_and_skips_trailing_silence():
+    pcm = PcmAudio(_tone_with_gaps([(2, False), (1, True), (2, False), (0.2, True), (1, False), (1, True)]))
+
+    intervals = AudioProcessor.detect_silence_in_pcm(pcm, silence_thresh_db=-30.0, min_silence_dur=0.5)
+
+    assert len(intervals) == 1
+    start, end = intervals[0]
+    assert abs(start - 2.0) < 0.02
+    assert abs(end - 3.0) < 0.02
+
+
+def test_smart_split_feeds_pcm_slices_to_model_without_chunk_files(asr_service, monkeypatch, tmp_path):
+    pcm = PcmAudio(_tone_with_gaps([(4, False), (1, True), (4, False)]))
+    monkeypatch.setattr("backend.services.asr.core_strategies.PcmAudio.decode", lambda path: pcm)
+    monkeypatch.setattr(
+        AudioProcessor,
+        "split_audio_physically",
+        lambda *args, **kwargs: pytest.fail("chunk files should not be written"),
+    )
+    monkeypatch.setattr(
+        AudioProcessor,
+        "calculate_split_points",
+        lambda duration, silences, target_chunk_s=600: [(silences[0][0] + silences[0][1]) / 2],
+    )
+
+    model = MagicMock()
+    received = []
+
+    def fake_transcribe(audio, **kwargs):
+        received.append(audio)
+        return iter([]), None
+
+    model.transcribe.side_effect = fake_transcribe
+
+    segments = asr_service.core_strategies.transcribe_smart_split(
+        "long.mp4", 9.0, model, None, None, None, max_parallel=2,
+    )
+
+    assert segments == []
+    assert len(received) == 2
+    assert all(isinstance(audio, np.ndarray) and audio.dtype == np.float32 for audio in received)
+    assert sorted(len(audio) for audio in received) == [int(4.5 * PCM_SAMPLE_RATE)] * 2
+
+
+def test_batched_engine_decodes_spans_and_shifts_segments_to_absolute_time(asr_service, monkeypatch):
+    import faster_whisper
+    from types import SimpleNamespace
+
+    pcm = PcmAudio(_tone_with_gaps([(70, False), (2, True), (58, False)]))
+    monkeypatch.setattr("backend.services.asr.core_strategies.PcmAudio.decode", lambda path: pcm)
+    monkeypatch.setattr("backend.services.asr.core_strategies.settings.ASR_BATCHED_SPAN_S", 60)
+    calls = []
+
+    class FakePipeline:
+        def __init__(self, model):
+            self.model = model
+
+        def transcribe(self, audio, **kwargs):
+            calls.append((len(audio), kwargs["batch_size"], kwargs["vad_filter"]))
+            return iter([SimpleNamespace(start=1.0, end=2.5, text="hello", words=None)]), None
+
+    monkeypatch.setattr(faster_whisper, "BatchedInferencePipeline", FakePipeline)
+    released = []
+    stats = []
+
+    segments = asr_service.core_strategies.transcribe_batched(
+        "long.mp4", 130.0, MagicMock(), "en", None, None,
+        batch_size=4,
+        chunk_stats=stats,
+        on_chunk_ready=lambda offset, chunk: released.append((offset, [(s.start, s.end) for s in chunk])),
+    )
+
+    assert [(batch, vad) for _length, batch, vad in calls] == [(4, True), (4, True)]
+    assert sum(length for length, _batch, _vad in calls) == 130 * PCM_SAMPLE_RATE
+    split = released[1][0]
+    assert abs(split - 71.0) < 1.0
+    assert released == [(0.0, [(1.0, 2.5)]), (split, [(split + 1.0, split + 2.5)])]
+    assert [(s.start, s.end) for s in segments] == [(1.0, 2.5), (split + 1.0, split + 2.5)]
+    assert [entry["offset"] for entry in stats] == [0.0, round(split, 3)]
+
+
+def test_pcm_audio_close_releases_memory_map_and_backing_file(tmp_path):
+    backing = tmp_path / "decoded.s16le"
+    _tone_with_gaps([(1, False)]).tofile(backing)
+    pcm = PcmAudio(np.memmap(backing, dtype=np.int16, mode="r"), backing_path=backing)
+
+    assert abs(pcm.duration - 1.0) < 1e-6
+    assert pcm.slice(0.25, 0.5).shape == (PCM_SAMPLE_RATE // 4,)
+
+    pcm.close()
+    assert not backing.exists()
+    assert len(pcm) == 0
+
+
+def test_detect_silence_in_pcm_hysteresis_keeps_noisy_pause_whole():
+    # A pause whose noise floor flickers just above -30 dBFS every 100 ms.
+    rng = np.random.default_rng(0)
+    pause = np.zeros(2 * PCM_SAMPLE_RATE, dtype=np.int16)
+    flicker_level = int(32768 * 10 ** (-29 / 20) * np.sqrt(2))
+    for start in range(0, len(pause), PCM_SAMPLE_RATE // 10):
+        t = np.arange(160) / PCM_SAMPLE_RATE
+        pause[start:start + 160] = (np.sin(2 * np.pi * 440 * t) * flicker_level).astype(np.int16)
+    pause += rng.integers(-3, 4, len(pause)).astype(np.int16)
+    samples = np.concatenate([_tone_with_gaps([(1, False)]), pause, _tone_with_gaps([(1, False)])])
+
+    chopped = AudioProcessor.detect_silence_in_pcm(PcmAudio(samples), -30.0, 0.5, hysteresis_db=0.0)
+    whole = AudioProcessor.detect_silence_in_pcm(PcmAudio(samples), -30.0, 0.5, hysteresis_db=3.0)
+
+    assert len(chopped) == 0
+    assert len(whole) == 1
+    assert abs(whole[0][0] - 1.0) < 0.02
+    assert abs(whole[0][1] - 3.0) < 0.02
+
+
+def test_parse_silence_threshold_accepts_db_and_amplitude_ratio():
+    assert AudioProcessor.parse_silence_threshold("-30dB") == -30.0
+    assert AudioProcessor.parse_silence_threshold(" -42.5 DB ") == -42.5
+    assert abs(AudioProcessor.parse_silence_threshold("0.001") - -60.0) < 1e-9
+    with pytest.raises(ValueError):
+        AudioProcessor.parse_silence_threshold("0")
+
+
+def test_detect_silence_reuses_cached_decode(monkeypatch, tmp_path):
+    from backend.utils import pcm_audio
+
+    audio_path = tmp_path / "clip.wav"
+    audio_path.write_bytes(b"fake-audio")
+    decodes = []
+
+    def fake_decode(path, work_dir=None):
+        decodes.append(path)
+        return PcmAudio(_tone_with_gaps([(2, False), (1, True), (2, False)]))
+
+    monkeypatch.setattr(pcm_audio.PcmAudio, "decode", fake_decode)
+    monkeypatch.setattr("backend.utils.audio_processor.pcm_cache", pcm_audio.PcmAudioCache(max_entries=1))
+    monkeypatch.setattr("backend.utils.audio_processor.settings.SILENCE_DETECTOR", "native")
+
+    first = AudioProcessor.detect_silence(str(audio_path), "-30dB", 0.5)
+    second = AudioProcessor.detect_silence(str(audio_path), "-35dB", 0.5)
+
+    assert len(first) == 1 and len(second) == 1
+    assert len(decodes) == 1
+
+
+def test_pcm_audio_cache_evicts_released_entries_only(monkeypatch, tmp_path):
+    from backend.utils import pcm_audio
+
+    closed = []
+
+    class TrackedPcm(PcmAudio):
+        def close(self):
+            closed.append(self)
+            super().close()
+
+    monkeypatch.setattr(pcm_audio.PcmAudio, "decode", lambda path, work_dir=None: TrackedPcm(np.zeros(16, dtype=np.int16)))
+    paths = []
+    for name in ["a.wav", "b.wav"]:
+        path = tmp_path / name
+        path.write_bytes(name.encode())
+        paths.append(str(path))
+
+    cache = pcm_audio.PcmAudioCache(max_entries=1)
+    with cache.open(paths[0]) as held:
+        with cache.open(paths[1]):
+            pass
+        # paths[1] was over capacity but paths[0] is still in use.
+        assert len(closed) == 1 and held not in closed
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0 and held in closed
+
+
+def test_calculate_split_points_matches_linear_scan():
+    def linear_scan(total_duration, silence_intervals, target=600):
+        points, current = [], 0.0
+        while current + target < total_duration:
+            target_time = current + target
+            lo, hi = max(current + 60, target_time - 60), min(total_duration - 10, target_time + 60)
+            valid = [(s, e) for s, e in silence_intervals if lo <= s <= hi]
+            if valid:
+                s, e = min(valid, key=lambda x: abs(x[0] - target_time))
+                point = (s + e) / 2
+            else:
+                point = target_time
+            points.append(point)
+            current = point
+        return points
+
+    rng = np.random.default_rng(7)
+    for _ in range(50):
+        total = float(rng.uniform(700, 20000))
+        starts = np.sort(rng.uniform(0, total, rng.integers(0, 200)))
+        # Integer starts make exact ties with the target likely.
+        starts = np.round(starts / 10) * 10
+        silences = [(float(s), float(s + rng.uniform(0.5, 5))) for s in starts]
+
+        assert AudioProcessor.calculate_split_points(total, silences) == linear_scan(total, silences)
+
+
+def test_transcribe_segment_slices_cached_pcm_without_files(asr_service, monkeypatch, tmp_path):
+    from types import SimpleNamespace
+    from backend.utils import pcm_audio
+
+    audio_path = tmp_path / "episode.mp4"
+    audio_path.write_bytes(b"fake-media")
+    decodes = []
+
+    def fake_decode(path, work_dir=None):
+        decodes.append(path)
+        return PcmAudio(_tone_with_gaps([(10, False)]))
+
+    monkeypatch.setattr(pcm_audio.PcmAudio, "decode", fake_decode)
+    monkeypatch.setattr("backend.services.asr.service.pcm_cache", pcm_audio.PcmAudioCache(max_entries=1))
+    monkeypatch.setattr(AudioProcessor, "extract_segment", lambda *args: pytest.fail("no clip file expected"))
+    monkeypatch.setattr(
+        "backend.services.asr.service.SubtitleWriter.save_srt",
+        lambda *args: pytest.fail("no SRT expected"),
+    )
+    received = []
+    model = MagicMock()
+
+    def fake_transcribe(audio, **kwargs):
+        received.append(len(audio))
+        return iter([SimpleNamespace(start=0.5, end=2.0, text=" hello ", words=None)]), None
+
+    model.transcribe.side_effect = fake_transcribe
+    monkeypatch.setattr(asr_service.model_manager, "load_model", lambda *args, **kwargs: model)
+
+    first = asr_service.transcribe_segment(str(audio_path), 4.0, 7.0)
+    second = asr_service.transcribe_segment(str(audio_path), 1.0, 2.0)
+
+    assert first.success and second.success
+    assert received == [3 * PCM_SAMPLE_RATE, PCM_SAMPLE_RATE]
+    assert len(decodes) == 1
+    assert first.meta["segments"] == [{"id": "1", "start": 4.5, "end": 6.0, "text": "hello"}]
+    assert first.meta["text"] == "hello"
+    assert "srt_path" not in first.meta
+
+
+def test_speech_dense_windows_prefer_windows_with_least_silence():
+    from backend.services.asr.core_strategies import CoreStrategies
+
+    silences = [(0.0, 25.0), (40.0, 50.0), (95.0, 120.0)]
+
+    assert CoreStrategies._speech_dense_windows(150.0, silences, 2) == [60.0, 120.0]
+
+
+def _split_into_two_chunks(monkeypatch, pcm):
+    monkeypatch.setattr("backend.services.asr.core_strategies.PcmAudio.decode", lambda path: pcm)
+    monkeypatch.setattr(
+        AudioProcessor,
+        "calculate_split_points",
+        lambda duration, silences, target_chunk_s=600: [(silences[0][0] + silences[0][1]) / 2],
+    )
+
+
+def test_smart_split_detects_language_once_and_pins_it(asr_service, monkeypatch):
+    _split_into_two_chunks(monkeypatch, PcmAudio(_tone_with_gaps([(40, False), (1, True), (40, False)])))
+    model = MagicMock()
+    model.detect_language.return_value = ("ja", 0.8, [("ja", 0.8), ("zh", 0.15)])
+    languages = []
+
+    def fake_transcribe(audio, **kwargs):
+        languages.append(kwargs["language"])
+        return iter([]), None
+
+    model.transcribe.side_effect = fake_transcribe
+    language_info = {}
+
+    asr_service.core_strategies.transcribe_smart_split(
+        "long.mp4", 81.0, model, None, None, None, max_parallel=2, language_info=language_info,
+    )
+
+    assert model.detect_language.call_count == 2
+    assert languages == ["ja", "ja"]
+    assert language_info == {"language": "ja", "probability": 0.8, "windows": [0.0, 30.0], "pinned": True}
+
+
+def test_smart_split_per_chunk_language_is_opt_in(asr_service, monkeypatch):
+    _split_into_two_chunks(monkeypatch, PcmAudio(_tone_with_gaps([(40, False), (1, True), (40, False)])))
+    monkeypatch.setattr("backend.services.asr.core_strategies.settings.ASR_PER_CHUNK_LANGUAGE", True)
+    model = MagicMock()
+    model.transcribe.side_effect = lambda audio, **kwargs: (iter([]), None)
+
+    asr_service.core_strategies.transcribe_smart_split("long.mp4", 81.0, model, None, None, None, max_parallel=2)
+
+    model.detect_language.assert_not_called()
+    assert [call.kwargs["language"] for call in model.transcribe.call_args_list] == [None, None]
+
+
+def test_transcribe_plans_chunks_from_rtf_history_and_records_speed(asr_service, monkeypatch, tmp_path):
+    from backend.services.asr import service as service_module
+
+    audio_path = tmp_path / "talk.mp4"
+    audio_path.write_bytes(b"fake-media")
+    monkeypatch.setattr("backend.services.asr.service.AudioProcessor.get_audio_duration", lambda path: 1800.0)
+    monkeypatch.setattr("backend.services.asr.service.SubtitleWriter.save_srt", lambda segments, path: tmp_path / "talk.srt")
+    monkeypatch.setattr(
+        asr_service.model_manager,
+        "acquire",
+        lambda *args, **kwargs: nullcontext(AcquiredModel(MagicMock(), 4)),
+    )
+    service_module.rtf_history.record("base", "cpu", audio_s=100, compute_s=10)
+    planned = {}
+
+    def fake_smart_split(audio_path, duration, model, language, prompt, progress, **kwargs):
+        planned.update(max_parallel=kwargs["max_parallel"], target_chunk_s=kwargs["target_chunk_s"])
+        kwargs["chunk_stats"].append({"offset": 0.0, "duration": 1800.0, "elapsed_s": 360.0, "rtf": 0.2})
+        return []
+
+    monkeypatch.setattr(asr_service.core_strategies, "transcribe_smart_split", fake_smart_split)
+
+    result = asr_service.transcribe(str(audio_path), model_name="base", generate_peaks=False)
+
+    assert result.success
+    assert planned == {"max_parallel": 4, "target_chunk_s": 300.0}
+    assert result.meta["asr_plan"] == {"strategy": "smart_split", "chunk_s": 300.0, "rtf": 0.1, "replicas": 4}
+    assert abs(service_module.rtf_history.get("base", "cpu") - (0.7 * 0.1 + 0.3 * 0.2)) < 1e-6
+
+
+def test_pcm_audio_cache_removes_stale_files_but_keeps_recent_ones(tmp_path):
+    from backend.utils import pcm_audio
+
+    stale = tmp_path / "pcm_old_1234abcd.s16le"
+    recent = tmp_path / "pcm_new_5678abcd.s16le"
+    other = tmp_path / "notes.txt"
+    for path in (stale, recent, other):
+        path.write_bytes(b"\0\0")
+    old = time.time() - 2 * pcm_audio.STALE_PCM_MIN_AGE_S
+    os.utime(stale, (old, old))
+
+    cache = pcm_audio.PcmAudioCache(work_dir=tmp_path)
+
+    assert cache.remove_stale_files() == 1
+    assert not stale.exists()
+    assert recent.exists() and other.exists()
+
+
+def test_pcm_decode_defaults_to_the_swept_directory(monkeypatch, tmp_path):
+    from backend.utils import pcm_audio
+
+    media = tmp_path / "talk.wav"
+    media.write_bytes(b"fake-media")
+    outputs = []
+
+    def fake_run(cmd, **kwargs):
+        outputs.append(Path(cmd[-1]))
+        Path(cmd[-1]).write_bytes(b"\0\0" * 16)
+
+    monkeypatch.setattr(pcm_audio.settings, "TEMP_DIR", tmp_path / "temp")
+    monkeypatch.setattr(pcm_audio.subprocess, "run", fake_run)
+
+    pcm = pcm_audio.PcmAudio.decode(str(media))
+    try:
+        assert outputs[0].parent == pcm_audio.PcmAudioCache()._dir() == tmp_path / "temp" / "pcm"
+    finally:
+        pcm.close()
@@ -0,0 +1,46 @@
+import json
+
+from backend.services.asr.chunk_planner import RtfHistory, plan_transcription
+
+
+def test_single_replica_keeps_fixed_plan():
+    assert plan_transcription(800, 1, 0.25).strategy == "direct"
+    plan = plan_transcription(3600, 1, 0.25)
+    assert (plan.strategy, plan.chunk_s) == ("smart_split", 600)
+
+
+def test_many_replicas_get_more_smaller_chunks_than_few():
+    many = plan_transcription(3600, 16, 0.25)
+    few = plan_transcription(3600, 2, 0.25)
+
+    assert many.strategy == few.strategy == "smart_split"
+    # Two chunks per replica, but never below the per-chunk overhead floor.
+    assert many.chunk_s == 120
+    assert few.chunk_s == 900
+
+
+def test_short_or_fast_files_go_direct_unless_very_long():
+    assert plan_transcription(200, 8, 0.25).strategy == "direct"
+    # A fast model needs long chunks to amortise overhead, so a 10 min file is not split.
+    assert plan_transcription(600, 8, 0.01).strategy == "direct"
+    assert plan_transcription(1200, 8, 0.01).strategy == "smart_split"
+
+
+def test_adaptive_off_restores_fixed_thresholds():
+    plan = plan_transcription(1000, 16, 0.25, adaptive=False)
+    assert (plan.strategy, plan.chunk_s) == ("smart_split", 600)
+
+
+def test_rtf_history_smooths_and_persists(tmp_path):
+    path = tmp_path / "rtf.json"
+    history = RtfHistory(path)
+    assert history.get("base", "cpu") is None
+
+    history.record("base", "cpu", audio_s=100, compute_s=20)
+    history.record("base", "cpu", audio_s=100, compute_s=40)
+    history.record("base", "cpu", audio_s=0, compute_s=5)
+
+    assert abs(history.get("base", "cpu") - (0.7 * 0.2 + 0.3 * 0.4)) < 1e-6
+    assert json.loads(path.read_text("utf-8"))["base|cpu"]["samples"] == 2
+    assert RtfHistory(path).get("base", "cpu") == history.get("base", "cpu")
+    assert RtfHistory(path).get("base", "cuda") is None
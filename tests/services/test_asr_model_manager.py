@@ -8,6 +8,7 @@ from backend.config import settings
 from backend.services.asr.model_manager import (
     ModelManager,
     _ModelDownloadProgressReporter,
+    resolve_model_parallelism,
 )
 
 
@@ -190,3 +191,92 @@ def test_ensure_model_downloaded_reports_huggingface_fallback_progress(monkeypat
         assert emitted[-1] == (8.0, "Downloaded model large-v2.")
     finally:
         shutil.rmtree(temp_root, ignore_errors=True)
+
+
+def test_resolve_model_parallelism_splits_cores_between_replicas(monkeypatch):
+    monkeypatch.setattr("backend.services.asr.model_manager.os.cpu_count", lambda: 16)
+    monkeypatch.setattr(settings, "ASR_MODEL_REPLICAS", 0)
+    monkeypatch.setattr(settings, "ASR_CPU_THREADS_PER_REPLICA", 0)
+
+    assert resolve_model_parallelism("cpu") == (4, 4)
+    assert resolve_model_parallelism("cuda") == (1, 0)
+
+    monkeypatch.setattr(settings, "ASR_MODEL_REPLICAS", 2)
+    monkeypatch.setattr(settings, "ASR_CPU_THREADS_PER_REPLICA", 8)
+    assert resolve_model_parallelism("cpu") == (2, 8)
+
+
+def test_load_model_passes_replicas_to_whisper_model(monkeypatch):
+    created = []
+
+    class FakeWhisperModel:
+        def __init__(self, path, **kwargs):
+            created.append(kwargs)
+
+    fake_module = types.ModuleType("faster_whisper")
+    fake_module.WhisperModel = FakeWhisperModel
+    monkeypatch.setitem(sys.modules, "faster_whisper", fake_module)
+    monkeypatch.setattr(settings, "ASR_MODEL_REPLICAS", 3)
+    monkeypatch.setattr(settings, "ASR_CPU_THREADS_PER_REPLICA", 2)
+
+    manager = ModelManager()
+    monkeypatch.setattr(manager, "ensure_model_downloaded", lambda *args, **kwargs: "local-base")
+    manager.load_model("base", "cpu")
+    manager.load_model("base", "cpu")
+
+    assert len(created) == 1
+    assert created[0]["num_workers"] == 3
+    assert created[0]["cpu_threads"] == 2
+    with manager.acquire("base", "cpu") as acquired:
+        assert acquired.replicas == 3
+
+
+def _fake_whisper(monkeypatch, created):
+    class FakeWhisperModel:
+        def __init__(self, path, **kwargs):
+            self.path = path
+            self.compute_type = kwargs["compute_type"]
+            created.append((path, kwargs["device"], kwargs["compute_type"]))
+
+    fake_module = types.ModuleType("faster_whisper")
+    fake_module.WhisperModel = FakeWhisperModel
+    monkeypatch.setitem(sys.modules, "faster_whisper", fake_module)
+
+
+def test_model_cache_keeps_models_by_device_and_compute_type(monkeypatch):
+    created = []
+    _fake_whisper(monkeypatch, created)
+    monkeypatch.setattr(settings, "ASR_MODEL_CACHE_MB", 10_000)
+    manager = ModelManager()
+    monkeypatch.setattr(manager, "ensure_model_downloaded", lambda name, *args, **kwargs: name)
+
+    base = manager.load_model("base", "cpu")
+    large = manager.load_model("large-v3", "cpu")
+    assert manager.load_model("base", "cpu") is base
+    assert manager.load_model("large-v3", "cpu") is large
+    float32_base = manager.load_model("base", "cpu", compute_type="float32")
+
+    assert float32_base is not base
+    assert created == [("base", "cpu", "int8"), ("large-v3", "cpu", "int8"), ("base", "cpu", "float32")]
+    stats = manager.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 3, 0)
+    assert stats["hit_rate"] == 0.4
+
+
+def test_model_cache_evicts_least_recently_used_but_not_models_in_use(monkeypatch):
+    created = []
+    _fake_whisper(monkeypatch, created)
+    # int8 large (~1.5 GB) plus int8 base fits; a second large does not.
+    monkeypatch.setattr(settings, "ASR_MODEL_CACHE_MB", 1700)
+    manager = ModelManager()
+    monkeypatch.setattr(manager, "ensure_model_downloaded", lambda name, *args, **kwargs: name)
+
+    with manager.acquire("large-v3", "cpu"):
+        manager.load_model("base", "cpu")
+        manager.load_model("large-v2", "cpu")
+        loaded = [model["model"] for model in manager.stats()["models"]]
+        assert loaded == ["large-v3", "large-v2"]
+
+    loaded = [model["model"] for model in manager.stats()["models"]]
+    assert loaded == ["large-v2"]
+    assert manager.stats()["evictions"] == 2
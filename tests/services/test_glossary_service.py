@@ -0,0 +1,170 @@
+import json
+import threading
+
+import pytest
+
+from backend.services.translator import glossary_service as glossary_module
+from backend.services.translator.glossary_index import GlossaryIndex
+from backend.services.translator.glossary_service import GlossaryService
+
+
+@pytest.fixture
+def glossary_paths(monkeypatch, tmp_path):
+    monkeypatch.setattr(glossary_module, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(glossary_module, "GLOSSARY_FILE", str(tmp_path / "glossary.json"))
+    monkeypatch.setattr(glossary_module, "GLOSSARY_JOURNAL", str(tmp_path / "glossary.jsonl"))
+    return tmp_path
+
+
+def test_index_finds_overlapping_and_cjk_sources():
+    index = GlossaryIndex()
+    index.add("he", "he")
+    index.add("she", "SHE")
+    index.add("hers", "hers")
+    index.add("cjk", "机器学习")
+
+    found = index.search("Ushers study 深度机器学习")
+
+    assert found == {"she": [1], "he": [2], "hers": [2], "cjk": [15]}
+
+
+def test_index_remove_prunes_without_breaking_shared_prefixes():
+    index = GlossaryIndex()
+    index.add("a", "abc")
+    index.add("b", "abcd")
+    index.search("x")
+    index.remove("b")
+
+    assert index.search("abcd") == {"a": [0]}
+    index.add("a", "xyz")
+    assert index.search("abc xyz") == {"a": [4]}
+
+
+def test_index_searches_stay_correct_during_concurrent_edits():
+    index = GlossaryIndex()
+    index.add("stable", "neural network")
+    errors = []
+    done = threading.Event()
+
+    def edit():
+        for step in range(2000):
+            index.add(f"t{step % 50}", f"neural net{step}")
+            index.remove(f"t{(step + 25) % 50}")
+        done.set()
+
+    def search():
+        while not done.is_set():
+            try:
+                assert index.search("a neural network layer")["stable"] == [2]
+            except Exception as exc:
+                errors.append(exc)
+                return
+
+    threads = [threading.Thread(target=edit)] + [threading.Thread(target=search) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+
+    assert not errors
+    assert done.is_set()
+
+
+def test_relevant_terms_survive_concurrent_add_and_delete(glossary_paths):
+    service = GlossaryService()
+    errors = []
+    done = threading.Event()
+
+    def edit():
+        for _ in range(1000):
+            term = service.add_term("transformer", "变换器")
+            service.delete_term(term.id)
+        done.set()
+
+    def read():
+        while not done.is_set():
+            try:
+                service.get_relevant_terms("a transformer model")
+            except Exception as exc:
+                errors.append(exc)
+                return
+
+    threads = [threading.Thread(target=edit), threading.Thread(target=read)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+
+    assert not errors
+    assert service.get_relevant_terms("a transformer model") == []
+
+
+def test_relevant_terms_match_case_insensitively_and_follow_edits(glossary_paths):
+    service = GlossaryService()
+    term = service.add_term("Neural Network", "神经网络")
+    service.add_term("GPU", "显卡")
+
+    assert [t.target for t in service.get_relevant_terms("a neural network on a gpu")] == ["神经网络", "显卡"]
+
+    service.update_term(term.id, {"source": "Transformer"})
+    assert [t.target for t in service.get_relevant_terms("a neural network")] == []
+    assert [t.source for t in service.get_relevant_terms("the transformer")] == ["Transformer"]
+
+
+def test_relevant_terms_rank_longer_containing_terms_first_and_cap(glossary_paths):
+    service = GlossaryService()
+    service.add_term("York", "约克")
+    service.add_term("New York", "纽约")
+    service.add_term("Apple", "苹果")
+
+    ranked = service.get_relevant_terms("New York apple apple", max_terms=2)
+
+    assert [t.source for t in ranked] == ["Apple", "New York"]
+
+
+def test_relevant_terms_respect_prompt_token_budget(glossary_paths):
+    service = GlossaryService()
+    for index in range(20):
+        service.add_term(f"term{index:02d}", "x" * 40)
+
+    kept = service.get_relevant_terms(" ".join(f"term{index:02d}" for index in range(20)), max_tokens=100)
+
+    assert 0 < len(kept) < 20
+    assert sum(service._prompt_tokens(term) for term in kept) <= 100
+
+
+def test_edits_append_to_journal_and_survive_reload(glossary_paths):
+    service = GlossaryService()
+    kept = service.add_term("alpha", "A")
+    dropped = service.add_term("beta", "B")
+    service.update_term(kept.id, {"target": "AA"})
+    service.delete_term(dropped.id)
+
+    lines = (glossary_paths / "glossary.jsonl").read_text("utf-8").splitlines()
+    assert [json.loads(line)["op"] for line in lines] == ["put", "put", "put", "delete"]
+
+    reloaded = GlossaryService()
+    assert [(t.source, t.target) for t in reloaded.list_terms()] == [("alpha", "AA")]
+    assert reloaded.version == service.version
+
+
+def test_legacy_glossary_file_is_migrated(glossary_paths):
+    legacy = [{"id": "1", "source": "cat", "target": "猫", "note": None, "category": "general"}]
+    (glossary_paths / "glossary.json").write_text(json.dumps(legacy), "utf-8")
+
+    service = GlossaryService()
+
+    assert [t.target for t in service.get_relevant_terms("a cat")] == ["猫"]
+    assert (glossary_paths / "glossary.jsonl").exists()
+
+
+def test_journal_is_compacted(monkeypatch, glossary_paths):
+    monkeypatch.setattr(glossary_module, "JOURNAL_COMPACT_MIN_LINES", 10)
+    service = GlossaryService()
+    term = service.add_term("alpha", "A")
+    for index in range(12):
+        service.update_term(term.id, {"target": f"A{index}"})
+
+    lines = (glossary_paths / "glossary.jsonl").read_text("utf-8").splitlines()
+    assert len(lines) < 10
+    assert [t.target for t in GlossaryService().list_terms()] == ["A11"]
@@ -1,13 +1,21 @@
+import json
 import pytest
+import queue
 import threading
 import time
 from types import SimpleNamespace
 from backend.core.task_control import TaskCancelRequested
 from backend.services.translator.llm_translator import LLMTranslator
-from backend.services.translator.translation_batch_runner import build_translation_batches
+from backend.services.translator.translation_client import TranslationClientFactory
+from backend.services.translator.translation_batch_runner import (
+    StreamingBatchPlanner,
+    build_translation_batches,
+    run_translation_batches,
+)
 from backend.services.translator.translation_models import (
     IntelligentTranslationResponse,
     TranslationOutcome,
+    TranslationBatch,
     TranslationResponse,
     TranslatorSegment,
 )
@@ -25,6 +33,12 @@ class FakeGlossaryService:
         return []
 
 
+@pytest.fixture(autouse=True)
+def isolated_concurrency_limiters(monkeypatch):
+    # Limiters are per-provider process state; start every test from a fresh window.
+    monkeypatch.setattr("backend.services.translator.translation_rate_limiter._limiters", {})
+
+
 def make_translator() -> LLMTranslator:
     return LLMTranslator(
         settings_manager=FakeSettingsManager(),
@@ -67,6 +81,26 @@ def test_translate_segments_fails_immediately_when_batch_translation_cannot_fall
         llm_translator.translate_segments(segments, "Chinese", batch_size=10)
 
 
+def test_client_factory_shares_pooled_client_until_provider_changes(monkeypatch):
+    provider = SimpleNamespace(id="p1", base_url="http://127.0.0.1:9/v1", api_key="key-1", model="m1")
+    settings_manager = SimpleNamespace(get_active_llm_provider=lambda: provider)
+    monkeypatch.setattr("backend.services.translator.translation_client.settings.LLM_TRANSLATION_MAX_CONCURRENCY", 4)
+    TranslationClientFactory.reset()
+
+    try:
+        first, model = TranslationClientFactory(settings_manager).get_client()
+        again, _ = TranslationClientFactory(settings_manager).get_client()
+        assert first is again
+        assert model == "m1"
+        assert first._client._transport._pool._max_keepalive_connections == 4
+
+        provider.api_key = "key-2"
+        switched, _ = TranslationClientFactory(settings_manager).get_client()
+        assert switched is not first
+    finally:
+        TranslationClientFactory.reset()
+
+
 def test_build_translation_batches_uses_source_overlap():
     segments = [
         SubtitleSegment(id=str(i + 1), start=float(i), end=float(i + 1), text=f"line {i + 1}")
@@ -81,6 +115,68 @@ def test_build_translation_batches_uses_source_overlap():
     assert [segment.id for segment in batches[2].context_before] == ["18", "19", "20"]
 
 
+@pytest.mark.parametrize("mode", ["standard", "intelligent"])
+def test_streaming_batch_planner_matches_full_planning(mode):
+    segments = [
+        SubtitleSegment(id=str(i + 1), start=float(i), end=float(i + 1), text=f"line {i + 1}")
+        for i in range(27)
+    ]
+    planner = StreamingBatchPlanner(batch_size=10, mode=mode)
+
+    streamed = []
+    for start, stop in [(0, 4), (4, 13), (13, 13), (13, 25), (25, 27)]:
+        streamed.extend(planner.add(segments[start:stop]))
+    streamed.extend(planner.close())
+
+    expected = build_translation_batches(segments, batch_size=10, mode=mode)
+    assert [batch.index for batch in streamed] == [batch.index for batch in expected]
+    assert [[s.id for s in batch.segments] for batch in streamed] == [
+        [s.id for s in batch.segments] for batch in expected
+    ]
+    assert [
+        [s.id for s in batch.context_before] if batch.context_before else None for batch in streamed
+    ] == [
+        [s.id for s in batch.context_before] if batch.context_before else None for batch in expected
+    ]
+
+
+def test_translate_segment_stream_starts_before_producer_finishes(monkeypatch):
+    llm_translator = make_translator()
+    segment_queue = queue.Queue()
+    first_batch_started = threading.Event()
+
+    def fake_translate_planned_batch(batch, target_language, mode, cancel_check=None):
+        first_batch_started.set()
+        return [segment.model_copy(update={"text": f"translated-{segment.id}"}) for segment in batch.segments]
+
+    monkeypatch.setattr(llm_translator, "_translate_planned_batch", fake_translate_planned_batch)
+
+    def produce():
+        segment_queue.put([
+            SubtitleSegment(id=str(i + 1), start=float(i), end=float(i + 1), text=f"line {i + 1}")
+            for i in range(4)
+        ])
+        # The first two batches must be in flight before the rest arrives.
+        assert first_batch_started.wait(timeout=5)
+        segment_queue.put([SubtitleSegment(id="5", start=4.0, end=5.0, text="line 5")])
+        segment_queue.put(None)
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    progress = []
+    result = llm_translator.translate_segment_stream(
+        segment_queue,
+        "Chinese",
+        batch_size=2,
+        max_concurrency=2,
+        progress_callback=lambda done, seen: progress.append((done, seen)),
+    )
+    producer.join()
+
+    assert [segment.text for segment in result] == [f"translated-{i}" for i in range(1, 6)]
+    assert progress[-1] == (5, 5)
+
+
 def test_translate_segments_parallel_batches_preserve_output_order(monkeypatch):
     llm_translator = make_translator()
     segments = [
@@ -235,7 +331,7 @@ def test_validate_response_rejects_duplicate_ids():
     assert "duplicate IDs" in error_msg
 
 
-def test_translate_with_correction_falls_back_when_ids_do_not_match(monkeypatch):
+def test_translate_with_correction_keeps_valid_rows_and_falls_back_for_the_rest(monkeypatch):
     llm_translator = make_translator()
     segments = [
         SubtitleSegment(id="14", start=40.0, end=44.0, text="Line 14"),
@@ -261,19 +357,16 @@ def test_translate_with_correction_falls_back_when_ids_do_not_match(monkeypatch)
         def __init__(self):
             self.chat = type("Chat", (), {"completions": FakeCompletions()})()
 
-    fallback_result = [
-        SubtitleSegment(id="14", start=40.0, end=44.0, text="正确14"),
-        SubtitleSegment(id="15", start=44.0, end=45.0, text="正确15"),
-    ]
+    fallback_calls = []
 
-    monkeypatch.setattr(
-        llm_translator,
-        "_translate_single_fallback",
-        lambda *args, **kwargs: TranslationOutcome(
-            segments=fallback_result,
+    def fake_single_fallback(client, model_name, segments, *args, **kwargs):
+        fallback_calls.append([segment.id for segment in segments])
+        return TranslationOutcome(
+            segments=[segment.model_copy(update={"text": f"正确{segment.id}"}) for segment in segments],
             cacheable=True,
-        ),
-    )
+        )
+
+    monkeypatch.setattr(llm_translator, "_translate_single_fallback", fake_single_fallback)
 
     result = llm_translator._translate_with_correction(
         client=FakeClient(),
@@ -285,7 +378,9 @@ def test_translate_with_correction_falls_back_when_ids_do_not_match(monkeypatch)
         mode_label="Standard",
     )
 
-    assert result.segments == fallback_result
+    # Row 15 came back intact and is kept; only row 14 is re-requested.
+    assert fallback_calls == [["14"]]
+    assert [segment.text for segment in result.segments] == ["正确14", "最后一点"]
     assert result.cacheable is True
 
 
@@ -507,10 +602,10 @@ def test_translate_batch_struct_skips_cache_when_fallback_keeps_source(monkeypat
     )
 
     cache_put_calls = []
-    monkeypatch.setattr(llm_translator._cache, "get", lambda *args, **kwargs: None)
+    monkeypatch.setattr(llm_translator._memory, "get_many", lambda keys: {})
     monkeypatch.setattr(
-        llm_translator._cache,
-        "put",
+        llm_translator._memory,
+        "put_many",
         lambda *args, **kwargs: cache_put_calls.append((args, kwargs)),
     )
     monkeypatch.setattr(
@@ -543,13 +638,13 @@ def test_translate_batch_struct_normalizes_cached_chinese_text(monkeypatch):
 
     cache_put_calls = []
     monkeypatch.setattr(
-        llm_translator._cache,
-        "get",
-        lambda *args, **kwargs: {"19": "缓存——结果"},
+        llm_translator._memory,
+        "get_many",
+        lambda keys: {key: "缓存——结果" for key in keys},
     )
     monkeypatch.setattr(
-        llm_translator._cache,
-        "put",
+        llm_translator._memory,
+        "put_many",
         lambda *args, **kwargs: cache_put_calls.append((args, kwargs)),
     )
 
@@ -561,7 +656,7 @@ def test_translate_batch_struct_normalizes_cached_chinese_text(monkeypatch):
 
     assert result[0].text == "缓存，结果"
     assert len(cache_put_calls) == 1
-    assert cache_put_calls[0][0][-1] == {"19": "缓存，结果"}
+    assert [text for _key, text in cache_put_calls[0][0][0]] == ["缓存，结果"]
 
 
 def test_intelligent_mode_recovers_broken_tool_call_json(monkeypatch):
@@ -614,3 +709,290 @@ def test_intelligent_mode_recovers_broken_tool_call_json(monkeypatch):
 
     assert len(result) == 1
     assert result[0].text == '他说"不"。'
+
+
+def _rate_limit_error(headers):
+    import httpx
+    import openai
+
+    request = httpx.Request("POST", "http://llm.local/v1/chat/completions")
+    return openai.RateLimitError(
+        "rate limited",
+        response=httpx.Response(429, headers=headers, request=request),
+        body=None,
+    )
+
+
+def test_rate_limiter_aimd_grows_on_success_and_halves_on_429():
+    from backend.services.translator.translation_rate_limiter import (
+        AdaptiveConcurrencyLimiter,
+        retry_after_seconds,
+    )
+
+    limiter = AdaptiveConcurrencyLimiter("aimd-test", initial=4, maximum=32)
+    for _ in range(20):
+        limiter.on_success(1.0, 100)
+    grown = limiter.limit
+    assert grown > 4
+
+    error = _rate_limit_error({"retry-after": "2"})
+    limiter.on_transient_error(error, retry_after_seconds(error))
+
+    assert limiter.limit == max(1, int(grown / 2))
+    assert 1.5 < limiter.pause_remaining() <= 2.0
+    assert limiter.stats()["rate_limited"] == 1
+    assert retry_after_seconds(_rate_limit_error({"retry-after-ms": "250"})) == 0.25
+
+
+def test_concurrent_jobs_share_the_provider_concurrency_window():
+    from backend.services.translator.translation_rate_limiter import AdaptiveConcurrencyLimiter
+
+    limiter = AdaptiveConcurrencyLimiter("shared-test", initial=2, maximum=2)
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+
+    def slow_translate(batch, target_language, mode, cancel_check=None):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.02)
+        with lock:
+            active["now"] -= 1
+        return batch.segments
+
+    def job(prefix):
+        batches = [
+            TranslationBatch(
+                index=index + 1,
+                segments=[SubtitleSegment(id=f"{prefix}{index}", start=0.0, end=1.0, text="line")],
+                context_before=None,
+            )
+            for index in range(6)
+        ]
+        run_translation_batches(
+            batches=batches,
+            target_language="Chinese",
+            mode="standard",
+            max_concurrency=4,
+            translate_batch=slow_translate,
+            limiter=limiter,
+        )
+
+    threads = [threading.Thread(target=job, args=(prefix,)) for prefix in "ab"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert active["peak"] == 2
+    assert limiter.in_flight == 0
+
+
+def test_failed_job_releases_its_provider_slots():
+    from backend.services.translator.translation_rate_limiter import AdaptiveConcurrencyLimiter
+
+    limiter = AdaptiveConcurrencyLimiter("release-test", initial=4, maximum=4)
+
+    def batches():
+        return [
+            TranslationBatch(
+                index=index + 1,
+                segments=[SubtitleSegment(id=str(index), start=0.0, end=1.0, text="line")],
+                context_before=None,
+            )
+            for index in range(4)
+        ]
+
+    def failing_translate(batch, target_language, mode, cancel_check=None):
+        if batch.index == 1:
+            raise ValueError("bad batch")
+        time.sleep(0.2)
+        return batch.segments
+
+    for _ in range(3):
+        with pytest.raises(RuntimeError, match="bad batch"):
+            run_translation_batches(
+                batches=batches(),
+                target_language="Chinese",
+                mode="standard",
+                max_concurrency=4,
+                translate_batch=failing_translate,
+                limiter=limiter,
+            )
+        assert limiter.in_flight == 0
+
+    result = run_translation_batches(
+        batches=batches(),
+        target_language="Chinese",
+        mode="standard",
+        max_concurrency=4,
+        translate_batch=lambda batch, target_language, mode, cancel_check=None: batch.segments,
+        limiter=limiter,
+    )
+    assert len(result) == 4
+
+
+def test_translate_segments_retries_rate_limited_batches(monkeypatch):
+    monkeypatch.setattr("backend.services.translator.translation_batch_runner.settings.LLM_TRANSLATION_MAX_RETRIES", 3)
+    llm_translator = make_translator()
+    segments = [
+        SubtitleSegment(id=str(i + 1), start=float(i), end=float(i + 1), text=f"line {i + 1}")
+        for i in range(6)
+    ]
+    attempts = {}
+
+    def fake_translate_planned_batch(batch, target_language, mode, cancel_check=None):
+        attempts[batch.index] = attempts.get(batch.index, 0) + 1
+        if batch.index == 2 and attempts[batch.index] == 1:
+            raise _rate_limit_error({"retry-after-ms": "10"})
+        return [segment.model_copy(update={"text": f"translated-{segment.id}"}) for segment in batch.segments]
+
+    monkeypatch.setattr(llm_translator, "_translate_planned_batch", fake_translate_planned_batch)
+
+    result = llm_translator.translate_segments(segments, "Chinese", batch_size=2, max_concurrency=3)
+
+    assert [segment.text for segment in result] == [f"translated-{i}" for i in range(1, 7)]
+    assert attempts == {1: 1, 2: 2, 3: 1}
+
+
+def test_translate_segments_records_requests_and_segments_per_job(monkeypatch):
+    from backend.services.translator import translation_usage
+
+    monkeypatch.setattr(translation_usage, "_recent_jobs", translation_usage.deque(maxlen=5))
+    llm_translator = make_translator()
+    segments = [
+        SubtitleSegment(id=str(i + 1), start=float(i), end=float(i + 1), text=f"line {i + 1}")
+        for i in range(5)
+    ]
+
+    def fake_translate_planned_batch(batch, target_language, mode, cancel_check=None):
+        usage = translation_usage.active_usage()
+        usage.add_request(100, 10)
+        return batch.segments
+
+    monkeypatch.setattr(llm_translator, "_translate_planned_batch", fake_translate_planned_batch)
+
+    llm_translator.translate_segments(segments, "Chinese", batch_size=2)
+
+    [job] = translation_usage.recent_job_usage()
+    assert (job["segments"], job["batches"], job["requests"]) == (5, 3, 3)
+    assert job["requests_per_segment"] == 0.6
+    assert job["tokens_per_segment"] == 66.0
+
+
+def _rows_response(rows):
+    return TranslationResponse(
+        segments=[TranslatorSegment(id=row_id, source_text=source, text=text) for row_id, source, text in rows]
+    )
+
+
+def test_recovery_bisects_failing_rows_sequentially_instead_of_line_by_line(monkeypatch):
+    llm_translator = make_translator()
+    segments = [
+        SubtitleSegment(id=str(i), start=float(i), end=float(i + 1), text=f"Line {i}")
+        for i in range(1, 9)
+    ]
+    requests = []
+    lock = threading.Lock()
+
+    class FakeCompletions:
+        def create(self, **kwargs):
+            rows = json.loads(kwargs["messages"][1]["content"])
+            with lock:
+                requests.append([row["id"] for row in rows])
+            # Any request holding line 3 shifts every row; smaller ones succeed.
+            if any(row["id"] == "3" for row in rows) and len(rows) > 1:
+                return _rows_response([(row["id"], "wrong", "错") for row in rows])
+            return _rows_response([(row["id"], row["source_text"], f"T{row['id']}") for row in rows])
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions()))
+
+    def build_request(rows):
+        return "system", json.dumps([{"id": row.id, "source_text": row.text} for row in rows])
+
+    single_lines = []
+
+    def fake_single_fallback(client, model_name, rows, *args, **kwargs):
+        single_lines.extend(row.id for row in rows)
+        return TranslationOutcome(
+            segments=[row.model_copy(update={"text": f"S{row.id}"}) for row in rows],
+            cacheable=True,
+        )
+
+    monkeypatch.setattr(llm_translator, "_translate_single_fallback", fake_single_fallback)
+    system_prompt, user_content = build_request(segments)
+
+    result = llm_translator._translate_with_correction(
+        client=client,
+        model_name="test-model",
+        system_prompt=system_prompt,
+        segments=segments,
+        input_json_str=user_content,
+        target_language="Chinese",
+        build_request=build_request,
+    )
+
+    assert [segment.text for segment in result.segments] == [
+        "T1", "T2", "S3", "S4", "T5", "T6", "T7", "T8",
+    ]
+    # 1-8 fails, halves 1-4 (fails) and 5-8, then 1-2 and 3-4 (fails), then
+    # lines 3 and 4 alone: 5 batch and 2 single-line requests instead of 8.
+    assert sorted(single_lines) == ["3", "4"]
+    assert requests == [
+        [str(i) for i in range(1, 9)],
+        ["1", "2", "3", "4"],
+        ["1", "2"],
+        ["3", "4"],
+        ["5", "6", "7", "8"],
+    ]
+    assert result.cacheable is True
+
+
+def test_recovery_stops_before_the_next_half_when_cancelled():
+    llm_translator = make_translator()
+    segments = [
+        SubtitleSegment(id=str(i), start=float(i), end=float(i + 1), text=f"Line {i}")
+        for i in range(1, 9)
+    ]
+    requests = []
+
+    class FakeCompletions:
+        def create(self, **kwargs):
+            rows = json.loads(kwargs["messages"][1]["content"])
+            requests.append([row["id"] for row in rows])
+            return _rows_response([(row["id"], "wrong", "错") for row in rows])
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions()))
+
+    def build_request(rows):
+        return "system", json.dumps([{"id": row.id, "source_text": row.text} for row in rows])
+
+    def cancel_check():
+        if len(requests) >= 2:
+            raise TaskCancelRequested("cancelled")
+
+    with pytest.raises(TaskCancelRequested):
+        llm_translator._recover_rows(
+            client,
+            "test-model",
+            segments,
+            "Chinese",
+            "Standard",
+            build_request,
+            cancel_check=cancel_check,
+        )
+
+    assert requests == [[str(i) for i in range(1, 9)], ["1", "2", "3", "4"]]
+
+
+def test_validator_salvages_only_rows_matching_their_source():
+    segments = [
+        SubtitleSegment(id="1", start=0.0, end=1.0, text="a"),
+        SubtitleSegment(id="2", start=1.0, end=2.0, text="b"),
+        SubtitleSegment(id="3", start=2.0, end=3.0, text="c"),
+    ]
+    resp = _rows_response([("1", "a", "甲"), ("2", "c", "丙"), ("3", "c", " "), ("9", "z", "?")])
+
+    salvaged = TranslationResponseValidator().salvage(resp, segments, "Chinese")
+
+    assert {position: segment.text for position, segment in salvaged.items()} == {0: "甲"}
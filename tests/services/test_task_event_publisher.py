@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from backend.core.ws_notifier import WebSocketNotifier
+from backend.services.task_event_publisher import TaskEventPublisher
+
+
+class RecordingNotifier:
+    def __init__(self):
+        self.messages = []
+
+    async def broadcast(self, message):
+        self.messages.append(message)
+
+    def broadcast_nowait(self, message):
+        self.messages.append(message)
+
+
+def _payload(**overrides):
+    payload = {
+        "id": "task-1",
+        "status": "running",
+        "progress": 0.0,
+        "message": "Starting",
+        "result": None,
+        "queue_state": "running",
+    }
+    payload.update(overrides)
+    return payload
+
+
+@pytest.mark.asyncio
+async def test_publisher_sends_full_update_then_field_patches():
+    notifier = RecordingNotifier()
+    publisher = TaskEventPublisher(notifier, max_patches_per_sec=0)
+
+    await publisher.publish_update(_payload())
+    await publisher.publish_update(_payload(progress=10.0, message="step 1"))
+    await publisher.publish_update(_payload(progress=10.0, message="step 1"))
+    await publisher.publish_update(_payload(status="completed", progress=100.0))
+
+    assert [message["type"] for message in notifier.messages] == ["update", "patch", "update"]
+    assert notifier.messages[1] == {
+        "type": "patch",
+        "task_id": "task-1",
+        "changes": {"progress": 10.0, "message": "step 1"},
+    }
+    assert notifier.messages[2]["task"]["status"] == "completed"
+
+
+@pytest.mark.asyncio
+async def test_publisher_throttles_patches_and_delivers_latest_value():
+    notifier = RecordingNotifier()
+    publisher = TaskEventPublisher(notifier, max_patches_per_sec=20)
+
+    await publisher.publish_update(_payload())
+    for step in range(1, 11):
+        await publisher.publish_update(_payload(progress=float(step), message=f"step {step}"))
+
+    patches = [message for message in notifier.messages if message["type"] == "patch"]
+    assert len(patches) == 1
+
+    await asyncio.sleep(0.1)
+    patches = [message for message in notifier.messages if message["type"] == "patch"]
+    assert len(patches) == 2
+    assert patches[-1]["changes"] == {"progress": 10.0, "message": "step 10"}
+
+
+class SlowSocket:
+    def __init__(self, delay_s: float):
+        self.delay_s = delay_s
+        self.sent = []
+        self.closed_with = None
+
+    async def accept(self):
+        pass
+
+    async def send_json(self, data):
+        await asyncio.sleep(self.delay_s)
+        self.sent.append(data)
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+@pytest.mark.asyncio
+async def test_notifier_fans_out_without_waiting_on_slow_clients():
+    notifier = WebSocketNotifier(max_pending_per_client=4)
+    fast = SlowSocket(0)
+    slow = SlowSocket(1.0)
+    await notifier.connect(fast)
+    await notifier.connect(slow)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    for index in range(6):
+        await notifier.broadcast({"type": "patch", "task_id": "t", "changes": {"progress": index}})
+        await asyncio.sleep(0.001)
+    assert loop.time() - started < 0.5
+
+    await notifier.drain()
+    assert len(fast.sent) == 6
+    assert slow not in notifier.active_connections
+    assert slow.closed_with == 1013
+
+    notifier.disconnect(fast)
@@ -0,0 +1,89 @@
+import random
+
+from backend.services.task_queue_order import PooledTaskQueue, TaskQueueOrder
+
+
+def test_positions_follow_append_order_and_removal():
+    order = TaskQueueOrder()
+    for task_id in ["a", "b", "c", "d"]:
+        order.append(task_id)
+
+    assert [order.position(task_id) for task_id in "abcd"] == [1, 2, 3, 4]
+
+    order.remove("b")
+    assert order.position("b") is None
+    assert order.position("c") == 2
+    assert order.popleft() == "a"
+    assert order.to_list() == ["c", "d"]
+
+
+def test_move_reorders_queue_and_clamps_position():
+    order = TaskQueueOrder()
+    for task_id in ["a", "b", "c", "d"]:
+        order.append(task_id)
+
+    assert order.move("d", 1) == 1
+    assert order.to_list() == ["d", "a", "b", "c"]
+    assert order.move("d", 3) == 3
+    assert order.to_list() == ["a", "b", "d", "c"]
+    assert order.move("a", 99) == 4
+    assert order.to_list() == ["b", "d", "c", "a"]
+    assert order.at(2) == "d"
+
+
+def test_order_matches_reference_list_through_relayouts():
+    rng = random.Random(7)
+    order = TaskQueueOrder()
+    reference: list[str] = []
+
+    for step in range(5000):
+        action = rng.random()
+        if action < 0.45 or not reference:
+            task_id = f"t{step}"
+            order.append(task_id)
+            reference.append(task_id)
+        elif action < 0.55:
+            task_id = f"t{step}"
+            order.appendleft(task_id)
+            reference.insert(0, task_id)
+        elif action < 0.75:
+            task_id = rng.choice(reference)
+            target = rng.randint(1, len(reference))
+            order.move(task_id, target)
+            reference.remove(task_id)
+            reference.insert(target - 1, task_id)
+        else:
+            task_id = rng.choice(reference)
+            order.remove(task_id)
+            reference.remove(task_id)
+
+    assert order.to_list() == reference
+    for index, task_id in enumerate(reference, start=1):
+        assert order.position(task_id) == index
+
+
+def test_pooled_queue_orders_by_priority_within_each_pool():
+    queue = PooledTaskQueue()
+    queue.push("dl-1", "network")
+    queue.push("asr-1", "compute")
+    queue.push("asr-2", "compute")
+    assert queue.push("segment", "compute", priority=10) == 1
+    assert queue.push("asr-3", "compute") == 4
+
+    assert queue.position("dl-1") == 1
+    assert queue.queued_by_pool() == {"network": 1, "compute": 4}
+    assert [queue.pop("compute") for _ in range(4)] == ["segment", "asr-1", "asr-2", "asr-3"]
+    assert queue.pop("compute") is None
+    assert queue.pop("network") == "dl-1"
+
+
+def test_pooled_queue_move_stays_within_priority_band():
+    queue = PooledTaskQueue()
+    queue.push("asr-1", "compute")
+    queue.push("asr-2", "compute")
+    queue.push("segment-1", "compute", priority=10)
+    queue.push("segment-2", "compute", priority=10)
+
+    assert queue.move("asr-2", 1) == 3
+    assert queue.move("segment-1", 4) == 2
+    assert [queue.pop("compute") for _ in range(4)] == ["segment-2", "segment-1", "asr-2", "asr-1"]
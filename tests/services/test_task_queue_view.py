@@ -1,4 +1,5 @@
 from backend.models.task_model import Task
+from backend.services.task_queue_order import TaskQueueOrder
 from backend.services.task_queue_view import TASK_CONTRACT_VERSION, TaskQueueView
 
 
@@ -173,3 +174,21 @@ def test_serialize_task_preserves_native_structured_refs_without_legacy_normaliz
 
     assert payload["request_params"]["context_ref"]["path"] == "E:/subs/demo.srt"
     assert payload["result"]["meta"]["subtitle_ref"]["path"] == "E:/subs/demo_zh.srt"
+
+
+def test_serialize_task_reports_queue_position_from_queue_order():
+    view = TaskQueueView()
+    order = TaskQueueOrder()
+    for task_id in ["task-a", "task-b", "task-c"]:
+        order.append(task_id)
+    order.move("task-c", 1)
+
+    payload = view.serialize_task(
+        create_task("task-b", "pending"),
+        running_ids=set(),
+        queued_ids={"task-a", "task-b", "task-c"},
+        queued_order=order,
+    )
+
+    assert payload["queue_state"] == "queued"
+    assert payload["queue_position"] == 3
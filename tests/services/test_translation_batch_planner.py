@@ -0,0 +1,113 @@
+from types import SimpleNamespace
+
+import pytest
+
+from backend.models.schemas import SubtitleSegment
+from backend.services.translator.translation_batch_planner import (
+    DEFAULT_TOKEN_LIMITS,
+    TokenBudget,
+    expected_output_tokens,
+    model_token_limits,
+)
+from backend.services.translator.translation_batch_runner import (
+    StreamingBatchPlanner,
+    build_translation_batches,
+)
+from backend.services.translator.translation_usage import MeteredClient, TranslationUsage
+
+
+def make_segments(texts):
+    return [
+        SubtitleSegment(id=str(i + 1), start=float(i), end=float(i + 1), text=text)
+        for i, text in enumerate(texts)
+    ]
+
+
+def test_model_token_limits_use_longest_prefix_and_overrides(monkeypatch):
+    monkeypatch.setattr(
+        "backend.services.translator.translation_batch_planner.settings.LLM_MODEL_TOKEN_LIMITS",
+        {"local-llama": [8192, 1024]},
+    )
+    assert model_token_limits("gpt-4o-mini") == (128_000, 16_384)
+    assert model_token_limits("gpt-4-0613") == (8_192, 4_096)
+    assert model_token_limits("local-llama-3") == (8192, 1024)
+    assert model_token_limits("unknown") == DEFAULT_TOKEN_LIMITS
+
+
+def test_short_lines_are_packed_up_to_the_segment_cap():
+    segments = make_segments(["ok"] * 95)
+    budget = TokenBudget(max_input_tokens=100_000, max_output_tokens=100_000, max_segments=40)
+
+    batches = build_translation_batches(segments, batch_size=10, mode="standard", budget=budget)
+
+    assert [len(batch.segments) for batch in batches] == [40, 40, 15]
+    assert [segment.id for segment in batches[1].context_before] == ["38", "39", "40"]
+
+
+def test_long_lines_are_split_by_output_budget_before_sending():
+    long_line = "word " * 80
+    segments = make_segments([long_line] * 10)
+    per_line = expected_output_tokens(segments[0])
+    budget = TokenBudget(max_input_tokens=100_000, max_output_tokens=per_line * 3, max_segments=40)
+
+    batches = build_translation_batches(segments, batch_size=10, mode="standard", budget=budget)
+
+    assert [len(batch.segments) for batch in batches] == [3, 3, 3, 1]
+
+
+def test_line_over_budget_on_its_own_is_sent_alone():
+    segments = make_segments(["short", "word " * 400, "short"])
+    budget = TokenBudget(max_input_tokens=100_000, max_output_tokens=50, max_segments=40)
+
+    batches = build_translation_batches(segments, batch_size=10, mode="standard", budget=budget)
+
+    assert [[segment.id for segment in batch.segments] for batch in batches] == [["1"], ["2"], ["3"]]
+
+
+def test_glossary_terms_count_against_the_input_budget():
+    segments = make_segments(["alpha"] * 6)
+    budget = TokenBudget(
+        max_input_tokens=100,
+        max_output_tokens=100_000,
+        max_segments=40,
+        term_tokens=lambda _text: 30,
+    )
+
+    batches = build_translation_batches(segments, batch_size=10, mode="intelligent", budget=budget)
+
+    assert [len(batch.segments) for batch in batches] == [2, 2, 2]
+
+
+@pytest.mark.parametrize("mode", ["standard", "intelligent"])
+def test_streaming_planner_with_budget_matches_full_planning(mode):
+    texts = [("word " * (i % 7 * 10)) or "hi" for i in range(60)]
+    segments = make_segments(texts)
+    budget = TokenBudget(max_input_tokens=100_000, max_output_tokens=400, max_segments=12)
+    planner = StreamingBatchPlanner(batch_size=10, mode=mode, budget=budget)
+
+    streamed = []
+    for start, stop in [(0, 5), (5, 21), (21, 21), (21, 50), (50, 60)]:
+        streamed.extend(planner.add(segments[start:stop]))
+    streamed.extend(planner.close())
+
+    expected = build_translation_batches(segments, batch_size=10, mode=mode, budget=budget)
+    assert [[s.id for s in batch.segments] for batch in streamed] == [
+        [s.id for s in batch.segments] for batch in expected
+    ]
+
+
+def test_metered_client_counts_requests_and_reported_tokens():
+    usage = TranslationUsage("standard", segments=4)
+
+    class FakeCompletions:
+        def create(self, **kwargs):
+            return SimpleNamespace(usage=SimpleNamespace(prompt_tokens=100, completion_tokens=20))
+
+    client = MeteredClient(SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions())), usage)
+    client.chat.completions.create(model="m", messages=[{"role": "user", "content": "hi"}])
+    client.chat.completions.create(model="m", messages=[{"role": "user", "content": "hi"}])
+
+    summary = usage.summary()
+    assert summary["requests"] == 2
+    assert summary["requests_per_segment"] == 0.5
+    assert summary["tokens_per_segment"] == 60.0
@@ -0,0 +1,145 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from backend.models.schemas import SubtitleSegment
+from backend.services.translator.llm_translator import LLMTranslator
+from backend.services.translator.translation_memory import TranslationMemory, normalize_source_text
+from backend.services.translator.translation_models import TranslationOutcome
+
+
+class FakeGlossaryService:
+    version = "g1"
+
+    def get_relevant_terms(self, _text):
+        return []
+
+
+@pytest.fixture
+def memory(monkeypatch, tmp_path):
+    monkeypatch.setattr("backend.services.translator.translation_memory.settings.TRANSLATION_MEMORY_ENABLED", True)
+    monkeypatch.setattr("backend.services.translator.translation_rate_limiter._limiters", {})
+    store = TranslationMemory(tmp_path / "memory.sqlite3")
+    yield store
+    store.close()
+
+
+def make_translator(monkeypatch, memory):
+    provider = SimpleNamespace(id="p1", base_url="http://127.0.0.1:9/v1", api_key="key", model="m1")
+    translator = LLMTranslator(
+        settings_manager=SimpleNamespace(get_active_llm_provider=lambda: provider),
+        glossary_service=FakeGlossaryService(),
+    )
+    translator._memory = memory
+    monkeypatch.setattr(translator._client_factory, "get_client", lambda: (SimpleNamespace(), "m1"))
+    sent = []
+
+    def fake_translate(client, model_name, system_prompt, segments, *args, **kwargs):
+        sent.append([segment.text for segment in segments])
+        return TranslationOutcome(
+            segments=[segment.model_copy(update={"text": f"T:{segment.text}"}) for segment in segments],
+            cacheable=True,
+        )
+
+    monkeypatch.setattr(translator, "_translate_with_correction", fake_translate)
+    return translator, sent
+
+
+def make_segments(texts):
+    return [
+        SubtitleSegment(id=str(i + 1), start=float(i), end=float(i + 1), text=text)
+        for i, text in enumerate(texts)
+    ]
+
+
+def test_normalize_source_text_folds_width_and_whitespace():
+    assert normalize_source_text("  Ｈello \n  world ") == "Hello world"
+
+
+def test_segment_key_depends_on_previous_line_and_glossary():
+    base = TranslationMemory.segment_key("hi", "before", "m1", "zh", "standard", "g1")
+    assert base == TranslationMemory.segment_key(" hi ", "before", "m1", "zh", "standard", "g1")
+    assert base != TranslationMemory.segment_key("hi", "other", "m1", "zh", "standard", "g1")
+    assert base != TranslationMemory.segment_key("hi", "before", "m1", "zh", "standard", "g2")
+
+
+def test_memory_round_trip(memory):
+    memory.put_many([("a", "A"), ("b", "B")], "m1", "zh", "standard")
+    assert memory.get_many(["a", "b", "c"]) == {"a": "A", "b": "B"}
+
+
+def _age(memory, key, days):
+    memory._connection().execute(
+        "UPDATE translation_memory SET last_used = ? WHERE key = ?",
+        (time.time() - days * 86400, key),
+    )
+
+
+def test_expired_entries_miss_and_are_evicted(monkeypatch, memory):
+    monkeypatch.setattr("backend.services.translator.translation_memory.settings.TRANSLATION_MEMORY_TTL_DAYS", 7)
+    memory.put_many([("old", "O"), ("new", "N")], "m1", "zh", "standard")
+    _age(memory, "old", 8)
+
+    assert memory.get_many(["old", "new"]) == {"new": "N"}
+    assert memory.evict() == 1
+    assert memory.stats()["entries"] == 1
+    assert (memory.hits, memory.misses, memory.evictions) == (1, 1, 1)
+
+
+def test_eviction_caps_entries_least_recently_used_first(monkeypatch, memory):
+    monkeypatch.setattr("backend.services.translator.translation_memory.settings.TRANSLATION_MEMORY_MAX_ENTRIES", 2)
+    memory.put_many([("a", "A"), ("b", "B"), ("c", "C")], "m1", "zh", "standard")
+    _age(memory, "b", 2)
+    _age(memory, "a", 1)
+
+    assert memory.evict() == 1
+    assert memory.get_many(["a", "b", "c"]) == {"a": "A", "c": "C"}
+
+
+def test_background_eviction_removes_legacy_cache_dir(monkeypatch, memory, tmp_path):
+    monkeypatch.setattr("backend.services.translator.translation_memory.settings.TEMP_DIR", tmp_path)
+    legacy = tmp_path / "translation_cache"
+    legacy.mkdir()
+    (legacy / "stale.json").write_text("{}", "utf-8")
+
+    memory.start_eviction(interval_s=60)
+    memory.stop_eviction()
+
+    assert not legacy.exists()
+
+
+def test_memory_disabled_is_a_no_op(monkeypatch, memory):
+    monkeypatch.setattr("backend.services.translator.translation_memory.settings.TRANSLATION_MEMORY_ENABLED", False)
+    memory.put_many([("a", "A")], "m1", "zh", "standard")
+    assert memory.get_many(["a"]) == {}
+
+
+def test_retranslation_only_sends_edited_lines(monkeypatch, memory):
+    translator, sent = make_translator(monkeypatch, memory)
+    texts = [f"line {i}" for i in range(12)]
+
+    first = translator.translate_segments(make_segments(texts), "Chinese", batch_size=5)
+    assert [segment.text for segment in first] == [f"T:line {i}" for i in range(12)]
+    assert sum(len(batch) for batch in sent) == 12
+
+    sent.clear()
+    texts[6] = "line six, edited"
+    second = translator.translate_segments(make_segments(texts), "Chinese", batch_size=5)
+
+    # The edited line and the one after it (whose context changed) miss.
+    assert sent == [["line six, edited", "line 7"]]
+    assert [segment.text for segment in second] == [f"T:{text}" for text in texts]
+    assert [segment.id for segment in second] == [str(i + 1) for i in range(12)]
+
+
+def test_fully_remembered_run_skips_the_llm(monkeypatch, memory):
+    translator, sent = make_translator(monkeypatch, memory)
+    texts = [f"line {i}" for i in range(4)]
+    translator.translate_segments(make_segments(texts), "Chinese", batch_size=2)
+    sent.clear()
+
+    result = translator.translate_segments(make_segments(texts), "Chinese", batch_size=2)
+
+    assert sent == []
+    assert [segment.text for segment in result] == [f"T:{text}" for text in texts]
@@ -0,0 +1,112 @@
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend.config import settings
+from backend.models.schemas import SubtitleSegment
+from backend.services.asr import ASRService
+from backend.services.video.media_prober import MediaProber
+from backend.utils.artifact_cache import ArtifactCache, file_fingerprint
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "ARTIFACT_CACHE_ENABLED", True)
+    cache = ArtifactCache(root=tmp_path / "artifacts", max_bytes=1 << 20)
+    for target in [
+        "backend.utils.artifact_cache.artifact_cache",
+        "backend.services.asr.service.artifact_cache",
+        "backend.services.video.media_prober.artifact_cache",
+    ]:
+        monkeypatch.setattr(target, cache)
+    return cache
+
+
+def test_cache_hits_same_content_and_misses_after_edit(cache, tmp_path):
+    media = tmp_path / "clip.mp4"
+    media.write_bytes(b"a" * 4096)
+
+    assert cache.get(str(media), "transcribe", {"model": "base"}) is None
+    cache.put(str(media), "transcribe", {"model": "base"}, {"segments": [1, 2]})
+
+    assert cache.get(str(media), "transcribe", {"model": "base"}) == {"segments": [1, 2]}
+    assert cache.get(str(media), "transcribe", {"model": "small"}) is None
+    assert cache.get(str(media), "transcribe", {"model": "base"}, version="2") is None
+
+    media.write_bytes(b"b" * 4096)
+    assert cache.get(str(media), "transcribe", {"model": "base"}) is None
+    assert (cache.hits, cache.misses) == (1, 4)
+
+
+def test_fingerprint_samples_large_files_and_tracks_mtime(tmp_path):
+    media = tmp_path / "large.bin"
+    media.write_bytes(os.urandom(5 << 20))
+    first = file_fingerprint(str(media))
+
+    stat = media.stat()
+    os.utime(media, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert file_fingerprint(str(media)) != first
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "ARTIFACT_CACHE_ENABLED", True)
+    cache = ArtifactCache(root=tmp_path / "artifacts", max_bytes=2500)
+    sources = []
+    for index in range(3):
+        source = tmp_path / f"source{index}.wav"
+        source.write_bytes(bytes([index]) * 64)
+        sources.append(str(source))
+
+    payload = "x" * 1000
+    cache.put(sources[0], "probe", {}, payload)
+    cache.put(sources[1], "probe", {}, payload)
+    # Touch the first entry so the second becomes least recently used.
+    for path in (tmp_path / "artifacts").glob("*/*.json"):
+        os.utime(path, (1, 1))
+    assert cache.get(sources[0], "probe", {}) == payload
+    cache.put(sources[2], "probe", {}, payload)
+
+    assert cache.get(sources[0], "probe", {}) == payload
+    assert cache.get(sources[1], "probe", {}) is None
+    assert cache.get(sources[2], "probe", {}) == payload
+    assert cache.total_bytes() <= 2500
+
+
+def test_transcribe_reuses_cached_transcript_without_loading_model(cache, monkeypatch, tmp_path):
+    audio_path = tmp_path / "talk.wav"
+    audio_path.write_bytes(b"fake-audio")
+    service = ASRService()
+    monkeypatch.setattr("backend.services.asr.service.AudioProcessor.get_audio_duration", lambda path: 12.0)
+    monkeypatch.setattr(
+        "backend.services.asr.service.SubtitleWriter.save_srt",
+        lambda segments, path: tmp_path / "talk.srt",
+    )
+    segments = [SubtitleSegment(id="1", start=0.0, end=2.0, text="hello")]
+
+    with patch.object(service.model_manager, "load_model", return_value=MagicMock()) as load_model, \
+         patch.object(service.core_strategies, "transcribe_direct", return_value=segments):
+        first = service.transcribe(str(audio_path), model_name="base", language="en")
+        second = service.transcribe(str(audio_path), model_name="base", language="en", device="cuda")
+        other_language = service.transcribe(str(audio_path), model_name="base", language="de")
+
+    assert load_model.call_count == 2
+    assert "cache" not in first.meta and "cache" not in other_language.meta
+    assert second.meta["cache"] == "hit"
+    assert second.meta["segments"] == first.meta["segments"]
+    assert second.meta["duration"] == 12.0
+
+
+def test_media_probe_is_cached(cache, monkeypatch, tmp_path):
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"fake-video")
+    probe = {"format": {"duration": "3.5"}, "streams": [{"codec_type": "audio"}]}
+    calls = []
+    monkeypatch.setattr(
+        "backend.services.video.media_prober.ffmpeg.probe",
+        lambda path, cmd: calls.append(path) or probe,
+    )
+
+    assert MediaProber.get_duration(str(video)) == 3.5
+    assert MediaProber.has_audio(str(video)) is True
+    assert len(calls) == 1
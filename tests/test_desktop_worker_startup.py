@@ -73,3 +73,20 @@ def test_all_contract_worker_commands_are_registered():
 def test_worker_command_registration_rejects_commands_outside_contract():
     with pytest.raises(ValueError, match="Unknown worker command"):
         register_worker_command("outside_contract")(lambda _request_id, _payload: None)
+
+
+def test_runtime_bootstrap_starts_translation_memory_eviction(monkeypatch):
+    started: list[bool] = []
+
+    monkeypatch.setattr(desktop_worker, "_worker_runtime_bootstrapped", False)
+    monkeypatch.setattr(desktop_worker.settings, "init_dirs", lambda: None)
+    monkeypatch.setattr(desktop_worker, "register_desktop_worker_services", lambda _container: None)
+    monkeypatch.setattr(desktop_worker, "configure_runtime_services", lambda _container: None)
+    monkeypatch.setattr(desktop_worker.pcm_cache, "remove_stale_files", lambda: 0)
+    monkeypatch.setattr(desktop_worker.translation_memory, "enabled", lambda: True)
+    monkeypatch.setattr(desktop_worker.translation_memory, "start_eviction", lambda: started.append(True))
+
+    desktop_worker.ensure_worker_runtime_bootstrapped()
+    desktop_worker.ensure_worker_runtime_bootstrapped()
+
+    assert started == [True]
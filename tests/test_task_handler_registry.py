@@ -11,3 +11,40 @@ def test_register_all_task_handlers_covers_required_task_types():
     validate_required_task_handlers()
 
     assert REQUIRED_TASK_TYPES.issubset(TaskHandlerRegistry.registered_types())
+
+
+def test_resource_profile_is_derived_from_task_handlers():
+    from backend.core.tasks.base import (
+        PRIORITY_INTERACTIVE,
+        PRIORITY_NORMAL,
+        RESOURCE_COMPUTE,
+        RESOURCE_ENCODER,
+        RESOURCE_LLM,
+        RESOURCE_NETWORK,
+    )
+    from backend.models.task_model import Task
+
+    register_all_task_handlers()
+
+    def profile(task_type, request_params=None):
+        task = Task(type=task_type, status="pending", request_params=request_params or {})
+        return TaskHandlerRegistry.resource_profile(task)
+
+    assert profile("download") == (RESOURCE_NETWORK, PRIORITY_NORMAL)
+    assert profile("transcribe") == (RESOURCE_COMPUTE, PRIORITY_NORMAL)
+    assert profile("transcribe_segment") == (RESOURCE_COMPUTE, PRIORITY_INTERACTIVE)
+    assert profile("translate") == (RESOURCE_LLM, PRIORITY_NORMAL)
+    assert profile("synthesis") == (RESOURCE_ENCODER, PRIORITY_NORMAL)
+    assert profile("pipeline", {"steps": [{"step_name": "download", "params": {}}]}) == (
+        RESOURCE_NETWORK,
+        PRIORITY_NORMAL,
+    )
+    assert profile(
+        "pipeline",
+        {"steps": [{"step_name": "download", "params": {}}, {"step_name": "transcribe", "params": {}}]},
+    ) == (RESOURCE_COMPUTE, PRIORITY_NORMAL)
+    assert profile("pipeline", {"steps": [{"step_name": "translate"}, {"step_name": "synthesize"}]}) == (
+        RESOURCE_ENCODER,
+        PRIORITY_NORMAL,
+    )
+    assert profile("unknown") == (RESOURCE_COMPUTE, PRIORITY_NORMAL)
@@ -7,7 +7,8 @@ from sqlalchemy.orm import sessionmaker
 from sqlmodel import SQLModel
 
 import backend.core.database as db_module
-from backend.models.task_model import Task
+from backend.config import settings
+from backend.models.task_model import PipelineCheckpoint, Task, TaskResultRecord
 from backend.services.task_control_service import TaskControlService
 from backend.services.task_event_publisher import TaskEventPublisher
 from backend.services.task_manager import TaskManager
@@ -150,3 +151,294 @@ async def test_warm_start_returns_before_background_task_hydration_finishes(
     release_load.set()
     await asyncio.wait_for(tm._startup_load_task, timeout=1.0)
     await tm.shutdown_async()
+
+
+@pytest.mark.asyncio
+async def test_progress_updates_are_coalesced_until_flush(task_manager, monkeypatch):
+    task_id = await task_manager.create_task("test_type")
+    await task_manager.update_task(task_id, status="running")
+
+    calls = []
+    original_batch = task_manager._repository.apply_progress_batch
+
+    async def counting_batch(updates):
+        calls.append(dict(updates))
+        return await original_batch(updates)
+
+    monkeypatch.setattr(task_manager._repository, "apply_progress_batch", counting_batch)
+
+    for step in range(1, 21):
+        await task_manager.update_task(task_id, progress=step * 5, message=f"step {step}")
+
+    task = task_manager.tasks[task_id]
+    assert task.progress == 100.0
+    assert task.message == "step 20"
+
+    async with db_module.get_session_context() as session:
+        db_task = await session.get(Task, task_id)
+        assert db_task.progress == 0.0
+
+    await task_manager._progress_store.flush()
+    assert len(calls) == 1
+    assert calls[0] == {task_id: {"progress": 100.0, "message": "step 20"}}
+
+    async with db_module.get_session_context() as session:
+        db_task = await session.get(Task, task_id)
+        assert db_task.progress == 100.0
+        assert db_task.message == "step 20"
+
+    await task_manager.shutdown_async()
+
+
+@pytest.mark.asyncio
+async def test_status_change_absorbs_pending_progress(task_manager):
+    task_id = await task_manager.create_task("test_type")
+    await task_manager.update_task(task_id, status="running")
+    await task_manager.update_task(task_id, progress=42.0, message="halfway")
+    await task_manager.update_task(task_id, status="paused")
+
+    assert task_manager._progress_store.pending_count == 0
+    async with db_module.get_session_context() as session:
+        db_task = await session.get(Task, task_id)
+        assert db_task.status == "paused"
+        assert db_task.progress == 42.0
+        assert db_task.message == "halfway"
+
+    await task_manager.update_task(task_id, progress=90.0, message="late tick")
+    assert task_manager.tasks[task_id].progress == 42.0
+
+    await task_manager.shutdown_async()
+
+
+@pytest.mark.asyncio
+async def test_large_results_are_detached_from_task_row(task_manager):
+    task_manager._repository._result_inline_limit_bytes = 1024
+    task_id = await task_manager.create_task("transcribe")
+    segments = [{"id": index, "start": index, "end": index + 1, "text": "word " * 10} for index in range(200)]
+    result = {
+        "success": True,
+        "files": [{"type": "subtitle", "path": "out.srt"}],
+        "meta": {"segments": segments, "text": "hello " * 400, "language": "en", "execution_trace": []},
+    }
+
+    await task_manager.update_task(task_id, status="completed", result=result)
+
+    cached = task_manager.tasks[task_id].result
+    assert "segments" not in cached["meta"]
+    assert cached["meta"]["language"] == "en"
+    assert cached["meta"]["execution_trace"] == []
+    assert cached["result_ref"]["summary"]["meta.segments"] == {"count": 200}
+
+    payload = task_manager.serialize_task(task_manager.tasks[task_id])
+    assert len(str(payload)) < 2048
+
+    full_result = await task_manager.get_task_result(task_id)
+    assert full_result == result
+
+    await task_manager.delete_task(task_id)
+    async with db_module.get_session_context() as session:
+        assert await session.get(TaskResultRecord, task_id) is None
+
+
+@pytest.mark.asyncio
+async def test_detached_result_of_cached_task_without_row_is_merged(task_manager):
+    task_manager._repository._result_inline_limit_bytes = 1024
+    task_id = await task_manager.create_task("transcribe")
+    async with db_module.get_session_context() as session:
+        await session.delete(await session.get(Task, task_id))
+        await session.commit()
+    result = {"success": True, "files": [], "meta": {"text": "hello " * 400, "language": "en"}}
+
+    await task_manager.update_task(task_id, status="completed", result=result)
+
+    assert "result_ref" in task_manager.tasks[task_id].result
+    assert await task_manager.get_task_result(task_id) == result
+
+
+@pytest.mark.asyncio
+async def test_small_results_stay_inline(task_manager):
+    task_id = await task_manager.create_task("transcribe")
+    result = {"success": True, "files": [], "meta": {"segments": [], "text": "ok"}}
+
+    await task_manager.update_task(task_id, status="completed", result=result)
+
+    assert task_manager.tasks[task_id].result == result
+    assert await task_manager.get_task_result(task_id) == result
+
+
+@pytest.mark.asyncio
+async def test_query_tasks_filters_and_pages(task_manager):
+    ids = []
+    for index in range(5):
+        task_id = await task_manager.create_task(
+            "transcribe" if index % 2 == 0 else "translate",
+            task_name=f"clip_{index}.mp4",
+        )
+        ids.append(task_id)
+    await task_manager.update_task(ids[0], status="completed")
+
+    page = await task_manager.query_tasks(task_types=["transcribe"], limit=2)
+    assert page["total"] == 3
+    assert len(page["items"]) == 2
+    assert all(item["type"] == "transcribe" for item in page["items"])
+
+    completed = await task_manager.query_tasks(statuses=["completed"])
+    assert [item["id"] for item in completed["items"]] == [ids[0]]
+
+    searched = await task_manager.query_tasks(search="clip_3")
+    assert [item["id"] for item in searched["items"]] == [ids[3]]
+
+    literal = await task_manager.query_tasks(search="clip%")
+    assert literal["total"] == 0
+
+
+@pytest.mark.asyncio
+async def test_runtime_only_mode_pages_history_from_db(test_engine, monkeypatch):
+    monkeypatch.setattr(db_module, "engine", test_engine)
+    monkeypatch.setattr(
+        db_module,
+        "async_session_maker",
+        sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False),
+    )
+    tm = TaskManager(
+        repository=TaskRepository(),
+        event_publisher=TaskEventPublisher(),
+        queue_view=TaskQueueView(),
+        control_service=TaskControlService(),
+        runtime_state=TaskRuntimeState(),
+        keep_history_in_memory=False,
+    )
+    await tm.init_async()
+    try:
+        done_id = await tm.create_task("transcribe", task_name="done")
+        active_id = await tm.create_task("transcribe", task_name="active")
+        await tm.update_task(done_id, status="completed", result={"text": "ok"})
+
+        assert done_id not in tm.tasks
+        assert active_id in tm.tasks
+        assert (await tm.fetch_task(done_id)).status == "completed"
+        assert await tm.get_task_result(done_id) == {"text": "ok"}
+
+        page = await tm.query_tasks()
+        assert {item["id"] for item in page["items"]} == {done_id, active_id}
+
+        restarted = create_task_manager()
+        restarted._keep_history_in_memory = False
+        await restarted.load_tasks()
+        assert set(restarted.tasks) == {active_id}
+        loaded = await restarted.load_task(done_id)
+        assert loaded is not None and done_id in restarted.tasks
+    finally:
+        await tm.shutdown_async()
+
+
+@pytest.mark.asyncio
+async def test_moved_task_is_dispatched_first(task_manager):
+    release = asyncio.Event()
+    started: list[str] = []
+
+    def make_runner(task_id):
+        async def _run():
+            started.append(task_id)
+            await release.wait()
+            await task_manager.update_task(task_id, status="completed")
+
+        return _run
+
+    task_ids = [await task_manager.create_task("test_type") for _ in range(5)]
+    for task_id in task_ids:
+        await task_manager.enqueue_task(task_id, make_runner(task_id))
+    await asyncio.sleep(0.05)
+    assert started == task_ids[:2]
+
+    assert await task_manager.move_queued_task(task_ids[4], 1) == 1
+    assert task_manager.serialize_task(task_manager.get_task(task_ids[2]))["queue_position"] == 2
+    assert await task_manager.move_queued_task(task_ids[0], 1) is None
+
+    release.set()
+    await asyncio.wait_for(task_manager.wait_until_idle(), timeout=2)
+    assert started[2:] == [task_ids[4], task_ids[2], task_ids[3]]
+    await task_manager.shutdown_async()
+
+
+@pytest.mark.asyncio
+async def test_resource_pools_isolate_work_and_honour_priority(test_engine, monkeypatch):
+    monkeypatch.setattr(db_module, "engine", test_engine)
+    monkeypatch.setattr(
+        db_module,
+        "async_session_maker",
+        sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False),
+    )
+    monkeypatch.setattr(settings, "TASK_POOL_LIMITS", {"network": 1, "compute": 1})
+
+    def resource_profile(task):
+        if task.type == "download":
+            return "network", 0
+        return "compute", 10 if task.type == "transcribe_segment" else 0
+
+    tm = TaskManager(
+        repository=TaskRepository(),
+        event_publisher=TaskEventPublisher(),
+        queue_view=TaskQueueView(),
+        control_service=TaskControlService(),
+        runtime_state=TaskRuntimeState(),
+        resource_profile=resource_profile,
+    )
+    await tm.init_async()
+    release = asyncio.Event()
+    started: list[str] = []
+
+    def make_runner(task_id):
+        async def _run():
+            started.append(task_id)
+            await release.wait()
+            await tm.update_task(task_id, status="completed")
+
+        return _run
+
+    try:
+        downloads = [await tm.create_task("download") for _ in range(3)]
+        transcribe_ids = [await tm.create_task("transcribe") for _ in range(2)]
+        segment_id = await tm.create_task("transcribe_segment")
+        for task_id in downloads + transcribe_ids + [segment_id]:
+            await tm.enqueue_task(task_id, make_runner(task_id))
+        await asyncio.sleep(0.05)
+
+        # Downloads hold the network slot without blocking the compute pool.
+        assert started == [downloads[0], transcribe_ids[0]]
+        summary = tm.get_pool_summary()
+        assert summary["network"] == {"limit": 1, "running": 1, "queued": 2}
+        assert summary["compute"] == {"limit": 1, "running": 1, "queued": 2}
+        assert tm.serialize_task(tm.get_task(segment_id))["queue_position"] == 1
+
+        release.set()
+        await asyncio.wait_for(tm.wait_until_idle(), timeout=2)
+        compute_order = [task_id for task_id in started if task_id not in downloads]
+        assert compute_order == [transcribe_ids[0], segment_id, transcribe_ids[1]]
+    finally:
+        await tm.shutdown_async()
+
+
+@pytest.mark.asyncio
+async def test_pipeline_checkpoints_round_trip_and_are_deleted_with_task(task_manager):
+    task_id = await task_manager.create_task("pipeline", "Queued")
+    for index, name in enumerate(["download", "transcribe", "synthesize"]):
+        await task_manager.save_pipeline_checkpoint(PipelineCheckpoint(
+            task_id=task_id,
+            step_index=index,
+            step_name=name,
+            params_digest=f"params-{index}",
+            input_digest=f"input-{index}",
+            data={f"{name}_path": f"/tmp/{name}.out"},
+            files=[],
+        ))
+
+    loaded = await task_manager.load_pipeline_checkpoints(task_id)
+    assert [cp.step_name for cp in loaded] == ["download", "transcribe", "synthesize"]
+    assert loaded[1].data == {"transcribe_path": "/tmp/transcribe.out"}
+
+    await task_manager.clear_pipeline_checkpoints(task_id, from_step=1)
+    assert [cp.step_index for cp in await task_manager.load_pipeline_checkpoints(task_id)] == [0]
+
+    await task_manager.delete_task(task_id)
+    assert await task_manager.load_pipeline_checkpoints(task_id) == []